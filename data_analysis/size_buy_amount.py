@@ -0,0 +1,117 @@
+"""
+Offline sizing of buy_amount and extreme_fast_token_amount.
+
+Loads the curve snapshots in data/tokens/tokens_all.csv and sweeps candidate
+buy sizes through the vectorized curve simulator:
+
+- price impact percentiles per buy size
+- SOL still needed for the curves to graduate
+- median round-trip PnL per buy size as other traders move the curve
+- the largest extreme_fast_token_amount that buy_amount (plus slippage) pays
+  for on a given share of curves
+
+Usage:
+    python data_analysis/size_buy_amount.py --buy-amount 0.1 --slippage 0.3
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+from core.curve_simulator import CurveArrays, CurveSimulator
+from core.pubkeys import LAMPORTS_PER_SOL, TOKEN_DECIMALS
+
+DEFAULT_CSV = Path(__file__).parent.parent / "data" / "tokens" / "tokens_all.csv"
+DEFAULT_SIZES = (0.0001, 0.001, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 5.0)
+DEFAULT_FLOWS = (-2.0, -1.0, -0.5, 0.0, 0.5, 1.0, 2.0, 5.0, 10.0)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--csv", type=Path, default=DEFAULT_CSV, help="Token snapshot CSV")
+    parser.add_argument(
+        "--buy-amount", type=float, default=0.0001, help="Configured buy_amount in SOL"
+    )
+    parser.add_argument(
+        "--slippage", type=float, default=0.3, help="Configured buy_slippage"
+    )
+    parser.add_argument(
+        "--coverage",
+        type=float,
+        default=0.9,
+        help="Share of curves the extreme fast token amount must be affordable on",
+    )
+    parser.add_argument(
+        "--sizes", type=float, nargs="+", default=DEFAULT_SIZES, help="Buy sizes in SOL"
+    )
+    parser.add_argument(
+        "--flows",
+        type=float,
+        nargs="+",
+        default=DEFAULT_FLOWS,
+        help="Net SOL other traders move the curve by before the sell",
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+
+    started = time.perf_counter()
+    curves = CurveArrays.from_csv(args.csv)
+    loaded = time.perf_counter()
+    if not len(curves):
+        print(f"No curves with reserves in {args.csv}")
+        return
+
+    simulator = CurveSimulator(curves)
+    sizes = np.asarray(args.sizes) * LAMPORTS_PER_SOL
+    flows = np.asarray(args.flows) * LAMPORTS_PER_SOL
+
+    impact = simulator.price_impact(sizes)
+    graduation = simulator.graduation_distance() / LAMPORTS_PER_SOL
+    pnl = simulator.round_trip_pnl(sizes, flows) / LAMPORTS_PER_SOL
+
+    # The extreme fast buy caps its spend at buy_amount * (1 + slippage)
+    budget = args.buy_amount * (1 + args.slippage) * LAMPORTS_PER_SOL
+    affordable = simulator.buy_tokens([budget])[:, 0] / 10**TOKEN_DECIMALS
+    token_amount = np.percentile(affordable, (1 - args.coverage) * 100)
+    simulated = time.perf_counter()
+
+    print(f"Loaded {len(curves):,} curves from {args.csv} in {loaded - started:.3f} s")
+    print(
+        f"Simulated {len(curves) * len(sizes) * len(flows):,} round trips "
+        f"in {simulated - loaded:.3f} s"
+    )
+
+    print("\nPrice impact by buy size")
+    print(f"{'SOL':>9} {'p50':>8} {'p90':>8} {'p99':>8}")
+    for size, column in zip(args.sizes, impact.T, strict=True):
+        p50, p90, p99 = np.percentile(column, [50, 90, 99])
+        print(f"{size:>9g} {p50:>8.2%} {p90:>8.2%} {p99:>8.2%}")
+
+    p10, p50, p90 = np.percentile(graduation, [10, 50, 90])
+    print(f"\nSOL to graduation: p10 {p10:.2f}  p50 {p50:.2f}  p90 {p90:.2f}")
+
+    print("\nMedian round-trip PnL in SOL (rows: buy size, columns: SOL flow)")
+    print(f"{'SOL':>9} " + " ".join(f"{flow:>9g}" for flow in args.flows))
+    for size, row in zip(args.sizes, np.nanmedian(pnl, axis=0), strict=True):
+        print(f"{size:>9g} " + " ".join(f"{value:>9.4f}" for value in row))
+
+    print(
+        f"\nbuy_amount {args.buy_amount:g} SOL with {args.slippage:.0%} slippage buys "
+        f"{np.median(affordable):,.0f} tokens on the median curve"
+    )
+    print(
+        f"Suggested extreme_fast_token_amount: {int(token_amount):,} "
+        f"(affordable on {args.coverage:.0%} of curves)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -9,6 +9,9 @@ import uvloop
 asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
 
 from config_loader import load_bot_config, print_config_summary
+from core.client import SolanaClient
+from monitoring.hub import DEFAULT_SOCKET_PATH, MarketDataHub
+from monitoring.multi_listener import MultiSourceListener, create_source_listeners
 from trading.trader import PumpTrader
 from utils.logger import setup_file_logging
 
@@ -28,6 +31,103 @@ def setup_logging(bot_name: str):
     
     setup_file_logging(str(log_filename))
 
+def get_token_sources(cfg: dict) -> list[dict]:
+    """
+    Get the token sources of a bot: its listener type and any extra sources.
+    
+    Args:
+        cfg: Bot configuration
+        
+    Returns:
+        Source definitions as accepted by create_source_listeners
+    """
+    geyser = cfg.get("geyser", {})
+    primary = {
+        "type": cfg["filters"]["listener_type"],
+        "wss_endpoint": cfg["wss_endpoint"],
+        "endpoint": geyser.get("endpoint"),
+        "api_token": geyser.get("api_token"),
+        "auth_type": geyser.get("auth_type", "x-token"),
+    }
+    return [primary, *(cfg["filters"].get("extra_sources") or [])]
+
+def get_hub_socket_path(cfg: dict) -> str | None:
+    """
+    Get the market-data hub socket of a bot, or None if it does not use the hub.
+    
+    Args:
+        cfg: Bot configuration
+    """
+    hub = cfg.get("hub", {})
+    if not hub.get("enabled", False):
+        return None
+    return hub.get("socket_path", DEFAULT_SOCKET_PATH)
+
+def get_shared_hub_socket_path(configs: list[dict]) -> str:
+    """
+    Get the socket of the market-data hub shared by the specified bots.
+    
+    Only one hub runs, so every bot using it must connect to the same socket.
+    
+    Args:
+        configs: Configurations of the bots using the hub
+        
+    Raises:
+        ValueError: If the bots are configured with different hub sockets
+    """
+    socket_paths = {cfg.get("name", "unnamed"): get_hub_socket_path(cfg) for cfg in configs}
+    if len(set(socket_paths.values())) > 1:
+        details = ", ".join(f"{name}: {path}" for name, path in socket_paths.items())
+        raise ValueError(f"Bots using the market-data hub must share one hub.socket_path ({details})")
+    return next(iter(socket_paths.values()))
+
+async def start_hub(config_paths: list[str]):
+    """
+    Start the market-data hub shared by the bots with the specified configurations.
+    
+    The hub subscribes once to every distinct token source of those bots and
+    publishes tokens, blockhashes and priority fees to them over a local socket.
+    
+    Args:
+        config_paths: Paths to the YAML configurations of the bots using the hub
+        
+    Raises:
+        ValueError: If the bots are configured with different hub sockets
+    """
+    configs = [load_bot_config(path) for path in config_paths]
+    setup_logging("hub")
+    
+    sources = {}
+    for cfg in configs:
+        for source in get_token_sources(cfg):
+            key = (
+                source["type"],
+                source.get("endpoint") if source["type"] == "geyser" else source.get("wss_endpoint"),
+            )
+            sources.setdefault(key, source)
+    
+    first = configs[0]
+    geyser = next((cfg["geyser"] for cfg in configs if cfg.get("geyser", {}).get("endpoint")), {})
+    client = SolanaClient(
+        first["rpc_endpoint"],
+        first["wss_endpoint"],
+        max_rps=first.get("node", {}).get("max_rps"),
+        geyser_endpoint=geyser.get("endpoint"),
+        geyser_api_token=geyser.get("api_token"),
+        geyser_auth_type=geyser.get("auth_type", "x-token"),
+    )
+    # Publish the fee percentile of every bot paying dynamic fees, refreshed
+    # as often as the most demanding of them asks
+    fee_configs = [cfg for cfg in configs if cfg.get("priority_fees", {}).get("enable_dynamic", False)]
+    hub = MarketDataHub(
+        MultiSourceListener(create_source_listeners(list(sources.values()))),
+        client,
+        socket_path=get_shared_hub_socket_path(configs),
+        fee_interval=min((cfg["hub"].get("fee_interval", 2.0) for cfg in fee_configs), default=0.0),
+        fee_percentiles=sorted({cfg["priority_fees"].get("percentile", 70) for cfg in fee_configs}),
+    )
+    await hub.run()
+
 async def start_bot(config_path: str):
     """
     Start a trading bot with the configuration from the specified path.
@@ -53,6 +153,10 @@ async def start_bot(config_path: str):
         # Extreme fast mode settings
         extreme_fast_mode=cfg["trade"].get("extreme_fast_mode", False),
         extreme_fast_token_amount=cfg["trade"].get("extreme_fast_token_amount", 30),
+
+        # Position limits
+        max_positions=cfg["trade"].get("max_positions", 1),
+        max_exposure=cfg["trade"].get("max_exposure") or None,
         
         # Listener configuration
         listener_type=cfg["filters"]["listener_type"],
@@ -62,12 +166,30 @@ async def start_bot(config_path: str):
         geyser_api_token=cfg.get("geyser", {}).get("api_token"),
         geyser_auth_type=cfg.get("geyser", {}).get("auth_type"),
         
+        # Extra racing token sources and the shared market-data hub
+        extra_sources=cfg["filters"].get("extra_sources") or None,
+        hub_socket_path=get_hub_socket_path(cfg),
+        
         # Priority fee configuration
         enable_dynamic_priority_fee=cfg.get("priority_fees", {}).get("enable_dynamic", False),
         enable_fixed_priority_fee=cfg.get("priority_fees", {}).get("enable_fixed", True),
         fixed_priority_fee=cfg.get("priority_fees", {}).get("fixed_amount", 500000),
         extra_priority_fee=cfg.get("priority_fees", {}).get("extra_percentage", 0.0),
         hard_cap_prior_fee=cfg.get("priority_fees", {}).get("hard_cap", 500000),
+        priority_fee_refresh_interval=cfg.get("priority_fees", {}).get("refresh_interval", 2.0),
+        priority_fee_max_age=cfg.get("priority_fees", {}).get("max_age", 10.0),
+        priority_fee_percentile=cfg.get("priority_fees", {}).get("percentile", 70),
+        priority_fee_source=cfg.get("priority_fees", {}).get("dynamic_source", "rpc"),
+        priority_fee_window_slots=cfg.get("priority_fees", {}).get("window_slots", 150),
+        autosize_compute_units=cfg.get("compute_units", {}).get("autosize", True),
+        compute_unit_headroom=cfg.get("compute_units", {}).get("headroom", 0.15),
+        compute_unit_profile=cfg.get("compute_units", {}).get("profile_path"),
+        compute_unit_resample_interval=cfg.get("compute_units", {}).get(
+            "resample_interval", 600.0
+        ),
+        compute_unit_profile_max_age=cfg.get("compute_units", {}).get(
+            "profile_max_age", 86_400.0
+        ),
         
         # Retry and timeout settings
         max_retries=cfg.get("retries", {}).get("max_attempts", 10),
@@ -87,6 +209,26 @@ async def start_bot(config_path: str):
         bro_address=cfg["filters"].get("bro_address"),
         marry_mode=cfg["filters"].get("marry_mode", False),
         yolo_mode=cfg["filters"].get("yolo_mode", False),
+
+        # Node provider settings
+        max_rps=cfg.get("node", {}).get("max_rps"),
+        max_connections=cfg.get("node", {}).get("max_connections", 100),
+        max_connections_per_host=cfg.get("node", {}).get("max_connections_per_host", 0),
+        keepalive_timeout=cfg.get("node", {}).get("keepalive_timeout", 75.0),
+        dns_cache_ttl=cfg.get("node", {}).get("dns_cache_ttl", 300),
+        enable_rpc_batching=cfg.get("node", {}).get("enable_batching", True),
+        rpc_batch_window=cfg.get("node", {}).get("batch_window", 0.0),
+        rpc_max_batch_size=cfg.get("node", {}).get("max_batch_size", 100),
+        send_endpoints=cfg.get("node", {}).get("send_endpoints") or None,
+        hedge_endpoints=cfg.get("node", {}).get("hedge_endpoints") or None,
+        enable_curve_cache=cfg.get("node", {}).get("enable_curve_cache", True),
+
+        # Trade journal
+        journal_dir=cfg.get("journal", {}).get("directory", "trades"),
+        journal_formats=cfg.get("journal", {}).get("formats"),
+        journal_fsync=cfg.get("journal", {}).get("fsync", "interval"),
+        journal_max_bytes=cfg.get("journal", {}).get("max_bytes", 64 * 1024 * 1024),
+        journal_backup_count=cfg.get("journal", {}).get("backup_count", 5),
     )
     
     await trader.start()
@@ -112,6 +254,31 @@ def run_all_bots():
     processes = []
     skipped_bots = 0
     
+    # Bots that share the market-data hub need it running before they start
+    hub_bots = {}
+    for file in bot_files:
+        try:
+            cfg = load_bot_config(str(file))
+        except Exception:
+            continue
+        if cfg.get("enabled", True) and get_hub_socket_path(cfg):
+            hub_bots[str(file)] = cfg
+    if hub_bots:
+        try:
+            get_shared_hub_socket_path(list(hub_bots.values()))
+        except ValueError as e:
+            logging.error(str(e))
+            return
+    hub_process = None
+    if hub_bots:
+        logging.info(f"Starting market-data hub for {len(hub_bots)} bot(s)")
+        hub_process = multiprocessing.Process(
+            target=lambda: asyncio.run(start_hub(list(hub_bots))),
+            name="market-data-hub",
+            daemon=True,
+        )
+        hub_process.start()
+    
     for file in bot_files:
         try:
             cfg = load_bot_config(str(file))
@@ -142,6 +309,11 @@ def run_all_bots():
     for p in processes:
         p.join()
         logging.info(f"Process {p.name} completed")
+    
+    if hub_process:
+        hub_process.terminate()
+        hub_process.join()
+        logging.info("Market-data hub stopped")
 
 
 def main() -> None:
@@ -4,8 +4,10 @@ from solders.pubkey import Pubkey
 from spl.token.instructions import BurnParams, CloseAccountParams, burn, close_account
 
 from core.client import SolanaClient
+from core.compute_units import BURN_CLOSE, CLOSE
 from core.priority_fee.manager import PriorityFeeManager
 from core.pubkeys import SystemAddresses
+from core.rate_limiter import RequestPriority
 from core.wallet import Wallet
 from utils.logger import get_logger
 
@@ -39,7 +41,6 @@ class AccountCleanupManager:
         Skips if account doesn't exist or is already empty/closed.
         """
         ata = self.wallet.get_associated_token_address(mint)
-        solana_client = await self.client.get_client()
 
         priority_fee = (
             await self.priority_fee_manager.calculate_priority_fee([ata])
@@ -51,12 +52,23 @@ class AccountCleanupManager:
         await asyncio.sleep(15)
 
         try:
-            info = await solana_client.get_account_info(ata, encoding="base64")
-            if not info.value:
+            # Both reads are issued together so they share one JSON-RPC batch
+            info, balance = await asyncio.gather(
+                self.client.get_account_info(ata, RequestPriority.BACKGROUND),
+                self.client.get_token_account_balance(
+                    ata, RequestPriority.BACKGROUND
+                ),
+                return_exceptions=True,
+            )
+            if isinstance(info, ValueError):
                 logger.info(f"ATA {ata} does not exist or already closed.")
                 return
+            if isinstance(balance, Exception):
+                raise balance
+            # A readable balance already shows the account exists
+            if isinstance(info, Exception):
+                logger.debug(f"Account info read for ATA {ata} failed: {info!s}")
 
-            balance = await self.client.get_token_account_balance(ata)
             instructions = []
 
             if balance > 0 and self.close_with_force_burn:
@@ -98,6 +110,8 @@ class AccountCleanupManager:
                     self.wallet.keypair,
                     skip_preflight=True,
                     priority_fee=priority_fee,
+                    priority=RequestPriority.BACKGROUND,
+                    compute_unit_shape=BURN_CLOSE if len(instructions) > 1 else CLOSE,
                 )
                 await self.client.confirm_transaction(tx_sig)
                 logger.info(f"Closed successfully: {ata}")
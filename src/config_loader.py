@@ -15,17 +15,35 @@ CONFIG_VALIDATION_RULES = [
     ("trade.buy_amount", (int, float), 0, float('inf'), "trade.buy_amount must be a positive number"),
     ("trade.buy_slippage", float, 0, 1, "trade.buy_slippage must be between 0 and 1"),
     ("trade.sell_slippage", float, 0, 1, "trade.sell_slippage must be between 0 and 1"),
+    ("trade.max_positions", int, 1, 1000, "trade.max_positions must be between 1 and 1000"),
+    ("trade.max_exposure", (int, float), 0, float('inf'), "trade.max_exposure must be a non-negative number"),
     ("priority_fees.fixed_amount", int, 0, float('inf'), "priority_fees.fixed_amount must be a non-negative integer"),
     ("priority_fees.extra_percentage", float, 0, 1, "priority_fees.extra_percentage must be between 0 and 1"),
     ("priority_fees.hard_cap", int, 0, float('inf'), "priority_fees.hard_cap must be a non-negative integer"),
+    ("priority_fees.refresh_interval", (int, float), 0, float('inf'), "priority_fees.refresh_interval must be a non-negative number"),
+    ("priority_fees.max_age", (int, float), 0.1, float('inf'), "priority_fees.max_age must be a positive number"),
+    ("priority_fees.percentile", int, 1, 99, "priority_fees.percentile must be between 1 and 99"),
+    ("priority_fees.window_slots", int, 1, 10_000, "priority_fees.window_slots must be between 1 and 10000"),
+    ("compute_units.headroom", float, 0, 1, "compute_units.headroom must be between 0 and 1"),
+    ("compute_units.resample_interval", (int, float), 1, float('inf'), "compute_units.resample_interval must be at least 1 second"),
+    ("compute_units.profile_max_age", (int, float), 0, float('inf'), "compute_units.profile_max_age must be a non-negative number"),
     ("retries.max_attempts", int, 0, 100, "retries.max_attempts must be between 0 and 100"),
-    ("filters.max_token_age", (int, float), 0, float('inf'), "filters.max_token_age must be a non-negative number")
+    ("filters.max_token_age", (int, float), 0, float('inf'), "filters.max_token_age must be a non-negative number"),
+    ("node.max_rps", (int, float), 0.1, float('inf'), "node.max_rps must be a positive number"),
+    ("node.max_connections", int, 1, float('inf'), "node.max_connections must be a positive integer"),
+    ("node.batch_window", (int, float), 0, 1, "node.batch_window must be between 0 and 1 second"),
+    ("node.max_batch_size", int, 1, 1000, "node.max_batch_size must be between 1 and 1000"),
+    ("journal.max_bytes", int, 0, float('inf'), "journal.max_bytes must be a non-negative integer"),
+    ("journal.backup_count", int, 0, 100, "journal.backup_count must be between 0 and 100"),
+    ("hub.fee_interval", (int, float), 0.1, float('inf'), "hub.fee_interval must be a positive number")
 ]
 
 # Valid values for enum-like fields
 VALID_VALUES = {
     "filters.listener_type": ["logs", "blocks", "geyser"],
-    "cleanup.mode": ["disabled", "on_fail", "after_sell", "post_session"]
+    "cleanup.mode": ["disabled", "on_fail", "after_sell", "post_session"],
+    "journal.fsync": ["none", "interval", "batch"],
+    "priority_fees.dynamic_source": ["rpc", "stream"]
 }
 
 
@@ -80,6 +98,11 @@ def resolve_env_vars(config: dict) -> None:
         for k, v in d.items():
             if isinstance(v, dict):
                 resolve_all(v)
+            elif isinstance(v, list):
+                for item in v:
+                    if isinstance(item, dict):
+                        resolve_all(item)
+                d[k] = [resolve_env(item) for item in v]
             else:
                 d[k] = resolve_env(v)
     
@@ -147,15 +170,49 @@ def validate_config(config: dict) -> None:
             # Skip if the field is missing
             continue
     
-    # Cannot enable both dynamic and fixed priority fees
+    # Send and hedge endpoints must be lists of URLs
+    for path in ("node.send_endpoints", "node.hedge_endpoints"):
+        try:
+            endpoints = get_nested_value(config, path)
+            if endpoints is not None and not (
+                isinstance(endpoints, list)
+                and all(isinstance(url, str) for url in endpoints)
+            ):
+                raise ValueError(f"{path} must be a list of endpoint URLs")
+        except ValueError as e:
+            if str(e).startswith(path):
+                raise
+
+    # Journal formats must be a list of known sinks
+    try:
+        formats = get_nested_value(config, "journal.formats")
+        if formats is not None and not (
+            isinstance(formats, list)
+            and all(name in ("jsonl", "binary") for name in formats)
+        ):
+            raise ValueError("journal.formats must be a list of 'jsonl' and/or 'binary'")
+    except ValueError as e:
+        if str(e).startswith("journal.formats"):
+            raise
+
+    # Extra token sources must name a listener type and its endpoint
     try:
-        dynamic = get_nested_value(config, "priority_fees.enable_dynamic")
-        fixed = get_nested_value(config, "priority_fees.enable_fixed")
-        if dynamic and fixed:
-            raise ValueError("Cannot enable both dynamic and fixed priority fees simultaneously")
-    except ValueError:
-        # Skip if one of the fields is missing
-        pass
+        sources = get_nested_value(config, "filters.extra_sources")
+        if sources is not None:
+            if not isinstance(sources, list):
+                raise ValueError("filters.extra_sources must be a list of sources")
+            for source in sources:
+                if not isinstance(source, dict) or source.get("type") not in VALID_VALUES["filters.listener_type"]:
+                    raise ValueError(
+                        f"filters.extra_sources entries need a type in {VALID_VALUES['filters.listener_type']}"
+                    )
+                required = ("endpoint", "api_token") if source["type"] == "geyser" else ("wss_endpoint",)
+                missing = [key for key in required if not source.get(key)]
+                if missing:
+                    raise ValueError(f"filters.extra_sources {source['type']} source is missing {missing}")
+    except ValueError as e:
+        if str(e).startswith("filters.extra_sources"):
+            raise
 
 def print_config_summary(config: dict) -> None:
     """
@@ -166,17 +223,25 @@ def print_config_summary(config: dict) -> None:
     """
     print(f"Bot name: {config.get('name', 'unnamed')}")
     print(f"Listener type: {config.get('filters', {}).get('listener_type', 'not configured')}")
+    extra_sources = config.get('filters', {}).get('extra_sources') or []
+    if extra_sources:
+        print(f"Extra token sources: {', '.join(source['type'] for source in extra_sources)}")
+    if config.get('hub', {}).get('enabled'):
+        print(f"Market-data hub: {config['hub'].get('socket_path', 'default socket')}")
     
     trade = config.get('trade', {})
     print("Trade settings:")
     print(f"  - Buy amount: {trade.get('buy_amount', 'not configured')} SOL")
     print(f"  - Buy slippage: {trade.get('buy_slippage', 'not configured') * 100}%")
     print(f"  - Extreme fast mode: {'enabled' if trade.get('extreme_fast_mode') else 'disabled'}")
+    print(f"  - Max positions: {trade.get('max_positions', 1)}")
     
     fees = config.get('priority_fees', {})
     print("Priority fees:")
     if fees.get('enable_dynamic'):
-        print("  - Dynamic fees enabled")
+        print(f"  - Dynamic fees enabled ({fees.get('dynamic_source', 'rpc')}, p{fees.get('percentile', 70)})")
+        if fees.get('enable_fixed'):
+            print(f"  - Fixed fee fallback: {fees.get('fixed_amount', 'not configured')} microlamports")
     elif fees.get('enable_fixed'):
         print(f"  - Fixed fee: {fees.get('fixed_amount', 'not configured')} microlamports")
     
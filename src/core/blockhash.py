@@ -0,0 +1,244 @@
+"""
+Stream-fed recent blockhash cache for Solana transactions.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from time import monotonic
+
+import websockets
+from solders.hash import Hash
+from solders.rpc.responses import GetLatestBlockhashResp
+
+from geyser.connection import create_geyser_channel
+from geyser.generated import geyser_pb2
+from utils import json_codec
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Number of blocks a blockhash stays valid for after the block that produced it
+MAX_PROCESSING_AGE = 150
+
+
+@dataclass(frozen=True)
+class BlockhashSnapshot:
+    """A recent blockhash together with its validity window."""
+
+    blockhash: Hash
+    slot: int
+    block_height: int
+    last_valid_block_height: int
+    received_at: float
+
+    @property
+    def age(self) -> float:
+        """Seconds since the blockhash was received."""
+        return monotonic() - self.received_at
+
+
+class BlockhashCache:
+    """Recent blockhash cache fed by a slot/blockhash stream.
+
+    With Geyser configured, every ``blocks_meta`` update carries the blockhash
+    and block height directly. Otherwise ``slotSubscribe`` notifications drive
+    a getLatestBlockhash refresh every few slots. The current snapshot is
+    replaced atomically, so reads never wait on a lock.
+    """
+
+    def __init__(
+        self,
+        fetch_latest: Callable[[], Awaitable[GetLatestBlockhashResp]],
+        wss_endpoint: str | None = None,
+        geyser_endpoint: str | None = None,
+        geyser_api_token: str | None = None,
+        geyser_auth_type: str = "x-token",
+        refresh_slots: int = 5,
+        poll_interval: float = 5.0,
+    ):
+        """Initialize the blockhash cache.
+
+        Args:
+            fetch_latest: Coroutine returning a getLatestBlockhash response
+            wss_endpoint: WebSocket endpoint used for slotSubscribe
+            geyser_endpoint: Geyser endpoint used for blocks_meta updates
+            geyser_api_token: Geyser API token
+            geyser_auth_type: Geyser authentication type ('x-token' or 'basic')
+            refresh_slots: Slots between getLatestBlockhash refreshes on the
+                           slotSubscribe path
+            poll_interval: Seconds between polls while no stream is available
+        """
+        self.fetch_latest = fetch_latest
+        self.wss_endpoint = wss_endpoint
+        self.geyser_endpoint = geyser_endpoint
+        self.geyser_api_token = geyser_api_token
+        self.geyser_auth_type = (geyser_auth_type or "x-token").lower()
+        self.refresh_slots = refresh_slots
+        self.poll_interval = poll_interval
+
+        self._snapshot: BlockhashSnapshot | None = None
+        self._current_slot = 0
+        self._current_block_height = 0
+        self._refresh_task: asyncio.Task | None = None
+
+    @property
+    def snapshot(self) -> BlockhashSnapshot | None:
+        """The most recent blockhash snapshot, if any."""
+        return self._snapshot
+
+    @property
+    def current_block_height(self) -> int:
+        """Best known current block height.
+
+        On the slot stream path this is an upper bound derived from the slot
+        distance, which errs on the side of treating a hash as older.
+        """
+        snapshot = self._snapshot
+        if snapshot is None:
+            return self._current_block_height
+        estimate = snapshot.block_height + max(0, self._current_slot - snapshot.slot)
+        return max(self._current_block_height, estimate)
+
+    def remaining_blocks(self) -> int:
+        """Blocks left before the cached blockhash expires (0 if none cached)."""
+        snapshot = self._snapshot
+        if snapshot is None:
+            return 0
+        return max(0, snapshot.last_valid_block_height - self.current_block_height)
+
+    def is_near_expiry(self, min_remaining_blocks: int = 20) -> bool:
+        """Check whether the cached blockhash is missing or close to expiring.
+
+        Args:
+            min_remaining_blocks: Minimum number of valid blocks still required
+
+        Returns:
+            True if the hash should not be used for a new transaction
+        """
+        return self.remaining_blocks() < min_remaining_blocks
+
+    def update(
+        self,
+        blockhash: Hash,
+        slot: int,
+        block_height: int,
+        last_valid_block_height: int | None = None,
+    ) -> None:
+        """Replace the cached blockhash if the new one is more recent.
+
+        Args:
+            blockhash: Recent blockhash
+            slot: Slot that produced the blockhash
+            block_height: Block height that produced the blockhash
+            last_valid_block_height: Last block height the hash is valid for
+        """
+        current = self._snapshot
+        if current is not None and block_height <= current.block_height:
+            return
+        self._current_slot = max(self._current_slot, slot)
+        self._current_block_height = max(self._current_block_height, block_height)
+        self._snapshot = BlockhashSnapshot(
+            blockhash=blockhash,
+            slot=slot,
+            block_height=block_height,
+            last_valid_block_height=(
+                last_valid_block_height
+                if last_valid_block_height is not None
+                else block_height + MAX_PROCESSING_AGE
+            ),
+            received_at=monotonic(),
+        )
+
+    async def refresh(self) -> BlockhashSnapshot:
+        """Fetch the latest blockhash over RPC and cache it.
+
+        Returns:
+            The refreshed snapshot
+        """
+        response = await self.fetch_latest()
+        last_valid = response.value.last_valid_block_height
+        self.update(
+            response.value.blockhash,
+            response.context.slot,
+            last_valid - MAX_PROCESSING_AGE,
+            last_valid,
+        )
+        return self._snapshot
+
+    async def run(self) -> None:
+        """Keep the cache current until cancelled."""
+        while True:
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.warning(f"Blockhash fetch failed: {e!s}")
+
+            try:
+                if self.geyser_endpoint and self.geyser_api_token:
+                    await self._stream_geyser()
+                elif self.wss_endpoint:
+                    await self._stream_slots()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Blockhash stream failed: {e!s}")
+
+            # No stream or stream lost: fall back to polling until the next attempt
+            await asyncio.sleep(self.poll_interval)
+
+    async def _stream_geyser(self) -> None:
+        """Feed the cache from Geyser blocks_meta updates."""
+        stub, channel = create_geyser_channel(
+            self.geyser_endpoint, self.geyser_api_token, self.geyser_auth_type
+        )
+        request = geyser_pb2.SubscribeRequest()
+        request.blocks_meta["blockhash"].SetInParent()
+        request.commitment = geyser_pb2.CommitmentLevel.CONFIRMED
+        try:
+            logger.info("Blockhash cache following Geyser blocks_meta")
+            async for update in stub.Subscribe(iter([request])):
+                if not update.HasField("block_meta"):
+                    continue
+                meta = update.block_meta
+                if not meta.HasField("block_height"):
+                    continue
+                self.update(
+                    Hash.from_string(meta.blockhash),
+                    meta.slot,
+                    meta.block_height.block_height,
+                )
+        finally:
+            await channel.close()
+
+    async def _stream_slots(self) -> None:
+        """Refresh the cache every few slots from slotSubscribe notifications."""
+        async with websockets.connect(self.wss_endpoint) as websocket:
+            await websocket.send(
+                json_codec.dumps(
+                    {"jsonrpc": "2.0", "id": 1, "method": "slotSubscribe"}
+                )
+            )
+            logger.info("Blockhash cache following slotSubscribe")
+            async for message in websocket:
+                data = json_codec.loads(message)
+                if data.get("method") != "slotNotification":
+                    continue
+                self._current_slot = max(
+                    self._current_slot, data["params"]["result"]["slot"]
+                )
+
+                snapshot = self._snapshot
+                stale = (
+                    snapshot is None
+                    or self._current_slot - snapshot.slot >= self.refresh_slots
+                )
+                if stale and (self._refresh_task is None or self._refresh_task.done()):
+                    self._refresh_task = asyncio.create_task(self._refresh_quietly())
+
+    async def _refresh_quietly(self) -> None:
+        """Refresh in the background, logging instead of raising."""
+        try:
+            await self.refresh()
+        except Exception as e:
+            logger.warning(f"Blockhash fetch failed: {e!s}")
@@ -3,12 +3,15 @@ Solana client abstraction for blockchain operations.
 """
 
 import asyncio
+import base64
 import json
+from functools import partial
 from typing import Any
 
 import aiohttp
 from solana.rpc.async_api import AsyncClient
 from solana.rpc.commitment import Processed
+from solana.rpc.core import RPCException
 from solana.rpc.types import TxOpts
 from solders.compute_budget import set_compute_unit_limit, set_compute_unit_price
 from solders.hash import Hash
@@ -16,46 +19,181 @@ from solders.instruction import Instruction
 from solders.keypair import Keypair
 from solders.message import Message
 from solders.pubkey import Pubkey
+from solders.rpc.responses import (
+    GetAccountInfoResp,
+    GetLatestBlockhashResp,
+    GetMultipleAccountsResp,
+    GetTokenAccountBalanceResp,
+)
 from solders.transaction import Transaction
 
+from core.blockhash import BlockhashCache
+from core.compute_units import DEFAULT_COMPUTE_UNIT_LIMIT, ComputeUnitProfiler
+from core.confirmation import SignatureConfirmer
+from core.hedging import HedgedReader
+from core.rate_limiter import RequestPriority, get_scheduler
+from core.rpc_batch import RpcBatcher
+from core.sender import TransactionSender
+from utils import json_codec
 from utils.logger import get_logger
+from utils.tracing import TokenTrace
 
 logger = get_logger(__name__)
 
+# Maximum number of keys accepted by a single getMultipleAccounts request
+MAX_MULTIPLE_ACCOUNTS = 100
+
 
 class SolanaClient:
     """Abstraction for Solana RPC client operations."""
 
-    def __init__(self, rpc_endpoint: str):
+    def __init__(
+        self,
+        rpc_endpoint: str,
+        wss_endpoint: str | None = None,
+        max_connections: int = 100,
+        max_connections_per_host: int = 0,
+        keepalive_timeout: float = 75.0,
+        dns_cache_ttl: int = 300,
+        enable_batching: bool = True,
+        batch_window: float = 0.0,
+        max_batch_size: int = 100,
+        send_endpoints: list[str] | None = None,
+        geyser_endpoint: str | None = None,
+        geyser_api_token: str | None = None,
+        geyser_auth_type: str = "x-token",
+        min_blockhash_remaining_blocks: int = 20,
+        max_rps: float | None = None,
+        hedge_endpoints: list[str] | None = None,
+        stream_blockhash: bool = True,
+        compute_unit_profile: str | None = None,
+        compute_unit_headroom: float = 0.15,
+        autosize_compute_units: bool = True,
+        compute_unit_resample_interval: float = 600.0,
+        compute_unit_profile_max_age: float = 86_400.0,
+    ):
         """Initialize Solana client with RPC endpoint.
 
         Args:
             rpc_endpoint: URL of the Solana RPC endpoint
+            wss_endpoint: URL of the Solana WebSocket endpoint, used for
+                          signatureSubscribe confirmations when set
+            max_connections: Total connection limit of the pooled HTTP session
+            max_connections_per_host: Per-host connection limit (0 = unlimited)
+            keepalive_timeout: Seconds an idle pooled connection is kept open
+            dns_cache_ttl: Seconds resolved DNS entries are cached
+            enable_batching: Coalesce concurrent reads into JSON-RPC batches
+            batch_window: Seconds to collect reads before sending a batch
+                          (0 = only coalesce reads issued in the same loop iteration)
+            max_batch_size: Maximum number of requests per batch
+            send_endpoints: Extra RPC/sender endpoints that every signed
+                            transaction is fanned out to, next to rpc_endpoint
+            geyser_endpoint: Geyser endpoint feeding the blockhash cache from
+                             blocks_meta (slotSubscribe on wss_endpoint otherwise)
+            geyser_api_token: Geyser API token
+            geyser_auth_type: Geyser authentication type ('x-token' or 'basic')
+            min_blockhash_remaining_blocks: Refresh the cached blockhash before
+                                            sending when fewer blocks remain valid
+            max_rps: Maximum requests per second to rpc_endpoint, shared by all
+                     clients of the endpoint in this process (None = unlimited)
+            hedge_endpoints: Secondary endpoints that hedged reads are repeated
+                             on when rpc_endpoint is slower than its rolling p90
+            stream_blockhash: Keep the blockhash cache current from a stream.
+                              When False the cache is fed externally (by the
+                              market-data hub) and only refreshed over RPC
+                              when it runs close to expiry
+            compute_unit_profile: JSON file compute unit profiles are kept in
+            compute_unit_headroom: Fraction added to the most compute units a
+                                   transaction shape consumed in simulation
+            autosize_compute_units: Size compute unit limits per transaction
+                                    shape from simulations (False = 72,000)
+            compute_unit_resample_interval: Seconds between simulations of a
+                                            shape once its limit is settled
+            compute_unit_profile_max_age: Seconds after which saved compute
+                                          unit profiles are not loaded
         """
         self.rpc_endpoint = rpc_endpoint
+        self.wss_endpoint = wss_endpoint
         self._client = None
-        self._cached_blockhash: Hash | None = None
-        self._blockhash_lock = asyncio.Lock()
-        self._blockhash_updater_task = asyncio.create_task(self.start_blockhash_updater())
+        self._session: aiohttp.ClientSession | None = None
+        self.max_connections = max_connections
+        self.max_connections_per_host = max_connections_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.dns_cache_ttl = dns_cache_ttl
+        self._scheduler = get_scheduler(rpc_endpoint, max_rps) if max_rps else None
+        self._batcher = (
+            RpcBatcher(self._post_batch, batch_window, max_batch_size)
+            if enable_batching
+            else None
+        )
+        self._confirmer = (
+            SignatureConfirmer(
+                wss_endpoint, partial(self.post_rpc, priority=RequestPriority.TRADE)
+            )
+            if wss_endpoint
+            else None
+        )
+        self._sender = (
+            TransactionSender([rpc_endpoint, *send_endpoints], self.get_session)
+            if send_endpoints
+            else None
+        )
+        self._hedger = (
+            HedgedReader([rpc_endpoint, *hedge_endpoints], self.get_session)
+            if hedge_endpoints
+            else None
+        )
+        self._blockhash_cache = BlockhashCache(
+            self._fetch_latest_blockhash,
+            wss_endpoint=wss_endpoint,
+            geyser_endpoint=geyser_endpoint,
+            geyser_api_token=geyser_api_token,
+            geyser_auth_type=geyser_auth_type,
+        )
+        self.min_blockhash_remaining_blocks = min_blockhash_remaining_blocks
+        self._blockhash_updater_task = (
+            asyncio.create_task(self._blockhash_cache.run()) if stream_blockhash else None
+        )
+        self.compute_units = ComputeUnitProfiler(
+            self.simulate_transaction,
+            headroom=compute_unit_headroom,
+            path=compute_unit_profile,
+            enabled=autosize_compute_units,
+            resample_interval=compute_unit_resample_interval,
+            max_age=compute_unit_profile_max_age,
+        )
+        if self._confirmer:
+            # Sampled transactions that run out of compute units raise their limit
+            self._confirmer.on_failure = self.compute_units.transaction_failed
+
+    @property
+    def blockhash_cache(self) -> BlockhashCache:
+        """Stream-fed cache of the most recent blockhash."""
+        return self._blockhash_cache
+
+    async def get_cached_blockhash(self) -> Hash:
+        """Return the most recently cached blockhash.
 
-    async def start_blockhash_updater(self, interval: float = 5.0):
-        """Start background task to update recent blockhash."""
-        while True:
+        A missing or near-expired hash is refreshed over RPC first, so
+        transactions are never signed with a hash that is about to be dropped.
+
+        Raises:
+            RuntimeError: If no usable blockhash is available
+        """
+        cache = self._blockhash_cache
+        if cache.is_near_expiry(self.min_blockhash_remaining_blocks):
+            logger.info(
+                f"Cached blockhash has {cache.remaining_blocks()} valid blocks left, refreshing"
+            )
             try:
-                blockhash = await self.get_latest_blockhash()
-                async with self._blockhash_lock:
-                    self._cached_blockhash = blockhash
+                await cache.refresh()
             except Exception as e:
-                logger.warning(f"Blockhash fetch failed: {e!s}")
-            finally:
-                await asyncio.sleep(interval)
+                raise RuntimeError(f"No usable blockhash available: {e!s}") from e
 
-    async def get_cached_blockhash(self) -> Hash:
-        """Return the most recently cached blockhash."""
-        async with self._blockhash_lock:
-            if self._cached_blockhash is None:
-                raise RuntimeError("No cached blockhash available yet")
-            return self._cached_blockhash
+        snapshot = cache.snapshot
+        if snapshot is None:
+            raise RuntimeError("No cached blockhash available yet")
+        return snapshot.blockhash
 
     async def get_client(self) -> AsyncClient:
         """Get or create the AsyncClient instance.
@@ -67,8 +205,37 @@ class SolanaClient:
             self._client = AsyncClient(self.rpc_endpoint)
         return self._client
 
+    async def get_session(self) -> aiohttp.ClientSession:
+        """Get or create the pooled HTTP session used for raw RPC calls.
+
+        The session keeps connections alive between requests, so repeated
+        calls reuse an established TCP+TLS connection instead of opening one.
+
+        Returns:
+            aiohttp.ClientSession instance
+        """
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_connections,
+                limit_per_host=self.max_connections_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+                ttl_dns_cache=self.dns_cache_ttl,
+                use_dns_cache=True,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(10),  # 10-second timeout
+                json_serialize=json_codec.dumps,
+            )
+        return self._session
+
+    def start(self) -> None:
+        """Open the confirmation websocket ahead of the first transaction."""
+        if self._confirmer:
+            self._confirmer.start()
+
     async def close(self):
-        """Close the client connection and stop the blockhash updater."""
+        """Close the client connections and stop the blockhash updater."""
         if self._blockhash_updater_task:
             self._blockhash_updater_task.cancel()
             try:
@@ -76,10 +243,51 @@ class SolanaClient:
             except asyncio.CancelledError:
                 pass
 
+        if self._confirmer:
+            await self._confirmer.close()
+
+        if self._sender:
+            for stats in self._sender.get_stats():
+                logger.info(f"Send endpoint stats: {stats}")
+            await self._sender.close()
+
+        if self._hedger:
+            for stats in self._hedger.get_stats():
+                logger.info(f"Hedged read endpoint stats: {stats}")
+            await self._hedger.close()
+
+        if self._batcher:
+            self._batcher.close()
+
+        if self._scheduler:
+            logger.info(f"RPC scheduler metrics: {self._scheduler.get_metrics()}")
+
         if self._client:
             await self._client.close()
             self._client = None
 
+        if self._session:
+            await self._session.close()
+            self._session = None
+
+    async def _throttle(self, priority: RequestPriority, cost: int = 1) -> None:
+        """Wait for the rate limiter to admit a request.
+
+        Args:
+            priority: Scheduling class of the request
+            cost: Calls the request carries (providers count each batch entry)
+        """
+        if self._scheduler:
+            await self._scheduler.acquire(priority, cost)
+
+    def get_scheduler_metrics(self) -> dict[str, Any] | None:
+        """Get queue depth and wait-time metrics of the rate limiter.
+
+        Returns:
+            Scheduler metrics, or None if rate limiting is disabled
+        """
+        return self._scheduler.get_metrics() if self._scheduler else None
+
     async def get_health(self) -> str | None:
         body = {
             "jsonrpc": "2.0",
@@ -91,11 +299,26 @@ class SolanaClient:
             return result["result"]
         return None
 
-    async def get_account_info(self, pubkey: Pubkey) -> dict[str, Any]:
+    def get_hedging_stats(self) -> list[dict[str, Any]] | None:
+        """Get per-endpoint statistics of hedged reads.
+
+        Returns:
+            Per-endpoint statistics, or None if hedging is disabled
+        """
+        return self._hedger.get_stats() if self._hedger else None
+
+    async def get_account_info(
+        self,
+        pubkey: Pubkey,
+        priority: RequestPriority = RequestPriority.NORMAL,
+        hedged: bool = False,
+    ) -> dict[str, Any]:
         """Get account info from the blockchain.
 
         Args:
             pubkey: Public key of the account
+            priority: Scheduling class of the request
+            hedged: Hedge the read to a secondary endpoint if the primary is slow
 
         Returns:
             Account info response
@@ -103,23 +326,101 @@ class SolanaClient:
         Raises:
             ValueError: If account doesn't exist or has no data
         """
-        client = await self.get_client()
-        response = await client.get_account_info(pubkey, encoding="base64") # base64 encoding for account data by default
+        params = [str(pubkey), {"encoding": "base64", "commitment": "finalized"}]
+        if hedged and self._hedger:
+            raw = await self._hedged_request("getAccountInfo", params, priority)
+            response = GetAccountInfoResp.from_json(json_codec.dumps(raw))
+        elif self._batcher:
+            raw = await self._batched_request("getAccountInfo", params, priority)
+            response = GetAccountInfoResp.from_json(json_codec.dumps(raw))
+        else:
+            client = await self.get_client()
+            await self._throttle(priority)
+            response = await client.get_account_info(pubkey, encoding="base64") # base64 encoding for account data by default
         if not response.value:
             raise ValueError(f"Account {pubkey} not found")
         return response.value
 
-    async def get_token_account_balance(self, token_account: Pubkey) -> int:
+    async def get_multiple_accounts(
+        self,
+        pubkeys: list[Pubkey],
+        priority: RequestPriority = RequestPriority.NORMAL,
+    ) -> list[Any | None]:
+        """Get several accounts with getMultipleAccounts.
+
+        Keys are split into requests of at most MAX_MULTIPLE_ACCOUNTS keys that
+        are sent concurrently, so with batching enabled they share one round trip.
+
+        Args:
+            pubkeys: Public keys of the accounts
+            priority: Scheduling class of the requests
+
+        Returns:
+            Accounts in the order of pubkeys, None for accounts that don't exist
+        """
+        chunks = [
+            pubkeys[i : i + MAX_MULTIPLE_ACCOUNTS]
+            for i in range(0, len(pubkeys), MAX_MULTIPLE_ACCOUNTS)
+        ]
+        responses = await asyncio.gather(
+            *(self._get_multiple_accounts_chunk(chunk, priority) for chunk in chunks)
+        )
+        return [account for response in responses for account in response.value]
+
+    async def _get_multiple_accounts_chunk(
+        self, pubkeys: list[Pubkey], priority: RequestPriority
+    ) -> GetMultipleAccountsResp:
+        """Send one getMultipleAccounts request.
+
+        Args:
+            pubkeys: At most MAX_MULTIPLE_ACCOUNTS public keys
+            priority: Scheduling class of the request
+
+        Returns:
+            getMultipleAccounts response
+        """
+        if self._batcher:
+            raw = await self._batched_request(
+                "getMultipleAccounts",
+                [
+                    [str(pubkey) for pubkey in pubkeys],
+                    {"encoding": "base64", "commitment": "finalized"},
+                ],
+                priority,
+            )
+            return GetMultipleAccountsResp.from_json(json_codec.dumps(raw))
+
+        client = await self.get_client()
+        await self._throttle(priority)
+        return await client.get_multiple_accounts(pubkeys, encoding="base64")
+
+    async def get_token_account_balance(
+        self,
+        token_account: Pubkey,
+        priority: RequestPriority = RequestPriority.NORMAL,
+        hedged: bool = False,
+    ) -> int:
         """Get token balance for an account.
 
         Args:
             token_account: Token account address
+            priority: Scheduling class of the request
+            hedged: Hedge the read to a secondary endpoint if the primary is slow
 
         Returns:
             Token balance as integer
         """
-        client = await self.get_client()
-        response = await client.get_token_account_balance(token_account)
+        params = [str(token_account), {"commitment": "finalized"}]
+        if hedged and self._hedger:
+            raw = await self._hedged_request("getTokenAccountBalance", params, priority)
+            response = GetTokenAccountBalanceResp.from_json(json_codec.dumps(raw))
+        elif self._batcher:
+            raw = await self._batched_request("getTokenAccountBalance", params, priority)
+            response = GetTokenAccountBalanceResp.from_json(json_codec.dumps(raw))
+        else:
+            client = await self.get_client()
+            await self._throttle(priority)
+            response = await client.get_token_account_balance(token_account)
         if response.value:
             return int(response.value.amount)
         return 0
@@ -131,9 +432,20 @@ class SolanaClient:
             Recent blockhash as string
         """
         client = await self.get_client()
+        await self._throttle(RequestPriority.TRADE)
         response = await client.get_latest_blockhash(commitment="processed")
         return response.value.blockhash
 
+    async def _fetch_latest_blockhash(self) -> GetLatestBlockhashResp:
+        """Fetch the latest blockhash with its validity window.
+
+        Returns:
+            getLatestBlockhash response
+        """
+        client = await self.get_client()
+        await self._throttle(RequestPriority.TRADE)
+        return await client.get_latest_blockhash(commitment="processed")
+
     async def build_and_send_transaction(
         self,
         instructions: list[Instruction],
@@ -141,6 +453,9 @@ class SolanaClient:
         skip_preflight: bool = True,
         max_retries: int = 3,
         priority_fee: int | None = None,
+        priority: RequestPriority = RequestPriority.TRADE,
+        trace: TokenTrace | None = None,
+        compute_unit_shape: str | None = None,
     ) -> str:
         """
         Send a transaction with optional priority fee.
@@ -150,20 +465,27 @@ class SolanaClient:
             skip_preflight: Whether to skip preflight checks.
             max_retries: Maximum number of retry attempts.
             priority_fee: Optional priority fee in microlamports.
+            priority: Scheduling class of the send request.
+            trace: Latency trace marked when the transaction is built and sent.
+            compute_unit_shape: Transaction shape the compute unit limit is
+                                profiled and sized for (None = default limit).
 
         Returns:
             Transaction signature.
         """
-        client = await self.get_client()
-
         logger.info(
             f"Priority fee in microlamports: {priority_fee if priority_fee else 0}"
         )
 
         # Add priority fee instructions if applicable
         if priority_fee is not None:
+            compute_unit_limit = (
+                self.compute_units.get_limit(compute_unit_shape)
+                if compute_unit_shape
+                else DEFAULT_COMPUTE_UNIT_LIMIT
+            )
             fee_instructions = [
-                set_compute_unit_limit(72_000),  # Default compute unit limit
+                set_compute_unit_limit(compute_unit_limit),
                 set_compute_unit_price(priority_fee),
             ]
             instructions = fee_instructions + instructions
@@ -171,14 +493,52 @@ class SolanaClient:
         recent_blockhash = await self.get_cached_blockhash()
         message = Message(instructions, signer_keypair.pubkey())
         transaction = Transaction([signer_keypair], message, recent_blockhash)
+        if trace:
+            trace.mark("build")
+        if compute_unit_shape:
+            self.compute_units.sample(compute_unit_shape, bytes(transaction))
+
+        return await self.send_raw_transaction(
+            bytes(transaction), skip_preflight, max_retries, priority, trace
+        )
+
+    async def send_raw_transaction(
+        self,
+        transaction: bytes,
+        skip_preflight: bool = True,
+        max_retries: int = 3,
+        priority: RequestPriority = RequestPriority.TRADE,
+        trace: TokenTrace | None = None,
+    ) -> str:
+        """
+        Send an already signed and serialized transaction.
+
+        Args:
+            transaction: Serialized signed transaction.
+            skip_preflight: Whether to skip preflight checks.
+            max_retries: Maximum number of retry attempts.
+            priority: Scheduling class of the send request.
+            trace: Latency trace marked once the transaction is accepted.
+
+        Returns:
+            Transaction signature.
+        """
+        client = await self.get_client()
 
         for attempt in range(max_retries):
             try:
-                tx_opts = TxOpts(
-                    skip_preflight=skip_preflight, preflight_commitment=Processed
-                )
-                response = await client.send_transaction(transaction, tx_opts)
-                return response.value
+                await self._throttle(priority)
+                if self._sender:
+                    signature = await self._sender.send(transaction, skip_preflight)
+                else:
+                    tx_opts = TxOpts(
+                        skip_preflight=skip_preflight, preflight_commitment=Processed
+                    )
+                    response = await client.send_raw_transaction(transaction, tx_opts)
+                    signature = response.value
+                if trace:
+                    trace.mark("send")
+                return signature
 
             except Exception as e:
                 if attempt == max_retries - 1:
@@ -193,48 +553,164 @@ class SolanaClient:
                 )
                 await asyncio.sleep(wait_time)
 
+    async def simulate_transaction(self, transaction: bytes) -> dict[str, Any] | None:
+        """
+        Simulate a signed transaction against the latest blockhash.
+
+        Args:
+            transaction: Serialized signed transaction.
+
+        Returns:
+            simulateTransaction result value with err, logs and unitsConsumed,
+            or None if the request fails.
+        """
+        body = {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "simulateTransaction",
+            "params": [
+                base64.b64encode(transaction).decode(),
+                {
+                    "encoding": "base64",
+                    "sigVerify": False,
+                    "replaceRecentBlockhash": True,
+                    "commitment": "processed",
+                },
+            ],
+        }
+        response = await self.post_rpc(body, RequestPriority.BACKGROUND)
+        if not response or "result" not in response:
+            return None
+        return response["result"]["value"]
+
     async def confirm_transaction(
-        self, signature: str, commitment: str = "confirmed"
+        self,
+        signature: str,
+        commitment: str = "confirmed",
+        trace: TokenTrace | None = None,
     ) -> bool:
         """Wait for transaction confirmation.
 
         Args:
             signature: Transaction signature
             commitment: Confirmation commitment level
+            trace: Latency trace marked when the wait ends
 
         Returns:
             Whether transaction was confirmed
         """
+        if self._confirmer:
+            confirmed = await self._confirmer.confirm(str(signature), commitment)
+        else:
+            confirmed = await self._confirm_with_client(signature, commitment)
+        if trace:
+            trace.mark("confirm")
+        return confirmed
+
+    async def _confirm_with_client(self, signature: str, commitment: str) -> bool:
+        """Wait for confirmation through the solana-py client."""
         client = await self.get_client()
         try:
+            await self._throttle(RequestPriority.TRADE)
             await client.confirm_transaction(signature, commitment=commitment, sleep_seconds=1)
             return True
         except Exception as e:
             logger.error(f"Failed to confirm transaction {signature}: {e!s}")
             return False
 
-    async def post_rpc(self, body: dict[str, Any]) -> dict[str, Any] | None:
+    async def post_rpc(
+        self,
+        body: dict[str, Any],
+        priority: RequestPriority = RequestPriority.NORMAL,
+    ) -> dict[str, Any] | None:
         """
         Send a raw RPC request to the Solana node.
 
         Args:
             body: JSON-RPC request body.
+            priority: Scheduling class of the request.
 
         Returns:
             Optional[Dict[str, Any]]: Parsed JSON response, or None if the request fails.
         """
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    self.rpc_endpoint,
-                    json=body,
-                    timeout=aiohttp.ClientTimeout(10),  # 10-second timeout
-                ) as response:
-                    response.raise_for_status()
-                    return await response.json()
+            if self._batcher:
+                response = await self._batcher.request(
+                    body["method"], body.get("params"), priority
+                )
+                return {**response, "id": body.get("id")}
+
+            await self._throttle(priority)
+            session = await self.get_session()
+            async with session.post(self.rpc_endpoint, json=body) as response:
+                response.raise_for_status()
+                return await response.json(loads=json_codec.loads)
         except aiohttp.ClientError as e:
             logger.error(f"RPC request failed: {e!s}", exc_info=True)
             return None
         except json.JSONDecodeError as e:
             logger.error(f"Failed to decode RPC response: {e!s}", exc_info=True)
             return None
+
+    async def _batched_request(
+        self,
+        method: str,
+        params: list[Any] | None = None,
+        priority: RequestPriority = RequestPriority.NORMAL,
+    ) -> dict[str, Any]:
+        """Send a request through the batcher and unwrap JSON-RPC errors.
+
+        Args:
+            method: JSON-RPC method name
+            params: JSON-RPC params
+            priority: Scheduling class of the request
+
+        Returns:
+            JSON-RPC response object
+
+        Raises:
+            RPCException: If the node returned an error for this request
+        """
+        response = await self._batcher.request(method, params, priority)
+        if "error" in response:
+            raise RPCException(response["error"])
+        return response
+
+    async def _hedged_request(
+        self,
+        method: str,
+        params: list[Any],
+        priority: RequestPriority = RequestPriority.NORMAL,
+    ) -> dict[str, Any]:
+        """Send a read through the hedged reader.
+
+        Args:
+            method: JSON-RPC method name
+            params: JSON-RPC params
+            priority: Scheduling class of the request
+
+        Returns:
+            JSON-RPC response object
+        """
+        await self._throttle(priority)
+        return await self._hedger.request(method, params)
+
+    async def _post_batch(
+        self, bodies: list[dict[str, Any]], priority: RequestPriority
+    ) -> list[dict[str, Any]]:
+        """Post a list of request bodies as one JSON-RPC batch.
+
+        Args:
+            bodies: JSON-RPC request bodies
+            priority: Most urgent scheduling class among the requests
+
+        Returns:
+            List of JSON-RPC responses
+        """
+        payload = bodies if len(bodies) > 1 else bodies[0]
+        await self._throttle(priority, len(bodies))
+        session = await self.get_session()
+        async with session.post(self.rpc_endpoint, json=payload) as response:
+            response.raise_for_status()
+            result = await response.json(loads=json_codec.loads)
+        return result if isinstance(result, list) else [result]
@@ -0,0 +1,272 @@
+"""
+Compute unit limits sized from simulation profiles per transaction shape.
+"""
+
+import asyncio
+import math
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import Any
+
+from solders.signature import Signature
+
+from core.pubkeys import SystemAddresses
+from utils import json_codec
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Compute unit limit used for transactions with a priority fee until their
+# shape has been profiled
+DEFAULT_COMPUTE_UNIT_LIMIT = 72_000
+
+# Highest compute unit limit a transaction may request
+MAX_COMPUTE_UNIT_LIMIT = 1_400_000
+
+# Format version of saved profiles; files of another version are not loaded
+PROFILE_VERSION = 1
+
+# Recently sampled transactions whose landing errors are checked
+MAX_WATCHED_SIGNATURES = 1_024
+
+# Transaction shapes
+BUY_CREATE_ATA = "buy_create_ata"  # buy that creates the token account
+BUY = "buy"  # buy into an existing token account
+SELL = "sell"
+CLOSE = "close"  # close an empty token account
+BURN_CLOSE = "burn_close"  # burn the remaining tokens and close the account
+SHAPES = (BUY_CREATE_ATA, BUY, SELL, CLOSE, BURN_CLOSE)
+
+# The idempotent token account creation only calls the system program when
+# the account does not exist yet
+_CREATE_ACCOUNT_LOG = f"Program {SystemAddresses.PROGRAM} invoke"
+
+_BUDGET_EXCEEDED = "ComputationalBudgetExceeded"
+
+
+class ComputeUnitProfiler:
+    """Per-shape compute unit limits learned from transaction simulations.
+
+    Transactions of each shape are simulated in the background, off the
+    send path, until `samples` simulations succeeded, and the limit of the
+    shape becomes the most units the last `samples` of them consumed plus
+    `headroom`. Simulations that fail, e.g. because their transaction
+    landed first, and buys re-classified into the other buy shape do not
+    use up a sample. Settled shapes are simulated again every
+    `resample_interval` seconds, and a shape whose simulation or landed
+    transaction ran out of compute units has its limit doubled; the raised
+    limit stays the shape's floor for the session. Learned profiles are
+    saved to `path` and loaded on start if they are younger than
+    `max_age`, so later sessions start sized.
+    """
+
+    def __init__(
+        self,
+        simulate: Callable[[bytes], Awaitable[dict[str, Any] | None]],
+        headroom: float = 0.15,
+        samples: int = 5,
+        path: str | Path | None = None,
+        enabled: bool = True,
+        resample_interval: float = 600.0,
+        max_age: float = 86_400.0,
+    ):
+        """Initialize the profiler.
+
+        Args:
+            simulate: Simulates a serialized transaction and returns the
+                      simulateTransaction result value
+            headroom: Fraction added on top of the most units consumed
+            samples: Successful simulations per shape before its limit is settled
+            path: JSON file the profiles are loaded from and saved to
+            enabled: Size limits from profiles (False = always the default limit)
+            resample_interval: Seconds between simulations of a settled shape
+            max_age: Seconds after which saved profiles are no longer loaded
+        """
+        self._simulate = simulate
+        self.headroom = headroom
+        self.samples = samples
+        self.path = Path(path) if path else None
+        self.enabled = enabled
+        self.resample_interval = resample_interval
+        self.max_age = max_age
+
+        self._units: dict[str, list[int]] = {shape: [] for shape in SHAPES}
+        self._limits: dict[str, int] = {}
+        # Limits raised after running out of compute units, kept as minimums
+        self._floors: dict[str, int] = {}
+        # Simulations in flight per shape, and when the last one started
+        self._pending: dict[str, int] = dict.fromkeys(SHAPES, 0)
+        self._sampled_at: dict[str, float] = dict.fromkeys(SHAPES, 0.0)
+        # Shapes of recently sampled transactions, by signature bytes
+        self._watched: OrderedDict[bytes, str] = OrderedDict()
+        self._tasks: set[asyncio.Task] = set()
+        if self.path and self.path.exists():
+            self._load()
+
+    def get_limit(self, shape: str) -> int:
+        """Get the compute unit limit of a transaction shape.
+
+        Args:
+            shape: Transaction shape
+
+        Returns:
+            Profiled limit with headroom, or the default limit if the shape
+            has not been profiled
+        """
+        if not self.enabled:
+            return DEFAULT_COMPUTE_UNIT_LIMIT
+        return self._limits.get(shape, DEFAULT_COMPUTE_UNIT_LIMIT)
+
+    def record(self, shape: str, units: int) -> None:
+        """Add the units a transaction of a shape consumed to its profile.
+
+        Args:
+            shape: Transaction shape
+            units: Compute units consumed
+        """
+        profile = self._units[shape]
+        profile.append(units)
+        del profile[: -self.samples]
+        self._update_limit(shape)
+        logger.info(
+            f"Compute unit limit for {shape}: {self._limits[shape]} "
+            f"(max {max(profile)} consumed over {len(profile)} simulation(s))"
+        )
+        if self.path:
+            self._save()
+
+    def _update_limit(self, shape: str) -> None:
+        """Size the limit of a shape from its profile, rounded up to 1,000 units."""
+        limit = math.ceil(max(self._units[shape]) * (1 + self.headroom) / 1_000) * 1_000
+        limit = max(limit, self._floors.get(shape, 0))
+        self._limits[shape] = min(MAX_COMPUTE_UNIT_LIMIT, limit)
+
+    def raise_limit(self, shape: str) -> None:
+        """Double the limit of a shape that ran out of compute units.
+
+        Args:
+            shape: Transaction shape
+        """
+        if not self.enabled:
+            return
+        limit = min(MAX_COMPUTE_UNIT_LIMIT, self.get_limit(shape) * 2)
+        logger.warning(f"{shape} ran out of compute units, raising its limit to {limit}")
+        self._floors[shape] = limit
+        self._limits[shape] = limit
+        self._sampled_at[shape] = 0.0
+
+    def transaction_failed(self, signature: str, error: Any) -> None:
+        """Raise the limit of a sampled transaction's shape if it ran out of units.
+
+        Args:
+            signature: Signature of a transaction that landed with an error
+            error: Transaction error
+        """
+        shape = self._watched.pop(bytes(Signature.from_string(signature)), None)
+        if shape and _BUDGET_EXCEEDED in str(error):
+            self.raise_limit(shape)
+
+    def sample(self, shape: str, transaction: bytes) -> None:
+        """Simulate a transaction in the background if its shape needs samples.
+
+        The transaction is also watched, so a landing error from running out
+        of compute units raises the limit of its shape.
+
+        Args:
+            shape: Transaction shape; buys are re-classified from the
+                   simulation logs into BUY_CREATE_ATA or BUY
+            transaction: Serialized signed transaction
+        """
+        if not self.enabled:
+            return
+        # The first signature follows the one-byte signature count
+        self._watched[transaction[1:65]] = shape
+        if len(self._watched) > MAX_WATCHED_SIGNATURES:
+            self._watched.popitem(last=False)
+
+        if len(self._units[shape]) + self._pending[shape] >= self.samples and (
+            self._pending[shape]
+            or time.monotonic() - self._sampled_at[shape] < self.resample_interval
+        ):
+            return
+        self._pending[shape] += 1
+        self._sampled_at[shape] = time.monotonic()
+        task = asyncio.create_task(self._profile(shape, transaction))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _profile(self, shape: str, transaction: bytes) -> None:
+        """Simulate a transaction and record the units it consumed."""
+        try:
+            value = await self._simulate(transaction)
+        except Exception as e:
+            logger.debug(f"Compute unit simulation failed for {shape}: {e!s}")
+            return
+        finally:
+            self._pending[shape] -= 1
+
+        if not value or value.get("unitsConsumed") is None:
+            return
+        if value.get("err") is not None:
+            if _BUDGET_EXCEEDED in str(value["err"]):
+                self.raise_limit(shape)
+            else:
+                logger.debug(f"Compute unit simulation of {shape} failed: {value['err']}")
+            return
+        if shape in (BUY_CREATE_ATA, BUY):
+            created = any(
+                log.startswith(_CREATE_ACCOUNT_LOG) for log in value.get("logs") or []
+            )
+            shape = BUY_CREATE_ATA if created else BUY
+        self.record(shape, value["unitsConsumed"])
+
+    def get_stats(self) -> dict[str, dict[str, int]]:
+        """Get the limit and sample count of every profiled shape.
+
+        Returns:
+            Mapping of shape to limit, most units consumed and sample count
+        """
+        return {
+            shape: {
+                "limit": self._limits[shape],
+                "max_units": max(units),
+                "samples": len(units),
+            }
+            for shape, units in self._units.items()
+            if units
+        }
+
+    def _load(self) -> None:
+        """Load saved profiles, ignoring unreadable, outdated or expired files."""
+        try:
+            saved = json_codec.loads(self.path.read_bytes())
+        except Exception as e:
+            logger.warning(f"Failed to load compute unit profiles from {self.path}: {e!s}")
+            return
+        if not isinstance(saved, dict) or saved.get("version") != PROFILE_VERSION:
+            logger.info(f"Ignoring compute unit profiles of another version in {self.path}")
+            return
+        age = time.time() - saved.get("saved_at", 0.0)
+        if age > self.max_age:
+            logger.info(f"Ignoring compute unit profiles saved {age:.0f}s ago in {self.path}")
+            return
+        for shape, units in saved.get("profiles", {}).items():
+            if shape in self._units and units:
+                self._units[shape] = list(units)[-self.samples :]
+                self._update_limit(shape)
+        logger.info(f"Loaded compute unit profiles: {self._limits}")
+
+    def _save(self) -> None:
+        """Save the profiles of all shapes."""
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            profiles = {shape: units for shape, units in self._units.items() if units}
+            self.path.write_bytes(
+                json_codec.dumps_bytes(
+                    {"version": PROFILE_VERSION, "saved_at": time.time(), "profiles": profiles}
+                )
+            )
+        except OSError as e:
+            logger.warning(f"Failed to save compute unit profiles to {self.path}: {e!s}")
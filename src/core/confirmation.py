@@ -0,0 +1,351 @@
+"""
+Transaction confirmation over a shared signatureSubscribe websocket.
+"""
+
+import asyncio
+import itertools
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+import websockets
+
+from utils import json_codec
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Ordering of commitment levels, lowest first
+COMMITMENT_RANKS: dict[str, int] = {"processed": 0, "confirmed": 1, "finalized": 2}
+
+# getSignatureStatuses accepts at most 256 signatures per call
+MAX_STATUS_BATCH = 256
+
+
+@dataclass
+class _PendingSignature:
+    """A signature waiting for confirmation."""
+
+    commitment: str
+    future: asyncio.Future
+    subscription_id: int | None = None
+    request_id: int | None = None
+    waiters: int = field(default=1)
+
+
+class SignatureConfirmer:
+    """Resolves per-signature futures from signatureSubscribe notifications.
+
+    All in-flight signatures are multiplexed over one websocket connection.
+    Signatures that cannot be subscribed (websocket down or subscription cap
+    reached) are confirmed by batched getSignatureStatuses polling, and every
+    pending signature is polled at a slower safety interval so a landing that
+    happened before the subscription was registered is never missed.
+    """
+
+    def __init__(
+        self,
+        wss_endpoint: str,
+        post_rpc: Callable[[dict[str, Any]], Awaitable[dict[str, Any] | None]],
+        poll_interval: float = 0.4,
+        safety_poll_interval: float = 2.0,
+        max_subscriptions: int = 50,
+        timeout: float = 90.0,
+        on_failure: Callable[[str, Any], None] | None = None,
+    ):
+        """Initialize the confirmer.
+
+        Args:
+            wss_endpoint: WebSocket endpoint URL
+            post_rpc: Coroutine used for getSignatureStatuses polling
+            poll_interval: Seconds between polls of unsubscribed signatures
+            safety_poll_interval: Seconds between polls of all pending signatures
+            max_subscriptions: Maximum concurrent signatureSubscribe subscriptions
+            timeout: Default seconds to wait for a confirmation
+            on_failure: Called with the signature and error of every
+                        transaction that landed with an error
+        """
+        self.wss_endpoint = wss_endpoint
+        self.post_rpc = post_rpc
+        self.poll_interval = poll_interval
+        self.safety_poll_interval = safety_poll_interval
+        self.max_subscriptions = max_subscriptions
+        self.timeout = timeout
+        self.on_failure = on_failure
+
+        self._pending: dict[str, _PendingSignature] = {}
+        self._subscriptions: dict[int, str] = {}
+        self._requests: dict[int, str] = {}
+        self._request_ids = itertools.count(1)
+        self._websocket = None
+        self._websocket_task: asyncio.Task | None = None
+        self._poller_task: asyncio.Task | None = None
+        self._wakeup = asyncio.Event()
+
+    async def confirm(
+        self,
+        signature: str,
+        commitment: str = "confirmed",
+        timeout: float | None = None,
+    ) -> bool:
+        """Wait until a signature reaches the requested commitment.
+
+        Args:
+            signature: Transaction signature
+            commitment: Confirmation commitment level
+            timeout: Seconds to wait (defaults to the confirmer timeout)
+
+        Returns:
+            True if the transaction landed without error, False if it failed
+            or was not confirmed in time
+        """
+        self.start()
+
+        pending = self._pending.get(signature)
+        if pending is None:
+            pending = _PendingSignature(
+                commitment, asyncio.get_running_loop().create_future()
+            )
+            self._pending[signature] = pending
+            await self._subscribe(signature, pending)
+            self._wakeup.set()
+        else:
+            pending.waiters += 1
+            if COMMITMENT_RANKS[commitment] > COMMITMENT_RANKS[pending.commitment]:
+                pending.commitment = commitment
+                # The existing subscription would resolve at the lower level
+                await self._unsubscribe(pending)
+                await self._subscribe(signature, pending)
+
+        try:
+            return await asyncio.wait_for(
+                asyncio.shield(pending.future), timeout or self.timeout
+            )
+        except TimeoutError:
+            logger.error(f"Timed out waiting for confirmation of {signature}")
+            return False
+        finally:
+            pending.waiters -= 1
+            if pending.waiters <= 0:
+                await self._forget(signature)
+
+    async def close(self) -> None:
+        """Stop background tasks and fail all pending confirmations."""
+        for task in (self._websocket_task, self._poller_task):
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._websocket_task = None
+        self._poller_task = None
+
+        for pending in self._pending.values():
+            if not pending.future.done():
+                pending.future.set_result(False)
+        self._pending.clear()
+
+    def start(self) -> None:
+        """Start the websocket and polling tasks if they are not running.
+
+        Called ahead of trading so the first confirmation already finds the
+        websocket connected; confirm() also calls it as a fallback.
+        """
+        if self._websocket_task is None or self._websocket_task.done():
+            self._websocket_task = asyncio.create_task(self._run_websocket())
+        if self._poller_task is None or self._poller_task.done():
+            self._poller_task = asyncio.create_task(self._run_poller())
+
+    def _resolve(self, signature: str, error: Any) -> None:
+        """Resolve the future of a pending signature from its landing error."""
+        pending = self._pending.get(signature)
+        if pending is None or pending.future.done():
+            return
+        pending.future.set_result(error is None)
+        if error is not None and self.on_failure:
+            try:
+                self.on_failure(signature, error)
+            except Exception as e:
+                logger.debug(f"Failure callback for {signature} failed: {e!s}")
+
+    async def _forget(self, signature: str) -> None:
+        """Drop a signature and its subscription once nobody waits for it."""
+        pending = self._pending.pop(signature, None)
+        if pending is not None:
+            await self._unsubscribe(pending)
+
+    async def _unsubscribe(self, pending: _PendingSignature) -> None:
+        """Drop the subscription or subscription request of a pending signature."""
+        if pending.request_id is not None:
+            self._requests.pop(pending.request_id, None)
+            pending.request_id = None
+        if pending.subscription_id is None:
+            return
+
+        # The server drops the subscription itself after a notification, which
+        # clears subscription_id, so only signatures resolved otherwise get here
+        subscription_id = pending.subscription_id
+        pending.subscription_id = None
+        self._subscriptions.pop(subscription_id, None)
+        if self._websocket is not None:
+            try:
+                await self._websocket.send(
+                    json_codec.dumps(
+                        {
+                            "jsonrpc": "2.0",
+                            "id": next(self._request_ids),
+                            "method": "signatureUnsubscribe",
+                            "params": [subscription_id],
+                        }
+                    )
+                )
+            except Exception as e:
+                logger.debug(f"signatureUnsubscribe failed: {e!s}")
+
+    async def _subscribe(self, signature: str, pending: _PendingSignature) -> None:
+        """Send signatureSubscribe for a signature if the websocket allows it."""
+        if self._websocket is None:
+            return
+        if len(self._subscriptions) + len(self._requests) >= self.max_subscriptions:
+            return
+
+        request_id = next(self._request_ids)
+        pending.request_id = request_id
+        self._requests[request_id] = signature
+        try:
+            await self._websocket.send(
+                json_codec.dumps(
+                    {
+                        "jsonrpc": "2.0",
+                        "id": request_id,
+                        "method": "signatureSubscribe",
+                        "params": [signature, {"commitment": pending.commitment}],
+                    }
+                )
+            )
+        except Exception as e:
+            logger.debug(f"signatureSubscribe failed for {signature}: {e!s}")
+            self._requests.pop(request_id, None)
+            pending.request_id = None
+
+    async def _run_websocket(self) -> None:
+        """Maintain the shared websocket and dispatch its messages."""
+        while True:
+            try:
+                async with websockets.connect(self.wss_endpoint) as websocket:
+                    self._websocket = websocket
+                    logger.info("Signature confirmation websocket connected")
+                    for signature, pending in list(self._pending.items()):
+                        await self._subscribe(signature, pending)
+
+                    async for message in websocket:
+                        self._handle_message(json_codec.loads(message))
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Signature confirmation websocket error: {e!s}")
+            finally:
+                self._websocket = None
+                self._subscriptions.clear()
+                self._requests.clear()
+                for pending in self._pending.values():
+                    pending.subscription_id = None
+                    pending.request_id = None
+
+            # Polling covers pending signatures until the websocket is back
+            await asyncio.sleep(1)
+
+    def _handle_message(self, data: dict[str, Any]) -> None:
+        """Handle a subscription response or a signature notification.
+
+        Args:
+            data: Decoded websocket message
+        """
+        if data.get("method") == "signatureNotification":
+            params = data.get("params", {})
+            signature = self._subscriptions.pop(params.get("subscription"), None)
+            if signature is None:
+                return
+            pending = self._pending.get(signature)
+            if pending:
+                pending.subscription_id = None
+            value = params.get("result", {}).get("value", {})
+            if isinstance(value, dict):
+                self._resolve(signature, value.get("err"))
+            return
+
+        signature = self._requests.pop(data.get("id"), None)
+        if signature is None:
+            return
+        pending = self._pending.get(signature)
+        if pending is None:
+            return
+        pending.request_id = None
+        if "result" in data:
+            pending.subscription_id = data["result"]
+            self._subscriptions[data["result"]] = signature
+        else:
+            logger.debug(f"signatureSubscribe rejected for {signature}: {data}")
+
+    async def _run_poller(self) -> None:
+        """Poll signature statuses for signatures the websocket does not cover."""
+        loop = asyncio.get_running_loop()
+        last_full_poll = loop.time()
+        while True:
+            if not self._pending:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                last_full_poll = loop.time()
+
+            await asyncio.sleep(self.poll_interval)
+
+            full_poll = loop.time() - last_full_poll >= self.safety_poll_interval
+            if full_poll:
+                last_full_poll = loop.time()
+            signatures = [
+                signature
+                for signature, pending in self._pending.items()
+                if full_poll or pending.subscription_id is None
+            ]
+            if signatures:
+                try:
+                    await self._poll_statuses(signatures)
+                except Exception as e:
+                    logger.warning(f"Signature status polling failed: {e!s}")
+
+    async def _poll_statuses(self, signatures: list[str]) -> None:
+        """Fetch statuses in batches and resolve signatures that reached commitment.
+
+        Args:
+            signatures: Signatures to check
+        """
+        chunks = [
+            signatures[i : i + MAX_STATUS_BATCH]
+            for i in range(0, len(signatures), MAX_STATUS_BATCH)
+        ]
+        responses = await asyncio.gather(
+            *(
+                self.post_rpc(
+                    {
+                        "jsonrpc": "2.0",
+                        "id": 1,
+                        "method": "getSignatureStatuses",
+                        "params": [chunk, {"searchTransactionHistory": False}],
+                    }
+                )
+                for chunk in chunks
+            )
+        )
+
+        for chunk, response in zip(chunks, responses, strict=True):
+            if not response or "result" not in response:
+                continue
+            for signature, status in zip(chunk, response["result"]["value"], strict=False):
+                pending = self._pending.get(signature)
+                if not status or pending is None:
+                    continue
+                reached = COMMITMENT_RANKS.get(status.get("confirmationStatus"), -1)
+                if reached >= COMMITMENT_RANKS[pending.commitment]:
+                    self._resolve(signature, status.get("err"))
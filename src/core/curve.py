@@ -3,15 +3,17 @@ Bonding curve operations for pump.fun tokens.
 """
 
 import struct
-from typing import Final
+from typing import TYPE_CHECKING, Final
 
-from construct import Bytes, Flag, Int64ul, Struct
 from solders.pubkey import Pubkey
 
 from core.client import SolanaClient
 from core.pubkeys import LAMPORTS_PER_SOL, TOKEN_DECIMALS
 from utils.logger import get_logger
 
+if TYPE_CHECKING:
+    from core.curve_cache import CurveStateCache
+
 logger = get_logger(__name__)
 
 # Discriminator for the bonding curve account
@@ -21,14 +23,19 @@ EXPECTED_DISCRIMINATOR: Final[bytes] = struct.pack("<Q", 6966180631402821399)
 class BondingCurveState:
     """Represents the state of a pump.fun bonding curve."""
 
-    _STRUCT = Struct(
-        "virtual_token_reserves" / Int64ul,
-        "virtual_sol_reserves" / Int64ul,
-        "real_token_reserves" / Int64ul,
-        "real_sol_reserves" / Int64ul,
-        "token_total_supply" / Int64ul,
-        "complete" / Flag,
-        "creator" / Bytes(32),  # Added new creator field - 32 bytes for Pubkey
+    # Curves created before the creator fee upgrade end after the complete flag
+    _LAYOUT: Final[struct.Struct] = struct.Struct("<QQQQQ?")
+    _LAYOUT_WITH_CREATOR: Final[struct.Struct] = struct.Struct("<QQQQQ?32s")
+
+    __slots__ = (
+        "_creator",
+        "_creator_bytes",
+        "complete",
+        "real_sol_reserves",
+        "real_token_reserves",
+        "token_total_supply",
+        "virtual_sol_reserves",
+        "virtual_token_reserves",
     )
 
     def __init__(self, data: bytes) -> None:
@@ -40,15 +47,40 @@ class BondingCurveState:
         Raises:
             ValueError: If data cannot be parsed
         """
-        if data[:8] != EXPECTED_DISCRIMINATOR:
+        if not data.startswith(EXPECTED_DISCRIMINATOR):
             raise ValueError("Invalid curve state discriminator")
 
-        parsed = self._STRUCT.parse(data[8:])
-        self.__dict__.update(parsed)
-        
-        # Convert raw bytes to Pubkey for creator field
-        if hasattr(self, 'creator') and isinstance(self.creator, bytes):
-            self.creator = Pubkey.from_bytes(self.creator)
+        try:
+            if len(data) >= 8 + self._LAYOUT_WITH_CREATOR.size:
+                (
+                    self.virtual_token_reserves,
+                    self.virtual_sol_reserves,
+                    self.real_token_reserves,
+                    self.real_sol_reserves,
+                    self.token_total_supply,
+                    self.complete,
+                    self._creator_bytes,
+                ) = self._LAYOUT_WITH_CREATOR.unpack_from(data, 8)
+            else:
+                (
+                    self.virtual_token_reserves,
+                    self.virtual_sol_reserves,
+                    self.real_token_reserves,
+                    self.real_sol_reserves,
+                    self.token_total_supply,
+                    self.complete,
+                ) = self._LAYOUT.unpack_from(data, 8)
+                self._creator_bytes = None
+        except struct.error as e:
+            raise ValueError(f"Invalid curve state data: {e!s}") from e
+        self._creator: Pubkey | None = None
+
+    @property
+    def creator(self) -> Pubkey | None:
+        """Token creator, None for curves without the creator field."""
+        if self._creator is None and self._creator_bytes is not None:
+            self._creator = Pubkey.from_bytes(self._creator_bytes)
+        return self._creator
 
     def calculate_price(self) -> float:
         """Calculate token price in SOL.
@@ -80,19 +112,24 @@ class BondingCurveState:
 class BondingCurveManager:
     """Manager for bonding curve operations."""
 
-    def __init__(self, client: SolanaClient):
+    def __init__(self, client: SolanaClient, cache: "CurveStateCache | None" = None):
         """Initialize with Solana client.
 
         Args:
             client: Solana client for RPC calls
+            cache: Optional streaming cache consulted before RPC
         """
         self.client = client
+        self.cache = cache
 
-    async def get_curve_state(self, curve_address: Pubkey) -> BondingCurveState:
+    async def get_curve_state(
+        self, curve_address: Pubkey, hedged: bool = True
+    ) -> BondingCurveState:
         """Get the state of a bonding curve.
 
         Args:
             curve_address: Address of the bonding curve account
+            hedged: Hedge the read to a secondary endpoint if the primary is slow
 
         Returns:
             Bonding curve state
@@ -100,8 +137,13 @@ class BondingCurveManager:
         Raises:
             ValueError: If curve data is invalid
         """
+        if self.cache:
+            cached = self.cache.get(curve_address)
+            if cached is not None:
+                return cached.state
+
         try:
-            account = await self.client.get_account_info(curve_address)
+            account = await self.client.get_account_info(curve_address, hedged=hedged)
             if not account.data:
                 raise ValueError(f"No data in bonding curve account {curve_address}")
 
@@ -111,6 +153,35 @@ class BondingCurveManager:
             logger.error(f"Failed to get curve state: {e!s}")
             raise ValueError(f"Invalid curve state: {e!s}")
 
+    async def get_curve_states(
+        self, curve_addresses: list[Pubkey]
+    ) -> dict[Pubkey, BondingCurveState]:
+        """Get the states of several bonding curves in as few requests as possible.
+
+        Args:
+            curve_addresses: Addresses of the bonding curve accounts
+
+        Returns:
+            Bonding curve states by address; curves that don't exist or can't
+            be decoded are left out
+        """
+        addresses = list(dict.fromkeys(curve_addresses))
+        if not addresses:
+            return {}
+
+        accounts = await self.client.get_multiple_accounts(addresses)
+
+        states: dict[Pubkey, BondingCurveState] = {}
+        for address, account in zip(addresses, accounts, strict=True):
+            if account is None or not account.data:
+                logger.debug(f"No data in bonding curve account {address}")
+                continue
+            try:
+                states[address] = BondingCurveState(account.data)
+            except Exception as e:
+                logger.warning(f"Invalid curve state for {address}: {e!s}")
+        return states
+
     async def calculate_price(self, curve_address: Pubkey) -> float:
         """Calculate the current price of a token.
 
@@ -0,0 +1,357 @@
+"""
+Streaming bonding curve state cache for open positions.
+"""
+
+import asyncio
+import base64
+import itertools
+from dataclasses import dataclass
+from time import monotonic
+
+import websockets
+from solders.pubkey import Pubkey
+
+from core.client import SolanaClient
+from core.curve import BondingCurveState
+from geyser.connection import create_geyser_channel
+from geyser.generated import geyser_pb2
+from utils import json_codec
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+GEYSER_COMMITMENTS = {
+    "processed": geyser_pb2.CommitmentLevel.PROCESSED,
+    "confirmed": geyser_pb2.CommitmentLevel.CONFIRMED,
+    "finalized": geyser_pb2.CommitmentLevel.FINALIZED,
+}
+
+
+@dataclass(frozen=True)
+class CachedCurveState:
+    """A decoded bonding curve state stamped with the slot it was seen in.
+
+    States seeded over RPC before the first stream update carry slot 0, so
+    any streamed update replaces them.
+    """
+
+    state: BondingCurveState
+    slot: int
+    received_at: float
+
+    @property
+    def age(self) -> float:
+        """Seconds since the state was received."""
+        return monotonic() - self.received_at
+
+
+class CurveStateCache:
+    """In-memory bonding curve states kept current by an account stream.
+
+    Tracked curves are subscribed through Geyser account filters when Geyser is
+    configured and through websocket ``accountSubscribe`` otherwise. States are
+    only served while the stream is connected; on disconnect the cache is
+    emptied so readers fall back to RPC until updates flow again.
+    """
+
+    def __init__(
+        self,
+        client: SolanaClient,
+        wss_endpoint: str | None = None,
+        geyser_endpoint: str | None = None,
+        geyser_api_token: str | None = None,
+        geyser_auth_type: str = "x-token",
+        commitment: str = "processed",
+        reconnect_delay: float = 5.0,
+    ):
+        """Initialize the cache.
+
+        Args:
+            client: Solana client used to seed newly tracked curves
+            wss_endpoint: WebSocket endpoint used for accountSubscribe
+            geyser_endpoint: Geyser endpoint used for account filters
+            geyser_api_token: Geyser API token
+            geyser_auth_type: Geyser authentication type ('x-token' or 'basic')
+            commitment: Commitment level of streamed updates
+            reconnect_delay: Seconds to wait before reconnecting a lost stream or
+                             retrying a failed subscription
+        """
+        self.client = client
+        self.wss_endpoint = wss_endpoint
+        self.geyser_endpoint = geyser_endpoint
+        self.geyser_api_token = geyser_api_token
+        self.geyser_auth_type = (geyser_auth_type or "x-token").lower()
+        self.commitment = commitment
+        self.reconnect_delay = reconnect_delay
+
+        self._tracked: set[Pubkey] = set()
+        self._states: dict[Pubkey, CachedCurveState] = {}
+        self._changed = asyncio.Event()
+        self._connected = False
+        self._seed_tasks: set[asyncio.Task] = set()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether a stream source is configured."""
+        return bool((self.geyser_endpoint and self.geyser_api_token) or self.wss_endpoint)
+
+    @property
+    def tracked(self) -> frozenset[Pubkey]:
+        """Bonding curves currently subscribed."""
+        return frozenset(self._tracked)
+
+    def get(self, curve_address: Pubkey) -> CachedCurveState | None:
+        """Look up the cached state of a tracked curve.
+
+        Args:
+            curve_address: Address of the bonding curve account
+
+        Returns:
+            Cached state, or None if the curve is not tracked or not known yet
+        """
+        return self._states.get(curve_address)
+
+    def update(self, curve_address: Pubkey, data: bytes, slot: int) -> bool:
+        """Decode and store account data if it is newer than the cached state.
+
+        Args:
+            curve_address: Address of the bonding curve account
+            data: Raw account data
+            slot: Slot the data was observed in
+
+        Returns:
+            True if the cached state was replaced
+        """
+        if curve_address not in self._tracked:
+            return False
+        current = self._states.get(curve_address)
+        if current is not None and slot < current.slot:
+            return False
+        try:
+            state = BondingCurveState(data)
+        except Exception as e:
+            logger.warning(f"Invalid curve update for {curve_address}: {e!s}")
+            return False
+        self._states[curve_address] = CachedCurveState(state, slot, monotonic())
+        return True
+
+    def track(self, curve_address: Pubkey) -> None:
+        """Start following a bonding curve.
+
+        Args:
+            curve_address: Address of the bonding curve account
+        """
+        if not self.enabled or curve_address in self._tracked:
+            return
+        self._tracked.add(curve_address)
+        self._changed.set()
+
+    def untrack(self, curve_address: Pubkey) -> None:
+        """Stop following a bonding curve and drop its state.
+
+        Args:
+            curve_address: Address of the bonding curve account
+        """
+        if curve_address not in self._tracked:
+            return
+        self._tracked.discard(curve_address)
+        self._states.pop(curve_address, None)
+        self._changed.set()
+
+    def _seed(self, curve_addresses: list[Pubkey]) -> None:
+        """Fetch the current states of newly subscribed curves in the background.
+
+        Curves only produce stream updates when they change, so the state at
+        subscription time is read over RPC. It is stamped with slot 0 and is
+        replaced by the first streamed update.
+
+        Args:
+            curve_addresses: Curves that were just subscribed
+        """
+        if curve_addresses:
+            task = asyncio.create_task(self._fetch_seed(curve_addresses))
+            self._seed_tasks.add(task)
+            task.add_done_callback(self._seed_tasks.discard)
+
+    async def _fetch_seed(self, curve_addresses: list[Pubkey]) -> None:
+        """Fetch and store the states of the given curves."""
+        try:
+            accounts = await self.client.get_multiple_accounts(curve_addresses)
+        except Exception as e:
+            logger.warning(f"Failed to seed curve cache: {e!s}")
+            return
+        if not self._connected:
+            return
+        for address, account in zip(curve_addresses, accounts, strict=True):
+            if account is not None and account.data and address not in self._states:
+                self.update(address, account.data, 0)
+
+    async def run(self) -> None:
+        """Keep tracked curves current until cancelled."""
+        if not self.enabled:
+            return
+
+        while True:
+            # Nothing to stream until a position is open
+            while not self._tracked:
+                self._changed.clear()
+                await self._changed.wait()
+
+            try:
+                if self.geyser_endpoint and self.geyser_api_token:
+                    await self._stream_geyser()
+                else:
+                    await self._stream_websocket()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Curve cache stream failed: {e!s}")
+            finally:
+                self._connected = False
+                self._states.clear()
+
+            await asyncio.sleep(self.reconnect_delay)
+
+    def _geyser_request(self) -> geyser_pb2.SubscribeRequest:
+        """Build a subscribe request covering every tracked curve."""
+        request = geyser_pb2.SubscribeRequest()
+        if self._tracked:
+            request.accounts["curves"].account.extend(
+                str(address) for address in self._tracked
+            )
+        request.commitment = GEYSER_COMMITMENTS[self.commitment]
+        return request
+
+    async def _geyser_requests(self):
+        """Yield a new subscribe request whenever the tracked set changes."""
+        subscribed: set[Pubkey] = set()
+        while True:
+            self._changed.clear()
+            yield self._geyser_request()
+            self._seed(list(self._tracked - subscribed))
+            subscribed = set(self._tracked)
+            await self._changed.wait()
+
+    async def _stream_geyser(self) -> None:
+        """Feed the cache from Geyser account updates."""
+        stub, channel = create_geyser_channel(
+            self.geyser_endpoint, self.geyser_api_token, self.geyser_auth_type
+        )
+        try:
+            self._connected = True
+            logger.info("Curve cache following Geyser account updates")
+            async for update in stub.Subscribe(self._geyser_requests()):
+                if not update.HasField("account"):
+                    continue
+                account = update.account.account
+                self.update(
+                    Pubkey.from_bytes(account.pubkey), account.data, update.account.slot
+                )
+        finally:
+            await channel.close()
+
+    async def _stream_websocket(self) -> None:
+        """Feed the cache from accountSubscribe notifications."""
+        async with websockets.connect(self.wss_endpoint) as websocket:
+            self._connected = True
+            logger.info("Curve cache following accountSubscribe")
+            ids = itertools.count(1)
+            # request id -> curve, subscription id -> curve, curve -> subscription id
+            pending: dict[int, Pubkey] = {}
+            by_subscription: dict[int, Pubkey] = {}
+            subscriptions: dict[Pubkey, int | None] = {}
+
+            async def sync_subscriptions() -> None:
+                while True:
+                    self._changed.clear()
+                    added = list(self._tracked - subscriptions.keys())
+                    for address in added:
+                        request_id = next(ids)
+                        pending[request_id] = address
+                        subscriptions[address] = None
+                        await websocket.send(
+                            json_codec.dumps(
+                                {
+                                    "jsonrpc": "2.0",
+                                    "id": request_id,
+                                    "method": "accountSubscribe",
+                                    "params": [
+                                        str(address),
+                                        {
+                                            "encoding": "base64",
+                                            "commitment": self.commitment,
+                                        },
+                                    ],
+                                }
+                            )
+                        )
+                    for address in subscriptions.keys() - self._tracked:
+                        subscription_id = subscriptions.pop(address)
+                        if subscription_id is None:
+                            continue
+                        by_subscription.pop(subscription_id, None)
+                        await websocket.send(
+                            json_codec.dumps(
+                                {
+                                    "jsonrpc": "2.0",
+                                    "id": next(ids),
+                                    "method": "accountUnsubscribe",
+                                    "params": [subscription_id],
+                                }
+                            )
+                        )
+                    self._seed(added)
+                    await self._changed.wait()
+
+            sync_task = asyncio.create_task(sync_subscriptions())
+            try:
+                async for message in websocket:
+                    data = json_codec.loads(message)
+                    if data.get("method") == "accountNotification":
+                        params = data["params"]
+                        address = by_subscription.get(params["subscription"])
+                        if address is None:
+                            continue
+                        result = params["result"]
+                        self.update(
+                            address,
+                            base64.b64decode(result["value"]["data"][0]),
+                            result["context"]["slot"],
+                        )
+                    elif data.get("id") in pending:
+                        address = pending.pop(data["id"])
+                        if "result" not in data:
+                            logger.warning(
+                                f"accountSubscribe failed for {address}: {data.get('error')}"
+                            )
+                            subscriptions.pop(address, None)
+                            # Resubscribe later rather than reading the curve
+                            # over RPC until some other curve changes
+                            asyncio.get_running_loop().call_later(
+                                self.reconnect_delay, self._changed.set
+                            )
+                        elif address in subscriptions:
+                            subscriptions[address] = data["result"]
+                            by_subscription[data["result"]] = address
+                        else:
+                            # Untracked while the subscription was in flight
+                            await websocket.send(
+                                json_codec.dumps(
+                                    {
+                                        "jsonrpc": "2.0",
+                                        "id": next(ids),
+                                        "method": "accountUnsubscribe",
+                                        "params": [data["result"]],
+                                    }
+                                )
+                            )
+            finally:
+                sync_task.cancel()
+
+    async def close(self) -> None:
+        """Cancel pending seed fetches and forget all curves."""
+        for task in self._seed_tasks:
+            task.cancel()
+        self._seed_tasks.clear()
+        self._tracked.clear()
+        self._states.clear()
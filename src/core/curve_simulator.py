@@ -0,0 +1,229 @@
+"""
+Vectorized bonding curve simulation for offline strategy sizing.
+
+Evaluates many curves against many trade sizes in single NumPy passes. Amounts
+are float64 lamports and raw token units, which is exact enough for sizing;
+use core.quote for the integer amounts that go into transactions.
+"""
+
+import csv
+from collections.abc import Sequence
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+from core.curve import BondingCurveState
+from core.pubkeys import LAMPORTS_PER_SOL, TOKEN_DECIMALS
+from core.quote import BASIS_POINTS_DENOMINATOR, DEFAULT_FEES
+
+# Virtual token reserves minus real token reserves of every pump.fun curve
+VIRTUAL_TOKEN_OFFSET = 279_900_000 * 10**TOKEN_DECIMALS
+
+
+@dataclass(frozen=True)
+class CurveArrays:
+    """Reserves of many bonding curves as parallel arrays."""
+
+    virtual_sol_reserves: np.ndarray
+    virtual_token_reserves: np.ndarray
+    real_token_reserves: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.virtual_sol_reserves)
+
+    @classmethod
+    def from_reserves(
+        cls,
+        virtual_sol_reserves: Sequence[float] | np.ndarray,
+        virtual_token_reserves: Sequence[float] | np.ndarray,
+        real_token_reserves: Sequence[float] | np.ndarray | None = None,
+    ) -> "CurveArrays":
+        """Build from reserve arrays in lamports and raw token units.
+
+        Args:
+            virtual_sol_reserves: Virtual SOL reserves
+            virtual_token_reserves: Virtual token reserves
+            real_token_reserves: Real token reserves (derived from the virtual
+                                 token reserves when omitted)
+
+        Returns:
+            Curve arrays
+        """
+        virtual_sol = np.asarray(virtual_sol_reserves, dtype=np.float64)
+        virtual_token = np.asarray(virtual_token_reserves, dtype=np.float64)
+        if real_token_reserves is None:
+            real_token = np.maximum(virtual_token - VIRTUAL_TOKEN_OFFSET, 0.0)
+        else:
+            real_token = np.asarray(real_token_reserves, dtype=np.float64)
+        return cls(virtual_sol, virtual_token, real_token)
+
+    @classmethod
+    def from_states(cls, states: Sequence[BondingCurveState]) -> "CurveArrays":
+        """Build from decoded bonding curve states.
+
+        Args:
+            states: Bonding curve states
+
+        Returns:
+            Curve arrays
+        """
+        return cls.from_reserves(
+            [state.virtual_sol_reserves for state in states],
+            [state.virtual_token_reserves for state in states],
+            [state.real_token_reserves for state in states],
+        )
+
+    @classmethod
+    def from_csv(cls, path: str | Path) -> "CurveArrays":
+        """Load curves from a token snapshot CSV like data/tokens/tokens_all.csv.
+
+        The file needs vSolInBondingCurve (SOL) and vTokensInBondingCurve
+        (tokens) columns; rows with missing or non-positive reserves are skipped.
+
+        Args:
+            path: CSV file path
+
+        Returns:
+            Curve arrays
+        """
+        virtual_sol = []
+        virtual_token = []
+        with open(path, newline="") as f:
+            for row in csv.DictReader(f):
+                try:
+                    sol = float(row["vSolInBondingCurve"])
+                    tokens = float(row["vTokensInBondingCurve"])
+                except (KeyError, TypeError, ValueError):
+                    continue
+                if sol > 0 and tokens > 0:
+                    virtual_sol.append(sol)
+                    virtual_token.append(tokens)
+        return cls.from_reserves(
+            np.asarray(virtual_sol) * LAMPORTS_PER_SOL,
+            np.asarray(virtual_token) * 10**TOKEN_DECIMALS,
+        )
+
+
+class CurveSimulator:
+    """Constant-product pump.fun math over curves x trade sizes.
+
+    Results are indexed ``[curve, size]`` (``[curve, size, flow]`` for round
+    trips) and follow the same formulas as core.quote, without integer
+    rounding.
+    """
+
+    def __init__(
+        self,
+        curves: CurveArrays,
+        fee_basis_points: int = DEFAULT_FEES.total_basis_points(),
+    ):
+        """Initialize the simulator.
+
+        Args:
+            curves: Curves to simulate
+            fee_basis_points: Total trading fee in basis points
+        """
+        self.curves = curves
+        self.fee_rate = fee_basis_points / BASIS_POINTS_DENOMINATOR
+        # Column vectors so (curves, 1) broadcasts against (sizes,)
+        self._virtual_sol = curves.virtual_sol_reserves[:, None]
+        self._virtual_token = curves.virtual_token_reserves[:, None]
+        self._real_token = curves.real_token_reserves[:, None]
+
+    def spot_prices(self) -> np.ndarray:
+        """Spot price of every curve in lamports per raw token unit."""
+        return self.curves.virtual_sol_reserves / self.curves.virtual_token_reserves
+
+    def buy_tokens(self, sol_amounts: Sequence[float] | np.ndarray) -> np.ndarray:
+        """Tokens received for SOL budgets that include fees.
+
+        Args:
+            sol_amounts: Budgets in lamports
+
+        Returns:
+            Raw token amounts, shape (curves, sizes)
+        """
+        sol = np.asarray(sol_amounts, dtype=np.float64)[None, :]
+        net = sol / (1 + self.fee_rate)
+        tokens = net * self._virtual_token / (self._virtual_sol + net)
+        return np.minimum(tokens, self._real_token)
+
+    def sell_proceeds(self, token_amounts: Sequence[float] | np.ndarray) -> np.ndarray:
+        """SOL received for selling token amounts, after fees.
+
+        Args:
+            token_amounts: Raw token amounts
+
+        Returns:
+            Proceeds in lamports, shape (curves, sizes)
+        """
+        tokens = np.asarray(token_amounts, dtype=np.float64)[None, :]
+        gross = tokens * self._virtual_sol / (self._virtual_token + tokens)
+        return gross * (1 - self.fee_rate)
+
+    def price_impact(self, sol_amounts: Sequence[float] | np.ndarray) -> np.ndarray:
+        """Relative cost over spot price of buying with each budget.
+
+        Args:
+            sol_amounts: Budgets in lamports
+
+        Returns:
+            Effective price / spot price - 1, shape (curves, sizes); inf where
+            the curve has no tokens left to sell
+        """
+        sol = np.asarray(sol_amounts, dtype=np.float64)[None, :]
+        tokens = self.buy_tokens(sol_amounts)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            effective = sol / tokens
+        spot = self._virtual_sol / self._virtual_token
+        return np.where(tokens > 0, effective / spot - 1, np.inf)
+
+    def graduation_distance(self) -> np.ndarray:
+        """SOL each curve still needs, fees included, to sell out and graduate.
+
+        Returns:
+            Lamports per curve
+        """
+        virtual_sol = self.curves.virtual_sol_reserves
+        virtual_token = self.curves.virtual_token_reserves
+        real_token = self.curves.real_token_reserves
+        cost = real_token * virtual_sol / (virtual_token - real_token)
+        return cost * (1 + self.fee_rate)
+
+    def round_trip_pnl(
+        self,
+        sol_amounts: Sequence[float] | np.ndarray,
+        sol_flows: Sequence[float] | np.ndarray = (0.0,),
+    ) -> np.ndarray:
+        """Profit of buying, letting other traders move the curve, then selling.
+
+        Args:
+            sol_amounts: Buy budgets in lamports, fees included
+            sol_flows: Net SOL other traders add to (positive) or take out of
+                       (negative) the curve between the buy and the sell
+
+        Returns:
+            Profit in lamports, shape (curves, sizes, flows); nan where the
+            flow would drain the curve. Budgets larger than a curve's
+            remaining supply only pay for the tokens actually bought.
+        """
+        sol = np.asarray(sol_amounts, dtype=np.float64)
+        flows = np.asarray(sol_flows, dtype=np.float64)[None, None, :]
+
+        # State after our buy
+        tokens = self.buy_tokens(sol)
+        spent = tokens * self._virtual_sol / (self._virtual_token - tokens)
+        virtual_sol = self._virtual_sol + spent
+        virtual_token = self._virtual_token - tokens
+
+        # Other traders move the curve along k = x * y
+        k = (virtual_sol * virtual_token)[:, :, None]
+        moved_sol = virtual_sol[:, :, None] + flows
+        with np.errstate(divide="ignore", invalid="ignore"):
+            moved_token = np.where(moved_sol > 0, k / moved_sol, np.nan)
+
+        tokens = tokens[:, :, None]
+        proceeds = tokens * moved_sol / (moved_token + tokens) * (1 - self.fee_rate)
+        cost = spent * (1 + self.fee_rate)
+        return proceeds - cost[:, :, None]
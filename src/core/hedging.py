@@ -0,0 +1,256 @@
+"""
+Hedged JSON-RPC reads across multiple Solana RPC endpoints.
+"""
+
+import asyncio
+import itertools
+from collections import deque
+from collections.abc import Awaitable, Callable
+from time import monotonic
+from typing import Any
+
+import aiohttp
+from solana.rpc.core import RPCException
+
+from utils import json_codec
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class ReadEndpointStats:
+    """Latency and outcome statistics for a single read endpoint."""
+
+    def __init__(self, endpoint: str, window: int = 200):
+        """Initialize the statistics.
+
+        Args:
+            endpoint: Endpoint URL
+            window: Number of recent latencies kept for percentiles
+        """
+        self.endpoint = endpoint
+        self.requests = 0
+        self.failed = 0
+        self.wins = 0
+        self.hedged = 0
+        self.latencies: deque[float] = deque(maxlen=window)
+
+    def percentile(self, fraction: float) -> float | None:
+        """Get a percentile of the recent latencies in seconds.
+
+        Args:
+            fraction: Percentile as a fraction (0.9 = p90)
+
+        Returns:
+            Latency in seconds, or None if nothing was recorded yet
+        """
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary.
+
+        Returns:
+            Dictionary representation
+        """
+        p50 = self.percentile(0.5)
+        p90 = self.percentile(0.9)
+        return {
+            "endpoint": self.endpoint,
+            "requests": self.requests,
+            "failed": self.failed,
+            "wins": self.wins,
+            "hedged": self.hedged,
+            "p50_latency_ms": p50 * 1000 if p50 is not None else None,
+            "p90_latency_ms": p90 * 1000 if p90 is not None else None,
+        }
+
+
+class HedgedReader:
+    """Sends a read to the primary endpoint and hedges it when it runs slow.
+
+    If the primary has not answered within its rolling p90 latency, the same
+    request is sent to the secondary endpoint with the best p90 and the first
+    successful response wins. The slower request keeps running in the
+    background so both endpoints' latency windows stay unbiased.
+    """
+
+    def __init__(
+        self,
+        endpoints: list[str],
+        get_session: Callable[[], Awaitable[aiohttp.ClientSession]],
+        percentile: float = 0.9,
+        min_samples: int = 20,
+        default_delay: float = 0.1,
+        window: int = 200,
+    ):
+        """Initialize the reader.
+
+        Args:
+            endpoints: Primary endpoint followed by secondary endpoints
+            get_session: Coroutine returning the pooled HTTP session
+            percentile: Primary latency percentile after which to hedge
+            min_samples: Samples required before the percentile is trusted
+            default_delay: Seconds to wait before hedging until then
+            window: Number of recent latencies kept per endpoint
+        """
+        # Keep order but drop duplicates
+        self.endpoints = list(dict.fromkeys(endpoints))
+        self.get_session = get_session
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.default_delay = default_delay
+        self.stats: dict[str, ReadEndpointStats] = {
+            endpoint: ReadEndpointStats(endpoint, window) for endpoint in self.endpoints
+        }
+        self._ids = itertools.count(1)
+        self._background: set[asyncio.Task] = set()
+
+    @property
+    def primary(self) -> str:
+        """The endpoint every read is sent to first."""
+        return self.endpoints[0]
+
+    def hedge_delay(self) -> float:
+        """Seconds to wait for the primary before hedging."""
+        stats = self.stats[self.primary]
+        if len(stats.latencies) < self.min_samples:
+            return self.default_delay
+        return stats.percentile(self.percentile)
+
+    def _secondary(self) -> str | None:
+        """Pick the secondary endpoint with the lowest recent p90 latency."""
+        secondaries = self.endpoints[1:]
+        if not secondaries:
+            return None
+        return min(
+            secondaries,
+            key=lambda endpoint: self.stats[endpoint].percentile(0.9) or 0.0,
+        )
+
+    async def request(
+        self, method: str, params: list[Any] | None = None
+    ) -> dict[str, Any]:
+        """Send a read, hedging it to a secondary endpoint if the primary is slow.
+
+        Args:
+            method: JSON-RPC method name
+            params: JSON-RPC params
+
+        Returns:
+            JSON-RPC response object from the first endpoint that answered
+
+        Raises:
+            RPCException: If every endpoint tried failed and one returned a
+                JSON-RPC error; the primary's is preferred, raised unchanged
+            RuntimeError: If every endpoint tried failed otherwise
+        """
+        body: dict[str, Any] = {"jsonrpc": "2.0", "id": next(self._ids), "method": method}
+        if params is not None:
+            body["params"] = params
+
+        session = await self.get_session()
+        tasks = {
+            asyncio.create_task(self._read_from(session, self.primary, body)): self.primary
+        }
+        secondary = self._secondary()
+
+        errors: dict[str, Exception] = {}
+        pending = set(tasks)
+        try:
+            timeout = self.hedge_delay()
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    endpoint = tasks[task]
+                    try:
+                        response = task.result()
+                    except Exception as e:
+                        errors[endpoint] = e
+                        continue
+
+                    self.stats[endpoint].wins += 1
+                    return response
+
+                # Primary is slower than usual or failed: hedge once
+                if secondary and secondary not in tasks.values():
+                    self.stats[self.primary].hedged += 1
+                    task = asyncio.create_task(self._read_from(session, secondary, body))
+                    tasks[task] = secondary
+                    pending.add(task)
+                    logger.debug(f"Hedged {method} to {secondary}")
+                timeout = None
+        finally:
+            for task in pending:
+                self._background.add(task)
+                task.add_done_callback(self._finish_background)
+
+        # Keep the node's error type for callers handling RPCException
+        rpc_errors = [e for e in errors.values() if isinstance(e, RPCException)]
+        if rpc_errors:
+            primary_error = errors.get(self.primary)
+            raise primary_error if isinstance(primary_error, RPCException) else rpc_errors[0]
+        details = [f"{endpoint}: {e!s}" for endpoint, e in errors.items()]
+        raise RuntimeError(f"All read endpoints failed for {method}: {details}")
+
+    async def _read_from(
+        self, session: aiohttp.ClientSession, endpoint: str, body: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Send a read to one endpoint and record its latency.
+
+        Args:
+            session: HTTP session to use
+            endpoint: Endpoint URL
+            body: JSON-RPC request body
+
+        Returns:
+            JSON-RPC response object
+
+        Raises:
+            RPCException: If the node returned an error for this request
+        """
+        stats = self.stats[endpoint]
+        stats.requests += 1
+        started = monotonic()
+        try:
+            async with session.post(endpoint, json=body) as response:
+                response.raise_for_status()
+                data = await response.json(
+                    content_type=None, loads=json_codec.loads
+                )
+            if "error" in data:
+                raise RPCException(data["error"])
+        except Exception:
+            stats.failed += 1
+            raise
+
+        stats.latencies.append(monotonic() - started)
+        return data
+
+    def _finish_background(self, task: asyncio.Task) -> None:
+        """Drop a finished background read and retrieve its outcome.
+
+        Args:
+            task: Read that finished after the winner
+        """
+        self._background.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.debug(f"Background read failed: {task.exception()!s}")
+
+    def get_stats(self) -> list[dict[str, Any]]:
+        """Get per-endpoint read statistics.
+
+        Returns:
+            List of per-endpoint statistics dictionaries
+        """
+        return [stats.to_dict() for stats in self.stats.values()]
+
+    async def close(self) -> None:
+        """Cancel reads still running in the background."""
+        for task in self._background:
+            task.cancel()
+        self._background.clear()
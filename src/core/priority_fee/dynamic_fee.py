@@ -4,22 +4,70 @@ from solders.pubkey import Pubkey
 
 from core.client import SolanaClient
 from core.priority_fee import PriorityFeePlugin
+from core.rate_limiter import RequestPriority
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 
+def fee_percentile(fees: list[int], percentile: int) -> int:
+    """
+    Get a percentile of recent priority fees.
+
+    Paying the 70th percentile means paying more than 70% of other transactions:
+    a higher percentile is faster but more expensive, a lower one cheaper but slower.
+
+    Args:
+        fees: Priority fees in microlamports.
+        percentile: Percentile between 1 and 99.
+
+    Returns:
+        int: Fee at the percentile in microlamports.
+    """
+    if len(fees) == 1:
+        return fees[0]
+    return int(statistics.quantiles(fees, n=100)[percentile - 1])
+
+
 class DynamicPriorityFee(PriorityFeePlugin):
     """Dynamic priority fee plugin using getRecentPrioritizationFees."""
 
-    def __init__(self, client: SolanaClient):
+    def __init__(self, client: SolanaClient, percentile: int = 70):
         """
         Initialize the dynamic fee plugin.
 
         Args:
             client: Solana RPC client for network requests.
+            percentile: Percentile of recent fees to pay.
         """
         self.client = client
+        self.percentile = percentile
+
+    async def fetch_fees(self, accounts: list[Pubkey] | None = None) -> list[int] | None:
+        """
+        Fetch recent prioritization fees of slots that write-locked the accounts.
+
+        Args:
+            accounts: Accounts to consider, or None for fees across the network.
+
+        Returns:
+            Optional[list[int]]: Fees in microlamports, or None if the request fails.
+        """
+        body = {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "getRecentPrioritizationFees",
+            "params": [[str(account) for account in accounts]] if accounts else [],
+        }
+
+        response = await self.client.post_rpc(body, RequestPriority.BACKGROUND)
+        if not response or "result" not in response:
+            logger.error(
+                "Failed to fetch recent prioritization fees: invalid response"
+            )
+            return None
+
+        return [fee["prioritizationFee"] for fee in response["result"]]
 
     async def get_priority_fee(
         self, accounts: list[Pubkey] | None = None
@@ -32,35 +80,18 @@ class DynamicPriorityFee(PriorityFeePlugin):
                      If None, the fee is calculated without specific account constraints.
 
         Returns:
-            Optional[int]: Median priority fee in microlamports, or None if the request fails.
+            Optional[int]: Priority fee at the configured percentile in microlamports,
+                or None if the request fails.
         """
         try:
-            body = {
-                "jsonrpc": "2.0",
-                "id": 1,
-                "method": "getRecentPrioritizationFees",
-                "params": [[str(account) for account in accounts]] if accounts else [],
-            }
-
-            response = await self.client.post_rpc(body)
-            if not response or "result" not in response:
-                logger.error(
-                    "Failed to fetch recent prioritization fees: invalid response"
-                )
+            fees = await self.fetch_fees(accounts)
+            if fees is None:
                 return None
-
-            fees = [fee["prioritizationFee"] for fee in response["result"]]
             if not fees:
                 logger.warning("No prioritization fees found in the response")
                 return None
 
-            # Get the 70th percentile of fees for faster processing
-            # It means you're paying a fee that's higher than 70% of other transactions
-            # Higher percentile = faster transactions but more expensive
-            # Lower percentile = cheaper but slower transactions
-            prior_fee = int(statistics.quantiles(fees, n=10)[-3])  # 70th percentile
-
-            return prior_fee
+            return fee_percentile(fees, self.percentile)
 
         except Exception as e:
             logger.error(
@@ -0,0 +1,48 @@
+from time import monotonic
+
+from solders.pubkey import Pubkey
+
+from . import PriorityFeePlugin
+
+
+class HubPriorityFee(PriorityFeePlugin):
+    """Priority fee pushed by the market-data hub process."""
+
+    def __init__(self, percentile: int = 70, max_age: float = 30.0):
+        """
+        Initialize the hub fee plugin.
+
+        Args:
+            percentile: Percentile of recent fees to pay, picked from the hub's estimates.
+            max_age: Seconds a pushed fee is used before it is considered stale.
+        """
+        self.percentile = percentile
+        self.max_age = max_age
+        self.fee: int | None = None
+        self.updated_at = 0.0
+
+    def update(self, fee: int) -> None:
+        """
+        Store the latest fee received from the hub.
+
+        Args:
+            fee: Priority fee in microlamports.
+        """
+        self.fee = fee
+        self.updated_at = monotonic()
+
+    async def get_priority_fee(
+        self, accounts: list[Pubkey] | None = None
+    ) -> int | None:
+        """
+        Return the latest hub fee without a network request.
+
+        Args:
+            accounts: Ignored; the hub estimates fees for the pump.fun program accounts.
+
+        Returns:
+            Optional[int]: Priority fee in microlamports, or None if none is fresh.
+        """
+        if self.fee is None or monotonic() - self.updated_at > self.max_age:
+            return None
+        return self.fee
@@ -1,6 +1,7 @@
 from solders.pubkey import Pubkey
 
 from core.client import SolanaClient
+from core.priority_fee import PriorityFeePlugin
 from core.priority_fee.dynamic_fee import DynamicPriorityFee
 from core.priority_fee.fixed_fee import FixedPriorityFee
 from utils.logger import get_logger
@@ -19,6 +20,8 @@ class PriorityFeeManager:
         fixed_fee: int,
         extra_fee: float,
         hard_cap: int,
+        dynamic_fee_plugin: PriorityFeePlugin | None = None,
+        fee_percentile: int = 70,
     ):
         """
         Initialize the priority fee manager.
@@ -30,6 +33,8 @@ class PriorityFeeManager:
             fixed_fee: Fixed priority fee in microlamports.
             extra_fee: Percentage increase to apply to the base fee.
             hard_cap: Maximum allowed priority fee in microlamports.
+            dynamic_fee_plugin: Source of dynamic fees (defaults to getRecentPrioritizationFees).
+            fee_percentile: Percentile of recent fees paid by the default dynamic fee plugin.
         """
         self.client = client
         self.enable_dynamic_fee = enable_dynamic_fee
@@ -39,7 +44,9 @@ class PriorityFeeManager:
         self.hard_cap = hard_cap
 
         # Initialize plugins
-        self.dynamic_fee_plugin = DynamicPriorityFee(client)
+        self.dynamic_fee_plugin = dynamic_fee_plugin or DynamicPriorityFee(
+            client, fee_percentile
+        )
         self.fixed_fee_plugin = FixedPriorityFee(fixed_fee)
 
     async def calculate_priority_fee(
@@ -0,0 +1,138 @@
+import asyncio
+from time import monotonic
+
+from solders.pubkey import Pubkey
+
+from core.client import SolanaClient
+from core.priority_fee import PriorityFeePlugin
+from core.priority_fee.dynamic_fee import DynamicPriorityFee, fee_percentile
+from core.pubkeys import PumpAddresses
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Accounts every pump.fun trade write-locks, shared by all tokens
+PUMP_ACCOUNTS = (PumpAddresses.PROGRAM, PumpAddresses.FEE)
+
+
+class PriorityFeeOracle(PriorityFeePlugin):
+    """Priority fee percentiles refreshed in the background and served from memory.
+
+    An estimate is kept per tracked account set. A lookup uses the largest
+    tracked set contained in the requested accounts, so the per-token mint
+    and bonding curve of a trade are ignored and its fee comes from the
+    shared pump.fun accounts. Accounts matching no tracked set, or whose
+    set has no fresh estimate, use the network-wide estimate.
+    """
+
+    def __init__(
+        self,
+        client: SolanaClient,
+        account_sets: list[list[Pubkey]] | None = None,
+        refresh_interval: float = 2.0,
+        max_age: float = 10.0,
+        percentile: int = 70,
+    ):
+        """
+        Initialize the fee oracle.
+
+        Args:
+            client: Solana RPC client for getRecentPrioritizationFees.
+            account_sets: Account sets to estimate fees for, in addition to the
+                network-wide estimate (defaults to the pump.fun program and fee account).
+            refresh_interval: Seconds between refreshes (0 = only updated from a stream).
+            max_age: Seconds an estimate is served before it is considered stale.
+            percentile: Percentile of recent fees to pay.
+        """
+        self.fetcher = DynamicPriorityFee(client, percentile)
+        self.refresh_interval = refresh_interval
+        self.max_age = max_age
+        self.percentile = percentile
+        self.account_sets: list[frozenset[Pubkey]] = [frozenset()]
+        for accounts in account_sets if account_sets is not None else [list(PUMP_ACCOUNTS)]:
+            self.track(accounts)
+
+        # Account set -> (fee in microlamports, monotonic time of the estimate)
+        self._estimates: dict[frozenset[Pubkey], tuple[int, float]] = {}
+
+    def track(self, accounts: list[Pubkey]) -> None:
+        """
+        Start estimating fees for an account set.
+
+        Args:
+            accounts: Accounts whose write-locking slots are considered.
+        """
+        key = frozenset(accounts)
+        if key not in self.account_sets:
+            self.account_sets.append(key)
+            # Larger sets first, so a lookup takes the most specific match
+            self.account_sets.sort(key=len, reverse=True)
+
+    def update(self, fees: list[int], accounts: list[Pubkey] | None = None) -> None:
+        """
+        Store an estimate from recent fees, e.g. fees observed on a stream.
+
+        Args:
+            fees: Recent priority fees in microlamports.
+            accounts: Account set the fees belong to (None = network-wide).
+        """
+        if not fees:
+            return
+        key = frozenset(accounts or ())
+        self.track(list(key))
+        self._estimates[key] = (fee_percentile(fees, self.percentile), monotonic())
+
+    async def refresh(self) -> None:
+        """Fetch fresh estimates for every tracked account set."""
+        account_sets = list(self.account_sets)
+        results = await asyncio.gather(
+            *(self.fetcher.fetch_fees(list(accounts)) for accounts in account_sets),
+            return_exceptions=True,
+        )
+        for accounts, fees in zip(account_sets, results, strict=True):
+            if isinstance(fees, Exception):
+                logger.warning(f"Priority fee refresh failed: {fees!s}")
+            elif fees:
+                self._estimates[accounts] = (
+                    fee_percentile(fees, self.percentile),
+                    monotonic(),
+                )
+
+    async def run(self) -> None:
+        """Refresh the estimates on the configured interval until cancelled."""
+        if self.refresh_interval <= 0:
+            return
+        logger.info(
+            f"Priority fee oracle refreshing {len(self.account_sets)} account set(s) "
+            f"every {self.refresh_interval}s"
+        )
+        while True:
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.warning(f"Priority fee refresh failed: {e!s}")
+            await asyncio.sleep(self.refresh_interval)
+
+    async def get_priority_fee(
+        self, accounts: list[Pubkey] | None = None
+    ) -> int | None:
+        """
+        Return the latest estimate for the accounts without a network request.
+
+        Args:
+            accounts: Accounts of the transaction to price.
+
+        Returns:
+            Optional[int]: Priority fee in microlamports, or None if neither the
+                matching nor the network-wide estimate is fresh, so the fixed fee applies.
+        """
+        requested = frozenset(accounts or ())
+        # The network-wide set is empty and matches every request
+        key = next(
+            account_set for account_set in self.account_sets if account_set <= requested
+        )
+        for account_set in (key, frozenset()):
+            estimate = self._estimates.get(account_set)
+            if estimate is not None and monotonic() - estimate[1] <= self.max_age:
+                return estimate[0]
+        return None
@@ -0,0 +1,206 @@
+import math
+import re
+import struct
+from time import monotonic
+
+from solders.pubkey import Pubkey
+
+from core.priority_fee import PriorityFeePlugin
+from core.pubkeys import SystemAddresses
+
+# SetComputeUnitPrice: instruction index 3 followed by the price as a u64
+SET_COMPUTE_UNIT_PRICE = 3
+_PRICE = struct.Struct("<Q")
+# The same instruction as a serialized Geyser CompiledInstruction entry of
+# Message.instructions: entry length, program_id_index (omitted when 0, one
+# or two varint bytes otherwise) and the 9 data bytes
+_RAW_SET_PRICE = re.compile(
+    rb"\x22\x0b\x1a\x09\x03(.{8})"
+    rb"|\x22\x0d\x08[\x01-\x7f]\x1a\x09\x03(.{8})"
+    rb"|\x22\x0e\x08[\x80-\xff][\x01-\x7f]\x1a\x09\x03(.{8})",
+    re.DOTALL,
+)
+_COMPUTE_BUDGET = bytes(SystemAddresses.COMPUTE_BUDGET_PROGRAM)
+
+# Geometric buckets: bucket 0 holds zero prices, bucket i >= 1 holds prices
+# in [GROWTH ** (i - 1), GROWTH ** i), so estimates are within 10%
+GROWTH = 1.1
+MAX_PRICE = 10**10
+BUCKETS = math.ceil(math.log(MAX_PRICE) / math.log(GROWTH)) + 2
+
+
+def bucket_of(price: int) -> int:
+    """Histogram bucket of a compute unit price."""
+    if price <= 0:
+        return 0
+    return min(BUCKETS - 1, int(math.log(price) / math.log(GROWTH)) + 1)
+
+
+def bucket_price(bucket: int) -> int:
+    """Upper bound of a bucket, so a percentile is never underpaid."""
+    if bucket == 0:
+        return 0
+    return math.ceil(GROWTH**bucket)
+
+
+class StreamingPriorityFee(PriorityFeePlugin):
+    """Priority fee percentiles of landed pump.fun transactions seen on a stream.
+
+    The compute unit price of every observed transaction is counted in a
+    fixed-size histogram per slot, kept for the last `window_slots` slots,
+    so memory stays constant however many transactions arrive and reads
+    need no RPC call.
+    """
+
+    def __init__(
+        self,
+        window_slots: int = 150,
+        percentile: int = 70,
+        min_samples: int = 10,
+        max_age: float = 10.0,
+    ):
+        """
+        Initialize the streaming fee estimator.
+
+        Args:
+            window_slots: Number of recent slots the percentile covers.
+            percentile: Percentile of observed compute unit prices to pay.
+            min_samples: Observations in the window needed for an estimate.
+            max_age: Seconds without observations after which no estimate is given.
+        """
+        self.window_slots = window_slots
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.max_age = max_age
+
+        # Sparse bucket counts per slot of the window, indexed by slot % window_slots
+        self._slots: list[dict[int, int]] = [{} for _ in range(window_slots)]
+        self._totals = [0] * BUCKETS
+        self.samples = 0
+        self.latest_slot = -1
+        self.updated_at = 0.0
+        self._estimate: int | None = None
+        self._dirty = False
+
+    def observe(self, slot: int, price: int) -> None:
+        """
+        Count the compute unit price of a landed transaction.
+
+        Args:
+            slot: Slot the transaction landed in.
+            price: Compute unit price in microlamports (0 without SetComputeUnitPrice).
+        """
+        if slot > self.latest_slot:
+            self._advance(slot)
+        elif slot <= self.latest_slot - self.window_slots:
+            return
+
+        bucket = bucket_of(price)
+        counts = self._slots[slot % self.window_slots]
+        counts[bucket] = counts.get(bucket, 0) + 1
+        self._totals[bucket] += 1
+        self.samples += 1
+        self.updated_at = monotonic()
+        self._dirty = True
+
+    def observe_transaction(self, slot: int, message) -> None:
+        """
+        Count a landed transaction from its message.
+
+        Args:
+            slot: Slot the transaction landed in.
+            message: Transaction message with account_keys (raw bytes) and
+                compiled instructions, e.g. a Geyser Message.
+        """
+        self.observe(slot, compute_unit_price(message))
+
+    def _advance(self, slot: int) -> None:
+        """Drop the counts of slots leaving the window as `slot` becomes the latest."""
+        first_new = max(self.latest_slot + 1, slot - self.window_slots + 1)
+        for expired in range(first_new, slot + 1):
+            counts = self._slots[expired % self.window_slots]
+            if counts:
+                for bucket, count in counts.items():
+                    self._totals[bucket] -= count
+                    self.samples -= count
+                counts.clear()
+                self._dirty = True
+        self.latest_slot = slot
+
+    def _compute_estimate(self) -> int | None:
+        """Walk the window histogram up to the configured percentile."""
+        if self.samples < self.min_samples:
+            return None
+        rank = math.ceil(self.samples * self.percentile / 100)
+        seen = 0
+        for bucket, count in enumerate(self._totals):
+            seen += count
+            if seen >= rank:
+                return bucket_price(bucket)
+        return None
+
+    async def get_priority_fee(
+        self, accounts: list[Pubkey] | None = None
+    ) -> int | None:
+        """
+        Return the percentile of recently observed compute unit prices.
+
+        Args:
+            accounts: Ignored; the stream carries pump.fun transactions only.
+
+        Returns:
+            Optional[int]: Priority fee in microlamports, or None if too few
+                transactions were observed recently.
+        """
+        if monotonic() - self.updated_at > self.max_age:
+            return None
+        if self._dirty:
+            self._estimate = self._compute_estimate()
+            self._dirty = False
+        return self._estimate
+
+
+def compute_unit_price(message) -> int:
+    """
+    Get the compute unit price a transaction message sets.
+
+    Args:
+        message: Message with account_keys (raw bytes) and compiled instructions.
+
+    Returns:
+        int: Compute unit price in microlamports, 0 if the message sets none.
+    """
+    compute_budget = bytes(SystemAddresses.COMPUTE_BUDGET_PROGRAM)
+    account_keys = message.account_keys
+    for ix in message.instructions:
+        data = ix.data
+        if (
+            len(data) == 9
+            and data[0] == SET_COMPUTE_UNIT_PRICE
+            and ix.program_id_index < len(account_keys)
+            and account_keys[ix.program_id_index] == compute_budget
+        ):
+            return _PRICE.unpack_from(data, 1)[0]
+    return 0
+
+
+def raw_compute_unit_price(raw_update: bytes) -> int:
+    """
+    Get the compute unit price of a serialized Geyser transaction update.
+
+    Matches the serialized SetComputeUnitPrice instruction in the raw bytes
+    instead of parsing the update, and requires the compute budget program
+    among them; the program id index itself is not resolved.
+
+    Args:
+        raw_update: Serialized SubscribeUpdate.
+
+    Returns:
+        int: Compute unit price in microlamports, 0 if none is found.
+    """
+    if _COMPUTE_BUDGET not in raw_update:
+        return 0
+    match = _RAW_SET_PRICE.search(raw_update)
+    if match is None:
+        return 0
+    return _PRICE.unpack(match.group(match.lastindex))[0]
@@ -28,6 +28,9 @@ class SystemAddresses:
     SOL: Final[Pubkey] = Pubkey.from_string(
         "So11111111111111111111111111111111111111112"
     )
+    COMPUTE_BUDGET_PROGRAM: Final[Pubkey] = Pubkey.from_string(
+        "ComputeBudget111111111111111111111111111111"
+    )
 
 
 @dataclass
@@ -46,6 +49,9 @@ class PumpAddresses:
     FEE: Final[Pubkey] = Pubkey.from_string(
         "CebN5WGQ4jvEPvsVU4EoHEpgzq1VV7AbicfhtW4xC9iM"
     )
+    MINT_AUTHORITY: Final[Pubkey] = Pubkey.from_string(
+        "TSLvdd1pWpHVjahSpsvCXUbgwsL3JAcvokwaKt1eokM"
+    )
     LIQUIDITY_MIGRATOR: Final[Pubkey] = Pubkey.from_string(
         "39azUYFWPz3VHgKCf3VChUwbpURdCHRxjWVowf5jUJjg"
     )
@@ -0,0 +1,194 @@
+"""
+Exact integer trade quotes for pump.fun bonding curves.
+
+All amounts are integers in lamports and raw token units, computed with the
+same constant-product formulas and rounding as the pump.fun program, so a
+quote can be used directly as the max_sol_cost of a buy or the min_sol_output
+of a sell.
+"""
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Final
+
+from core.curve import BondingCurveState
+
+BASIS_POINTS_DENOMINATOR: Final[int] = 10_000
+
+
+@dataclass(frozen=True)
+class FeeSchedule:
+    """Trading fees charged by the pump.fun program, in basis points."""
+
+    protocol_fee_basis_points: int = 95
+    creator_fee_basis_points: int = 5
+
+    def total_basis_points(self, has_creator: bool = True) -> int:
+        """Total fee rate for a curve.
+
+        Args:
+            has_creator: Whether the curve pays a creator fee
+
+        Returns:
+            Fee rate in basis points
+        """
+        creator = self.creator_fee_basis_points if has_creator else 0
+        return self.protocol_fee_basis_points + creator
+
+    def fee(self, sol_amount: int, has_creator: bool = True) -> int:
+        """Fee charged on a trade of sol_amount lamports.
+
+        Each fee is rounded up separately, like the program does.
+
+        Args:
+            sol_amount: Trade size in lamports before fees
+            has_creator: Whether the curve pays a creator fee
+
+        Returns:
+            Total fee in lamports
+        """
+        fee = _ceil_div(
+            sol_amount * self.protocol_fee_basis_points, BASIS_POINTS_DENOMINATOR
+        )
+        if has_creator and self.creator_fee_basis_points:
+            fee += _ceil_div(
+                sol_amount * self.creator_fee_basis_points, BASIS_POINTS_DENOMINATOR
+            )
+        return fee
+
+
+DEFAULT_FEES: Final[FeeSchedule] = FeeSchedule()
+
+
+def _ceil_div(numerator: int, denominator: int) -> int:
+    """Integer division rounding up."""
+    return -(-numerator // denominator)
+
+
+def _has_creator(curve_state: BondingCurveState) -> bool:
+    """Whether the curve has a creator that receives creator fees."""
+    creator = curve_state.creator
+    return creator is not None and bytes(creator) != bytes(32)
+
+
+def buy_sol_cost(
+    curve_state: BondingCurveState,
+    token_amount: int,
+    fees: FeeSchedule = DEFAULT_FEES,
+) -> int:
+    """Lamports needed to buy exactly token_amount tokens, fees included.
+
+    Args:
+        curve_state: Current bonding curve state
+        token_amount: Tokens to buy in raw units
+        fees: Fee schedule
+
+    Returns:
+        Total cost in lamports
+
+    Raises:
+        ValueError: If the curve cannot supply token_amount tokens
+    """
+    if token_amount <= 0:
+        return 0
+    if token_amount >= curve_state.virtual_token_reserves:
+        raise ValueError("Token amount exceeds curve reserves")
+    sol_cost = (
+        token_amount
+        * curve_state.virtual_sol_reserves
+        // (curve_state.virtual_token_reserves - token_amount)
+        + 1
+    )
+    return sol_cost + fees.fee(sol_cost, _has_creator(curve_state))
+
+
+def buy_token_amount(
+    curve_state: BondingCurveState,
+    sol_amount: int,
+    fees: FeeSchedule = DEFAULT_FEES,
+) -> int:
+    """Tokens received for spending at most sol_amount lamports, fees included.
+
+    Args:
+        curve_state: Current bonding curve state
+        sol_amount: Lamports to spend including fees
+        fees: Fee schedule
+
+    Returns:
+        Tokens in raw units, capped at the curve's real token reserves
+    """
+    if sol_amount <= 1:
+        return 0
+    total_basis_points = fees.total_basis_points(_has_creator(curve_state))
+    input_amount = (
+        (sol_amount - 1)
+        * BASIS_POINTS_DENOMINATOR
+        // (BASIS_POINTS_DENOMINATOR + total_basis_points)
+    )
+    tokens = (
+        input_amount
+        * curve_state.virtual_token_reserves
+        // (curve_state.virtual_sol_reserves + input_amount)
+    )
+    return min(tokens, curve_state.real_token_reserves)
+
+
+def sell_sol_output(
+    curve_state: BondingCurveState,
+    token_amount: int,
+    fees: FeeSchedule = DEFAULT_FEES,
+) -> int:
+    """Lamports received for selling token_amount tokens, after fees.
+
+    Args:
+        curve_state: Current bonding curve state
+        token_amount: Tokens to sell in raw units
+        fees: Fee schedule
+
+    Returns:
+        Proceeds in lamports
+    """
+    if token_amount <= 0:
+        return 0
+    sol_output = (
+        token_amount
+        * curve_state.virtual_sol_reserves
+        // (curve_state.virtual_token_reserves + token_amount)
+    )
+    return max(0, sol_output - fees.fee(sol_output, _has_creator(curve_state)))
+
+
+def quote_buys(
+    curve_state: BondingCurveState,
+    sol_amounts: Sequence[int],
+    fees: FeeSchedule = DEFAULT_FEES,
+) -> list[int]:
+    """Token amounts received for each of several SOL budgets.
+
+    Args:
+        curve_state: Current bonding curve state
+        sol_amounts: Lamport budgets including fees
+        fees: Fee schedule
+
+    Returns:
+        Tokens in raw units, one per budget
+    """
+    return [buy_token_amount(curve_state, amount, fees) for amount in sol_amounts]
+
+
+def quote_sells(
+    curve_state: BondingCurveState,
+    token_amounts: Sequence[int],
+    fees: FeeSchedule = DEFAULT_FEES,
+) -> list[int]:
+    """Proceeds for each of several sell sizes.
+
+    Args:
+        curve_state: Current bonding curve state
+        token_amounts: Tokens to sell in raw units
+        fees: Fee schedule
+
+    Returns:
+        Proceeds in lamports, one per size
+    """
+    return [sell_sol_output(curve_state, amount, fees) for amount in token_amounts]
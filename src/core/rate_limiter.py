@@ -0,0 +1,177 @@
+"""
+Client-side request rate limiting for Solana RPC endpoints.
+"""
+
+import asyncio
+import heapq
+import itertools
+from collections import deque
+from enum import IntEnum
+from time import monotonic
+from typing import Any
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class RequestPriority(IntEnum):
+    """Scheduling class of an RPC request, lower values are served first."""
+
+    TRADE = 0  # Transaction sends and confirmations
+    NORMAL = 1  # Reads on the trading path
+    BACKGROUND = 2  # Cleanup, balance polling and dynamic fee lookups
+
+
+class RpcScheduler:
+    """Token bucket that serves waiting requests in priority order.
+
+    Requests take a token when one is available and nobody is queued,
+    otherwise they wait in a priority queue that a dispatcher drains as the
+    bucket refills. A JSON-RPC batch takes one token per call; a batch larger
+    than the bucket runs it into debt that later requests wait out.
+    """
+
+    def __init__(self, max_rps: float, burst: int | None = None, window: int = 1000):
+        """Initialize the scheduler.
+
+        Args:
+            max_rps: Maximum requests per second
+            burst: Bucket capacity (defaults to max_rps)
+            window: Number of recent wait times kept per priority for metrics
+        """
+        self.max_rps = max_rps
+        self.burst = burst or max(1, int(max_rps))
+        self._tokens = float(self.burst)
+        self._updated = monotonic()
+        self._queue: list[tuple[int, int, asyncio.Future, int]] = []
+        self._sequence = itertools.count()
+        self._dispatcher: asyncio.Task | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._waits: dict[RequestPriority, deque[float]] = {
+            priority: deque(maxlen=window) for priority in RequestPriority
+        }
+        self._served: dict[RequestPriority, int] = dict.fromkeys(RequestPriority, 0)
+
+    def _refill(self) -> None:
+        """Add the tokens accumulated since the last refill."""
+        now = monotonic()
+        self._tokens = min(
+            float(self.burst), self._tokens + (now - self._updated) * self.max_rps
+        )
+        self._updated = now
+
+    async def acquire(
+        self, priority: RequestPriority = RequestPriority.NORMAL, cost: int = 1
+    ) -> None:
+        """Wait until a request of the given priority may be sent.
+
+        Args:
+            priority: Scheduling class of the request
+            cost: Tokens the request takes (calls in a JSON-RPC batch)
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # A previous event loop ended, its waiters and dispatcher are gone
+            self._loop = loop
+            self._queue = []
+            self._dispatcher = None
+
+        self._refill()
+        if not self._queue and self._tokens >= self._needed(cost):
+            self._tokens -= cost
+            self._record(priority, 0.0, cost)
+            return
+
+        started = monotonic()
+        future = loop.create_future()
+        heapq.heappush(self._queue, (int(priority), next(self._sequence), future, cost))
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = asyncio.create_task(self._dispatch())
+
+        await future
+        waited = monotonic() - started
+        self._record(priority, waited, cost)
+        if waited > 1.0 and priority < RequestPriority.BACKGROUND:
+            logger.warning(
+                f"{priority.name} RPC request waited {waited:.2f}s for rate limit"
+            )
+
+    async def _dispatch(self) -> None:
+        """Hand out tokens to queued requests, highest priority first."""
+        while self._queue:
+            _, _, future, cost = self._queue[0]
+            if future.done():
+                # Caller was cancelled while waiting
+                heapq.heappop(self._queue)
+                continue
+
+            self._refill()
+            needed = self._needed(cost)
+            if self._tokens < needed:
+                await asyncio.sleep((needed - self._tokens) / self.max_rps)
+                continue
+
+            heapq.heappop(self._queue)
+            self._tokens -= cost
+            future.set_result(None)
+
+    def _needed(self, cost: int) -> float:
+        """Tokens that must be available before a request of `cost` is admitted."""
+        return float(min(cost, self.burst))
+
+    def _record(self, priority: RequestPriority, waited: float, cost: int = 1) -> None:
+        """Record the wait time of a served request."""
+        self._waits[priority].append(waited)
+        self._served[priority] += cost
+
+    def get_metrics(self) -> dict[str, Any]:
+        """Get queue depth and wait-time metrics per priority.
+
+        Returns:
+            Dictionary with the current queue depth and, per priority, the
+            number of served requests and recent wait-time statistics in ms
+        """
+        depth = dict.fromkeys((priority.name for priority in RequestPriority), 0)
+        for priority, _, future, _ in self._queue:
+            if not future.done():
+                depth[RequestPriority(priority).name] += 1
+
+        metrics: dict[str, Any] = {"max_rps": self.max_rps, "queue_depth": depth}
+        for priority in RequestPriority:
+            waits = sorted(self._waits[priority])
+            metrics[priority.name] = {
+                "served": self._served[priority],
+                "avg_wait_ms": (sum(waits) / len(waits) * 1000) if waits else 0.0,
+                "p99_wait_ms": (
+                    waits[min(len(waits) - 1, int(len(waits) * 0.99))] * 1000
+                    if waits
+                    else 0.0
+                ),
+                "max_wait_ms": (waits[-1] * 1000) if waits else 0.0,
+            }
+        return metrics
+
+
+# Schedulers shared by every client in the process, keyed by endpoint
+_schedulers: dict[str, RpcScheduler] = {}
+
+
+def get_scheduler(endpoint: str, max_rps: float) -> RpcScheduler:
+    """Get the process-wide scheduler for an endpoint.
+
+    Args:
+        endpoint: RPC endpoint URL
+        max_rps: Maximum requests per second for the endpoint
+
+    Returns:
+        Shared RpcScheduler instance
+    """
+    scheduler = _schedulers.get(endpoint)
+    if scheduler is None:
+        scheduler = RpcScheduler(max_rps)
+        _schedulers[endpoint] = scheduler
+    elif max_rps < scheduler.max_rps:
+        # The strictest limit configured for an endpoint wins
+        scheduler.max_rps = max_rps
+    return scheduler
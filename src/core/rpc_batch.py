@@ -0,0 +1,150 @@
+"""
+JSON-RPC request batching for Solana RPC calls.
+"""
+
+import asyncio
+import itertools
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from core.rate_limiter import RequestPriority
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class RpcBatcher:
+    """Coalesces concurrent JSON-RPC requests into batch array requests.
+
+    Requests issued within the batching window are sent as one JSON-RPC batch
+    and each response is dispatched back to the coroutine awaiting it.
+    """
+
+    def __init__(
+        self,
+        send_batch: Callable[
+            [list[dict[str, Any]], RequestPriority], Awaitable[list[dict[str, Any]]]
+        ],
+        window: float = 0.0,
+        max_batch_size: int = 100,
+    ):
+        """Initialize the batcher.
+
+        Args:
+            send_batch: Coroutine that posts a list of request bodies with the
+                        most urgent priority among them and returns the responses
+            window: Seconds to wait for more requests before flushing
+                    (0 = flush on the next event loop iteration)
+            max_batch_size: Flush immediately once this many requests are pending
+        """
+        self.send_batch = send_batch
+        self.window = window
+        self.max_batch_size = max_batch_size
+        self._ids = itertools.count(1)
+        self._pending: list[tuple[dict[str, Any], asyncio.Future]] = []
+        self._priority = RequestPriority.BACKGROUND
+        self._flush_handle: asyncio.Handle | None = None
+        self._dispatch_tasks: set[asyncio.Task] = set()
+
+    async def request(
+        self,
+        method: str,
+        params: list[Any] | None = None,
+        priority: RequestPriority = RequestPriority.NORMAL,
+    ) -> dict[str, Any]:
+        """Queue a request and wait for its response.
+
+        Args:
+            method: JSON-RPC method name
+            params: JSON-RPC params
+            priority: Scheduling class of the request
+
+        Returns:
+            JSON-RPC response object for this request
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        body: dict[str, Any] = {
+            "jsonrpc": "2.0",
+            "id": next(self._ids),
+            "method": method,
+        }
+        if params is not None:
+            body["params"] = params
+        self._pending.append((body, future))
+        self._priority = min(self._priority, priority)
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            if self.window > 0:
+                self._flush_handle = loop.call_later(self.window, self._flush)
+            else:
+                self._flush_handle = loop.call_soon(self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+        """Send all pending requests as one batch."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        batch, self._pending = self._pending, []
+        priority, self._priority = self._priority, RequestPriority.BACKGROUND
+        if not batch:
+            return
+
+        task = asyncio.create_task(self._dispatch(batch, priority))
+        self._dispatch_tasks.add(task)
+        task.add_done_callback(self._dispatch_tasks.discard)
+
+    async def _dispatch(
+        self,
+        batch: list[tuple[dict[str, Any], asyncio.Future]],
+        priority: RequestPriority,
+    ) -> None:
+        """Post a batch and resolve the futures waiting on it.
+
+        Args:
+            batch: Pending request bodies with their futures
+            priority: Most urgent scheduling class in the batch
+        """
+        try:
+            responses = await self.send_batch([body for body, _ in batch], priority)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        if len(batch) > 1:
+            logger.debug(f"Dispatched JSON-RPC batch of {len(batch)} requests")
+
+        by_id = {
+            response.get("id"): response
+            for response in responses
+            if isinstance(response, dict)
+        }
+        for body, future in batch:
+            if future.done():
+                continue
+            response = by_id.get(body["id"])
+            if response is None:
+                response = {
+                    "jsonrpc": "2.0",
+                    "id": body["id"],
+                    "error": {"code": -32603, "message": "Missing response in batch"},
+                }
+            future.set_result(response)
+
+    def close(self) -> None:
+        """Cancel a scheduled flush and in-flight dispatches."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        for task in self._dispatch_tasks:
+            task.cancel()
+        for _, future in self._pending:
+            future.cancel()
+        self._pending = []
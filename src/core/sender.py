@@ -0,0 +1,205 @@
+"""
+Multi-endpoint transaction fan-out for Solana transactions.
+"""
+
+import asyncio
+import base64
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from time import monotonic
+from typing import Any
+
+import aiohttp
+
+from utils import json_codec
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class EndpointStats:
+    """Acceptance statistics for a single send endpoint."""
+
+    endpoint: str
+    sent: int = 0
+    accepted: int = 0
+    failed: int = 0
+    wins: int = 0
+    last_latency_ms: float | None = None
+    total_latency_ms: float = 0.0
+
+    @property
+    def avg_latency_ms(self) -> float | None:
+        """Average acceptance latency in milliseconds."""
+        if not self.accepted:
+            return None
+        return self.total_latency_ms / self.accepted
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary.
+
+        Returns:
+            Dictionary representation
+        """
+        return {
+            "endpoint": self.endpoint,
+            "sent": self.sent,
+            "accepted": self.accepted,
+            "failed": self.failed,
+            "wins": self.wins,
+            "last_latency_ms": self.last_latency_ms,
+            "avg_latency_ms": self.avg_latency_ms,
+        }
+
+
+class TransactionSender:
+    """Pushes the same signed transaction to several endpoints concurrently."""
+
+    def __init__(
+        self,
+        endpoints: list[str],
+        get_session: Callable[[], Awaitable[aiohttp.ClientSession]],
+    ):
+        """Initialize the sender.
+
+        Args:
+            endpoints: RPC or dedicated sender endpoint URLs
+            get_session: Coroutine returning the pooled HTTP session
+        """
+        # Keep order but drop duplicates
+        self.endpoints = list(dict.fromkeys(endpoints))
+        self.get_session = get_session
+        self.stats: dict[str, EndpointStats] = {
+            endpoint: EndpointStats(endpoint) for endpoint in self.endpoints
+        }
+        self._background: set[asyncio.Task] = set()
+
+    async def send(self, transaction: bytes, skip_preflight: bool = True) -> str:
+        """Send a signed transaction to all endpoints and return the first signature.
+
+        Endpoints that answer after the winner keep running in the background
+        so their acceptance latency is still recorded.
+
+        Args:
+            transaction: Serialized signed transaction
+            skip_preflight: Whether to skip preflight checks
+
+        Returns:
+            Transaction signature from the first endpoint that accepted it
+
+        Raises:
+            RuntimeError: If every endpoint rejected the transaction
+        """
+        body = {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "sendTransaction",
+            "params": [
+                base64.b64encode(transaction).decode("ascii"),
+                {
+                    "encoding": "base64",
+                    "skipPreflight": skip_preflight,
+                    "preflightCommitment": "processed",
+                },
+            ],
+        }
+        session = await self.get_session()
+        started = monotonic()
+        tasks = {
+            asyncio.create_task(self._send_to(session, endpoint, body, started)): endpoint
+            for endpoint in self.endpoints
+        }
+
+        errors: list[str] = []
+        pending = set(tasks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    endpoint = tasks[task]
+                    try:
+                        signature = task.result()
+                    except Exception as e:
+                        errors.append(f"{endpoint}: {e!s}")
+                        continue
+
+                    self.stats[endpoint].wins += 1
+                    logger.info(
+                        f"Transaction accepted first by {endpoint} "
+                        f"in {self.stats[endpoint].last_latency_ms:.1f} ms"
+                    )
+                    return signature
+        finally:
+            for task in pending:
+                self._background.add(task)
+                task.add_done_callback(self._finish_background)
+
+        raise RuntimeError(f"All send endpoints rejected the transaction: {errors}")
+
+    async def _send_to(
+        self,
+        session: aiohttp.ClientSession,
+        endpoint: str,
+        body: dict[str, Any],
+        started: float,
+    ) -> str:
+        """Send a transaction to one endpoint and record its latency.
+
+        Args:
+            session: HTTP session to use
+            endpoint: Endpoint URL
+            body: sendTransaction request body
+            started: Monotonic time the fan-out started
+
+        Returns:
+            Transaction signature
+
+        Raises:
+            RuntimeError: If the endpoint rejected the transaction
+        """
+        stats = self.stats[endpoint]
+        stats.sent += 1
+        try:
+            async with session.post(endpoint, json=body) as response:
+                response.raise_for_status()
+                data = await response.json(
+                    content_type=None, loads=json_codec.loads
+                )
+            if "result" not in data:
+                raise RuntimeError(data.get("error", data))
+        except Exception:
+            stats.failed += 1
+            raise
+
+        latency_ms = (monotonic() - started) * 1000
+        stats.accepted += 1
+        stats.last_latency_ms = latency_ms
+        stats.total_latency_ms += latency_ms
+        return data["result"]
+
+    def _finish_background(self, task: asyncio.Task) -> None:
+        """Drop a finished background send and retrieve its outcome.
+
+        Args:
+            task: Send that finished after the winner
+        """
+        self._background.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.debug(f"Background send failed: {task.exception()!s}")
+
+    def get_stats(self) -> list[dict[str, Any]]:
+        """Get per-endpoint acceptance statistics.
+
+        Returns:
+            List of per-endpoint statistics dictionaries
+        """
+        return [stats.to_dict() for stats in self.stats.values()]
+
+    async def close(self) -> None:
+        """Cancel sends still running in the background."""
+        for task in self._background:
+            task.cancel()
+        self._background.clear()
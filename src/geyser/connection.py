@@ -0,0 +1,66 @@
+"""
+Connection helpers for Geyser gRPC endpoints.
+"""
+
+import grpc
+
+from geyser.generated import geyser_pb2, geyser_pb2_grpc
+
+VALID_AUTH_TYPES = {"x-token", "basic"}
+# Endpoints on this host (a mock server or a co-located node) are reached without TLS
+LOCAL_HOSTS = ("localhost", "127.0.0.1", "[::1]")
+SUBSCRIBE_METHOD = "/geyser.Geyser/Subscribe"
+
+
+def create_geyser_channel(
+    geyser_endpoint: str, geyser_api_token: str, auth_type: str = "x-token"
+) -> tuple[geyser_pb2_grpc.GeyserStub, grpc.aio.Channel]:
+    """Establish a secure connection to a Geyser endpoint.
+
+    Remote endpoints use TLS; endpoints on this host use gRPC local
+    credentials, which still carry the authentication metadata.
+
+    Args:
+        geyser_endpoint: Geyser gRPC endpoint URL
+        geyser_api_token: API token for authentication
+        auth_type: Authentication type ('x-token' or 'basic')
+
+    Returns:
+        Geyser stub and the underlying channel
+    """
+    if auth_type == "x-token":
+        auth = grpc.metadata_call_credentials(
+            lambda _, callback: callback((("x-token", geyser_api_token),), None)
+        )
+    else:  # Default to basic auth
+        auth = grpc.metadata_call_credentials(
+            lambda _, callback: callback((("authorization", f"Basic {geyser_api_token}"),), None)
+        )
+    host = geyser_endpoint.rsplit(":", 1)[0] if ":" in geyser_endpoint else geyser_endpoint
+    channel_creds = (
+        grpc.local_channel_credentials(grpc.LocalConnectionType.LOCAL_TCP)
+        if host in LOCAL_HOSTS
+        else grpc.ssl_channel_credentials()
+    )
+    creds = grpc.composite_channel_credentials(channel_creds, auth)
+    channel = grpc.aio.secure_channel(geyser_endpoint, creds)
+    return geyser_pb2_grpc.GeyserStub(channel), channel
+
+
+def create_raw_subscribe(channel: grpc.aio.Channel) -> grpc.aio.StreamStreamMultiCallable:
+    """Create a Subscribe call that yields updates as serialized bytes.
+
+    Lets the caller inspect raw SubscribeUpdate bytes and parse only the
+    updates it needs.
+
+    Args:
+        channel: Channel returned by create_geyser_channel
+
+    Returns:
+        Stream-stream callable taking an iterator of SubscribeRequest
+    """
+    return channel.stream_stream(
+        SUBSCRIBE_METHOD,
+        request_serializer=geyser_pb2.SubscribeRequest.SerializeToString,
+        response_deserializer=None,
+    )
@@ -3,8 +3,8 @@ WebSocket monitoring for pump.fun tokens.
 """
 
 import asyncio
-import json
 from collections.abc import Awaitable, Callable
+from time import monotonic
 
 import websockets
 from solders.pubkey import Pubkey
@@ -12,7 +12,9 @@ from solders.pubkey import Pubkey
 from monitoring.base_listener import BaseTokenListener
 from monitoring.block_event_processor import PumpEventProcessor
 from trading.base import TokenInfo
+from utils import json_codec
 from utils.logger import get_logger
+from utils.tracing import TokenTrace
 
 logger = get_logger(__name__)
 
@@ -96,7 +98,7 @@ class BlockListener(BaseTokenListener):
         Args:
             websocket: Active WebSocket connection
         """
-        subscription_message = json.dumps(
+        subscription_message = json_codec.dumps(
             {
                 "jsonrpc": "2.0",
                 "id": 1,
@@ -149,8 +151,9 @@ class BlockListener(BaseTokenListener):
             TokenInfo if a token creation is found, None otherwise
         """
         try:
-            response = await asyncio.wait_for(websocket.recv(), timeout=30)
-            data = json.loads(response)
+            response = await asyncio.wait_for(websocket.recv(decode=False), timeout=30)
+            received = monotonic()
+            data = json_codec.loads(response)
 
             if "method" not in data or data["method"] != "blockNotification":
                 return None
@@ -174,6 +177,8 @@ class BlockListener(BaseTokenListener):
                     tx["transaction"][0]
                 )
                 if token_info:
+                    token_info.trace = TokenTrace("blocks", received)
+                    token_info.trace.mark("decode")
                     return token_info
 
         except TimeoutError:
@@ -4,18 +4,97 @@ Geyser monitoring for pump.fun tokens.
 
 import asyncio
 from collections.abc import Awaitable, Callable
+from time import monotonic
 
 import grpc
 from solders.pubkey import Pubkey
 
-from geyser.generated import geyser_pb2, geyser_pb2_grpc
+from core.priority_fee.stream_fee import StreamingPriorityFee, raw_compute_unit_price
+from core.pubkeys import PumpAddresses
+from geyser.connection import (
+    VALID_AUTH_TYPES,
+    create_geyser_channel,
+    create_raw_subscribe,
+)
+from geyser.generated import geyser_pb2
 from monitoring.base_listener import BaseTokenListener
 from monitoring.geyser_event_processor import GeyserEventProcessor
 from trading.base import TokenInfo
 from utils.logger import get_logger
+from utils.tracing import TokenTrace
 
 logger = get_logger(__name__)
 
+# Seconds between update rate log lines
+STATS_INTERVAL = 60.0
+
+# Protobuf keys (field number << 3 | wire type) of SubscribeUpdate.transaction
+# and SubscribeUpdateTransaction.slot
+_TRANSACTION_KEY = 4 << 3 | 2
+_SLOT_KEY = 2 << 3 | 0
+
+
+def _read_varint(data: bytes, pos: int) -> tuple[int, int]:
+    """Decode a protobuf varint, returning its value and the next position."""
+    value = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+def _skip_field(data: bytes, pos: int, wire_type: int) -> int:
+    """Return the position after a protobuf field value of the given wire type."""
+    if wire_type == 0:
+        return _read_varint(data, pos)[1]
+    if wire_type == 1:
+        return pos + 8
+    if wire_type == 2:
+        length, pos = _read_varint(data, pos)
+        return pos + length
+    if wire_type == 5:
+        return pos + 4
+    raise ValueError(f"Unsupported protobuf wire type {wire_type}")
+
+
+def transaction_slot(raw_update: bytes) -> int | None:
+    """Get the slot of a serialized transaction update without parsing it.
+
+    Only field keys and lengths are read; the transaction itself is skipped.
+
+    Args:
+        raw_update: Serialized SubscribeUpdate
+
+    Returns:
+        Slot of the transaction, or None if the update carries no transaction
+
+    Raises:
+        ValueError: If the update is not valid protobuf
+    """
+    end = len(raw_update)
+    pos = 0
+    try:
+        while pos < end:
+            key, pos = _read_varint(raw_update, pos)
+            if key != _TRANSACTION_KEY:
+                pos = _skip_field(raw_update, pos, key & 7)
+                continue
+            length, pos = _read_varint(raw_update, pos)
+            end = pos + length
+            while pos < end:
+                key, pos = _read_varint(raw_update, pos)
+                if key == _SLOT_KEY:
+                    return _read_varint(raw_update, pos)[0]
+                pos = _skip_field(raw_update, pos, key & 7)
+            # Default values are not serialized
+            return 0
+    except IndexError:
+        raise ValueError("Truncated protobuf message") from None
+    return None
+
 
 class GeyserListener(BaseTokenListener):
     """Geyser listener for pump.fun token creation events."""
@@ -31,37 +110,48 @@ class GeyserListener(BaseTokenListener):
         """
         self.geyser_endpoint = geyser_endpoint
         self.geyser_api_token = geyser_api_token
-        valid_auth_types = {"x-token", "basic"}
         self.auth_type: str = (geyser_auth_type or "x-token").lower()
-        if self.auth_type not in valid_auth_types:
+        if self.auth_type not in VALID_AUTH_TYPES:
             raise ValueError(
                 f"Unsupported auth_type={self.auth_type!r}. "
-                f"Expected one of {valid_auth_types}"
+                f"Expected one of {VALID_AUTH_TYPES}"
             )
         self.pump_program = pump_program
         self.event_processor = GeyserEventProcessor(pump_program)
+        self._create_discriminator = GeyserEventProcessor.CREATE_DISCRIMINATOR
+        # When set, every landed pump.fun transaction is streamed and its
+        # compute unit price counted, not only creates
+        self.fee_estimator: StreamingPriorityFee | None = None
+
+        # Update counters since the last stats log line
+        self.updates_received = 0
+        self.updates_parsed = 0
+        self.tokens_found = 0
+        self._stats_started = monotonic()
         
     async def _create_geyser_connection(self):
         """Establish a secure connection to the Geyser endpoint."""
-        if self.auth_type == "x-token":
-            auth = grpc.metadata_call_credentials(
-                lambda _, callback: callback((("x-token", self.geyser_api_token),), None)
-            )
-        else:  # Default to basic auth
-            auth = grpc.metadata_call_credentials(
-                lambda _, callback: callback((("authorization", f"Basic {self.geyser_api_token}"),), None)
-            )
-        creds = grpc.composite_channel_credentials(
-            grpc.ssl_channel_credentials(), auth
+        return create_geyser_channel(
+            self.geyser_endpoint, self.geyser_api_token, self.auth_type
         )
-        channel = grpc.aio.secure_channel(self.geyser_endpoint, creds)
-        return geyser_pb2_grpc.GeyserStub(channel), channel
 
     def _create_subscription_request(self):
-        """Create a subscription request for Pump.fun transactions."""
+        """Create a subscription request for Pump.fun token creations.
+
+        Only creates reference the pump.fun mint authority, so requiring it
+        server-side drops every buy and sell before it is streamed.
+        """
         request = geyser_pb2.SubscribeRequest()
-        request.transactions["pump_filter"].account_include.append(str(self.pump_program))
-        request.transactions["pump_filter"].failed = False
+        pump_filter = request.transactions["pump_filter"]
+        pump_filter.account_include.append(str(self.pump_program))
+        pump_filter.account_required.append(str(PumpAddresses.MINT_AUTHORITY))
+        pump_filter.failed = False
+        pump_filter.vote = False
+        if self.fee_estimator:
+            fee_filter = request.transactions["pump_fees"]
+            fee_filter.account_include.append(str(self.pump_program))
+            fee_filter.failed = False
+            fee_filter.vote = False
         request.commitment = geyser_pb2.CommitmentLevel.PROCESSED
         return request
 
@@ -80,15 +170,16 @@ class GeyserListener(BaseTokenListener):
         """
         while True:
             try:
-                stub, channel = await self._create_geyser_connection()
+                _, channel = await self._create_geyser_connection()
+                subscribe = create_raw_subscribe(channel)
                 request = self._create_subscription_request()
                 
                 logger.info(f"Connected to Geyser endpoint: {self.geyser_endpoint}")
                 logger.info(f"Monitoring for transactions involving program: {self.pump_program}")
                 
                 try:
-                    async for update in stub.Subscribe(iter([request])):
-                        token_info = await self._process_update(update)
+                    async for raw_update in subscribe(iter([request])):
+                        token_info = await self._process_raw_update(raw_update)
                         if not token_info:
                             continue
                             
@@ -128,15 +219,81 @@ class GeyserListener(BaseTokenListener):
                 logger.info("Reconnecting in 10 seconds...")
                 await asyncio.sleep(10)
     
-    async def _process_update(self, update) -> TokenInfo | None:
+    async def _process_raw_update(self, raw_update: bytes) -> TokenInfo | None:
+        """Prefilter a serialized Geyser update and process it if it may be a create.
+
+        Instruction data is embedded verbatim in the serialized update, so
+        an update without the create discriminator anywhere in its bytes
+        cannot carry a create and is dropped without parsing. The fee
+        estimator is fed from the raw bytes as well, so the buys and sells
+        streamed for it are never parsed.
+
+        Args:
+            raw_update: Serialized SubscribeUpdate
+
+        Returns:
+            TokenInfo if a token creation is found, None otherwise
+        """
+        received = monotonic()
+        self.updates_received += 1
+        if received - self._stats_started >= STATS_INTERVAL:
+            self._log_stats(received)
+
+        if self.fee_estimator:
+            self._observe_fee(raw_update)
+        if self._create_discriminator not in raw_update:
+            return None
+        self.updates_parsed += 1
+        try:
+            update = geyser_pb2.SubscribeUpdate.FromString(raw_update)
+        except Exception as e:
+            logger.error(f"Failed to parse Geyser update: {e}")
+            return None
+
+        token_info = await self._process_update(update, received)
+        if token_info:
+            self.tokens_found += 1
+        return token_info
+
+    def _observe_fee(self, raw_update: bytes) -> None:
+        """Count the compute unit price of a serialized transaction update.
+
+        Args:
+            raw_update: Serialized SubscribeUpdate
+        """
+        try:
+            slot = transaction_slot(raw_update)
+        except ValueError as e:
+            logger.debug(f"Failed to read Geyser update slot: {e!s}")
+            return
+        if slot is not None:
+            self.fee_estimator.observe(slot, raw_compute_unit_price(raw_update))
+
+    def _log_stats(self, now: float) -> None:
+        """Log update rates since the last call and reset the counters."""
+        elapsed = now - self._stats_started
+        logger.info(
+            f"Geyser updates: {self.updates_received / elapsed:.1f}/s received, "
+            f"{self.updates_parsed / elapsed:.1f}/s parsed, "
+            f"{self.tokens_found} token(s) in {elapsed:.0f}s"
+        )
+        self.updates_received = 0
+        self.updates_parsed = 0
+        self.tokens_found = 0
+        self._stats_started = now
+
+    async def _process_update(self, update, received: float | None = None) -> TokenInfo | None:
         """Process a Geyser update and extract token creation info.
         
         Args:
             update: Geyser update from the subscription
+            received: Monotonic time the update arrived (defaults to now)
             
         Returns:
             TokenInfo if a token creation is found, None otherwise
         """
+        if received is None:
+            received = monotonic()
         try:
             if not update.HasField("transaction"):
                 return None
@@ -161,6 +318,8 @@ class GeyserListener(BaseTokenListener):
                     ix.data, ix.accounts, msg.account_keys
                 )
                 if token_info:
+                    token_info.trace = TokenTrace("geyser", received)
+                    token_info.trace.mark("decode")
                     return token_info
                     
             return None
@@ -0,0 +1,358 @@
+"""
+Shared market-data hub for bots running in separate processes.
+
+The hub process owns one subscription per token source, one blockhash cache
+and one priority fee refresh, and fans the results out to every connected bot
+over a local Unix socket. Bots connect with HubListener, which applies their
+own match and creator filters and feeds their blockhash cache and fee plugin.
+
+Messages are length-prefixed JSON documents:
+    token:     a decoded TokenInfo with the source that delivered it first and
+               its trace timestamps
+    blockhash: the latest blockhash and its validity window
+    fee:       the latest priority fee estimates in microlamports, keyed by
+               the percentile of recent fees each bot pays
+"""
+
+import asyncio
+import os
+import struct
+from collections.abc import Awaitable, Callable
+from time import monotonic
+from typing import Any
+
+from solders.hash import Hash
+from solders.pubkey import Pubkey
+
+from core.blockhash import BlockhashCache
+from core.client import SolanaClient
+from core.priority_fee.dynamic_fee import DynamicPriorityFee, fee_percentile
+from core.priority_fee.hub_fee import HubPriorityFee
+from core.pubkeys import PumpAddresses
+from monitoring.base_listener import BaseTokenListener
+from trading.base import TokenInfo
+from utils import json_codec
+from utils.logger import get_logger
+from utils.tracing import TokenTrace
+
+logger = get_logger(__name__)
+
+DEFAULT_SOCKET_PATH = "/tmp/pump-bot-hub.sock"
+
+_FRAME_HEADER = struct.Struct("<I")
+
+TOKEN_FIELDS = (
+    "mint",
+    "bonding_curve",
+    "associated_bonding_curve",
+    "user",
+    "creator",
+    "creator_vault",
+)
+
+
+def encode_message(message: dict[str, Any]) -> bytes:
+    """Frame a message for the hub socket."""
+    payload = json_codec.dumps_bytes(message)
+    return _FRAME_HEADER.pack(len(payload)) + payload
+
+
+async def read_message(reader: asyncio.StreamReader) -> dict[str, Any]:
+    """Read one framed message from the hub socket.
+
+    Raises:
+        asyncio.IncompleteReadError: If the connection closes mid-frame
+    """
+    header = await reader.readexactly(_FRAME_HEADER.size)
+    (length,) = _FRAME_HEADER.unpack(header)
+    return json_codec.loads(await reader.readexactly(length))
+
+
+def token_message(token_info: TokenInfo) -> dict[str, Any]:
+    """Build the message announcing a detected token.
+
+    Trace timestamps are monotonic. The monotonic clock is system-wide, so the
+    bot process can continue the trace where the hub left off.
+    """
+    message: dict[str, Any] = {
+        "type": "token",
+        "name": token_info.name,
+        "symbol": token_info.symbol,
+        "uri": token_info.uri,
+    }
+    for field in TOKEN_FIELDS:
+        message[field] = str(getattr(token_info, field))
+    trace = token_info.trace
+    if trace:
+        message["source"] = trace.listener
+        message["detected"] = trace.started
+        message["marks"] = trace.marks
+    return message
+
+
+def token_from_message(message: dict[str, Any]) -> TokenInfo:
+    """Rebuild a TokenInfo (with its trace) from a token message."""
+    token_info = TokenInfo(
+        name=message["name"],
+        symbol=message["symbol"],
+        uri=message["uri"],
+        **{field: Pubkey.from_string(message[field]) for field in TOKEN_FIELDS},
+    )
+    if "detected" in message:
+        trace = TokenTrace(message["source"], message["detected"])
+        trace.marks.extend((stage, at) for stage, at in message["marks"])
+        trace.mark("hub")
+        token_info.trace = trace
+    return token_info
+
+
+class MarketDataHub:
+    """Publishes tokens, blockhashes and priority fees to local bot processes."""
+
+    def __init__(
+        self,
+        listener: BaseTokenListener,
+        client: SolanaClient,
+        socket_path: str = DEFAULT_SOCKET_PATH,
+        fee_interval: float = 0.0,
+        fee_percentiles: list[int] | None = None,
+        blockhash_interval: float = 0.4,
+        max_client_buffer: int = 1024 * 1024,
+    ):
+        """Initialize the hub.
+
+        Args:
+            listener: Token listener shared by all bots (usually racing several sources)
+            client: Solana client whose blockhash cache is published
+            socket_path: Unix socket path bots connect to
+            fee_interval: Seconds between priority fee refreshes (0 = no fees)
+            fee_percentiles: Percentiles of recent fees to publish, one per
+                             percentile the bots pay (default: 70)
+            blockhash_interval: Seconds between checks for a new cached blockhash
+            max_client_buffer: Bytes queued for a bot before it is disconnected
+                               as too slow
+        """
+        self.listener = listener
+        self.client = client
+        self.socket_path = socket_path
+        self.fee_interval = fee_interval
+        self.fee_percentiles = fee_percentiles or [70]
+        self.blockhash_interval = blockhash_interval
+        self.max_client_buffer = max_client_buffer
+        # Fees of the pump.fun program accounts: a fresh mint has no fee history
+        self.fee_plugin = DynamicPriorityFee(client)
+        self.fee_accounts = [PumpAddresses.PROGRAM, PumpAddresses.FEE]
+
+        self._clients: set[asyncio.StreamWriter] = set()
+        self._last_blockhash: dict[str, Any] | None = None
+        self._last_fee: dict[str, Any] | None = None
+
+    @property
+    def client_count(self) -> int:
+        """Number of connected bots."""
+        return len(self._clients)
+
+    async def run(self) -> None:
+        """Serve bots until cancelled."""
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+        server = await asyncio.start_unix_server(self._handle_client, path=self.socket_path)
+        logger.info(f"Market-data hub listening on {self.socket_path}")
+
+        tasks = [
+            asyncio.create_task(self.listener.listen_for_tokens(self.publish_token)),
+            asyncio.create_task(self._blockhash_loop()),
+        ]
+        if self.fee_interval > 0:
+            tasks.append(asyncio.create_task(self._fee_loop()))
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            server.close()
+            for writer in list(self._clients):
+                writer.close()
+            self._clients.clear()
+            await server.wait_closed()
+            if os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)
+            await self.client.close()
+
+    async def publish_token(self, token_info: TokenInfo) -> None:
+        """Send a detected token to every connected bot."""
+        self._broadcast(encode_message(token_message(token_info)))
+        logger.info(
+            f"Published token {token_info.symbol} ({token_info.mint}) "
+            f"to {len(self._clients)} bot(s)"
+        )
+
+    async def _handle_client(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Register a bot connection and keep it until it closes."""
+        self._clients.add(writer)
+        logger.info(f"Bot connected to hub ({len(self._clients)} connected)")
+        for message in (self._last_blockhash, self._last_fee):
+            if message:
+                writer.write(encode_message(message))
+        try:
+            # Bots never send anything; reading only detects the disconnect
+            while await reader.read(1024):
+                pass
+        except ConnectionError:
+            pass
+        finally:
+            self._clients.discard(writer)
+            writer.close()
+            logger.info(f"Bot disconnected from hub ({len(self._clients)} connected)")
+
+    def _broadcast(self, frame: bytes) -> None:
+        """Queue a frame on every bot connection, dropping bots that fell behind."""
+        for writer in list(self._clients):
+            if writer.transport.get_write_buffer_size() > self.max_client_buffer:
+                logger.warning("Disconnecting bot that stopped reading hub updates")
+                self._clients.discard(writer)
+                writer.close()
+                continue
+            writer.write(frame)
+
+    async def _blockhash_loop(self) -> None:
+        """Publish every new blockhash of the shared cache."""
+        cache = self.client.blockhash_cache
+        published = None
+        while True:
+            snapshot = cache.snapshot
+            if snapshot is not None and snapshot is not published:
+                published = snapshot
+                self._last_blockhash = {
+                    "type": "blockhash",
+                    "blockhash": str(snapshot.blockhash),
+                    "slot": snapshot.slot,
+                    "block_height": snapshot.block_height,
+                    "last_valid_block_height": snapshot.last_valid_block_height,
+                }
+                self._broadcast(encode_message(self._last_blockhash))
+            await asyncio.sleep(self.blockhash_interval)
+
+    async def _fee_loop(self) -> None:
+        """Refresh and publish the priority fee estimates."""
+        while True:
+            fees = await self._fetch_fee_estimates()
+            if fees:
+                self._last_fee = {"type": "fee", "fees": fees}
+                self._broadcast(encode_message(self._last_fee))
+            await asyncio.sleep(self.fee_interval)
+
+    async def _fetch_fee_estimates(self) -> dict[str, int] | None:
+        """Fetch recent fees once and estimate every published percentile."""
+        try:
+            fees = await self.fee_plugin.fetch_fees(self.fee_accounts)
+        except Exception as e:
+            logger.error(f"Failed to fetch recent priority fees: {e!s}")
+            return None
+        if not fees:
+            return None
+        return {
+            str(percentile): fee_percentile(fees, percentile)
+            for percentile in self.fee_percentiles
+        }
+
+
+class HubListener(BaseTokenListener):
+    """Receives tokens, blockhashes and fees from the market-data hub."""
+
+    def __init__(
+        self,
+        socket_path: str = DEFAULT_SOCKET_PATH,
+        blockhash_cache: BlockhashCache | None = None,
+        fee_plugin: HubPriorityFee | None = None,
+        reconnect_delay: float = 1.0,
+    ):
+        """Initialize the hub listener.
+
+        Args:
+            socket_path: Unix socket path of the hub
+            blockhash_cache: Cache fed with the blockhashes the hub publishes
+            fee_plugin: Fee plugin fed with the fees the hub publishes
+            reconnect_delay: Seconds to wait before reconnecting to the hub
+        """
+        self.socket_path = socket_path
+        self.blockhash_cache = blockhash_cache
+        self.fee_plugin = fee_plugin
+        self.reconnect_delay = reconnect_delay
+        self.last_message_at: float | None = None
+
+    async def listen_for_tokens(
+        self,
+        token_callback: Callable[[TokenInfo], Awaitable[None]],
+        match_string: str | None = None,
+        creator_address: str | None = None,
+    ) -> None:
+        """Listen for new tokens published by the hub.
+
+        Args:
+            token_callback: Callback function for new tokens
+            match_string: Optional string to match in token name/symbol
+            creator_address: Optional creator address to filter by
+        """
+        while True:
+            try:
+                reader, writer = await asyncio.open_unix_connection(self.socket_path)
+                logger.info(f"Connected to market-data hub at {self.socket_path}")
+                try:
+                    while True:
+                        token_info = self._handle_message(await read_message(reader))
+                        if not token_info:
+                            continue
+
+                        logger.info(
+                            f"New token detected: {token_info.name} ({token_info.symbol})"
+                        )
+
+                        if match_string and not (
+                            match_string.lower() in token_info.name.lower()
+                            or match_string.lower() in token_info.symbol.lower()
+                        ):
+                            logger.info(
+                                f"Token does not match filter '{match_string}'. Skipping..."
+                            )
+                            continue
+
+                        if creator_address and str(token_info.user) != creator_address:
+                            logger.info(f"Token not created by {creator_address}. Skipping...")
+                            continue
+
+                        await token_callback(token_info)
+                finally:
+                    writer.close()
+
+            except asyncio.IncompleteReadError:
+                logger.warning("Market-data hub closed the connection. Reconnecting...")
+            except Exception as e:
+                logger.error(f"Market-data hub connection error: {e!s}")
+
+            await asyncio.sleep(self.reconnect_delay)
+
+    def _handle_message(self, message: dict[str, Any]) -> TokenInfo | None:
+        """Apply a hub message and return the token it carries, if any."""
+        self.last_message_at = monotonic()
+        message_type = message.get("type")
+        if message_type == "token":
+            return token_from_message(message)
+        if message_type == "blockhash":
+            if self.blockhash_cache:
+                self.blockhash_cache.update(
+                    Hash.from_string(message["blockhash"]),
+                    message["slot"],
+                    message["block_height"],
+                    message["last_valid_block_height"],
+                )
+        elif message_type == "fee":
+            fee = message["fees"].get(str(self.fee_plugin.percentile)) if self.fee_plugin else None
+            if fee is not None:
+                self.fee_plugin.update(fee)
+        else:
+            logger.debug(f"Ignoring unknown hub message: {message_type}")
+        return None
@@ -3,8 +3,8 @@ WebSocket monitoring for pump.fun tokens using logsSubscribe.
 """
 
 import asyncio
-import json
 from collections.abc import Awaitable, Callable
+from time import monotonic
 
 import websockets
 from solders.pubkey import Pubkey
@@ -12,7 +12,9 @@ from solders.pubkey import Pubkey
 from monitoring.base_listener import BaseTokenListener
 from monitoring.logs_event_processor import LogsEventProcessor
 from trading.base import TokenInfo
+from utils import json_codec
 from utils.logger import get_logger
+from utils.tracing import TokenTrace
 
 logger = get_logger(__name__)
 
@@ -96,7 +98,7 @@ class LogsListener(BaseTokenListener):
         Args:
             websocket: Active WebSocket connection
         """
-        subscription_message = json.dumps(
+        subscription_message = json_codec.dumps(
             {
                 "jsonrpc": "2.0",
                 "id": 1,
@@ -113,7 +115,7 @@ class LogsListener(BaseTokenListener):
 
         # Wait for subscription confirmation
         response = await websocket.recv()
-        response_data = json.loads(response)
+        response_data = json_codec.loads(response)
         if "result" in response_data:
             logger.info(f"Subscription confirmed with ID: {response_data['result']}")
         else:
@@ -143,8 +145,9 @@ class LogsListener(BaseTokenListener):
 
     async def _wait_for_token_creation(self, websocket) -> TokenInfo | None:
         try:
-            response = await asyncio.wait_for(websocket.recv(), timeout=30)
-            data = json.loads(response)
+            response = await asyncio.wait_for(websocket.recv(decode=False), timeout=30)
+            received = monotonic()
+            data = json_codec.loads(response)
 
             if "method" not in data or data["method"] != "logsNotification":
                 return None
@@ -154,7 +157,11 @@ class LogsListener(BaseTokenListener):
             signature = log_data.get("signature", "unknown")
 
             # Use the processor to extract token info
-            return self.event_processor.process_program_logs(logs, signature)
+            token_info = self.event_processor.process_program_logs(logs, signature)
+            if token_info:
+                token_info.trace = TokenTrace("logs", received)
+                token_info.trace.mark("decode")
+            return token_info
 
         except asyncio.TimeoutError:
             logger.debug("No data received for 30 seconds")
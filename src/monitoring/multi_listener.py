@@ -0,0 +1,274 @@
+"""
+Racing listener that combines several token sources.
+
+Every source (Geyser, logsSubscribe or blockSubscribe, possibly on several
+endpoints each) runs concurrently and each mint is forwarded only from the
+source that delivered it first. Per source, the listener keeps how often it
+won the race and how far behind the winner it was when it lost.
+"""
+
+import asyncio
+from collections import deque
+from collections.abc import Awaitable, Callable
+from time import monotonic
+from typing import Any
+
+from core.pubkeys import PumpAddresses
+from monitoring.base_listener import BaseTokenListener
+from monitoring.block_listener import BlockListener
+from monitoring.geyser_listener import GeyserListener
+from monitoring.logs_listener import LogsListener
+from trading.base import TokenInfo
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+LISTENER_TYPES = ("logs", "blocks", "geyser")
+
+
+def create_listener(
+    listener_type: str,
+    wss_endpoint: str | None = None,
+    geyser_endpoint: str | None = None,
+    geyser_api_token: str | None = None,
+    geyser_auth_type: str | None = "x-token",
+) -> BaseTokenListener:
+    """Create a single token listener.
+
+    Args:
+        listener_type: Type of listener ('logs', 'blocks', or 'geyser')
+        wss_endpoint: WebSocket endpoint URL (logs and blocks listeners)
+        geyser_endpoint: Geyser endpoint URL (geyser listener)
+        geyser_api_token: Geyser API token (geyser listener)
+        geyser_auth_type: Geyser authentication type ('x-token' or 'basic')
+
+    Returns:
+        Listener for the requested source
+
+    Raises:
+        ValueError: If the listener type is unknown or its endpoint is missing
+    """
+    listener_type = listener_type.lower()
+    if listener_type == "geyser":
+        if not geyser_endpoint or not geyser_api_token:
+            raise ValueError("Geyser endpoint and API token are required for geyser listener")
+        return GeyserListener(
+            geyser_endpoint, geyser_api_token, geyser_auth_type, PumpAddresses.PROGRAM
+        )
+    if listener_type not in LISTENER_TYPES:
+        raise ValueError(f"Unknown listener type: {listener_type}")
+    if not wss_endpoint:
+        raise ValueError(f"WebSocket endpoint is required for {listener_type} listener")
+    if listener_type == "logs":
+        return LogsListener(wss_endpoint, PumpAddresses.PROGRAM)
+    return BlockListener(wss_endpoint, PumpAddresses.PROGRAM)
+
+
+def create_source_listeners(sources: list[dict[str, Any]]) -> dict[str, BaseTokenListener]:
+    """Create named listeners from source definitions.
+
+    Each source is a mapping with a ``type`` and the endpoint settings of that
+    type: ``wss_endpoint`` for logs and blocks, ``endpoint``, ``api_token`` and
+    ``auth_type`` for geyser. Sources are named by their optional ``name`` or
+    their type, numbered when a name repeats.
+
+    Args:
+        sources: Source definitions
+
+    Returns:
+        Listeners by source name, in the given order
+    """
+    listeners: dict[str, BaseTokenListener] = {}
+    for source in sources:
+        listener_type = source["type"].lower()
+        base_name = source.get("name") or listener_type
+        name = base_name
+        index = 1
+        while name in listeners:
+            index += 1
+            name = f"{base_name}-{index}"
+        listeners[name] = create_listener(
+            listener_type,
+            wss_endpoint=source.get("wss_endpoint"),
+            geyser_endpoint=source.get("endpoint"),
+            geyser_api_token=source.get("api_token"),
+            geyser_auth_type=source.get("auth_type", "x-token"),
+        )
+    return listeners
+
+
+class SourceStats:
+    """Race results of one token source."""
+
+    __slots__ = ("delivered", "lags", "wins")
+
+    def __init__(self, window: int):
+        self.wins = 0
+        self.delivered = 0
+        # Seconds behind the winner, for the races this source lost
+        self.lags: deque[float] = deque(maxlen=window)
+
+    def lag_percentile(self, fraction: float) -> float | None:
+        """Get a percentile of the recent lags in seconds (None if never late)."""
+        if not self.lags:
+            return None
+        ordered = sorted(self.lags)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+class MultiSourceListener(BaseTokenListener):
+    """Runs several token listeners at once and forwards each mint once."""
+
+    def __init__(
+        self,
+        sources: dict[str, BaseTokenListener],
+        max_seen: int = 10_000,
+        lag_window: int = 500,
+        summary_every: int = 100,
+    ):
+        """Initialize the racing listener.
+
+        Args:
+            sources: Listeners by source name
+            max_seen: Number of recent mints remembered for deduplication
+            lag_window: Number of recent lags kept per source
+            summary_every: Log race statistics after this many tokens (0 = never)
+        """
+        if not sources:
+            raise ValueError("At least one token source is required")
+        self.sources = sources
+        self.max_seen = max_seen
+        self.summary_every = summary_every
+        self.tokens = 0
+        self.stats = {name: SourceStats(lag_window) for name in sources}
+        # Raw mint -> (winning source, arrival time). Check and insert happen
+        # without an await in between, so the event loop makes them atomic
+        # and no lock is needed.
+        self._seen: dict[bytes, tuple[str, float]] = {}
+
+    async def listen_for_tokens(
+        self,
+        token_callback: Callable[[TokenInfo], Awaitable[None]],
+        match_string: str | None = None,
+        creator_address: str | None = None,
+    ) -> None:
+        """Listen on every source and forward the first arrival of each token.
+
+        Args:
+            token_callback: Callback function for new tokens
+            match_string: Optional string to match in token name/symbol
+            creator_address: Optional creator address to filter by
+        """
+        logger.info(f"Racing token sources: {', '.join(self.sources)}")
+        tasks = [
+            asyncio.create_task(
+                listener.listen_for_tokens(
+                    self._source_callback(name, token_callback, match_string, creator_address)
+                ),
+                name=f"listener-{name}",
+            )
+            for name, listener in self.sources.items()
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _source_callback(
+        self,
+        name: str,
+        token_callback: Callable[[TokenInfo], Awaitable[None]],
+        match_string: str | None,
+        creator_address: str | None,
+    ) -> Callable[[TokenInfo], Awaitable[None]]:
+        """Build the callback a source reports its tokens to."""
+
+        async def on_token(token_info: TokenInfo) -> None:
+            if not self.register(name, token_info):
+                return
+
+            if match_string and not (
+                match_string.lower() in token_info.name.lower()
+                or match_string.lower() in token_info.symbol.lower()
+            ):
+                logger.info(f"Token does not match filter '{match_string}'. Skipping...")
+                return
+
+            if creator_address and str(token_info.user) != creator_address:
+                logger.info(f"Token not created by {creator_address}. Skipping...")
+                return
+
+            await token_callback(token_info)
+
+        return on_token
+
+    def register(self, source: str, token_info: TokenInfo) -> bool:
+        """Record a delivery and check whether it is the first for its mint.
+
+        Arrival is the time the source received the update carrying the token
+        (taken from its trace), so decoding time does not skew the race.
+
+        Args:
+            source: Name of the delivering source
+            token_info: Delivered token
+
+        Returns:
+            True if the source is the first to deliver the mint
+        """
+        trace = token_info.trace
+        arrived = trace.started if trace else monotonic()
+        stats = self.stats[source]
+        stats.delivered += 1
+
+        key = bytes(token_info.mint)
+        first = self._seen.get(key)
+        if first is not None:
+            stats.lags.append(max(0.0, arrived - first[1]))
+            return False
+
+        self._seen[key] = (source, arrived)
+        if len(self._seen) > self.max_seen:
+            del self._seen[next(iter(self._seen))]
+        stats.wins += 1
+        self.tokens += 1
+        if trace:
+            trace.listener = source
+
+        if self.summary_every and self.tokens % self.summary_every == 0:
+            self.log_summary()
+        return True
+
+    def get_stats(self) -> dict[str, dict[str, float | int | None]]:
+        """Get win rates and lag percentiles per source.
+
+        Returns:
+            Mapping of source name to wins, deliveries, win rate and p50/p99
+            lag behind the winner in milliseconds
+        """
+        stats = {}
+        for name, source in self.stats.items():
+            p50 = source.lag_percentile(0.5)
+            p99 = source.lag_percentile(0.99)
+            stats[name] = {
+                "wins": source.wins,
+                "delivered": source.delivered,
+                "win_rate": source.wins / self.tokens if self.tokens else 0.0,
+                "lag_p50_ms": p50 * 1000 if p50 is not None else None,
+                "lag_p99_ms": p99 * 1000 if p99 is not None else None,
+            }
+        return stats
+
+    def log_summary(self) -> None:
+        """Log the current race statistics."""
+        for name, values in self.get_stats().items():
+            lag = (
+                f"lag p50/p99 {values['lag_p50_ms']:.1f}/{values['lag_p99_ms']:.1f} ms"
+                if values["lag_p50_ms"] is not None
+                else "never late"
+            )
+            logger.info(
+                f"Source {name}: won {values['wins']}/{self.tokens} "
+                f"({values['win_rate']:.0%}), delivered {values['delivered']}, {lag}"
+            )
@@ -0,0 +1,277 @@
+"""
+Record and replay raw listener streams.
+
+A recording is an append-only file of length-prefixed records. Each record
+holds the stream it came from, the wall-clock time it was received and the
+raw bytes exactly as they arrived: a serialized Geyser SubscribeUpdate or a
+logsSubscribe/blockSubscribe WebSocket frame. Replaying a recording feeds the
+same bytes through the listeners' decode path, either at the recorded pace or
+as fast as possible, for deterministic offline throughput and latency numbers.
+"""
+
+import asyncio
+import struct
+import time
+from collections import defaultdict
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from time import monotonic, perf_counter
+from typing import Any, BinaryIO
+
+import websockets
+
+from core.pubkeys import PumpAddresses
+from geyser.connection import create_raw_subscribe
+from monitoring.block_event_processor import PumpEventProcessor
+from monitoring.block_listener import BlockListener
+from monitoring.geyser_listener import GeyserListener
+from monitoring.logs_event_processor import LogsEventProcessor
+from monitoring.logs_listener import LogsListener
+from trading.base import TokenInfo
+from utils import json_codec
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+MAGIC = b"PBSTREAM1\n"
+
+# Stream kinds
+GEYSER = 1
+LOGS = 2
+BLOCKS = 3
+KIND_NAMES = {GEYSER: "geyser", LOGS: "logs", BLOCKS: "blocks"}
+
+# kind, received (unix seconds), payload length
+_RECORD_HEADER = struct.Struct("<BdI")
+
+
+@dataclass(frozen=True)
+class StreamRecord:
+    """One raw message of a recorded stream."""
+
+    kind: int
+    received: float
+    payload: bytes
+
+
+class StreamRecorder:
+    """Appends raw stream messages to a recording file."""
+
+    def __init__(self, path: str | Path):
+        """Open a recording for appending, writing the file header if it is new.
+
+        Args:
+            path: Recording file path
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file: BinaryIO = open(self.path, "ab")
+        if self._file.tell() == 0:
+            self._file.write(MAGIC)
+        self.recorded = 0
+
+    def record(self, kind: int, payload: bytes, received: float | None = None) -> None:
+        """Append one message.
+
+        Args:
+            kind: Stream kind (GEYSER, LOGS or BLOCKS)
+            payload: Raw message bytes
+            received: Unix time the message was received (defaults to now)
+        """
+        if isinstance(payload, str):
+            payload = payload.encode()
+        self._file.write(
+            _RECORD_HEADER.pack(kind, time.time() if received is None else received, len(payload))
+        )
+        self._file.write(payload)
+        self.recorded += 1
+
+    def flush(self) -> None:
+        """Flush buffered records to the file."""
+        self._file.flush()
+
+    def close(self) -> None:
+        """Flush and close the recording."""
+        if not self._file.closed:
+            self._file.close()
+
+    async def record_geyser(self, listener: GeyserListener) -> None:
+        """Record the raw updates of a Geyser listener's subscription until cancelled.
+
+        Args:
+            listener: Geyser listener whose endpoint and filters are used
+        """
+        _, channel = await listener._create_geyser_connection()
+        subscribe = create_raw_subscribe(channel)
+        try:
+            logger.info(f"Recording Geyser updates from {listener.geyser_endpoint}")
+            async for raw_update in subscribe(iter([listener._create_subscription_request()])):
+                self.record(GEYSER, raw_update)
+        finally:
+            self.flush()
+            await channel.close()
+
+    async def record_websocket(self, listener: LogsListener | BlockListener) -> None:
+        """Record the raw frames of a logs or blocks listener's subscription until cancelled.
+
+        Args:
+            listener: WebSocket listener whose endpoint and subscription are used
+        """
+        if isinstance(listener, LogsListener):
+            kind, subscribe = LOGS, listener._subscribe_to_logs
+        else:
+            kind, subscribe = BLOCKS, listener._subscribe_to_program
+        async with websockets.connect(listener.wss_endpoint, max_size=None) as websocket:
+            await subscribe(websocket)
+            logger.info(f"Recording {KIND_NAMES[kind]} frames from {listener.wss_endpoint}")
+            try:
+                while True:
+                    self.record(kind, await websocket.recv(decode=False))
+            finally:
+                self.flush()
+
+
+def read_recording(path: str | Path) -> Iterator[StreamRecord]:
+    """Read the records of a recording in order.
+
+    A record cut short at the end of the file (a recorder that was killed)
+    ends the iteration instead of raising.
+
+    Args:
+        path: Recording file path
+
+    Yields:
+        Recorded messages
+    """
+    with open(path, "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} is not a stream recording")
+        while True:
+            header = f.read(_RECORD_HEADER.size)
+            if len(header) < _RECORD_HEADER.size:
+                return
+            kind, received, length = _RECORD_HEADER.unpack(header)
+            payload = f.read(length)
+            if len(payload) < length:
+                logger.warning(f"Recording {path} ends with a truncated record")
+                return
+            yield StreamRecord(kind, received, payload)
+
+
+@dataclass
+class ReplayStats:
+    """Decode throughput and latency of a replay."""
+
+    messages: dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    tokens: dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    decode_times: dict[str, list[float]] = field(default_factory=lambda: defaultdict(list))
+    # Seconds each message was handed over later than its recorded offset
+    lateness: list[float] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @staticmethod
+    def _percentile(values: list[float], fraction: float) -> float:
+        ordered = sorted(values)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+    def summary(self) -> dict[str, dict[str, Any]]:
+        """Get per-stream counts, throughput and decode latency percentiles.
+
+        Returns:
+            Mapping of stream name to messages, tokens, messages per second of
+            decode time and p50/p99/max decode latency in microseconds
+        """
+        summary = {}
+        for kind, times in self.decode_times.items():
+            busy = sum(times)
+            summary[kind] = {
+                "messages": self.messages[kind],
+                "tokens": self.tokens[kind],
+                "messages_per_s": len(times) / busy if busy else 0.0,
+                "p50_us": self._percentile(times, 0.5) * 1e6,
+                "p99_us": self._percentile(times, 0.99) * 1e6,
+                "max_us": max(times) * 1e6,
+            }
+        return summary
+
+
+class StreamReplayer:
+    """Feeds a recording through the listeners' decode path."""
+
+    def __init__(self, path: str | Path, speed: float | None = None):
+        """Initialize the replayer.
+
+        Args:
+            path: Recording file path
+            speed: Replay pace relative to the recording (1.0 = recorded
+                   speed, 2.0 = twice as fast, None = as fast as possible)
+        """
+        self.path = Path(path)
+        self.speed = speed
+        self.geyser_listener = GeyserListener(
+            "replay", "replay", "x-token", PumpAddresses.PROGRAM
+        )
+        self.logs_processor = LogsEventProcessor(PumpAddresses.PROGRAM)
+        self.block_processor = PumpEventProcessor(PumpAddresses.PROGRAM)
+
+    async def replay(self) -> tuple[ReplayStats, list[TokenInfo]]:
+        """Replay the whole recording.
+
+        Returns:
+            Replay statistics and the tokens decoded, in order
+        """
+        stats = ReplayStats()
+        tokens: list[TokenInfo] = []
+        first_received = None
+        started = monotonic()
+        for record in read_recording(self.path):
+            if self.speed:
+                if first_received is None:
+                    first_received = record.received
+                due = started + (record.received - first_received) / self.speed
+                delay = due - monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                stats.lateness.append(max(0.0, monotonic() - due))
+
+            kind = KIND_NAMES.get(record.kind)
+            if kind is None:
+                continue
+            decode_started = perf_counter()
+            found = await self._decode(record)
+            stats.decode_times[kind].append(perf_counter() - decode_started)
+            stats.messages[kind] += 1
+            stats.tokens[kind] += len(found)
+            tokens.extend(found)
+
+        stats.elapsed = monotonic() - started
+        return stats, tokens
+
+    async def _decode(self, record: StreamRecord) -> list[TokenInfo]:
+        """Decode one recorded message with the processor of its listener."""
+        if record.kind == GEYSER:
+            # Same entry point as the live stream, raw prefilter included
+            token_info = await self.geyser_listener._process_raw_update(record.payload)
+            return [token_info] if token_info else []
+
+        data = json_codec.loads(record.payload)
+        if record.kind == LOGS:
+            if data.get("method") != "logsNotification":
+                return []
+            value = data["params"]["result"]["value"]
+            token_info = self.logs_processor.process_program_logs(
+                value.get("logs", []), value.get("signature", "unknown")
+            )
+            return [token_info] if token_info else []
+
+        if data.get("method") != "blockNotification":
+            return []
+        block = data["params"]["result"]["value"].get("block") or {}
+        found = []
+        for tx in block.get("transactions", []):
+            if isinstance(tx, dict) and "transaction" in tx:
+                token_info = self.block_processor.process_transaction(tx["transaction"][0])
+                if token_info:
+                    found.append(token_info)
+        return found
@@ -3,12 +3,13 @@ Base interfaces for trading operations.
 """
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
 
 from solders.pubkey import Pubkey
 
 from core.pubkeys import PumpAddresses
+from utils.tracing import TokenTrace
 
 
 @dataclass
@@ -24,6 +25,8 @@ class TokenInfo:
     user: Pubkey
     creator: Pubkey
     creator_vault: Pubkey
+    # Latency trace from detection on, set by the listener
+    trace: TokenTrace | None = field(default=None, repr=False, compare=False)
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "TokenInfo":
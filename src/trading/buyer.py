@@ -5,21 +5,17 @@ Buy operations for pump.fun tokens.
 import struct
 from typing import Final
 
-from solders.instruction import AccountMeta, Instruction
 from solders.pubkey import Pubkey
-from spl.token.instructions import create_idempotent_associated_token_account
 
 from core.client import SolanaClient
+from core.compute_units import BUY_CREATE_ATA
 from core.curve import BondingCurveManager
 from core.priority_fee.manager import PriorityFeeManager
-from core.pubkeys import (
-    LAMPORTS_PER_SOL,
-    TOKEN_DECIMALS,
-    PumpAddresses,
-    SystemAddresses,
-)
+from core.pubkeys import LAMPORTS_PER_SOL, TOKEN_DECIMALS
+from core.quote import buy_sol_cost, buy_token_amount
 from core.wallet import Wallet
 from trading.base import TokenInfo, Trader, TradeResult
+from trading.templates import BuyTransactionTemplate
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -64,6 +60,10 @@ class TokenBuyer(Trader):
         self.max_retries = max_retries
         self.extreme_fast_mode = extreme_fast_mode
         self.extreme_fast_token_amount = extreme_fast_token_amount
+        self._templates = {
+            with_fee: BuyTransactionTemplate(wallet, EXPECTED_DISCRIMINATOR, with_fee)
+            for with_fee in (True, False)
+        }
 
     async def execute(self, token_info: TokenInfo, *args, **kwargs) -> TradeResult:
         """Execute buy operation.
@@ -81,16 +81,27 @@ class TokenBuyer(Trader):
             if self.extreme_fast_mode:
                 # Skip the wait and directly calculate the amount
                 token_amount = self.extreme_fast_token_amount
+                token_amount_raw = int(token_amount * 10**TOKEN_DECIMALS)
                 token_price_sol = self.amount / token_amount
                 #logger.info(f"EXTREME FAST Mode: Buying {token_amount} tokens.")
+
+                # Calculate maximum SOL to spend with slippage
+                max_amount_lamports = int(amount_lamports * (1 + self.slippage))
             else:
-                # Regular behavior with RPC call
+                # Regular behavior with RPC call: quote exactly, fees included
                 curve_state = await self.curve_manager.get_curve_state(token_info.bonding_curve)
-                token_price_sol = curve_state.calculate_price()
-                token_amount = self.amount / token_price_sol
+                token_amount_raw = buy_token_amount(curve_state, amount_lamports)
+                if token_amount_raw <= 0:
+                    raise ValueError("Buy amount too small for the current curve")
+                token_amount = token_amount_raw / 10**TOKEN_DECIMALS
+                token_price_sol = self.amount / token_amount
 
-            # Calculate maximum SOL to spend with slippage
-            max_amount_lamports = int(amount_lamports * (1 + self.slippage))
+                # Slippage only has to cover curve movement before landing
+                max_amount_lamports = int(
+                    buy_sol_cost(curve_state, token_amount_raw) * (1 + self.slippage)
+                )
+            if token_info.trace:
+                token_info.trace.mark("quote")
 
             associated_token_account = self.wallet.get_associated_token_address(
                 token_info.mint
@@ -99,7 +110,7 @@ class TokenBuyer(Trader):
             tx_signature = await self._send_buy_transaction(
                 token_info,
                 associated_token_account,
-                token_amount,
+                token_amount_raw,
                 max_amount_lamports,
             )
 
@@ -110,7 +121,9 @@ class TokenBuyer(Trader):
                 f"Total cost: {self.amount:.6f} SOL (max: {max_amount_lamports / LAMPORTS_PER_SOL:.6f} SOL)"
             )
 
-            success = await self.client.confirm_transaction(tx_signature)
+            success = await self.client.confirm_transaction(
+                tx_signature, trace=token_info.trace
+            )
 
             if success:
                 logger.info(f"Buy transaction confirmed: {tx_signature}")
@@ -130,11 +143,22 @@ class TokenBuyer(Trader):
             logger.error(f"Buy operation failed: {e!s}")
             return TradeResult(success=False, error_message=str(e))
 
+    def _get_template(self, with_priority_fee: bool) -> BuyTransactionTemplate:
+        """Get the pre-compiled buy template.
+
+        Args:
+            with_priority_fee: Whether the transaction carries a priority fee
+
+        Returns:
+            Buy transaction template
+        """
+        return self._templates[with_priority_fee]
+
     async def _send_buy_transaction(
         self,
         token_info: TokenInfo,
         associated_token_account: Pubkey,
-        token_amount: float,
+        token_amount_raw: int,
         max_amount_lamports: int,
     ) -> str:
         """Send buy transaction.
@@ -142,7 +166,7 @@ class TokenBuyer(Trader):
         Args:
             token_info: Token information
             associated_token_account: User's token account
-            token_amount: Amount of tokens to buy
+            token_amount_raw: Amount of tokens to buy in raw units
             max_amount_lamports: Maximum SOL to spend in lamports
 
         Returns:
@@ -151,67 +175,39 @@ class TokenBuyer(Trader):
         Raises:
             Exception: If transaction fails after all retries
         """
-        accounts = [
-            AccountMeta(
-                pubkey=PumpAddresses.GLOBAL, is_signer=False, is_writable=False
-            ),
-            AccountMeta(pubkey=PumpAddresses.FEE, is_signer=False, is_writable=True),
-            AccountMeta(pubkey=token_info.mint, is_signer=False, is_writable=False),
-            AccountMeta(
-                pubkey=token_info.bonding_curve, is_signer=False, is_writable=True
-            ),
-            AccountMeta(
-                pubkey=token_info.associated_bonding_curve,
-                is_signer=False,
-                is_writable=True,
-            ),
-            AccountMeta(
-                pubkey=associated_token_account, is_signer=False, is_writable=True
-            ),
-            AccountMeta(pubkey=self.wallet.pubkey, is_signer=True, is_writable=True),
-            AccountMeta(
-                pubkey=SystemAddresses.PROGRAM, is_signer=False, is_writable=False
-            ),
-            AccountMeta(
-                pubkey=SystemAddresses.TOKEN_PROGRAM, is_signer=False, is_writable=False
-            ),
-            AccountMeta(
-                pubkey=token_info.creator_vault, is_signer=False, is_writable=True
-            ),
-            AccountMeta(
-                pubkey=PumpAddresses.EVENT_AUTHORITY, is_signer=False, is_writable=False
-            ),
-            AccountMeta(
-                pubkey=PumpAddresses.PROGRAM, is_signer=False, is_writable=False
-            ),
-        ]
-
-        # Prepare idempotent create ATA instruction: it will not fail if ATA already exists
-        idempotent_ata_ix = create_idempotent_associated_token_account(
-            self.wallet.pubkey,
-            self.wallet.pubkey,
-            token_info.mint,
-            SystemAddresses.TOKEN_PROGRAM
+        priority_fee = await self.priority_fee_manager.calculate_priority_fee(
+            self._get_relevant_accounts(token_info)
         )
-
-        # Prepare buy instruction data
-        token_amount_raw = int(token_amount * 10**TOKEN_DECIMALS)
-        data = (
-            EXPECTED_DISCRIMINATOR
-            + struct.pack("<Q", token_amount_raw)
-            + struct.pack("<Q", max_amount_lamports)
+        logger.info(
+            f"Priority fee in microlamports: {priority_fee if priority_fee else 0}"
+        )
+        if token_info.trace:
+            token_info.trace.mark("priority_fee")
+
+        # Only the token-specific keys and amounts are patched into a template
+        # compiled ahead of time, then the message is signed
+        template = self._get_template(with_priority_fee=priority_fee is not None)
+        transaction = template.build(
+            token_info,
+            associated_token_account,
+            token_amount_raw,
+            max_amount_lamports,
+            await self.client.get_cached_blockhash(),
+            priority_fee,
+            self.client.compute_units.get_limit(BUY_CREATE_ATA),
         )
-        buy_ix = Instruction(PumpAddresses.PROGRAM, data, accounts)
+        if token_info.trace:
+            token_info.trace.mark("build")
+        # The template always carries the idempotent token account creation;
+        # a freshly detected mint has no token account yet
+        self.client.compute_units.sample(BUY_CREATE_ATA, transaction)
 
         try:
-            return await self.client.build_and_send_transaction(
-                [idempotent_ata_ix, buy_ix],
-                self.wallet.keypair,
+            return await self.client.send_raw_transaction(
+                transaction,
                 skip_preflight=True,
                 max_retries=self.max_retries,
-                priority_fee=await self.priority_fee_manager.calculate_priority_fee(
-                    self._get_relevant_accounts(token_info)
-                ),
+                trace=token_info.trace,
             )
         except Exception as e:
             logger.error(f"Buy transaction failed: {e!s}")
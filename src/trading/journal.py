@@ -0,0 +1,335 @@
+"""
+Asynchronous trade journal.
+
+Records are handed to a bounded queue from the event loop and written in
+batches by a background thread, so a slow or stalled disk never delays a
+trade. Each sink appends to a size-rotated file:
+
+- ``jsonl``: one JSON object per line (``trades.log``, the historical format)
+- ``binary``: length-prefixed frames (``trades.bin``); buys and sells use a
+  fixed 121-byte layout plus the symbol, other records are stored as JSON
+"""
+
+import asyncio
+import os
+import queue
+import struct
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from solders.pubkey import Pubkey
+from solders.signature import Signature
+
+from utils import json_codec
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+FSYNC_POLICIES = ("none", "interval", "batch")
+
+# Frame header: payload length, record kind
+_FRAME = struct.Struct("<IB")
+_KIND_JSON = 0
+_KIND_TRADE = 1
+# Trade payload: timestamp, is_sell, mint, price, amount, signature, then the symbol
+_TRADE = struct.Struct("<d?32sdd64s")
+_TRADE_ACTIONS = ("buy", "sell")
+_NO_SIGNATURE = bytes(64)
+
+_STOP = object()
+
+
+class _RotatingFile(ABC):
+    """Append-only file rotated to ``name.1`` .. ``name.N`` once it grows too large."""
+
+    def __init__(self, path: Path, max_bytes: int, backup_count: int):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "ab")
+
+    @abstractmethod
+    def encode(self, record: dict[str, Any]) -> bytes:
+        """Serialize one record to the bytes appended to the file."""
+
+    def write(self, records: list[dict[str, Any]]) -> None:
+        """Append a batch of records, rotating first if the file is full."""
+        data = b"".join(self.encode(record) for record in records)
+        size = self._file.tell()
+        if self.max_bytes and size and size + len(data) > self.max_bytes:
+            self._rotate()
+        self._file.write(data)
+
+    def flush(self, fsync: bool) -> None:
+        """Flush buffered data to the OS, and to disk if fsync is set."""
+        self._file.flush()
+        if fsync:
+            os.fsync(self._file.fileno())
+
+    def _rotate(self) -> None:
+        self._file.close()
+        if self.backup_count > 0:
+            for index in range(self.backup_count - 1, 0, -1):
+                source = self.path.with_name(f"{self.path.name}.{index}")
+                if source.exists():
+                    source.replace(self.path.with_name(f"{self.path.name}.{index + 1}"))
+            self.path.replace(self.path.with_name(f"{self.path.name}.1"))
+        else:
+            self.path.unlink(missing_ok=True)
+        self._file = open(self.path, "ab")
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class JsonlSink(_RotatingFile):
+    """One JSON object per line, with ISO-8601 UTC timestamps."""
+
+    def encode(self, record: dict[str, Any]) -> bytes:
+        timestamp = datetime.fromtimestamp(record["timestamp"], UTC)
+        line = {"timestamp": timestamp.replace(tzinfo=None).isoformat()}
+        line.update((key, value) for key, value in record.items() if key != "timestamp")
+        return json_codec.dumps_bytes(line) + b"\n"
+
+
+class BinarySink(_RotatingFile):
+    """Length-prefixed binary frames; buys and sells are packed with a fixed layout."""
+
+    def encode(self, record: dict[str, Any]) -> bytes:
+        if record.get("action") in _TRADE_ACTIONS:
+            tx_hash = record.get("tx_hash")
+            payload = _TRADE.pack(
+                record["timestamp"],
+                record["action"] == "sell",
+                bytes(Pubkey.from_string(record["token_address"])),
+                record.get("price") or 0.0,
+                record.get("amount") or 0.0,
+                bytes(Signature.from_string(tx_hash)) if tx_hash else _NO_SIGNATURE,
+            ) + (record.get("symbol") or "").encode()
+            kind = _KIND_TRADE
+        else:
+            payload = json_codec.dumps_bytes(record)
+            kind = _KIND_JSON
+        return _FRAME.pack(len(payload), kind) + payload
+
+
+def read_binary_journal(path: str | Path) -> Iterator[dict[str, Any]]:
+    """Decode the records of a binary journal file.
+
+    Args:
+        path: Journal file written by BinarySink
+
+    Yields:
+        Records as written, with float timestamps
+
+    Raises:
+        ValueError: If the file ends inside a frame
+    """
+    data = Path(path).read_bytes()
+    offset = 0
+    while offset < len(data):
+        if offset + _FRAME.size > len(data):
+            raise ValueError(f"Truncated frame header at offset {offset}")
+        length, kind = _FRAME.unpack_from(data, offset)
+        offset += _FRAME.size
+        payload = data[offset : offset + length]
+        if len(payload) < length:
+            raise ValueError(f"Truncated frame at offset {offset}")
+        offset += length
+
+        if kind != _KIND_TRADE:
+            yield json_codec.loads(payload)
+            continue
+        timestamp, is_sell, mint, price, amount, signature = _TRADE.unpack_from(payload)
+        yield {
+            "timestamp": timestamp,
+            "action": "sell" if is_sell else "buy",
+            "token_address": str(Pubkey.from_bytes(mint)),
+            "symbol": payload[_TRADE.size :].decode(),
+            "price": price,
+            "amount": amount,
+            "tx_hash": (
+                str(Signature.from_bytes(signature)) if signature != _NO_SIGNATURE else None
+            ),
+        }
+
+
+SINKS = {"jsonl": (JsonlSink, ".log"), "binary": (BinarySink, ".bin")}
+
+
+class TradeJournal:
+    """Batched, non-blocking writer for trade and token records."""
+
+    def __init__(
+        self,
+        directory: str | Path = "trades",
+        formats: tuple[str, ...] | list[str] = ("jsonl",),
+        name: str = "trades",
+        fsync: str = "interval",
+        fsync_interval: float = 1.0,
+        flush_interval: float = 0.2,
+        max_batch_size: int = 256,
+        max_queue_size: int = 10_000,
+        max_bytes: int = 64 * 1024 * 1024,
+        backup_count: int = 5,
+    ):
+        """Initialize the journal.
+
+        Args:
+            directory: Directory the journal files are written to
+            formats: Sinks to write ('jsonl' and/or 'binary')
+            name: File name stem, e.g. 'trades' for trades.log and trades.bin
+            fsync: When to fsync: 'none', 'interval' (every fsync_interval) or
+                   'batch' (after every batch)
+            fsync_interval: Seconds between fsyncs with the 'interval' policy
+            flush_interval: Seconds the writer collects records into a batch
+            max_batch_size: Maximum records written per batch
+            max_queue_size: Records held in memory before new ones are dropped
+            max_bytes: Size at which a file is rotated (0 = never)
+            backup_count: Rotated files kept per sink
+        """
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f"fsync must be one of {FSYNC_POLICIES}")
+        unknown = set(formats) - SINKS.keys()
+        if unknown:
+            raise ValueError(f"Unknown journal formats: {sorted(unknown)}")
+
+        self.directory = Path(directory)
+        self.formats = tuple(formats)
+        self.name = name
+        self.fsync = fsync
+        self.fsync_interval = fsync_interval
+        self.flush_interval = flush_interval
+        self.max_batch_size = max_batch_size
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue_size)
+        self._thread: threading.Thread | None = None
+        self.dropped = 0
+        self.written = 0
+
+    def start(self) -> None:
+        """Start the background writer thread."""
+        if self._thread is None and self.formats:
+            self._thread = threading.Thread(
+                target=self._run, name=f"{self.name}-journal", daemon=True
+            )
+            self._thread.start()
+
+    def write(self, record: dict[str, Any]) -> bool:
+        """Queue a record without blocking.
+
+        Args:
+            record: JSON-serializable record; a float ``timestamp`` is added if missing
+
+        Returns:
+            True if the record was queued, False if it was dropped
+        """
+        if not self.formats:
+            return False
+        record.setdefault("timestamp", time.time())
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+            if self.dropped == 1 or self.dropped % 1000 == 0:
+                logger.warning(f"Trade journal queue full, {self.dropped} record(s) dropped")
+            return False
+        return True
+
+    def _next_batch(self) -> tuple[list[dict[str, Any]], bool]:
+        """Collect records until the batch is full or flush_interval has passed.
+
+        Returns:
+            The batch and whether close() was requested
+        """
+        batch: list[dict[str, Any]] = []
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.max_batch_size:
+            timeout = deadline - time.monotonic()
+            try:
+                record = self._queue.get(timeout=max(timeout, 0))
+            except queue.Empty:
+                break
+            if record is _STOP:
+                return batch, True
+            batch.append(record)
+        return batch, False
+
+    def _run(self) -> None:
+        """Writer thread: drain the queue in batches until stopped."""
+        try:
+            sinks = [
+                sink_cls(
+                    self.directory / f"{self.name}{suffix}",
+                    self.max_bytes,
+                    self.backup_count,
+                )
+                for sink_cls, suffix in (SINKS[name] for name in self.formats)
+            ]
+        except OSError as e:
+            logger.error(f"Failed to open trade journal in {self.directory}: {e!s}")
+            return
+
+        last_fsync = time.monotonic()
+        unsynced = False
+        stopping = False
+        try:
+            while not stopping:
+                batch, stopping = self._next_batch()
+                now = time.monotonic()
+                if batch:
+                    for sink in sinks:
+                        try:
+                            sink.write(batch)
+                            sink.flush(fsync=False)
+                        except Exception as e:
+                            logger.error(f"Failed to write trade journal {sink.path}: {e!s}")
+                    self.written += len(batch)
+                    unsynced = True
+
+                fsync_due = self.fsync == "batch" or (
+                    self.fsync == "interval" and now - last_fsync >= self.fsync_interval
+                )
+                if unsynced and fsync_due:
+                    for sink in sinks:
+                        try:
+                            sink.flush(fsync=True)
+                        except OSError as e:
+                            logger.error(f"Failed to fsync trade journal {sink.path}: {e!s}")
+                    last_fsync = now
+                    unsynced = False
+        finally:
+            for sink in sinks:
+                try:
+                    sink.flush(self.fsync != "none")
+                    sink.close()
+                except OSError as e:
+                    logger.error(f"Failed to close trade journal {sink.path}: {e!s}")
+
+    async def close(self, timeout: float = 5.0) -> None:
+        """Write out queued records and stop the writer thread.
+
+        Args:
+            timeout: Seconds to wait for the writer to finish
+        """
+        if self._thread is None:
+            return
+        thread, self._thread = self._thread, None
+        try:
+            # Waits only if the queue is full, until the writer drains it
+            await asyncio.to_thread(self._queue.put, _STOP, True, timeout)
+        except queue.Full:
+            logger.warning("Trade journal queue still full at shutdown")
+        await asyncio.to_thread(thread.join, timeout)
+        if thread.is_alive():
+            logger.warning("Trade journal writer did not finish in time")
+        if self.dropped:
+            logger.warning(f"Trade journal dropped {self.dropped} record(s)")
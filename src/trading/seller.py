@@ -2,6 +2,7 @@
 Sell operations for pump.fun tokens.
 """
 
+import asyncio
 import struct
 from typing import Final
 
@@ -9,6 +10,7 @@ from solders.instruction import AccountMeta, Instruction
 from solders.pubkey import Pubkey
 
 from core.client import SolanaClient
+from core.compute_units import SELL
 from core.curve import BondingCurveManager
 from core.priority_fee.manager import PriorityFeeManager
 from core.pubkeys import (
@@ -17,6 +19,7 @@ from core.pubkeys import (
     PumpAddresses,
     SystemAddresses,
 )
+from core.quote import sell_sol_output
 from core.wallet import Wallet
 from trading.base import TokenInfo, Trader, TradeResult
 from utils.logger import get_logger
@@ -70,10 +73,17 @@ class TokenSeller(Trader):
                 token_info.mint
             )
 
-            # Get token balance
-            token_balance = await self.client.get_token_account_balance(
-                associated_token_account
+            # Get token balance and curve state concurrently; without hedging
+            # both reads go out in the same JSON-RPC batch
+            token_balance, curve_state = await asyncio.gather(
+                self.client.get_token_account_balance(
+                    associated_token_account, hedged=True
+                ),
+                self.curve_manager.get_curve_state(token_info.bonding_curve),
+                return_exceptions=True,
             )
+            if isinstance(token_balance, Exception):
+                raise token_balance
             token_balance_decimal = token_balance / 10**TOKEN_DECIMALS
 
             logger.info(f"Token balance: {token_balance_decimal}")
@@ -81,22 +91,21 @@ class TokenSeller(Trader):
             if token_balance == 0:
                 logger.info("No tokens to sell.")
                 return TradeResult(success=False, error_message="No tokens to sell")
+            # The curve only matters once there is something to sell
+            if isinstance(curve_state, Exception):
+                raise curve_state
 
-            # Fetch token price
-            curve_state = await self.curve_manager.get_curve_state(
-                token_info.bonding_curve
-            )
-            token_price_sol = curve_state.calculate_price()
+            # Quote the exact proceeds, price impact and fees included
+            amount = token_balance
+            expected_sol_output_lamports = sell_sol_output(curve_state, amount)
+            expected_sol_output = expected_sol_output_lamports / LAMPORTS_PER_SOL
+            token_price_sol = expected_sol_output / token_balance_decimal
 
             logger.info(f"Price per Token: {token_price_sol:.8f} SOL")
 
-            # Calculate minimum SOL output with slippage
-            amount = token_balance
-            expected_sol_output = float(token_balance_decimal) * float(token_price_sol)
+            # Slippage only has to cover curve movement before landing
             slippage_factor = 1 - self.slippage
-            min_sol_output = int(
-                (expected_sol_output * slippage_factor) * LAMPORTS_PER_SOL
-            )
+            min_sol_output = int(expected_sol_output_lamports * slippage_factor)
 
             logger.info(f"Selling {token_balance_decimal} tokens")
             logger.info(f"Expected SOL output: {expected_sol_output:.8f} SOL")
@@ -205,6 +214,7 @@ class TokenSeller(Trader):
                 priority_fee=await self.priority_fee_manager.calculate_priority_fee(
                     self._get_relevant_accounts(token_info)
                 ),
+                compute_unit_shape=SELL,
             )
         except Exception as e:
             logger.error(f"Sell transaction failed: {e!s}")
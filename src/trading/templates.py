@@ -0,0 +1,251 @@
+"""
+Pre-compiled transaction templates for pump.fun trades.
+"""
+
+import struct
+from typing import Final
+
+from solders.compute_budget import set_compute_unit_limit, set_compute_unit_price
+from solders.hash import Hash
+from solders.instruction import AccountMeta, Instruction
+from solders.message import Message
+from solders.pubkey import Pubkey
+
+from core.compute_units import DEFAULT_COMPUTE_UNIT_LIMIT
+from core.pubkeys import PumpAddresses, SystemAddresses
+from core.wallet import Wallet
+from trading.base import TokenInfo
+
+# Sentinel values written into the template so their offsets can be located
+_TOKEN_AMOUNT_SENTINEL: Final[int] = 0x1F2E3D4C5B6A7988
+_MAX_COST_SENTINEL: Final[int] = 0x8879A6B5C4D3E2F1
+_PRICE_SENTINEL: Final[int] = 0x5A4B3C2D1E0F9687
+_LIMIT_SENTINEL: Final[int] = 0x7A6B5C4D
+
+
+def _encode_length(value: int) -> bytes:
+    """Encode a compact-u16 (shortvec) length prefix."""
+    out = bytearray()
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return bytes(out)
+
+
+def _find_unique(message: bytes, needle: bytes) -> int:
+    """Find the only occurrence of needle in message.
+
+    Raises:
+        ValueError: If needle is missing or occurs more than once
+    """
+    offset = message.find(needle)
+    if offset < 0 or message.find(needle, offset + 1) >= 0:
+        raise ValueError("Template sentinel is not unique in compiled message")
+    return offset
+
+
+class BuyTransactionTemplate:
+    """Buy transaction compiled once with placeholder keys and amounts.
+
+    Everything that does not depend on the token (global, fee, system and
+    token programs, event authority, compute budget instructions, fee payer)
+    is compiled into a legacy message up front. At detection time only the
+    mint-dependent keys, the amounts, the priority fee and the blockhash are
+    written into a copy of the message bytes before signing.
+    """
+
+    def __init__(self, wallet: Wallet, discriminator: bytes, with_priority_fee: bool):
+        """Compile the template.
+
+        Args:
+            wallet: Wallet that pays for and signs the transaction
+            discriminator: Buy instruction discriminator
+            with_priority_fee: Whether to include compute budget instructions
+        """
+        self.wallet = wallet
+        self.discriminator = discriminator
+        self.with_priority_fee = with_priority_fee
+
+        placeholders = {
+            name: Pubkey.new_unique()
+            for name in (
+                "mint",
+                "bonding_curve",
+                "associated_bonding_curve",
+                "associated_token_account",
+                "creator_vault",
+            )
+        }
+        message = Message(
+            self._instructions(wallet.pubkey, placeholders), wallet.pubkey
+        )
+        self._message = bytes(message)
+
+        keys = list(message.account_keys)
+        keys_offset = 3 + len(_encode_length(len(keys)))
+        self._key_offsets = {
+            name: keys_offset + 32 * keys.index(pubkey)
+            for name, pubkey in placeholders.items()
+        }
+        self._blockhash_offset = keys_offset + 32 * len(keys)
+
+        self._token_amount_offset = _find_unique(
+            self._message, struct.pack("<Q", _TOKEN_AMOUNT_SENTINEL)
+        )
+        self._max_cost_offset = _find_unique(
+            self._message, struct.pack("<Q", _MAX_COST_SENTINEL)
+        )
+        if with_priority_fee:
+            self._price_offset = _find_unique(
+                self._message, struct.pack("<Q", _PRICE_SENTINEL)
+            )
+            self._limit_offset = _find_unique(
+                self._message, struct.pack("<I", _LIMIT_SENTINEL)
+            )
+
+    def _instructions(
+        self, payer: Pubkey, placeholders: dict[str, Pubkey]
+    ) -> list[Instruction]:
+        """Build the template instructions around placeholder keys.
+
+        Args:
+            payer: Fee payer and token account owner
+            placeholders: Placeholder keys for the mint-dependent accounts
+
+        Returns:
+            Template instructions
+        """
+        accounts = [
+            AccountMeta(
+                pubkey=PumpAddresses.GLOBAL, is_signer=False, is_writable=False
+            ),
+            AccountMeta(pubkey=PumpAddresses.FEE, is_signer=False, is_writable=True),
+            AccountMeta(
+                pubkey=placeholders["mint"], is_signer=False, is_writable=False
+            ),
+            AccountMeta(
+                pubkey=placeholders["bonding_curve"], is_signer=False, is_writable=True
+            ),
+            AccountMeta(
+                pubkey=placeholders["associated_bonding_curve"],
+                is_signer=False,
+                is_writable=True,
+            ),
+            AccountMeta(
+                pubkey=placeholders["associated_token_account"],
+                is_signer=False,
+                is_writable=True,
+            ),
+            AccountMeta(pubkey=payer, is_signer=True, is_writable=True),
+            AccountMeta(
+                pubkey=SystemAddresses.PROGRAM, is_signer=False, is_writable=False
+            ),
+            AccountMeta(
+                pubkey=SystemAddresses.TOKEN_PROGRAM, is_signer=False, is_writable=False
+            ),
+            AccountMeta(
+                pubkey=placeholders["creator_vault"], is_signer=False, is_writable=True
+            ),
+            AccountMeta(
+                pubkey=PumpAddresses.EVENT_AUTHORITY, is_signer=False, is_writable=False
+            ),
+            AccountMeta(
+                pubkey=PumpAddresses.PROGRAM, is_signer=False, is_writable=False
+            ),
+        ]
+
+        data = (
+            self.discriminator
+            + struct.pack("<Q", _TOKEN_AMOUNT_SENTINEL)
+            + struct.pack("<Q", _MAX_COST_SENTINEL)
+        )
+        # Same layout as spl create_idempotent_associated_token_account, which
+        # derives the ATA itself and so cannot take a placeholder key
+        idempotent_ata_ix = Instruction(
+            SystemAddresses.ASSOCIATED_TOKEN_PROGRAM,
+            bytes([1]),
+            [
+                AccountMeta(pubkey=payer, is_signer=True, is_writable=True),
+                AccountMeta(
+                    pubkey=placeholders["associated_token_account"],
+                    is_signer=False,
+                    is_writable=True,
+                ),
+                AccountMeta(pubkey=payer, is_signer=False, is_writable=False),
+                AccountMeta(
+                    pubkey=placeholders["mint"], is_signer=False, is_writable=False
+                ),
+                AccountMeta(
+                    pubkey=SystemAddresses.PROGRAM, is_signer=False, is_writable=False
+                ),
+                AccountMeta(
+                    pubkey=SystemAddresses.TOKEN_PROGRAM,
+                    is_signer=False,
+                    is_writable=False,
+                ),
+            ],
+        )
+        instructions = [
+            idempotent_ata_ix,
+            Instruction(PumpAddresses.PROGRAM, data, accounts),
+        ]
+        if self.with_priority_fee:
+            instructions = [
+                set_compute_unit_limit(_LIMIT_SENTINEL),
+                set_compute_unit_price(_PRICE_SENTINEL),
+                *instructions,
+            ]
+        return instructions
+
+    def build(
+        self,
+        token_info: TokenInfo,
+        associated_token_account: Pubkey,
+        token_amount_raw: int,
+        max_amount_lamports: int,
+        recent_blockhash: Hash,
+        priority_fee: int | None = None,
+        compute_unit_limit: int = DEFAULT_COMPUTE_UNIT_LIMIT,
+    ) -> bytes:
+        """Patch the token-specific fields in and sign the transaction.
+
+        Args:
+            token_info: Token information
+            associated_token_account: User's token account
+            token_amount_raw: Amount of tokens to buy in raw units
+            max_amount_lamports: Maximum SOL to spend in lamports
+            recent_blockhash: Recent blockhash
+            priority_fee: Priority fee in microlamports (template with fee only)
+            compute_unit_limit: Compute unit limit (template with fee only)
+
+        Returns:
+            Serialized signed transaction
+        """
+        message = bytearray(self._message)
+        offsets = self._key_offsets
+        for name, pubkey in (
+            ("mint", token_info.mint),
+            ("bonding_curve", token_info.bonding_curve),
+            ("associated_bonding_curve", token_info.associated_bonding_curve),
+            ("associated_token_account", associated_token_account),
+            ("creator_vault", token_info.creator_vault),
+        ):
+            message[offsets[name] : offsets[name] + 32] = bytes(pubkey)
+
+        struct.pack_into("<Q", message, self._token_amount_offset, token_amount_raw)
+        struct.pack_into("<Q", message, self._max_cost_offset, max_amount_lamports)
+        if self.with_priority_fee:
+            struct.pack_into("<Q", message, self._price_offset, priority_fee or 0)
+            struct.pack_into("<I", message, self._limit_offset, compute_unit_limit)
+        message[self._blockhash_offset : self._blockhash_offset + 32] = bytes(
+            recent_blockhash
+        )
+
+        message = bytes(message)
+        signature = self.wallet.keypair.sign_message(message)
+        # Legacy transaction: one signature followed by the message
+        return b"\x01" + bytes(signature) + message
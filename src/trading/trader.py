@@ -4,9 +4,6 @@ Refactored PumpTrader to only process fresh tokens from WebSocket.
 """
 
 import asyncio
-import json
-import os
-from datetime import datetime
 from time import monotonic
 
 import uvloop
@@ -19,16 +16,26 @@ from cleanup.modes import (
 )
 from core.client import SolanaClient
 from core.curve import BondingCurveManager
+from core.curve_cache import CurveStateCache
+from core.priority_fee.hub_fee import HubPriorityFee
 from core.priority_fee.manager import PriorityFeeManager
-from core.pubkeys import PumpAddresses
+from core.priority_fee.oracle import PriorityFeeOracle
+from core.priority_fee.stream_fee import StreamingPriorityFee
 from core.wallet import Wallet
-from monitoring.block_listener import BlockListener
 from monitoring.geyser_listener import GeyserListener
-from monitoring.logs_listener import LogsListener
+from monitoring.hub import HubListener
+from monitoring.multi_listener import (
+    MultiSourceListener,
+    create_listener,
+    create_source_listeners,
+)
 from trading.base import TokenInfo, TradeResult
 from trading.buyer import TokenBuyer
+from trading.journal import TradeJournal
 from trading.seller import TokenSeller
+from utils.dedup import MintDeduplicator
 from utils.logger import get_logger
+from utils.tracing import LatencyTracker
 
 asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
 
@@ -49,9 +56,15 @@ class PumpTrader:
         geyser_endpoint: str | None = None,
         geyser_api_token: str | None = None,
         geyser_auth_type: str = "x-token",
+        extra_sources: list[dict] | None = None,
+        hub_socket_path: str | None = None,
 
         extreme_fast_mode: bool = False,
         extreme_fast_token_amount: int = 30,
+
+        # Position limits
+        max_positions: int = 1,
+        max_exposure: float | None = None,
         
         # Priority fee configuration
         enable_dynamic_priority_fee: bool = False,
@@ -59,6 +72,16 @@ class PumpTrader:
         fixed_priority_fee: int = 200_000,
         extra_priority_fee: float = 0.0,
         hard_cap_prior_fee: int = 200_000,
+        priority_fee_refresh_interval: float = 2.0,
+        priority_fee_max_age: float = 10.0,
+        priority_fee_percentile: int = 70,
+        priority_fee_source: str = "rpc",
+        priority_fee_window_slots: int = 150,
+        autosize_compute_units: bool = True,
+        compute_unit_headroom: float = 0.15,
+        compute_unit_profile: str | None = None,
+        compute_unit_resample_interval: float = 600.0,
+        compute_unit_profile_max_age: float = 86_400.0,
         
         # Retry and timeout settings
         max_retries: int = 3,
@@ -78,6 +101,30 @@ class PumpTrader:
         bro_address: str | None = None,
         marry_mode: bool = False,
         yolo_mode: bool = False,
+
+        # Node provider settings
+        max_rps: float | None = None,
+        max_connections: int = 100,
+        max_connections_per_host: int = 0,
+        keepalive_timeout: float = 75.0,
+        dns_cache_ttl: int = 300,
+        enable_rpc_batching: bool = True,
+        rpc_batch_window: float = 0.0,
+        rpc_max_batch_size: int = 100,
+        send_endpoints: list[str] | None = None,
+        hedge_endpoints: list[str] | None = None,
+        enable_curve_cache: bool = True,
+
+        # Deduplication of detected tokens
+        seen_tokens_ttl: float = 600.0,
+        max_seen_tokens: int = 50_000,
+
+        # Trade journal
+        journal_dir: str = "trades",
+        journal_formats: list[str] | None = None,
+        journal_fsync: str = "interval",
+        journal_max_bytes: int = 64 * 1024 * 1024,
+        journal_backup_count: int = 5,
     ):
         """Initialize the pump trader.
         Args:
@@ -92,15 +139,40 @@ class PumpTrader:
             geyser_endpoint: Geyser endpoint URL (required for geyser listener)
             geyser_api_token: Geyser API token (required for geyser listener)
             geyser_auth_type: Geyser authentication type ('x-token' or 'basic')
+            extra_sources: Further token sources raced against listener_type; each
+                           mint is taken from the source that delivers it first
+            hub_socket_path: Receive tokens, blockhashes and fees from the market-data
+                             hub on this socket instead of subscribing directly
 
             extreme_fast_mode: Whether to enable extreme fast mode
             extreme_fast_token_amount: Maximum token amount for extreme fast mode
 
+            max_positions: Maximum number of tokens bought and held concurrently
+            max_exposure: Maximum SOL committed to positions being bought or held
+                          for sale at once
+                          (None = max_positions * buy_amount)
+
             enable_dynamic_priority_fee: Whether to enable dynamic priority fees
             enable_fixed_priority_fee: Whether to enable fixed priority fees
             fixed_priority_fee: Fixed priority fee amount
             extra_priority_fee: Extra percentage for priority fees
             hard_cap_prior_fee: Hard cap for priority fees
+            priority_fee_refresh_interval: Seconds between background dynamic fee
+                                           refreshes (0 = fetch on every trade)
+            priority_fee_max_age: Seconds a background fee estimate is used before
+                                  the fixed fee applies again
+            priority_fee_percentile: Percentile of recent fees paid with dynamic fees
+            priority_fee_source: Source of dynamic fees: 'rpc' (getRecentPrioritizationFees)
+                                 or 'stream' (pump.fun transactions on the Geyser stream)
+            priority_fee_window_slots: Slots covered by the streaming fee estimate
+            autosize_compute_units: Size compute unit limits per transaction shape
+                                    from simulations
+            compute_unit_headroom: Fraction added to the most units a shape consumed
+            compute_unit_profile: JSON file learned compute unit limits are kept in
+            compute_unit_resample_interval: Seconds between simulations of a shape
+                                            once its limit is settled
+            compute_unit_profile_max_age: Seconds after which a saved profile is
+                                          not loaded
 
             max_retries: Maximum number of retry attempts
             wait_time_after_creation: Time to wait after token creation (seconds)
@@ -117,10 +189,119 @@ class PumpTrader:
             bro_address: Optional creator address to filter by
             marry_mode: If True, only buy tokens and skip selling
             yolo_mode: If True, trade continuously
+
+            max_rps: Maximum RPC requests per second (None = unlimited)
+            max_connections: Total connection limit of the pooled RPC HTTP session
+            max_connections_per_host: Per-host connection limit (0 = unlimited)
+            keepalive_timeout: Seconds an idle RPC connection is kept open
+            dns_cache_ttl: Seconds resolved DNS entries are cached
+            enable_rpc_batching: Whether to coalesce concurrent reads into JSON-RPC batches
+            rpc_batch_window: Seconds to collect reads before sending a batch
+            rpc_max_batch_size: Maximum number of requests per JSON-RPC batch
+            send_endpoints: Extra RPC/sender endpoints to fan signed transactions out to
+            hedge_endpoints: Secondary RPC endpoints for hedged curve and balance reads
+            enable_curve_cache: Stream the bonding curves of open positions into memory
+
+            seen_tokens_ttl: Seconds a detected mint is remembered to drop duplicates
+            max_seen_tokens: Maximum number of detected mints remembered at once
+
+            journal_dir: Directory trade records and latency traces are written to
+            journal_formats: Journal sinks ('jsonl' and/or 'binary'; None = ['jsonl'])
+            journal_fsync: Journal fsync policy ('none', 'interval' or 'batch')
+            journal_max_bytes: Size at which journal files are rotated (0 = never)
+            journal_backup_count: Rotated journal files kept per sink
         """
-        self.solana_client = SolanaClient(rpc_endpoint)
+        self.solana_client = SolanaClient(
+            rpc_endpoint,
+            wss_endpoint,
+            max_rps=max_rps,
+            max_connections=max_connections,
+            max_connections_per_host=max_connections_per_host,
+            keepalive_timeout=keepalive_timeout,
+            dns_cache_ttl=dns_cache_ttl,
+            enable_batching=enable_rpc_batching,
+            batch_window=rpc_batch_window,
+            max_batch_size=rpc_max_batch_size,
+            send_endpoints=send_endpoints,
+            hedge_endpoints=hedge_endpoints,
+            # The hub publishes blockhashes to its bots
+            stream_blockhash=not hub_socket_path,
+            geyser_endpoint=geyser_endpoint,
+            geyser_api_token=geyser_api_token,
+            geyser_auth_type=geyser_auth_type,
+            compute_unit_profile=compute_unit_profile,
+            compute_unit_headroom=compute_unit_headroom,
+            autosize_compute_units=autosize_compute_units,
+            compute_unit_resample_interval=compute_unit_resample_interval,
+            compute_unit_profile_max_age=compute_unit_profile_max_age,
+        )
         self.wallet = Wallet(private_key)
-        self.curve_manager = BondingCurveManager(self.solana_client)
+        self.journal = TradeJournal(
+            journal_dir,
+            journal_formats if journal_formats is not None else ["jsonl"],
+            fsync=journal_fsync,
+            max_bytes=journal_max_bytes,
+            backup_count=journal_backup_count,
+        )
+        # Detection-to-confirmation latency per stage, kept out of trades.log
+        self.latency_journal = TradeJournal(
+            journal_dir,
+            journal_formats if journal_formats is not None else ["jsonl"],
+            name="latency",
+            fsync="none",
+            max_bytes=journal_max_bytes,
+            backup_count=journal_backup_count,
+        )
+        self.latency = LatencyTracker(sink=self.latency_journal.write)
+        self.curve_cache = (
+            CurveStateCache(
+                self.solana_client,
+                wss_endpoint,
+                geyser_endpoint,
+                geyser_api_token,
+                geyser_auth_type,
+            )
+            if enable_curve_cache
+            else None
+        )
+        self._curve_cache_task: asyncio.Task | None = None
+        self.curve_manager = BondingCurveManager(self.solana_client, self.curve_cache)
+        hub_fee_plugin = (
+            HubPriorityFee(percentile=priority_fee_percentile) if hub_socket_path else None
+        )
+        # Dynamic fees are served from memory, pushed by the hub, counted from
+        # the Geyser stream or refreshed in the background, instead of fetched
+        # before every transaction
+        local_dynamic_fee = enable_dynamic_priority_fee and not hub_socket_path
+        geyser_stream = listener_type == "geyser" or any(
+            source.get("type") == "geyser" for source in extra_sources or []
+        )
+        if local_dynamic_fee and priority_fee_source == "stream" and not geyser_stream:
+            logger.warning(
+                "Streaming priority fees need a geyser token source, using RPC fees instead"
+            )
+        self.fee_estimator = (
+            StreamingPriorityFee(
+                window_slots=priority_fee_window_slots,
+                percentile=priority_fee_percentile,
+                max_age=priority_fee_max_age,
+            )
+            if local_dynamic_fee and priority_fee_source == "stream" and geyser_stream
+            else None
+        )
+        self.fee_oracle = (
+            PriorityFeeOracle(
+                self.solana_client,
+                refresh_interval=priority_fee_refresh_interval,
+                max_age=priority_fee_max_age,
+                percentile=priority_fee_percentile,
+            )
+            if local_dynamic_fee
+            and not self.fee_estimator
+            and priority_fee_refresh_interval > 0
+            else None
+        )
+        self._fee_oracle_task: asyncio.Task | None = None
         self.priority_fee_manager = PriorityFeeManager(
             client=self.solana_client,
             enable_dynamic_fee=enable_dynamic_priority_fee,
@@ -128,6 +309,8 @@ class PumpTrader:
             fixed_fee=fixed_priority_fee,
             extra_fee=extra_priority_fee,
             hard_cap=hard_cap_prior_fee,
+            dynamic_fee_plugin=hub_fee_plugin or self.fee_estimator or self.fee_oracle,
+            fee_percentile=priority_fee_percentile,
         )
         self.buyer = TokenBuyer(
             self.solana_client,
@@ -149,25 +332,49 @@ class PumpTrader:
             max_retries,
         )
         
-        # Initialize the appropriate listener type
-        listener_type = listener_type.lower()
-        if listener_type == "geyser":
-            if not geyser_endpoint or not geyser_api_token:
-                raise ValueError("Geyser endpoint and API token are required for geyser listener")
-                
-            self.token_listener = GeyserListener(
-                geyser_endpoint, 
-                geyser_api_token,
-                geyser_auth_type, 
-                PumpAddresses.PROGRAM
+        # Initialize the token listener: the shared hub, several racing
+        # sources, or a single source of the configured type
+        if hub_socket_path:
+            self.token_listener = HubListener(
+                hub_socket_path,
+                blockhash_cache=self.solana_client.blockhash_cache,
+                fee_plugin=hub_fee_plugin,
+            )
+            logger.info(f"Using market-data hub at {hub_socket_path} for token monitoring")
+        elif extra_sources:
+            primary = {
+                "type": listener_type,
+                "wss_endpoint": wss_endpoint,
+                "endpoint": geyser_endpoint,
+                "api_token": geyser_api_token,
+                "auth_type": geyser_auth_type,
+            }
+            self.token_listener = MultiSourceListener(
+                create_source_listeners([primary, *extra_sources])
             )
-            logger.info("Using Geyser listener for token monitoring")
-        elif listener_type == "logs":
-            self.token_listener = LogsListener(wss_endpoint, PumpAddresses.PROGRAM)
-            logger.info("Using logsSubscribe listener for token monitoring")
+            logger.info("Using racing multi-source listener for token monitoring")
         else:
-            self.token_listener = BlockListener(wss_endpoint, PumpAddresses.PROGRAM)
-            logger.info("Using blockSubscribe listener for token monitoring")
+            self.token_listener = create_listener(
+                listener_type,
+                wss_endpoint=wss_endpoint,
+                geyser_endpoint=geyser_endpoint,
+                geyser_api_token=geyser_api_token,
+                geyser_auth_type=geyser_auth_type,
+            )
+            logger.info(f"Using {listener_type} listener for token monitoring")
+
+        if self.fee_estimator:
+            # One Geyser stream feeds the estimator, so no transaction counts twice
+            listeners = (
+                self.token_listener.sources.values()
+                if isinstance(self.token_listener, MultiSourceListener)
+                else [self.token_listener]
+            )
+            geyser_listener = next(
+                listener for listener in listeners if isinstance(listener, GeyserListener)
+            )
+            geyser_listener.fee_estimator = self.fee_estimator
+            logger.info("Estimating priority fees from pump.fun transactions on the Geyser stream")
             
         # Trading parameters
         self.buy_amount = buy_amount
@@ -176,6 +383,10 @@ class PumpTrader:
         self.max_retries = max_retries
         self.extreme_fast_mode = extreme_fast_mode
         self.extreme_fast_token_amount = extreme_fast_token_amount
+
+        # Position limits
+        self.max_positions = max(1, max_positions)
+        self.max_exposure = max_exposure or self.max_positions * buy_amount
         
         # Timing parameters
         self.wait_time_after_creation = wait_time_after_creation
@@ -199,8 +410,14 @@ class PumpTrader:
         self.traded_mints: set[Pubkey] = set()
         self.token_queue: asyncio.Queue = asyncio.Queue()
         self.processing: bool = False
-        self.processed_tokens: set[str] = set()
-        self.token_timestamps: dict[str, float] = {}
+        # First-seen times of detected mints, bounded by age and count
+        self.seen_tokens = MintDeduplicator(
+            ttl=max(seen_tokens_ttl, max_token_age), max_entries=max_seen_tokens
+        )
+        self.position_tasks: set[asyncio.Task] = set()
+        self.open_exposure: dict[Pubkey, float] = {}
+        # Yolo mode opens no position before this monotonic time
+        self.next_position_at = 0.0
         
     async def start(self) -> None:
         """Start the trading bot and listen for new tokens."""
@@ -210,6 +427,10 @@ class PumpTrader:
         logger.info(f"Marry mode: {self.marry_mode}")
         logger.info(f"YOLO mode: {self.yolo_mode}")
         logger.info(f"Max token age: {self.max_token_age} seconds")
+        logger.info(
+            f"Max positions: {self.max_positions} "
+            f"(max exposure: {self.max_exposure:.6f} SOL)"
+        )
 
         try:
             health_resp = await self.solana_client.get_health()
@@ -217,6 +438,14 @@ class PumpTrader:
         except Exception as e:
             logger.warning(f"RPC warm-up failed: {e!s}")
 
+        self.solana_client.start()
+        if self.curve_cache:
+            self._curve_cache_task = asyncio.create_task(self.curve_cache.run())
+        if self.fee_oracle:
+            self._fee_oracle_task = asyncio.create_task(self.fee_oracle.run())
+        self.journal.start()
+        self.latency_journal.start()
+
         try:
             # Choose operating mode based on yolo_mode
             if not self.yolo_mode:
@@ -249,6 +478,7 @@ class PumpTrader:
                         await processor_task
                     except asyncio.CancelledError:
                         pass
+                    await self._stop_positions()
         
         except Exception as e:
             logger.error(f"Trading stopped due to error: {e!s}")
@@ -269,14 +499,10 @@ class PumpTrader:
         
         async def token_callback(token: TokenInfo) -> None:
             nonlocal found_token
-            token_key = str(token.mint)
-            
-            # Only process if not already processed and fresh
-            if token_key not in self.processed_tokens:
-                # Record when the token was discovered
-                self.token_timestamps[token_key] = monotonic()
+
+            # Only take the first sighting of each token
+            if found_token is None and self.seen_tokens.add(token.mint):
                 found_token = token
-                self.processed_tokens.add(token_key)
                 token_found.set()
         
         listener_task = asyncio.create_task(
@@ -319,44 +545,69 @@ class PumpTrader:
                 )
             except Exception as e:
                 logger.error(f"Error during cleanup: {e!s}")
-                
-        old_keys = {k for k in self.token_timestamps if k not in self.processed_tokens}
-        for key in old_keys:
-            self.token_timestamps.pop(key, None)
-            
+
+        if self._curve_cache_task:
+            self._curve_cache_task.cancel()
+            try:
+                await self._curve_cache_task
+            except asyncio.CancelledError:
+                pass
+        if self.curve_cache:
+            await self.curve_cache.close()
+        if self._fee_oracle_task:
+            self._fee_oracle_task.cancel()
+            try:
+                await self._fee_oracle_task
+            except asyncio.CancelledError:
+                pass
+
+        self.seen_tokens.clear()
+        if isinstance(self.token_listener, MultiSourceListener) and self.token_listener.tokens:
+            self.token_listener.log_summary()
+        if self.latency.recorded:
+            self.latency.log_summary()
+        compute_unit_stats = self.solana_client.compute_units.get_stats()
+        if compute_unit_stats:
+            logger.info(f"Compute unit profiles: {compute_unit_stats}")
+        await self.journal.close()
+        await self.latency_journal.close()
         await self.solana_client.close()
 
     async def _queue_token(
         self, token_info: TokenInfo
     ) -> None:
-        """Queue a token for processing if not already processed.
+        """Queue a token for processing if it was not seen before.
         
         Args:
             token_info: Token information to queue
         """
-        token_key = str(token_info.mint)
-
-        if token_key in self.processed_tokens:
-            logger.debug(f"Token {token_info.symbol} already processed. Skipping...")
+        # Records the discovery time of new tokens
+        if not self.seen_tokens.add(token_info.mint):
+            logger.debug(f"Token {token_info.symbol} already seen. Skipping...")
             return
 
-        # Record timestamp when token was discovered
-        self.token_timestamps[token_key] = monotonic()
-
         await self.token_queue.put(token_info)
+        if token_info.trace:
+            token_info.trace.mark("queue")
         logger.info(f"Queued new token: {token_info.symbol} ({token_info.mint})")
 
     async def _process_token_queue(self) -> None:
-        """Continuously process tokens from the queue, only if they're fresh."""
+        """Continuously dispatch fresh tokens from the queue to position workers.
+
+        Each accepted token runs in its own position task, so detection and
+        buying never wait for an open position's hold timer. Tokens that
+        arrive during the cooldown after a position, while every position
+        slot is taken, or whose buy would exceed the exposure cap, are
+        skipped rather than left to go stale.
+        """
         while True:
             try:
                 token_info = await self.token_queue.get()
-                token_key = str(token_info.mint)
-
                 # Check if token is still "fresh"
                 current_time = monotonic()
-                token_age = current_time - self.token_timestamps.get(
-                    token_key, current_time
+                first_seen = self.seen_tokens.first_seen(token_info.mint, current_time)
+                token_age = (
+                    current_time - first_seen if first_seen is not None else float("inf")
                 )
 
                 if token_age > self.max_token_age:
@@ -365,12 +616,18 @@ class PumpTrader:
                     )
                     continue
 
-                self.processed_tokens.add(token_key)
+                if not self._reserve_position(token_info):
+                    continue
 
+                if token_info.trace:
+                    token_info.trace.mark("dispatch")
                 logger.info(
-                    f"Processing fresh token: {token_info.symbol} (age: {token_age:.1f}s)"
+                    f"Processing fresh token: {token_info.symbol} (age: {token_age:.1f}s, "
+                    f"open positions: {len(self.position_tasks) + 1}/{self.max_positions})"
                 )
-                await self._handle_token(token_info)
+                task = asyncio.create_task(self._run_position(token_info))
+                self.position_tasks.add(task)
+                task.add_done_callback(self.position_tasks.discard)
 
             except asyncio.CancelledError:
                 # Handle cancellation gracefully
@@ -381,6 +638,74 @@ class PumpTrader:
             finally:
                 self.token_queue.task_done()
 
+    def _reserve_position(self, token_info: TokenInfo) -> bool:
+        """Reserve a position slot and exposure for a token if limits allow.
+
+        Args:
+            token_info: Token about to be bought
+
+        Returns:
+            True if the token may be bought
+        """
+        cooldown = self.next_position_at - monotonic()
+        if cooldown > 0:
+            logger.info(
+                f"Skipping token {token_info.symbol} - waiting {cooldown:.1f}s "
+                f"before a new position"
+            )
+            return False
+
+        if len(self.position_tasks) >= self.max_positions:
+            logger.info(
+                f"Skipping token {token_info.symbol} - all {self.max_positions} position slots in use"
+            )
+            return False
+
+        exposure = sum(self.open_exposure.values())
+        if exposure + self.buy_amount > self.max_exposure:
+            logger.info(
+                f"Skipping token {token_info.symbol} - exposure cap reached "
+                f"({exposure:.6f} + {self.buy_amount:.6f} > {self.max_exposure:.6f} SOL)"
+            )
+            return False
+
+        self.open_exposure[token_info.mint] = self.buy_amount
+        return True
+
+    async def _run_position(self, token_info: TokenInfo) -> None:
+        """Trade one token from buy to sell inside a position worker.
+
+        Args:
+            token_info: Token to trade
+        """
+        try:
+            await self._handle_token(token_info)
+        except asyncio.CancelledError:
+            logger.info(f"Position in {token_info.symbol} was cancelled")
+            raise
+        except Exception as e:
+            logger.error(f"Error in position worker for {token_info.symbol}: {e!s}")
+
+        # The dispatcher applies the cooldown, so this slot frees up right away
+        if self.yolo_mode and self.wait_time_before_new_token > 0:
+            logger.info(
+                f"YOLO mode enabled. Waiting {self.wait_time_before_new_token} seconds "
+                f"before opening a new position..."
+            )
+            self.next_position_at = max(
+                self.next_position_at, monotonic() + self.wait_time_before_new_token
+            )
+
+    async def _stop_positions(self) -> None:
+        """Cancel running position workers and wait for them to finish."""
+        if not self.position_tasks:
+            return
+        logger.info(f"Stopping {len(self.position_tasks)} open position worker(s)")
+        tasks = list(self.position_tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
     async def _handle_token(
         self, token_info: TokenInfo
     ) -> None:
@@ -389,11 +714,15 @@ class PumpTrader:
         Args:
             token_info: Token information
         """
+        # Follow the curve from the buy on so the sell prices from memory
+        if self.curve_cache:
+            self.curve_cache.track(token_info.bonding_curve)
+
         try:
             # Wait for bonding curve to stabilize (unless in extreme fast mode)
             if not self.extreme_fast_mode:
                 # Save token info to file
-                # await self._save_token_info(token_info)
+                # self._save_token_info(token_info)
                 logger.info(
                     f"Waiting for {self.wait_time_after_creation} seconds for the bonding curve to stabilize..."
                 )
@@ -403,22 +732,43 @@ class PumpTrader:
             logger.info(
                 f"Buying {self.buy_amount:.6f} SOL worth of {token_info.symbol}..."
             )
+            if token_info.trace:
+                token_info.trace.mark("wait")
             buy_result: TradeResult = await self.buyer.execute(token_info)
+            self._finish_trace(token_info, "confirmed" if buy_result.success else "failed")
 
             if buy_result.success:
                 await self._handle_successful_buy(token_info, buy_result)
             else:
                 await self._handle_failed_buy(token_info, buy_result)
 
-            # Only wait for next token in yolo mode
-            if self.yolo_mode:
-                logger.info(
-                    f"YOLO mode enabled. Waiting {self.wait_time_before_new_token} seconds before looking for next token..."
-                )
-                await asyncio.sleep(self.wait_time_before_new_token)
-
         except Exception as e:
             logger.error(f"Error handling token {token_info.symbol}: {e!s}")
+            self._finish_trace(token_info, "error")
+        finally:
+            # The position is closed, failed to sell or was handed off to
+            # marry mode: nothing more is bought or sold for it here
+            self.open_exposure.pop(token_info.mint, None)
+            if self.curve_cache:
+                self.curve_cache.untrack(token_info.bonding_curve)
+
+    def _finish_trace(self, token_info: TokenInfo, outcome: str) -> None:
+        """Record the latency trace of a token once its buy has finished.
+
+        Args:
+            token_info: Token whose trace is finished
+            outcome: How the buy ended
+        """
+        trace = token_info.trace
+        if trace is None:
+            return
+        token_info.trace = None
+        trace.finish(outcome)
+        self.latency.record(trace, str(token_info.mint))
+        logger.info(
+            f"Buy latency for {token_info.symbol}: {trace.elapsed * 1000:.1f} ms from "
+            f"detection ({trace.listener}, {outcome})"
+        )
 
     async def _handle_successful_buy(
         self, token_info: TokenInfo, buy_result: TradeResult
@@ -498,24 +848,22 @@ class PumpTrader:
             self.cleanup_force_close_with_burn
         )
 
-    async def _save_token_info(
+    def _save_token_info(
         self, token_info: TokenInfo
     ) -> None:
-        """Save token information to a file.
+        """Queue token information for the trade journal.
 
         Args:
             token_info: Token information
         """
-        try:
-            os.makedirs("trades", exist_ok=True)
-            file_name = os.path.join("trades", f"{token_info.mint}.txt")
-
-            with open(file_name, "w") as file:
-                file.write(json.dumps(token_info.to_dict(), indent=2))
-
-            logger.info(f"Token information saved to {file_name}")
-        except Exception as e:
-            logger.error(f"Failed to save token information: {e!s}")
+        self.journal.write(
+            {
+                "action": "token",
+                "token_address": str(token_info.mint),
+                "symbol": token_info.symbol,
+                "token": token_info.to_dict(),
+            }
+        )
 
     def _log_trade(
         self,
@@ -525,7 +873,7 @@ class PumpTrader:
         amount: float,
         tx_hash: str | None,
     ) -> None:
-        """Log trade information.
+        """Queue trade information for the trade journal.
 
         Args:
             action: Trade action (buy/sell)
@@ -534,11 +882,8 @@ class PumpTrader:
             amount: Trade amount in SOL
             tx_hash: Transaction hash
         """
-        try:
-            os.makedirs("trades", exist_ok=True)
-
-            log_entry = {
-                "timestamp": datetime.utcnow().isoformat(),
+        self.journal.write(
+            {
                 "action": action,
                 "token_address": str(token_info.mint),
                 "symbol": token_info.symbol,
@@ -546,8 +891,4 @@ class PumpTrader:
                 "amount": amount,
                 "tx_hash": str(tx_hash) if tx_hash else None,
             }
-
-            with open("trades/trades.log", "a") as log_file:
-                log_file.write(json.dumps(log_entry) + "\n")
-        except Exception as e:
-            logger.error(f"Failed to log trade information: {e!s}")
\ No newline at end of file
+        )
@@ -0,0 +1,98 @@
+"""
+Bounded time-to-live deduplication of token mints.
+"""
+
+from collections import OrderedDict
+from time import monotonic
+
+from solders.pubkey import Pubkey
+
+
+class MintDeduplicator:
+    """Remembers when mints were first seen, within a fixed memory budget.
+
+    Entries are keyed by the raw 32-byte mint and kept in first-seen order, so
+    expired entries are always at the front: inserts, lookups and expiry are
+    O(1) (amortized for expiry). Entries are dropped once they are older than
+    ``ttl`` or, oldest first, when more than ``max_entries`` are held.
+    """
+
+    def __init__(self, ttl: float = 600.0, max_entries: int = 50_000):
+        """Initialize the deduplicator.
+
+        Args:
+            ttl: Seconds a mint is remembered after it was first seen
+            max_entries: Maximum number of mints remembered at once
+        """
+        if ttl <= 0 or max_entries <= 0:
+            raise ValueError("ttl and max_entries must be positive")
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._first_seen: OrderedDict[bytes, float] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._first_seen)
+
+    def __contains__(self, mint: Pubkey) -> bool:
+        return self.first_seen(mint) is not None
+
+    def add(self, mint: Pubkey, now: float | None = None) -> bool:
+        """Record a mint unless it was already seen.
+
+        Args:
+            mint: Token mint
+            now: Current monotonic time (defaults to time.monotonic())
+
+        Returns:
+            True if the mint is new, False if it is a duplicate
+        """
+        now = monotonic() if now is None else now
+        self.expire(now)
+        key = bytes(mint)
+        if key in self._first_seen:
+            return False
+        self._first_seen[key] = now
+        if len(self._first_seen) > self.max_entries:
+            self._first_seen.popitem(last=False)
+        return True
+
+    def first_seen(self, mint: Pubkey, now: float | None = None) -> float | None:
+        """Monotonic time a mint was first seen.
+
+        Args:
+            mint: Token mint
+            now: Current monotonic time (defaults to time.monotonic())
+
+        Returns:
+            First-seen time, or None if the mint is unknown or expired
+        """
+        seen = self._first_seen.get(bytes(mint))
+        if seen is None:
+            return None
+        now = monotonic() if now is None else now
+        return seen if now - seen <= self.ttl else None
+
+    def expire(self, now: float | None = None) -> int:
+        """Drop every entry older than the TTL.
+
+        Args:
+            now: Current monotonic time (defaults to time.monotonic())
+
+        Returns:
+            Number of entries dropped
+        """
+        now = monotonic() if now is None else now
+        deadline = now - self.ttl
+        dropped = 0
+        first_seen = self._first_seen
+        while first_seen:
+            key, seen = next(iter(first_seen.items()))
+            if seen >= deadline:
+                break
+            del first_seen[key]
+            dropped += 1
+        return dropped
+
+    def clear(self) -> None:
+        """Forget every mint."""
+        self._first_seen.clear()
@@ -0,0 +1,73 @@
+"""
+JSON encoding and decoding for RPC and WebSocket payloads.
+
+Uses orjson when it is installed and the standard library otherwise. Objects
+orjson cannot encode (integers wider than 64 bits, non-string keys) fall back
+to the standard library, so both backends accept the same inputs.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+BACKEND = "orjson" if orjson else "json"
+
+
+def loads(data: str | bytes | bytearray | memoryview) -> Any:
+    """Decode a JSON document.
+
+    Args:
+        data: JSON text or UTF-8 encoded bytes
+
+    Returns:
+        Decoded Python object
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON
+    """
+    if orjson:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # Let the standard library decide (and raise the usual error)
+            pass
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+def dumps(obj: Any, pretty: bool = False) -> str:
+    """Encode an object as JSON text.
+
+    Args:
+        obj: Object to encode
+        pretty: Indent with two spaces
+
+    Returns:
+        JSON text
+    """
+    return dumps_bytes(obj, pretty).decode()
+
+
+def dumps_bytes(obj: Any, pretty: bool = False) -> bytes:
+    """Encode an object as UTF-8 JSON bytes.
+
+    Args:
+        obj: Object to encode
+        pretty: Indent with two spaces
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if orjson:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+        except TypeError:
+            pass
+    return json.dumps(
+        obj, indent=2 if pretty else None, separators=None if pretty else (",", ":")
+    ).encode()
@@ -0,0 +1,169 @@
+"""
+Per-token latency tracing from detection to a confirmed buy.
+
+A listener starts a TokenTrace when it decodes a create event and attaches it
+to the TokenInfo. Each step of the buy path marks the end of its stage with a
+monotonic timestamp, so a stage's latency is the time since the previous mark.
+Finished traces are turned into structured records and feed rolling per-stage
+percentiles kept per listener type.
+"""
+
+import time
+from collections import defaultdict, deque
+from collections.abc import Callable
+from time import monotonic
+from typing import Any
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class TokenTrace:
+    """Monotonic stage timestamps of one detected token."""
+
+    __slots__ = ("listener", "marks", "outcome", "started", "wall_started")
+
+    def __init__(self, listener: str, started: float | None = None):
+        """Start a trace.
+
+        Args:
+            listener: Listener type that detected the token ('geyser', 'logs', 'blocks')
+            started: Monotonic time the update carrying the token was received
+        """
+        self.listener = listener
+        self.started = monotonic() if started is None else started
+        self.wall_started = time.time() - (monotonic() - self.started)
+        self.marks: list[tuple[str, float]] = []
+        self.outcome: str | None = None
+
+    def mark(self, stage: str) -> None:
+        """Record the end of a stage.
+
+        Args:
+            stage: Stage name
+        """
+        self.marks.append((stage, monotonic()))
+
+    def finish(self, outcome: str) -> None:
+        """Record how the trace ended.
+
+        Args:
+            outcome: Outcome such as 'confirmed', 'failed' or 'skipped'
+        """
+        self.outcome = outcome
+
+    def stages(self) -> list[tuple[str, float]]:
+        """Seconds spent in each stage, in order."""
+        durations = []
+        previous = self.started
+        for stage, at in self.marks:
+            durations.append((stage, at - previous))
+            previous = at
+        return durations
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds from detection to the last mark."""
+        return self.marks[-1][1] - self.started if self.marks else 0.0
+
+    def to_record(self) -> dict[str, Any]:
+        """Structured record of the trace with stage latencies in milliseconds."""
+        return {
+            "timestamp": self.wall_started,
+            "action": "trace",
+            "listener": self.listener,
+            "outcome": self.outcome,
+            "total_ms": round(self.elapsed * 1000, 3),
+            "stages_ms": {
+                stage: round(duration * 1000, 3) for stage, duration in self.stages()
+            },
+        }
+
+
+class LatencyTracker:
+    """Rolling per-stage latency percentiles, kept per listener type."""
+
+    def __init__(
+        self,
+        window: int = 500,
+        sink: Callable[[dict[str, Any]], Any] | None = None,
+        summary_every: int = 50,
+    ):
+        """Initialize the tracker.
+
+        Args:
+            window: Number of recent latencies kept per listener and stage
+            sink: Receives the structured record of every finished trace
+            summary_every: Log a percentile summary after this many traces (0 = never)
+        """
+        self.window = window
+        self.sink = sink
+        self.summary_every = summary_every
+        self.recorded = 0
+        self._latencies: defaultdict[tuple[str, str], deque[float]] = defaultdict(
+            lambda: deque(maxlen=self.window)
+        )
+
+    def record(self, trace: TokenTrace, token: str | None = None) -> None:
+        """Add a finished trace to the statistics and emit its record.
+
+        Args:
+            trace: Finished trace
+            token: Token mint the trace belongs to, included in the record
+        """
+        for stage, duration in trace.stages():
+            self._latencies[trace.listener, stage].append(duration)
+        if trace.marks:
+            self._latencies[trace.listener, "total"].append(trace.elapsed)
+        self.recorded += 1
+
+        if self.sink:
+            record = trace.to_record()
+            if token:
+                record["token_address"] = token
+            self.sink(record)
+
+        if self.summary_every and self.recorded % self.summary_every == 0:
+            self.log_summary()
+
+    def percentile(self, listener: str, stage: str, fraction: float) -> float | None:
+        """Get a percentile of the recent latencies of a stage in seconds.
+
+        Args:
+            listener: Listener type
+            stage: Stage name ('total' for detection to last mark)
+            fraction: Percentile as a fraction (0.99 = p99)
+
+        Returns:
+            Latency in seconds, or None if nothing was recorded yet
+        """
+        latencies = self._latencies.get((listener, stage))
+        if not latencies:
+            return None
+        ordered = sorted(latencies)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+    def get_stats(self) -> dict[str, dict[str, dict[str, float]]]:
+        """Get p50/p99 latencies in milliseconds per listener type and stage.
+
+        Returns:
+            Mapping of listener type to stage to percentiles and sample count
+        """
+        stats: dict[str, dict[str, dict[str, float]]] = {}
+        for (listener, stage), latencies in self._latencies.items():
+            stats.setdefault(listener, {})[stage] = {
+                "p50_ms": self.percentile(listener, stage, 0.5) * 1000,
+                "p99_ms": self.percentile(listener, stage, 0.99) * 1000,
+                "samples": len(latencies),
+            }
+        return stats
+
+    def log_summary(self) -> None:
+        """Log the current per-stage percentiles."""
+        for listener, stages in self.get_stats().items():
+            summary = ", ".join(
+                f"{stage} {values['p50_ms']:.1f}/{values['p99_ms']:.1f}"
+                for stage, values in stages.items()
+            )
+            logger.info(f"Latency p50/p99 ms ({listener}): {summary}")
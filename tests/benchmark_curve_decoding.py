@@ -0,0 +1,92 @@
+"""
+Benchmark for BondingCurveState decoding
+Decodes 100k copies of the recorded bonding curve account from learning_examples
+(and the same account extended with a creator) with the precompiled struct
+decoder and with the construct-based parser it replaced
+"""
+
+import base64
+import json
+import sys
+import time
+from pathlib import Path
+
+from construct import Bytes, Flag, Int64ul, Struct
+from solders.pubkey import Pubkey
+
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+from core.curve import EXPECTED_DISCRIMINATOR, BondingCurveState
+
+ACCOUNTS = 100_000
+
+RECORDED_ACCOUNT = (
+    Path(__file__).parent.parent
+    / "learning_examples"
+    / "raw_bondingCurve_from_getAccountInfo.json"
+)
+
+LEGACY_STRUCT = Struct(
+    "virtual_token_reserves" / Int64ul,
+    "virtual_sol_reserves" / Int64ul,
+    "real_token_reserves" / Int64ul,
+    "real_sol_reserves" / Int64ul,
+    "token_total_supply" / Int64ul,
+    "complete" / Flag,
+    "creator" / Bytes(32),
+)
+
+
+class LegacyBondingCurveState:
+    """The construct-based parser BondingCurveState used before."""
+
+    def __init__(self, data: bytes) -> None:
+        if data[:8] != EXPECTED_DISCRIMINATOR:
+            raise ValueError("Invalid curve state discriminator")
+        parsed = LEGACY_STRUCT.parse(data[8:])
+        self.__dict__.update(parsed)
+        if hasattr(self, "creator") and isinstance(self.creator, bytes):
+            self.creator = Pubkey.from_bytes(self.creator)
+
+
+def load_recorded_account() -> bytes:
+    with open(RECORDED_ACCOUNT) as f:
+        response = json.load(f)
+    return base64.b64decode(response["result"]["value"]["data"][0])
+
+
+def bench(name: str, decode, accounts: list[bytes]) -> float:
+    started = time.perf_counter()
+    for data in accounts:
+        decode(data)
+    elapsed = time.perf_counter() - started
+    print(
+        f"{name:<28} {elapsed:>7.3f} s  "
+        f"{elapsed / len(accounts) * 1e9:>7.0f} ns/account"
+    )
+    return elapsed
+
+
+def main() -> None:
+    recorded = load_recorded_account()
+    with_creator = recorded + bytes(Pubkey.new_unique())
+
+    # Distinct bytes objects, like accounts arriving from the network
+    recorded_accounts = [bytes(bytearray(recorded)) for _ in range(ACCOUNTS)]
+    creator_accounts = [bytes(bytearray(with_creator)) for _ in range(ACCOUNTS)]
+
+    print(f"Decoding {ACCOUNTS:,} accounts")
+    bench("struct (recorded, 49 bytes)", BondingCurveState, recorded_accounts)
+    fast = bench("struct (with creator)", BondingCurveState, creator_accounts)
+    fast_creator = bench(
+        "struct (with creator read)",
+        lambda data: BondingCurveState(data).creator,
+        creator_accounts,
+    )
+    # The construct parser requires the creator field
+    legacy = bench("construct (with creator)", LegacyBondingCurveState, creator_accounts)
+    print(f"Speedup: {legacy / fast:.1f}x ({legacy / fast_creator:.1f}x with creator read)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Soak benchmark for detected-token deduplication
+Feeds simulated days of token creates (with duplicate sightings from a second
+source) through MintDeduplicator and through the unbounded set and dict that
+PumpTrader used before, printing resident memory as the simulated clock runs
+"""
+
+import gc
+import os
+import sys
+import time
+from pathlib import Path
+
+from solders.pubkey import Pubkey
+
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+from utils.dedup import MintDeduplicator
+
+CREATES_PER_HOUR = 20_000
+HOURS = 72
+REPORT_EVERY_HOURS = 12
+TTL = 600.0
+MAX_ENTRIES = 50_000
+
+
+def rss_mb() -> float:
+    """Current resident set size in MiB (Linux)."""
+    with open("/proc/self/statm") as f:
+        resident_pages = int(f.read().split()[1])
+    return resident_pages * os.sysconf("SC_PAGE_SIZE") / 2**20
+
+
+def soak(name: str, seen, mark_seen) -> None:
+    gc.collect()
+    baseline = rss_mb()
+    interval = 3600 / CREATES_PER_HOUR
+    clock = 0.0
+    started = time.perf_counter()
+
+    print(f"\n{name}")
+    print(f"{'hour':>6} {'entries':>10} {'RSS MiB':>9} {'growth':>8}")
+    for hour in range(1, HOURS + 1):
+        for _ in range(CREATES_PER_HOUR):
+            clock += interval
+            mint = Pubkey.new_unique()
+            mark_seen(mint, clock)
+            # A second listener reports the same create a moment later
+            mark_seen(mint, clock + 0.05)
+        if hour % REPORT_EVERY_HOURS == 0:
+            rss = rss_mb()
+            print(f"{hour:>6} {len(seen):>10,} {rss:>9.1f} {rss - baseline:>+8.1f}")
+
+    elapsed = time.perf_counter() - started
+    sightings = CREATES_PER_HOUR * HOURS * 2
+    print(f"{sightings / elapsed:,.0f} sightings/s ({elapsed / sightings * 1e9:.0f} ns each)")
+
+
+def main() -> None:
+    print(
+        f"Simulating {HOURS} h at {CREATES_PER_HOUR:,} creates/h "
+        f"(ttl {TTL:.0f} s, max {MAX_ENTRIES:,} entries)"
+    )
+
+    dedup = MintDeduplicator(ttl=TTL, max_entries=MAX_ENTRIES)
+    soak("MintDeduplicator", dedup, dedup.add)
+
+    # What PumpTrader kept before: mint strings in a set plus a timestamp dict
+    processed_tokens: set[str] = set()
+    token_timestamps: dict[str, float] = {}
+
+    def mark_seen_unbounded(mint: Pubkey, now: float) -> None:
+        key = str(mint)
+        if key in processed_tokens:
+            return
+        token_timestamps[key] = now
+        processed_tokens.add(key)
+
+    soak("Unbounded set + dict", token_timestamps, mark_seen_unbounded)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+"""
+Benchmark for Geyser create filtering
+Offline: rebuilds the recorded create and buy transactions from learning_examples
+as serialized Geyser updates and compares parsing every update with the raw-bytes
+discriminator prefilter, also with the streaming fee estimator on, which reads
+compute unit prices from the raw bytes. With GEYSER_ENDPOINT and GEYSER_API_TOKEN
+set, it also subscribes with the old (program only) and the new (mint authority
+required) server-side filters side by side and reports updates per second for each
+"""
+
+import asyncio
+import json
+import os
+import struct
+import sys
+import time
+from pathlib import Path
+
+import base58
+from dotenv import load_dotenv
+from solders.pubkey import Pubkey
+
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+from core.priority_fee.stream_fee import StreamingPriorityFee
+from core.pubkeys import PumpAddresses
+from geyser.connection import create_geyser_channel, create_raw_subscribe
+from geyser.generated import geyser_pb2
+from monitoring.geyser_event_processor import GeyserEventProcessor
+from monitoring.geyser_listener import GeyserListener
+
+load_dotenv()
+
+EXAMPLES = Path(__file__).parent.parent / "learning_examples"
+# Roughly what the pump program sees: many trades per create
+TRADES_PER_CREATE = 100
+CREATES = 200
+LIVE_SECONDS = 30
+
+
+def with_creator(data: bytes, creator: str) -> bytes:
+    """Append the creator argument that the recorded create predates."""
+    offset = 8
+    for _ in range(3):
+        offset += 4 + struct.unpack_from("<I", data, offset)[0]
+    if len(data) >= offset + 32:
+        return data
+    return data[:offset] + bytes(Pubkey.from_string(creator))
+
+
+def recorded_update(file_name: str) -> bytes:
+    """Serialize a recorded jsonParsed transaction as a Geyser update."""
+    with open(EXAMPLES / file_name) as f:
+        result = json.load(f)["result"]
+
+    message = result["transaction"]["message"]
+    keys = [key["pubkey"] for key in message["accountKeys"]]
+    update = geyser_pb2.SubscribeUpdate()
+    update.filters.append("pump_filter")
+    info = update.transaction.transaction
+    info.signature = base58.b58decode(result["transaction"]["signatures"][0])
+    tx = info.transaction
+    tx.signatures.append(info.signature)
+    tx.message.account_keys.extend(bytes(Pubkey.from_string(key)) for key in keys)
+    tx.message.recent_blockhash = base58.b58decode(message["recentBlockhash"])
+    for ix in message["instructions"]:
+        compiled = tx.message.instructions.add()
+        compiled.program_id_index = keys.index(ix["programId"])
+        compiled.accounts = bytes(keys.index(key) for key in ix.get("accounts", []))
+        compiled.data = base58.b58decode(ix["data"]) if "data" in ix else b""
+        if compiled.data.startswith(GeyserEventProcessor.CREATE_DISCRIMINATOR):
+            compiled.data = with_creator(compiled.data, keys[0])
+    info.meta.fee = result["meta"]["fee"]
+    info.meta.log_messages.extend(result["meta"]["logMessages"])
+    info.meta.pre_balances.extend(result["meta"]["preBalances"])
+    info.meta.post_balances.extend(result["meta"]["postBalances"])
+    return update.SerializeToString()
+
+
+async def parse_all(listener: GeyserListener, updates: list[bytes]) -> int:
+    """The previous path: deserialize and walk every update."""
+    found = 0
+    for raw in updates:
+        update = geyser_pb2.SubscribeUpdate.FromString(raw)
+        if await listener._process_update(update):
+            found += 1
+    return found
+
+
+async def prefilter(listener: GeyserListener, updates: list[bytes]) -> int:
+    """The new path: check the raw bytes before parsing."""
+    found = 0
+    for raw in updates:
+        if await listener._process_raw_update(raw):
+            found += 1
+    return found
+
+
+async def parse_for_fees(listener: GeyserListener, updates: list[bytes]) -> int:
+    """The previous fee path: deserialize every update to read its price."""
+    estimator = StreamingPriorityFee()
+    found = 0
+    for raw in updates:
+        update = geyser_pb2.SubscribeUpdate.FromString(raw)
+        estimator.observe_transaction(
+            update.transaction.slot, update.transaction.transaction.transaction.message
+        )
+        if await listener._process_update(update):
+            found += 1
+    return found
+
+
+async def prefilter_with_fees(listener: GeyserListener, updates: list[bytes]) -> int:
+    """The new path with the fee estimator on: prices come from the raw bytes."""
+    listener.fee_estimator = StreamingPriorityFee()
+    try:
+        return await prefilter(listener, updates)
+    finally:
+        listener.fee_estimator = None
+
+
+async def offline() -> None:
+    create = recorded_update("raw_create_tx_from_getTransaction.json")
+    buy = recorded_update("raw_buy_tx_from_getTransaction.json")
+    updates = ([create] + [buy] * TRADES_PER_CREATE) * CREATES
+    # Distinct objects, like updates arriving from the network
+    updates = [bytes(bytearray(raw)) for raw in updates]
+
+    listener = GeyserListener("localhost:0", "token", "x-token", PumpAddresses.PROGRAM)
+    print(
+        f"Offline: {len(updates):,} updates ({CREATES} creates, "
+        f"{TRADES_PER_CREATE} trades per create)"
+    )
+    results = {}
+    runs = (
+        ("parse every update", parse_all),
+        ("raw prefilter", prefilter),
+        ("parse for fees", parse_for_fees),
+        ("prefilter + fees", prefilter_with_fees),
+    )
+    for name, run in runs:
+        started = time.perf_counter()
+        found = await run(listener, updates)
+        elapsed = time.perf_counter() - started
+        results[name] = elapsed
+        print(
+            f"  {name:<20} {elapsed:>7.3f} s  {len(updates) / elapsed:>12,.0f} updates/s  "
+            f"{found} creates"
+        )
+    print(f"  Speedup: {results['parse every update'] / results['raw prefilter']:.1f}x")
+    print(
+        f"  Speedup with fee estimator: "
+        f"{results['parse for fees'] / results['prefilter + fees']:.1f}x"
+    )
+
+
+async def count_updates(subscribe, request, counts: dict, name: str) -> None:
+    async for raw in subscribe(iter([request])):
+        counts[name] += 1
+        counts[f"{name}_bytes"] += len(raw)
+
+
+async def live(endpoint: str, token: str, auth_type: str) -> None:
+    listener = GeyserListener(endpoint, token, auth_type, PumpAddresses.PROGRAM)
+    filtered = listener._create_subscription_request()
+    broad = geyser_pb2.SubscribeRequest()
+    broad.transactions["pump_filter"].account_include.append(str(PumpAddresses.PROGRAM))
+    broad.transactions["pump_filter"].failed = False
+    broad.commitment = geyser_pb2.CommitmentLevel.PROCESSED
+
+    _, channel = create_geyser_channel(endpoint, token, auth_type)
+    subscribe = create_raw_subscribe(channel)
+    counts = {"program": 0, "program_bytes": 0, "creates": 0, "creates_bytes": 0}
+    tasks = [
+        asyncio.create_task(count_updates(subscribe, broad, counts, "program")),
+        asyncio.create_task(count_updates(subscribe, filtered, counts, "creates")),
+    ]
+    print(f"\nLive: subscribing with both filters for {LIVE_SECONDS} s")
+    await asyncio.sleep(LIVE_SECONDS)
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    await channel.close()
+
+    for name, label in (("program", "program only"), ("creates", "mint authority")):
+        print(
+            f"  {label:<16} {counts[name] / LIVE_SECONDS:>8.1f} updates/s  "
+            f"{counts[f'{name}_bytes'] / LIVE_SECONDS / 1024:>8.1f} KiB/s"
+        )
+    if counts["creates"]:
+        print(f"  Reduction: {counts['program'] / counts['creates']:.0f}x fewer updates")
+
+
+async def main() -> None:
+    await offline()
+    endpoint = os.environ.get("GEYSER_ENDPOINT")
+    token = os.environ.get("GEYSER_API_TOKEN")
+    if endpoint and token:
+        await live(endpoint, token, os.environ.get("GEYSER_AUTH_TYPE", "x-token"))
+    else:
+        print("\nSet GEYSER_ENDPOINT and GEYSER_API_TOKEN to measure live update rates")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,100 @@
+"""
+Micro-benchmark for the JSON codec used by the listeners and RPC client
+Decodes blockNotification and logsNotification payloads built from the
+recorded transactions in learning_examples with the stdlib json module and
+with the configured codec backend
+"""
+
+import json
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+from utils import json_codec
+
+EXAMPLES = Path(__file__).parent.parent / "learning_examples"
+
+# blockSubscribe notifications for pump.fun carry dozens to hundreds of
+# transactions; the recorded create transaction is repeated to match
+TRANSACTIONS_PER_BLOCK = 200
+
+
+def build_block_notification() -> bytes:
+    """Wrap the recorded blockSubscribe transaction in a blockNotification."""
+    with open(EXAMPLES / "blockSubscribe-transactions/raw_create_tx_from_blockSubscribe.json") as f:
+        transaction = json.load(f)
+
+    notification = {
+        "jsonrpc": "2.0",
+        "method": "blockNotification",
+        "params": {
+            "result": {
+                "context": {"slot": 336_000_000},
+                "value": {
+                    "slot": 336_000_000,
+                    "block": {
+                        "previousBlockhash": "EkSnNWid2cvwEVnVx9aBqawnmiCNiDgp3gUdkDPTKN1N",
+                        "blockhash": "EkSnNWid2cvwEVnVx9aBqawnmiCNiDgp3gUdkDPTKN1N",
+                        "parentSlot": 335_999_999,
+                        "transactions": [transaction] * TRANSACTIONS_PER_BLOCK,
+                        "blockTime": 1_747_000_000,
+                        "blockHeight": 314_000_000,
+                    },
+                    "err": None,
+                },
+            },
+            "subscription": 1,
+        },
+    }
+    return json.dumps(notification).encode()
+
+
+def build_logs_notification() -> bytes:
+    """Wrap the logs of the recorded create transaction in a logsNotification."""
+    with open(EXAMPLES / "raw_create_tx_from_getTransaction.json") as f:
+        result = json.load(f)["result"]
+
+    notification = {
+        "jsonrpc": "2.0",
+        "method": "logsNotification",
+        "params": {
+            "result": {
+                "context": {"slot": result["slot"]},
+                "value": {
+                    "signature": result["transaction"]["signatures"][0],
+                    "err": None,
+                    "logs": result["meta"]["logMessages"],
+                },
+            },
+            "subscription": 1,
+        },
+    }
+    return json.dumps(notification).encode()
+
+
+def bench(name: str, payload: bytes, number: int) -> None:
+    """Time stdlib json against the codec for one payload."""
+    stdlib = min(timeit.repeat(lambda: json.loads(payload), number=number, repeat=5))
+    codec = min(
+        timeit.repeat(lambda: json_codec.loads(payload), number=number, repeat=5)
+    )
+    assert json_codec.loads(payload) == json.loads(payload)
+
+    print(
+        f"{name:<18} {len(payload) / 1024:>8.1f} KiB  "
+        f"json {stdlib / number * 1e6:>9.1f} us  "
+        f"{json_codec.BACKEND} {codec / number * 1e6:>9.1f} us  "
+        f"speedup {stdlib / codec:>5.2f}x"
+    )
+
+
+def main() -> None:
+    print(f"Codec backend: {json_codec.BACKEND}")
+    bench("blockNotification", build_block_notification(), number=20)
+    bench("logsNotification", build_logs_notification(), number=5_000)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+Record live listener streams and replay them through the decode path
+Record: subscribes like the listeners do (Geyser with GEYSER_ENDPOINT and
+GEYSER_API_TOKEN, logsSubscribe and blockSubscribe on SOLANA_NODE_WSS_ENDPOINT)
+and appends the raw updates and frames to a recording file
+Replay: feeds a recording through GeyserListener._process_update,
+LogsEventProcessor.process_program_logs and PumpEventProcessor.process_transaction
+at the recorded pace (--speed 1), faster (--speed 10) or as fast as possible
+
+    python tests/benchmark_replay.py record streams.rec --seconds 300 --streams logs geyser
+    python tests/benchmark_replay.py replay streams.rec
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+from core.pubkeys import PumpAddresses
+from monitoring.block_listener import BlockListener
+from monitoring.geyser_listener import GeyserListener
+from monitoring.logs_listener import LogsListener
+from monitoring.recording import StreamRecorder, StreamReplayer
+
+load_dotenv()
+
+
+async def record(path: str, seconds: float, streams: list[str]) -> None:
+    recorder = StreamRecorder(path)
+    wss_endpoint = os.environ.get("SOLANA_NODE_WSS_ENDPOINT")
+    tasks = []
+    if "geyser" in streams:
+        listener = GeyserListener(
+            os.environ["GEYSER_ENDPOINT"],
+            os.environ["GEYSER_API_TOKEN"],
+            os.environ.get("GEYSER_AUTH_TYPE", "x-token"),
+            PumpAddresses.PROGRAM,
+        )
+        tasks.append(asyncio.create_task(recorder.record_geyser(listener)))
+    if "logs" in streams:
+        listener = LogsListener(wss_endpoint, PumpAddresses.PROGRAM)
+        tasks.append(asyncio.create_task(recorder.record_websocket(listener)))
+    if "blocks" in streams:
+        listener = BlockListener(wss_endpoint, PumpAddresses.PROGRAM)
+        tasks.append(asyncio.create_task(recorder.record_websocket(listener)))
+
+    print(f"Recording {', '.join(streams)} for {seconds:.0f} s to {path}")
+    await asyncio.sleep(seconds)
+    for task in tasks:
+        task.cancel()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    for result in results:
+        if isinstance(result, Exception) and not isinstance(result, asyncio.CancelledError):
+            print(f"Recording stream failed: {result!r}")
+    recorder.close()
+    print(f"Recorded {recorder.recorded:,} messages")
+
+
+async def replay(path: str, speed: float | None) -> None:
+    stats, tokens = await StreamReplayer(path, speed).replay()
+    pace = f"{speed}x recorded speed" if speed else "max speed"
+    print(f"Replayed {path} at {pace} in {stats.elapsed:.3f} s")
+    print(
+        f"  {'stream':<8} {'messages':>9} {'tokens':>7} {'msg/s':>10} "
+        f"{'p50 us':>9} {'p99 us':>9} {'max us':>9}"
+    )
+    for kind, values in stats.summary().items():
+        print(
+            f"  {kind:<8} {values['messages']:>9,} {values['tokens']:>7} "
+            f"{values['messages_per_s']:>10,.0f} {values['p50_us']:>9.1f} "
+            f"{values['p99_us']:>9.1f} {values['max_us']:>9.1f}"
+        )
+    if stats.lateness:
+        worst = max(stats.lateness) * 1000
+        print(f"  Max lateness behind the recorded pace: {worst:.2f} ms")
+    print(f"  {len(tokens)} tokens decoded")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    commands = parser.add_subparsers(dest="command", required=True)
+    record_parser = commands.add_parser("record", help="Record live streams")
+    record_parser.add_argument("path")
+    record_parser.add_argument("--seconds", type=float, default=60.0)
+    record_parser.add_argument(
+        "--streams", nargs="+", choices=["geyser", "logs", "blocks"], default=["logs"]
+    )
+    replay_parser = commands.add_parser("replay", help="Replay a recording")
+    replay_parser.add_argument("path")
+    replay_parser.add_argument(
+        "--speed", type=float, default=None, help="Pace relative to the recording (default: max)"
+    )
+    args = parser.parse_args()
+
+    # Decode errors of individual messages would drown the report
+    logging.disable(logging.ERROR)
+    if args.command == "record":
+        asyncio.run(record(args.path, args.seconds, args.streams))
+    else:
+        asyncio.run(replay(args.path, args.speed))
+
+
+if __name__ == "__main__":
+    main()
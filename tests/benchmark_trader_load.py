@@ -0,0 +1,148 @@
+"""
+Load test of PumpTrader end to end against the local mock Solana server
+Starts tests/mock_solana_server.py in-process, emitting synthetic creates at
+the given rate, and runs a YOLO extreme-fast trader on it: detection, buy,
+confirmation, sell and journaling. Reports buys and sells per minute, the
+requests the node served and the latency percentiles per stage
+
+    python tests/benchmark_trader_load.py --creates-per-minute 3000 --listener geyser
+    python tests/benchmark_trader_load.py --latency 0.05 --error-rate 0.05 --land-rate 0.9
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import socket
+import sys
+import tempfile
+from collections import Counter
+from pathlib import Path
+
+from solders.keypair import Keypair
+
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+sys.path.append(str(Path(__file__).parent))
+
+from mock_solana_server import FaultInjection, MockSolanaServer
+
+from trading.trader import PumpTrader
+from utils import json_codec
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def run(args: argparse.Namespace) -> None:
+    server = MockSolanaServer(
+        port=free_port(),
+        geyser_port=free_port(),
+        creates_per_minute=args.creates_per_minute,
+        trades_per_create=args.trades_per_create,
+        faults=FaultInjection(
+            latency=args.latency,
+            jitter=args.jitter,
+            error_rate=args.error_rate,
+            land_rate=args.land_rate,
+            confirm_latency=args.confirm_latency,
+        ),
+    )
+    await server.start()
+
+    journal_dir = tempfile.mkdtemp(prefix="pump-load-")
+    trader = PumpTrader(
+        rpc_endpoint=server.rpc_endpoint,
+        wss_endpoint=server.wss_endpoint,
+        private_key=str(Keypair()),
+        buy_amount=0.0001,
+        buy_slippage=0.3,
+        sell_slippage=0.3,
+        listener_type=args.listener,
+        geyser_endpoint=server.geyser_endpoint,
+        geyser_api_token="mock",
+        extreme_fast_mode=True,
+        max_positions=args.max_positions,
+        max_retries=1,
+        wait_time_after_buy=args.hold,
+        wait_time_before_new_token=0,
+        max_token_age=1.0,
+        yolo_mode=True,
+        journal_dir=journal_dir,
+    )
+    # The trader is stopped by cancellation, so its summaries are printed here
+    trader.latency.summary_every = 0
+
+    print(
+        f"Trading {args.creates_per_minute:,.0f} creates/min on the {args.listener} "
+        f"listener for {args.seconds:.0f} s (journal in {journal_dir})"
+    )
+    task = asyncio.create_task(trader.start())
+    await asyncio.sleep(args.seconds)
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+    await server.stop()
+
+    actions: Counter[str] = Counter()
+    outcomes: Counter[str] = Counter()
+    with open(os.path.join(journal_dir, "trades.log"), "rb") as f:
+        for line in f:
+            record = json_codec.loads(line)
+            actions[record["action"]] += 1
+            if record["action"] == "trace":
+                outcomes[record["outcome"]] += 1
+    stats = server.get_stats()
+    minutes = args.seconds / 60
+    print(f"  Creates emitted:   {stats['creates']:,}")
+    print(f"  Buys:              {actions['buy']:,} ({actions['buy'] / minutes:,.0f}/min)")
+    print("  Buy outcomes:      " + ", ".join(
+        f"{outcome} {count:,}" for outcome, count in sorted(outcomes.items())
+    ))
+    print(f"  Sells:             {actions['sell']:,} ({actions['sell'] / minutes:,.0f}/min)")
+    print(f"  Transactions sent: {stats['transactions']:,} ({stats['landed']:,} landed)")
+    print(f"  Errors injected:   {stats['errors_injected']:,}")
+    print("  Requests served:   " + ", ".join(
+        f"{method} {count:,}" for method, count in sorted(stats["requests"].items())
+    ))
+    print("  Compute unit limits: " + ", ".join(
+        f"{shape} {profile['limit']:,}"
+        for shape, profile in trader.solana_client.compute_units.get_stats().items()
+    ))
+    for listener, stages in trader.latency.get_stats().items():
+        print(f"  Latency p50/p99 ms ({listener}):")
+        for stage, values in stages.items():
+            print(
+                f"    {stage:<10} {values['p50_ms']:>8.1f} {values['p99_ms']:>8.1f} "
+                f"({values['samples']} samples)"
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--seconds", type=float, default=30.0)
+    parser.add_argument("--creates-per-minute", type=float, default=3_000.0)
+    parser.add_argument("--trades-per-create", type=int, default=0)
+    parser.add_argument(
+        "--listener", choices=["logs", "blocks", "geyser"], default="logs"
+    )
+    parser.add_argument("--max-positions", type=int, default=50)
+    parser.add_argument("--hold", type=float, default=1.0, help="Seconds between buy and sell")
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--land-rate", type=float, default=1.0)
+    parser.add_argument("--confirm-latency", type=float, default=0.4)
+    args = parser.parse_args()
+
+    # Per-token logs would dominate the run, and positions still open at the
+    # end fail their confirmation on shutdown
+    logging.disable(logging.ERROR)
+    # The blocks listener loads the IDL relative to the repository root
+    os.chdir(Path(__file__).parent.parent)
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
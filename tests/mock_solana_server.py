@@ -0,0 +1,794 @@
+"""
+Local stand-in for a Solana node and a Geyser endpoint
+Serves the subset of the JSON-RPC API, the WebSocket subscriptions and the
+Geyser Subscribe stream used by src/, and emits synthetic pump.fun creates at
+a configurable rate on logsSubscribe, blockSubscribe and Geyser. Latency,
+JSON-RPC errors and transactions that never land can be injected, so the bot
+can be exercised end to end without any network
+
+    python tests/mock_solana_server.py --creates-per-minute 600 --latency 0.02
+"""
+
+import argparse
+import asyncio
+import base64
+import itertools
+import random
+import struct
+import sys
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import base58
+import grpc
+from aiohttp import WSMsgType, web
+from solders.compute_budget import set_compute_unit_price
+from solders.hash import Hash
+from solders.instruction import AccountMeta, Instruction
+from solders.keypair import Keypair
+from solders.message import Message
+from solders.pubkey import Pubkey
+from solders.transaction import Transaction
+
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+from core.curve import EXPECTED_DISCRIMINATOR
+from core.pubkeys import PumpAddresses, SystemAddresses
+from geyser.generated import geyser_pb2, geyser_pb2_grpc
+from monitoring.geyser_event_processor import GeyserEventProcessor
+from monitoring.logs_event_processor import LogsEventProcessor
+from utils import json_codec
+
+METADATA_PROGRAM = Pubkey.from_string("metaqbxxUerdq28cj1RbAWkYQm3ybzjb6a8bt518x1s")
+
+# Reserves of a freshly created pump.fun bonding curve
+INITIAL_VIRTUAL_TOKEN_RESERVES = 1_073_000_000_000_000
+INITIAL_VIRTUAL_SOL_RESERVES = 30_000_000_000
+INITIAL_REAL_TOKEN_RESERVES = 793_100_000_000_000
+TOKEN_TOTAL_SUPPLY = 1_000_000_000_000_000
+
+CURVE_LAYOUT = struct.Struct("<QQQQQ?32s")
+
+BUY_DISCRIMINATOR = struct.pack("<Q", 16927863322537952870)
+
+
+@dataclass
+class FaultInjection:
+    """Latency and failures injected into the mock node."""
+
+    # Seconds added to every JSON-RPC response, plus up to `jitter` at random
+    latency: float = 0.0
+    jitter: float = 0.0
+    # Per-method latency replacing `latency`, e.g. {"sendTransaction": 0.05}
+    method_latency: dict[str, float] = field(default_factory=dict)
+    # Probability that a JSON-RPC request is answered with an error
+    error_rate: float = 0.0
+    # Probability that an accepted transaction lands
+    land_rate: float = 1.0
+    # Seconds from sendTransaction to the transaction being confirmed
+    confirm_latency: float = 0.4
+
+
+def borsh_string(value: str) -> bytes:
+    return struct.pack("<I", len(value)) + value.encode()
+
+
+@dataclass
+class SyntheticCreate:
+    """A synthetic pump.fun create and its encodings for every stream."""
+
+    index: int
+    user: Keypair
+    mint: Keypair
+    bonding_curve: Pubkey
+    associated_bonding_curve: Pubkey
+    creator: Pubkey
+    transaction: Transaction
+
+    @classmethod
+    def generate(cls, index: int, blockhash: Hash, price: int = 0) -> "SyntheticCreate":
+        user, mint = Keypair(), Keypair()
+        bonding_curve, _ = Pubkey.find_program_address(
+            [b"bonding-curve", bytes(mint.pubkey())], PumpAddresses.PROGRAM
+        )
+        associated_bonding_curve = Pubkey.new_unique()
+        name, symbol = f"Mock Token {index}", f"MOCK{index}"
+        data = (
+            GeyserEventProcessor.CREATE_DISCRIMINATOR
+            + borsh_string(name)
+            + borsh_string(symbol)
+            + borsh_string(f"https://example.com/{index}.json")
+            + bytes(user.pubkey())
+        )
+        # Account order of the pump.fun create instruction
+        accounts = [
+            AccountMeta(mint.pubkey(), True, True),
+            AccountMeta(PumpAddresses.MINT_AUTHORITY, False, False),
+            AccountMeta(bonding_curve, False, True),
+            AccountMeta(associated_bonding_curve, False, True),
+            AccountMeta(PumpAddresses.GLOBAL, False, False),
+            AccountMeta(METADATA_PROGRAM, False, False),
+            AccountMeta(Pubkey.new_unique(), False, True),
+            AccountMeta(user.pubkey(), True, True),
+            AccountMeta(SystemAddresses.PROGRAM, False, False),
+            AccountMeta(SystemAddresses.TOKEN_PROGRAM, False, False),
+            AccountMeta(SystemAddresses.ASSOCIATED_TOKEN_PROGRAM, False, False),
+            AccountMeta(SystemAddresses.RENT, False, False),
+            AccountMeta(PumpAddresses.EVENT_AUTHORITY, False, False),
+            AccountMeta(PumpAddresses.PROGRAM, False, False),
+        ]
+        instruction = Instruction(PumpAddresses.PROGRAM, data, accounts)
+        message = Message([set_compute_unit_price(price), instruction], user.pubkey())
+        transaction = Transaction([user, mint], message, blockhash)
+        return cls(
+            index, user, mint, bonding_curve, associated_bonding_curve, user.pubkey(), transaction
+        )
+
+    @property
+    def signature(self) -> str:
+        return str(self.transaction.signatures[0])
+
+    def name(self) -> str:
+        return f"Mock Token {self.index}"
+
+    def curve_data(self) -> bytes:
+        return EXPECTED_DISCRIMINATOR + CURVE_LAYOUT.pack(
+            INITIAL_VIRTUAL_TOKEN_RESERVES,
+            INITIAL_VIRTUAL_SOL_RESERVES,
+            INITIAL_REAL_TOKEN_RESERVES,
+            0,
+            TOKEN_TOTAL_SUPPLY,
+            False,
+            bytes(self.creator),
+        )
+
+    def logs(self) -> list[str]:
+        event = (
+            struct.pack("<Q", LogsEventProcessor.CREATE_DISCRIMINATOR)
+            + borsh_string(self.name())
+            + borsh_string(f"MOCK{self.index}")
+            + borsh_string(f"https://example.com/{self.index}.json")
+            + bytes(self.mint.pubkey())
+            + bytes(self.bonding_curve)
+            + bytes(self.user.pubkey())
+            + bytes(self.creator)
+        )
+        return [
+            f"Program {PumpAddresses.PROGRAM} invoke [1]",
+            "Program log: Instruction: Create",
+            f"Program data: {base64.b64encode(event).decode()}",
+            f"Program {PumpAddresses.PROGRAM} success",
+        ]
+
+    def geyser_update(self, slot: int) -> geyser_pb2.SubscribeUpdate:
+        return geyser_transaction_update(self.transaction, slot, self.logs())
+
+
+def geyser_transaction_update(
+    transaction: Transaction, slot: int, logs: list[str]
+) -> geyser_pb2.SubscribeUpdate:
+    """A Geyser transaction update carrying a signed transaction."""
+    update = geyser_pb2.SubscribeUpdate()
+    update.filters.append("pump_filter")
+    info = update.transaction.transaction
+    info.signature = bytes(transaction.signatures[0])
+    update.transaction.slot = slot
+    tx = info.transaction
+    tx.signatures.append(info.signature)
+    message = transaction.message
+    tx.message.account_keys.extend(bytes(key) for key in message.account_keys)
+    tx.message.recent_blockhash = bytes(message.recent_blockhash)
+    for compiled in message.instructions:
+        ix = tx.message.instructions.add()
+        ix.program_id_index = compiled.program_id_index
+        ix.accounts = bytes(compiled.accounts)
+        ix.data = bytes(compiled.data)
+    info.meta.log_messages.extend(logs)
+    return update
+
+
+def trade_transaction(blockhash: Hash, price: int) -> Transaction:
+    """A pump.fun buy paying a compute unit price, for the fee stream."""
+    user = Keypair()
+    data = BUY_DISCRIMINATOR + struct.pack("<QQ", 1_000_000, 10_000_000)
+    accounts = [
+        AccountMeta(PumpAddresses.GLOBAL, False, False),
+        AccountMeta(PumpAddresses.FEE, False, True),
+        AccountMeta(user.pubkey(), True, True),
+    ]
+    message = Message(
+        [set_compute_unit_price(price), Instruction(PumpAddresses.PROGRAM, data, accounts)],
+        user.pubkey(),
+    )
+    return Transaction([user], message, blockhash)
+
+
+# Compute units each program consumes when a transaction is simulated; an
+# associated token account that does not exist yet costs more, since it is
+# created through the system program
+PROGRAM_UNITS = {
+    str(SystemAddresses.COMPUTE_BUDGET_PROGRAM): 150,
+    str(SystemAddresses.PROGRAM): 150,
+    str(SystemAddresses.TOKEN_PROGRAM): 3_000,
+    str(SystemAddresses.ASSOCIATED_TOKEN_PROGRAM): 4_500,
+    str(PumpAddresses.PROGRAM): 32_000,
+}
+CREATE_ACCOUNT_UNITS = 17_500
+DEFAULT_PROGRAM_UNITS = 5_000
+
+
+def trade_logs() -> list[str]:
+    """Logs of a pump.fun trade, which the listeners must skip."""
+    return [
+        f"Program {PumpAddresses.PROGRAM} invoke [1]",
+        "Program log: Instruction: Buy",
+        f"Program {PumpAddresses.PROGRAM} success",
+    ]
+
+
+class _GeyserService(geyser_pb2_grpc.GeyserServicer):
+    """Geyser Subscribe stream of the mock server."""
+
+    def __init__(self, server: "MockSolanaServer"):
+        self.server = server
+
+    async def Subscribe(self, request_iterator, context):
+        queue: asyncio.Queue = asyncio.Queue(maxsize=10_000)
+        subscriber = {
+            "queue": queue,
+            "transactions": False,
+            "trades": False,
+            "blocks_meta": False,
+            "accounts": set(),
+        }
+
+        async def read_requests() -> None:
+            async for request in request_iterator:
+                subscriber["transactions"] = bool(request.transactions)
+                # Only filters without the mint authority requirement match trades
+                subscriber["trades"] = any(
+                    not transaction_filter.account_required
+                    for transaction_filter in request.transactions.values()
+                )
+                subscriber["blocks_meta"] = bool(request.blocks_meta)
+                accounts = {
+                    address for account_filter in request.accounts.values()
+                    for address in account_filter.account
+                }
+                for address in accounts - subscriber["accounts"]:
+                    update = self.server.geyser_account_update(address)
+                    if update:
+                        queue.put_nowait(update)
+                subscriber["accounts"] = accounts
+
+        reader = asyncio.create_task(read_requests())
+        self.server.geyser_subscribers.append(subscriber)
+        try:
+            while True:
+                yield await queue.get()
+        finally:
+            reader.cancel()
+            self.server.geyser_subscribers.remove(subscriber)
+
+
+class MockSolanaServer:
+    """JSON-RPC, WebSocket and Geyser mock of a Solana node."""
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 8899,
+        geyser_port: int = 10015,
+        creates_per_minute: float = 60.0,
+        trades_per_create: int = 0,
+        slot_time: float = 0.4,
+        token_balance: int = 1_000_000_000,
+        faults: FaultInjection | None = None,
+        seed: int = 0,
+    ):
+        """Initialize the mock server.
+
+        Args:
+            host: Interface to listen on
+            port: Port of the JSON-RPC and WebSocket endpoints
+            geyser_port: Port of the Geyser endpoint (0 = no Geyser)
+            creates_per_minute: Synthetic creates emitted per minute (0 = none)
+            trades_per_create: Trades emitted between creates, as logs
+                               notifications and Geyser transactions
+            slot_time: Seconds per slot
+            token_balance: Raw balance reported for every token account
+            faults: Latency and failure injection
+            seed: Seed of the injected randomness
+        """
+        self.host = host
+        self.port = port
+        self.geyser_port = geyser_port
+        self.creates_per_minute = creates_per_minute
+        self.trades_per_create = trades_per_create
+        self.slot_time = slot_time
+        self.token_balance = token_balance
+        self.faults = faults or FaultInjection()
+        self.random = random.Random(seed)
+
+        self.slot = 300_000_000
+        self.block_height = 280_000_000
+        self.blockhash = Hash.new_unique()
+        self.curves: dict[str, bytes] = {}
+        # signature -> (time it lands, whether it lands at all)
+        self.transactions: dict[str, tuple[float, bool]] = {}
+        # Associated token accounts created by landed transactions, and those
+        # sent transactions create once they land
+        self.token_accounts: set[str] = set()
+        self.pending_accounts: dict[str, set[str]] = {}
+        self.creates: list[SyntheticCreate] = []
+        self.requests: defaultdict[str, int] = defaultdict(int)
+        self.errors_injected = 0
+
+        self.websockets: dict[web.WebSocketResponse, dict[int, tuple[str, Any]]] = {}
+        self.geyser_subscribers: list[dict[str, Any]] = []
+        self._subscription_ids = itertools.count(1)
+        self._runner: web.AppRunner | None = None
+        self._grpc_server: grpc.aio.Server | None = None
+        self._tasks: list[asyncio.Task] = []
+
+    @property
+    def rpc_endpoint(self) -> str:
+        return f"http://{self.host}:{self.port}/"
+
+    @property
+    def wss_endpoint(self) -> str:
+        return f"ws://{self.host}:{self.port}/"
+
+    @property
+    def geyser_endpoint(self) -> str:
+        return f"{self.host}:{self.geyser_port}"
+
+    async def start(self) -> None:
+        """Start serving and emitting slots and creates."""
+        app = web.Application()
+        app.router.add_post("/", self._handle_rpc)
+        app.router.add_get("/", self._handle_websocket)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, self.host, self.port).start()
+
+        if self.geyser_port:
+            self._grpc_server = grpc.aio.server()
+            geyser_pb2_grpc.add_GeyserServicer_to_server(_GeyserService(self), self._grpc_server)
+            self._grpc_server.add_secure_port(
+                self.geyser_endpoint,
+                grpc.local_server_credentials(grpc.LocalConnectionType.LOCAL_TCP),
+            )
+            await self._grpc_server.start()
+
+        self._tasks.append(asyncio.create_task(self._produce_slots()))
+        if self.creates_per_minute > 0:
+            self._tasks.append(asyncio.create_task(self._produce_creates()))
+
+    async def stop(self) -> None:
+        """Stop serving."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        for websocket in list(self.websockets):
+            await websocket.close()
+        if self._grpc_server:
+            await self._grpc_server.stop(0)
+        if self._runner:
+            await self._runner.cleanup()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Requests served per method and transaction outcomes."""
+        now = time.monotonic()
+        landed = sum(1 for at, lands in self.transactions.values() if lands and at <= now)
+        return {
+            "creates": len(self.creates),
+            "transactions": len(self.transactions),
+            "landed": landed,
+            "errors_injected": self.errors_injected,
+            "requests": dict(self.requests),
+        }
+
+    # Synthetic chain activity
+
+    async def _produce_slots(self) -> None:
+        while True:
+            await asyncio.sleep(self.slot_time)
+            self.slot += 1
+            self.block_height += 1
+            self.blockhash = Hash.new_unique()
+            self._land_accounts()
+            self._notify("slotSubscribe", lambda _: {"parent": self.slot - 1, "root": self.slot - 32, "slot": self.slot})
+            meta = geyser_pb2.SubscribeUpdate()
+            meta.block_meta.slot = self.slot
+            meta.block_meta.blockhash = str(self.blockhash)
+            meta.block_meta.block_height.block_height = self.block_height
+            for subscriber in self.geyser_subscribers:
+                if subscriber["blocks_meta"]:
+                    self._offer(subscriber, meta)
+            self._notify_signatures()
+
+    async def _produce_creates(self) -> None:
+        interval = 60.0 / self.creates_per_minute
+        next_at = time.monotonic()
+        for index in itertools.count():
+            next_at += interval
+            create = SyntheticCreate.generate(index, self.blockhash, self.compute_unit_price())
+            self.creates.append(create)
+            self.curves[str(create.bonding_curve)] = create.curve_data()
+            self._publish_create(create)
+            for _ in range(self.trades_per_create):
+                self._publish_trade()
+            await asyncio.sleep(max(0.0, next_at - time.monotonic()))
+
+    def _publish_create(self, create: SyntheticCreate) -> None:
+        self._notify(
+            "logsSubscribe",
+            lambda _: self._context({"signature": create.signature, "err": None, "logs": create.logs()}),
+        )
+        transaction = base64.b64encode(bytes(create.transaction)).decode()
+        self._notify(
+            "blockSubscribe",
+            lambda _: self._context(
+                {
+                    "slot": self.slot,
+                    "block": {
+                        "blockhash": str(self.blockhash),
+                        "parentSlot": self.slot - 1,
+                        "blockHeight": self.block_height,
+                        "transactions": [
+                            {"transaction": [transaction, "base64"], "meta": {"err": None}}
+                        ],
+                    },
+                    "err": None,
+                }
+            ),
+        )
+        update = create.geyser_update(self.slot)
+        for subscriber in self.geyser_subscribers:
+            if subscriber["transactions"]:
+                self._offer(subscriber, update)
+
+    def _publish_trade(self) -> None:
+        self._notify(
+            "logsSubscribe",
+            lambda _: self._context({"signature": "1" * 88, "err": None, "logs": trade_logs()}),
+        )
+        trade_subscribers = [
+            subscriber for subscriber in self.geyser_subscribers if subscriber["trades"]
+        ]
+        if trade_subscribers:
+            update = geyser_transaction_update(
+                trade_transaction(self.blockhash, self.compute_unit_price()),
+                self.slot,
+                trade_logs(),
+            )
+            for subscriber in trade_subscribers:
+                self._offer(subscriber, update)
+
+    def compute_unit_price(self) -> int:
+        """Compute unit price paid by a synthetic transaction."""
+        return int(self.random.lognormvariate(11.5, 1.0))
+
+    def geyser_account_update(self, address: str) -> geyser_pb2.SubscribeUpdate | None:
+        data = self.curves.get(address)
+        if data is None:
+            return None
+        update = geyser_pb2.SubscribeUpdate()
+        update.account.slot = self.slot
+        account = update.account.account
+        account.pubkey = bytes(Pubkey.from_string(address))
+        account.owner = bytes(PumpAddresses.PROGRAM)
+        account.lamports = 1_000_000
+        account.data = data
+        return update
+
+    @staticmethod
+    def _offer(subscriber: dict[str, Any], update: geyser_pb2.SubscribeUpdate) -> None:
+        if not subscriber["queue"].full():
+            subscriber["queue"].put_nowait(update)
+
+    def _context(self, value: Any) -> dict[str, Any]:
+        return {"context": {"slot": self.slot}, "value": value}
+
+    # WebSocket subscriptions
+
+    def _notify(self, method: str, result) -> None:
+        """Send a notification to every subscription of a method."""
+        notification = method.replace("Subscribe", "Notification")
+        for websocket, subscriptions in list(self.websockets.items()):
+            for subscription_id, (subscribed, argument) in list(subscriptions.items()):
+                if subscribed != method:
+                    continue
+                self._send(
+                    websocket,
+                    {
+                        "jsonrpc": "2.0",
+                        "method": notification,
+                        "params": {"result": result(argument), "subscription": subscription_id},
+                    },
+                )
+
+    def _notify_signatures(self) -> None:
+        now = time.monotonic()
+        for websocket, subscriptions in list(self.websockets.items()):
+            for subscription_id, (method, signature) in list(subscriptions.items()):
+                if method != "signatureSubscribe":
+                    continue
+                landing = self.transactions.get(signature)
+                if landing and landing[1] and landing[0] <= now:
+                    del subscriptions[subscription_id]
+                    self._send(
+                        websocket,
+                        {
+                            "jsonrpc": "2.0",
+                            "method": "signatureNotification",
+                            "params": {
+                                "result": self._context({"err": None}),
+                                "subscription": subscription_id,
+                            },
+                        },
+                    )
+
+    @staticmethod
+    def _send(websocket: web.WebSocketResponse, message: dict[str, Any]) -> None:
+        if not websocket.closed:
+            asyncio.create_task(websocket.send_str(json_codec.dumps(message)))
+
+    async def _handle_websocket(self, request: web.Request) -> web.WebSocketResponse:
+        websocket = web.WebSocketResponse(max_msg_size=0)
+        await websocket.prepare(request)
+        subscriptions: dict[int, tuple[str, Any]] = {}
+        self.websockets[websocket] = subscriptions
+        try:
+            async for message in websocket:
+                if message.type != WSMsgType.TEXT:
+                    continue
+                body = json_codec.loads(message.data)
+                method = body.get("method", "")
+                self.requests[method] += 1
+                params = body.get("params", [])
+                if method.endswith("Unsubscribe"):
+                    subscriptions.pop(params[0] if params else None, None)
+                    result: Any = True
+                else:
+                    result = next(self._subscription_ids)
+                    subscriptions[result] = (method, params[0] if params else None)
+                await websocket.send_str(
+                    json_codec.dumps({"jsonrpc": "2.0", "id": body.get("id"), "result": result})
+                )
+                if method == "accountSubscribe":
+                    data = self.curves.get(params[0])
+                    if data is not None:
+                        self._send(websocket, self._account_notification(result, data))
+                elif method == "signatureSubscribe":
+                    self._notify_signatures()
+        finally:
+            self.websockets.pop(websocket, None)
+        return websocket
+
+    def _account_notification(self, subscription_id: int, data: bytes) -> dict[str, Any]:
+        return {
+            "jsonrpc": "2.0",
+            "method": "accountNotification",
+            "params": {
+                "result": self._context(self._account(data)),
+                "subscription": subscription_id,
+            },
+        }
+
+    # JSON-RPC
+
+    async def _handle_rpc(self, request: web.Request) -> web.Response:
+        body = json_codec.loads(await request.read())
+        if isinstance(body, list):
+            responses = await asyncio.gather(*(self._answer(item) for item in body))
+            return web.Response(body=json_codec.dumps_bytes(responses), content_type="application/json")
+        response = await self._answer(body)
+        return web.Response(body=json_codec.dumps_bytes(response), content_type="application/json")
+
+    async def _answer(self, body: dict[str, Any]) -> dict[str, Any]:
+        method = body.get("method", "")
+        self.requests[method] += 1
+        faults = self.faults
+        delay = faults.method_latency.get(method, faults.latency)
+        if faults.jitter:
+            delay += self.random.uniform(0, faults.jitter)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        if faults.error_rate and self.random.random() < faults.error_rate:
+            self.errors_injected += 1
+            return {
+                "jsonrpc": "2.0",
+                "id": body.get("id"),
+                "error": {"code": -32005, "message": "Node is behind (injected)"},
+            }
+        handler = getattr(self, f"_rpc_{method}", None)
+        if handler is None:
+            return {
+                "jsonrpc": "2.0",
+                "id": body.get("id"),
+                "error": {"code": -32601, "message": f"Method not found: {method}"},
+            }
+        return {"jsonrpc": "2.0", "id": body.get("id"), "result": handler(body.get("params", []))}
+
+    @staticmethod
+    def _account(data: bytes) -> dict[str, Any]:
+        return {
+            "data": [base64.b64encode(data).decode(), "base64"],
+            "executable": False,
+            "lamports": 1_000_000,
+            "owner": str(PumpAddresses.PROGRAM),
+            "rentEpoch": 0,
+            "space": len(data),
+        }
+
+    def _rpc_getHealth(self, params: list) -> str:
+        return "ok"
+
+    def _rpc_getLatestBlockhash(self, params: list) -> dict[str, Any]:
+        return self._context(
+            {"blockhash": str(self.blockhash), "lastValidBlockHeight": self.block_height + 150}
+        )
+
+    def _rpc_getAccountInfo(self, params: list) -> dict[str, Any]:
+        data = self.curves.get(params[0])
+        return self._context(self._account(data) if data is not None else None)
+
+    def _rpc_getMultipleAccounts(self, params: list) -> dict[str, Any]:
+        return self._context(
+            [
+                self._account(self.curves[address]) if address in self.curves else None
+                for address in params[0]
+            ]
+        )
+
+    def _rpc_getTokenAccountBalance(self, params: list) -> dict[str, Any]:
+        amount = self.token_balance
+        return self._context(
+            {
+                "amount": str(amount),
+                "decimals": 6,
+                "uiAmount": amount / 1e6,
+                "uiAmountString": str(amount / 1e6),
+            }
+        )
+
+    def _rpc_sendTransaction(self, params: list) -> str:
+        config = params[1] if len(params) > 1 else {}
+        encoded = params[0]
+        raw = (
+            base64.b64decode(encoded)
+            if config.get("encoding") == "base64"
+            else base58.b58decode(encoded)
+        )
+        # Compact array of one signature: length byte, then the signature
+        signature = base58.b58encode(raw[1:65]).decode()
+        lands = self.random.random() < self.faults.land_rate
+        self.transactions[signature] = (time.monotonic() + self.faults.confirm_latency, lands)
+        if lands:
+            self.pending_accounts[signature] = self._execute(Transaction.from_bytes(raw).message)[2]
+        return signature
+
+    def _land_accounts(self) -> None:
+        now = time.monotonic()
+        for signature in [s for s in self.pending_accounts if self.transactions[s][0] <= now]:
+            self.token_accounts.update(self.pending_accounts.pop(signature))
+
+    def _execute(self, message: Message) -> tuple[int, list[str], set[str]]:
+        """Cost a transaction: units consumed, program logs and token accounts created."""
+        keys = [str(key) for key in message.account_keys]
+        ata_program = str(SystemAddresses.ASSOCIATED_TOKEN_PROGRAM)
+        units = 0
+        logs = []
+        created = set()
+        for ix in message.instructions:
+            program = keys[ix.program_id_index]
+            logs.append(f"Program {program} invoke [1]")
+            units += PROGRAM_UNITS.get(program, DEFAULT_PROGRAM_UNITS)
+            if program == ata_program:
+                account = keys[ix.accounts[1]]
+                if account not in self.token_accounts:
+                    logs.append(f"Program {SystemAddresses.PROGRAM} invoke [2]")
+                    logs.append(f"Program {SystemAddresses.PROGRAM} success")
+                    units += CREATE_ACCOUNT_UNITS
+                    created.add(account)
+            logs.append(f"Program {program} success")
+        return units, logs, created
+
+    def _rpc_simulateTransaction(self, params: list) -> dict[str, Any]:
+        config = params[1] if len(params) > 1 else {}
+        encoded = params[0]
+        raw = (
+            base64.b64decode(encoded)
+            if config.get("encoding") == "base64"
+            else base58.b58decode(encoded)
+        )
+        self._land_accounts()
+        message = Transaction.from_bytes(raw).message
+        units, logs, _ = self._execute(message)
+        err = None
+        compute_budget = str(SystemAddresses.COMPUTE_BUDGET_PROGRAM)
+        for ix in message.instructions:
+            # SetComputeUnitLimit: instruction index 2 followed by the limit as a u32
+            if (
+                str(message.account_keys[ix.program_id_index]) == compute_budget
+                and ix.data[0] == 2
+                and units > struct.unpack_from("<I", ix.data, 1)[0]
+            ):
+                err = {"InstructionError": [len(message.instructions) - 1, "ComputationalBudgetExceeded"]}
+        return self._context({"err": err, "logs": logs, "unitsConsumed": units, "accounts": None})
+
+    def _rpc_getSignatureStatuses(self, params: list) -> dict[str, Any]:
+        now = time.monotonic()
+        statuses = []
+        for signature in params[0]:
+            landing = self.transactions.get(signature)
+            if landing and landing[1] and landing[0] <= now:
+                statuses.append(
+                    {
+                        "slot": self.slot,
+                        "confirmations": 1,
+                        "err": None,
+                        "status": {"Ok": None},
+                        "confirmationStatus": "confirmed",
+                    }
+                )
+            else:
+                statuses.append(None)
+        return self._context(statuses)
+
+    def _rpc_getRecentPrioritizationFees(self, params: list) -> list[dict[str, int]]:
+        return [
+            {"slot": self.slot - offset, "prioritizationFee": self.random.randint(0, 200_000)}
+            for offset in range(150)
+        ]
+
+
+async def serve(args: argparse.Namespace) -> None:
+    server = MockSolanaServer(
+        port=args.port,
+        geyser_port=args.geyser_port,
+        creates_per_minute=args.creates_per_minute,
+        trades_per_create=args.trades_per_create,
+        faults=FaultInjection(
+            latency=args.latency,
+            jitter=args.jitter,
+            error_rate=args.error_rate,
+            land_rate=args.land_rate,
+            confirm_latency=args.confirm_latency,
+        ),
+    )
+    await server.start()
+    print(f"RPC:    {server.rpc_endpoint}")
+    print(f"WSS:    {server.wss_endpoint}")
+    if args.geyser_port:
+        print(f"Geyser: {server.geyser_endpoint} (any token)")
+    try:
+        while True:
+            await asyncio.sleep(10)
+            print(server.get_stats())
+    finally:
+        await server.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Local mock Solana RPC/WebSocket/Geyser server")
+    parser.add_argument("--port", type=int, default=8899)
+    parser.add_argument("--geyser-port", type=int, default=10015)
+    parser.add_argument("--creates-per-minute", type=float, default=60.0)
+    parser.add_argument("--trades-per-create", type=int, default=0)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--land-rate", type=float, default=1.0)
+    parser.add_argument("--confirm-latency", type=float, default=0.4)
+    asyncio.run(serve(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+Tests for the buy path's compute unit profile
+"""
+
+import asyncio
+import struct
+import sys
+from pathlib import Path
+
+from solders.hash import Hash
+from solders.keypair import Keypair
+from solders.pubkey import Pubkey
+
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+from core.compute_units import BUY_CREATE_ATA
+from core.curve import EXPECTED_DISCRIMINATOR, BondingCurveState
+from core.wallet import Wallet
+from trading.base import TokenInfo
+from trading.buyer import TokenBuyer
+
+
+class ShapeRecorder:
+    """Records the shapes limits are asked for and samples are taken of."""
+
+    def __init__(self):
+        self.limits: list[str] = []
+        self.samples: list[str] = []
+
+    def get_limit(self, shape: str) -> int:
+        self.limits.append(shape)
+        return 50_000
+
+    def sample(self, shape: str, transaction: bytes) -> None:
+        self.samples.append(shape)
+
+
+class BuyClient:
+    def __init__(self):
+        self.lookups: list[Pubkey] = []
+        self.compute_units = ShapeRecorder()
+
+    async def get_account_info(self, pubkey, priority=None, hedged=False):
+        self.lookups.append(pubkey)
+        return {"data": b""}
+
+    async def get_cached_blockhash(self):
+        return Hash.new_unique()
+
+    async def send_raw_transaction(self, transaction, **kwargs):
+        return "signature"
+
+    async def confirm_transaction(self, signature, trace=None):
+        return True
+
+
+class CurveManager:
+    async def get_curve_state(self, curve, *args, **kwargs):
+        return BondingCurveState(
+            EXPECTED_DISCRIMINATOR
+            + struct.pack(
+                "<QQQQQ?",
+                1_073_000_000_000_000,
+                30_000_000_000,
+                793_100_000_000_000,
+                0,
+                1_000_000_000_000_000,
+                False,
+            )
+            + bytes(Pubkey.new_unique())
+        )
+
+
+class FeeManager:
+    async def calculate_priority_fee(self, accounts):
+        return 1_000
+
+
+def token_info() -> TokenInfo:
+    return TokenInfo(
+        name="Token",
+        symbol="TKN",
+        uri="",
+        mint=Pubkey.new_unique(),
+        bonding_curve=Pubkey.new_unique(),
+        associated_bonding_curve=Pubkey.new_unique(),
+        user=Pubkey.new_unique(),
+        creator=Pubkey.new_unique(),
+        creator_vault=Pubkey.new_unique(),
+    )
+
+
+def buy(extreme_fast_mode: bool = False) -> BuyClient:
+    client = BuyClient()
+    buyer = TokenBuyer(
+        client,
+        Wallet(str(Keypair())),
+        CurveManager(),
+        FeeManager(),
+        amount=0.01,
+        extreme_fast_token_amount=1_000,
+        extreme_fast_mode=extreme_fast_mode,
+    )
+    result = asyncio.run(buyer.execute(token_info()))
+    assert result.success
+    return client
+
+
+def test_buys_use_the_create_ata_profile_without_account_lookups():
+    for extreme_fast_mode in (False, True):
+        client = buy(extreme_fast_mode)
+        # Nothing is read on the send path to pick the limit
+        assert not client.lookups
+        assert client.compute_units.limits == [BUY_CREATE_ATA]
+        assert client.compute_units.samples == [BUY_CREATE_ATA]
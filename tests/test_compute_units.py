@@ -0,0 +1,256 @@
+"""
+Tests for compute unit limits sized from simulation profiles
+"""
+
+import asyncio
+import json
+import socket
+import sys
+import time
+from pathlib import Path
+
+from solders.hash import Hash
+from solders.keypair import Keypair
+from solders.message import Message
+from solders.pubkey import Pubkey
+from solders.transaction import Transaction
+from spl.token.instructions import create_idempotent_associated_token_account
+
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+sys.path.append(str(Path(__file__).parent))
+
+from mock_solana_server import (
+    CREATE_ACCOUNT_UNITS,
+    PROGRAM_UNITS,
+    FaultInjection,
+    MockSolanaServer,
+)
+
+from core.client import SolanaClient
+from core.compute_units import (
+    BUY,
+    BUY_CREATE_ATA,
+    DEFAULT_COMPUTE_UNIT_LIMIT,
+    SELL,
+    ComputeUnitProfiler,
+)
+from core.pubkeys import SystemAddresses
+
+CREATE_ACCOUNT_LOGS = [f"Program {SystemAddresses.PROGRAM} invoke [2]"]
+
+
+def test_limits_follow_the_most_units_consumed_with_headroom(tmp_path):
+    results = iter(
+        [
+            {"err": None, "logs": CREATE_ACCOUNT_LOGS, "unitsConsumed": 60_100},
+            {"err": None, "logs": [], "unitsConsumed": 41_000},
+            {"err": {"InstructionError": [2, "Custom(6002)"]}, "logs": [], "unitsConsumed": 90_000},
+            None,
+        ]
+    )
+
+    async def simulate(transaction: bytes):
+        return next(results)
+
+    path = tmp_path / "compute_units.json"
+    profiler = ComputeUnitProfiler(simulate, headroom=0.15, samples=2, path=path)
+    assert profiler.get_limit(BUY_CREATE_ATA) == DEFAULT_COMPUTE_UNIT_LIMIT
+
+    async def run():
+        for shape in (BUY_CREATE_ATA, BUY_CREATE_ATA, SELL, SELL):
+            profiler.sample(shape, b"")
+            await asyncio.gather(*profiler._tasks)
+
+    asyncio.run(run())
+
+    # A buy without a system program invoke reused its token account
+    assert profiler.get_limit(BUY_CREATE_ATA) == 70_000
+    assert profiler.get_limit(BUY) == 48_000
+    # Failed simulations are not recorded
+    assert profiler.get_limit(SELL) == DEFAULT_COMPUTE_UNIT_LIMIT
+
+    profiler.record(SELL, 20_000)
+    reloaded = ComputeUnitProfiler(simulate, headroom=0.15, samples=2, path=path)
+    assert reloaded.get_stats() == profiler.get_stats()
+    assert reloaded.get_limit(SELL) == 23_000
+
+    disabled = ComputeUnitProfiler(simulate, path=path, enabled=False)
+    assert disabled.get_limit(SELL) == DEFAULT_COMPUTE_UNIT_LIMIT
+
+
+def test_unusable_simulations_do_not_use_up_samples():
+    reused = {"err": None, "logs": [], "unitsConsumed": 41_000}
+    created = {"err": None, "logs": CREATE_ACCOUNT_LOGS, "unitsConsumed": 60_100}
+    no_tokens = {
+        "err": {"InstructionError": [1, "Custom(6023)"]},
+        "logs": [],
+        "unitsConsumed": 9_000,
+    }
+    results = iter([reused] * 3 + [no_tokens] * 3 + [created] * 2)
+
+    async def simulate(transaction: bytes):
+        await asyncio.sleep(0)
+        return next(results)
+
+    profiler = ComputeUnitProfiler(simulate, headroom=0.15, samples=2)
+
+    async def run():
+        # Buys that landed before their simulation count as BUY samples only
+        for _ in range(3):
+            profiler.sample(BUY_CREATE_ATA, b"")
+            await asyncio.gather(*profiler._tasks)
+        assert profiler.get_stats()[BUY]["samples"] == 2
+        assert BUY_CREATE_ATA not in profiler.get_stats()
+
+        # Simulations in flight count against the shape until they finish
+        for _ in range(3):
+            profiler.sample(SELL, b"")
+        assert len(profiler._tasks) == 2
+        await asyncio.gather(*profiler._tasks)
+        # Both failed, so the shape is sampled again
+        profiler.sample(SELL, b"")
+        assert len(profiler._tasks) == 1
+        await asyncio.gather(*profiler._tasks)
+
+        for _ in range(2):
+            profiler.sample(BUY_CREATE_ATA, b"")
+            await asyncio.gather(*profiler._tasks)
+        profiler.sample(BUY_CREATE_ATA, b"")
+        assert not profiler._tasks
+
+    asyncio.run(run())
+    assert profiler.get_limit(BUY_CREATE_ATA) == 70_000
+    assert profiler.get_limit(BUY) == 48_000
+    assert profiler.get_limit(SELL) == DEFAULT_COMPUTE_UNIT_LIMIT
+
+
+def signed_transaction() -> tuple[bytes, str]:
+    payer = Keypair()
+    instruction = create_idempotent_associated_token_account(
+        payer.pubkey(), payer.pubkey(), Pubkey.new_unique()
+    )
+    transaction = Transaction([payer], Message([instruction], payer.pubkey()), Hash.new_unique())
+    return bytes(transaction), str(transaction.signatures[0])
+
+
+def test_settled_shapes_are_resampled_and_raised_when_out_of_units(tmp_path):
+    results = iter(
+        [
+            {"err": None, "logs": [], "unitsConsumed": 20_000},
+            {"err": None, "logs": [], "unitsConsumed": 30_000},
+            {
+                "err": {"InstructionError": [2, "ComputationalBudgetExceeded"]},
+                "logs": [],
+                "unitsConsumed": 35_000,
+            },
+            {"err": None, "logs": [], "unitsConsumed": 30_000},
+        ]
+    )
+
+    async def simulate(transaction: bytes):
+        return next(results)
+
+    profiler = ComputeUnitProfiler(
+        simulate, headroom=0.15, samples=1, path=tmp_path / "profile.json"
+    )
+
+    async def sample(transaction: bytes = b"") -> int:
+        profiler.sample(SELL, transaction)
+        started = len(profiler._tasks)
+        await asyncio.gather(*profiler._tasks)
+        return started
+
+    async def run():
+        assert await sample() == 1
+        assert profiler.get_limit(SELL) == 23_000
+        # Settled: no simulation until the resample interval has passed
+        assert await sample() == 0
+        profiler._sampled_at[SELL] -= profiler.resample_interval
+        assert await sample() == 1
+        assert profiler.get_limit(SELL) == 35_000
+
+        # A simulation that ran out of units doubles the limit
+        profiler._sampled_at[SELL] -= profiler.resample_interval
+        assert await sample() == 1
+        assert profiler.get_limit(SELL) == 70_000
+        # ... which stays the floor, and the shape is sampled again at once
+        assert await sample() == 1
+        assert profiler.get_limit(SELL) == 70_000
+
+        # So does a sampled transaction that landed out of units
+        transaction, signature = signed_transaction()
+        profiler.sample(SELL, transaction)
+        profiler.transaction_failed(signature, {"InstructionError": [0, "Custom(1)"]})
+        assert profiler.get_limit(SELL) == 70_000
+        profiler.sample(SELL, transaction)
+        profiler.transaction_failed(
+            signature, {"InstructionError": [2, "ComputationalBudgetExceeded"]}
+        )
+        assert profiler.get_limit(SELL) == 140_000
+
+    asyncio.run(run())
+
+
+def test_saved_profiles_of_another_version_or_expired_are_not_loaded(tmp_path):
+    async def simulate(transaction: bytes):
+        return None
+
+    path = tmp_path / "profile.json"
+    profiler = ComputeUnitProfiler(simulate, samples=2, path=path)
+    profiler.record(SELL, 20_000)
+    assert ComputeUnitProfiler(simulate, path=path).get_limit(SELL) == 23_000
+    assert ComputeUnitProfiler(simulate, path=path, max_age=0.0).get_limit(SELL) == (
+        DEFAULT_COMPUTE_UNIT_LIMIT
+    )
+
+    saved = json.loads(path.read_text())
+    assert saved["saved_at"] <= time.time()
+    path.write_text(json.dumps(saved["profiles"]))
+    assert ComputeUnitProfiler(simulate, path=path).get_limit(SELL) == DEFAULT_COMPUTE_UNIT_LIMIT
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def test_client_sizes_limits_from_mock_simulations():
+    server = MockSolanaServer(
+        port=free_port(),
+        geyser_port=0,
+        creates_per_minute=0,
+        slot_time=0.02,
+        faults=FaultInjection(confirm_latency=0.05),
+    )
+    payer = Keypair()
+    mint = Pubkey.new_unique()
+
+    async def send(client: SolanaClient) -> None:
+        instruction = create_idempotent_associated_token_account(
+            payer.pubkey(), payer.pubkey(), mint
+        )
+        signature = await client.build_and_send_transaction(
+            [instruction], payer, priority_fee=1_000, compute_unit_shape=BUY_CREATE_ATA
+        )
+        await asyncio.gather(*client.compute_units._tasks)
+        await client.confirm_transaction(signature)
+
+    async def run():
+        await server.start()
+        client = SolanaClient(server.rpc_endpoint, server.wss_endpoint, compute_unit_headroom=0.0)
+        try:
+            await send(client)
+            await send(client)
+            return client.compute_units.get_stats()
+        finally:
+            await client.close()
+            await server.stop()
+
+    stats = asyncio.run(run())
+
+    compute_budget = PROGRAM_UNITS[str(SystemAddresses.COMPUTE_BUDGET_PROGRAM)]
+    ata = PROGRAM_UNITS[str(SystemAddresses.ASSOCIATED_TOKEN_PROGRAM)]
+    assert stats[BUY_CREATE_ATA]["max_units"] == 2 * compute_budget + ata + CREATE_ACCOUNT_UNITS
+    assert stats[BUY]["max_units"] == 2 * compute_budget + ata
+    assert server.requests["simulateTransaction"] == 2
@@ -0,0 +1,182 @@
+"""
+Tests for signatureSubscribe confirmations and the safety poll
+"""
+
+import asyncio
+import socket
+import sys
+from pathlib import Path
+
+from solders.keypair import Keypair
+from solders.system_program import TransferParams, transfer
+
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+sys.path.append(str(Path(__file__).parent))
+
+from mock_solana_server import FaultInjection, MockSolanaServer
+
+from core.client import SolanaClient
+from core.confirmation import SignatureConfirmer
+from utils import json_codec
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def send_transfer(client: SolanaClient, payer: Keypair) -> str:
+    instruction = transfer(
+        TransferParams(from_pubkey=payer.pubkey(), to_pubkey=payer.pubkey(), lamports=1)
+    )
+    return str(await client.build_and_send_transaction([instruction], payer))
+
+
+def confirm_on(server: MockSolanaServer, safety_poll_interval: float) -> tuple[bool, float]:
+    """Start a confirmer before sending, then time the confirmation of one transfer."""
+
+    async def run():
+        await server.start()
+        client = SolanaClient(server.rpc_endpoint, server.wss_endpoint)
+        confirmer = SignatureConfirmer(
+            server.wss_endpoint,
+            client.post_rpc,
+            poll_interval=0.05,
+            safety_poll_interval=safety_poll_interval,
+        )
+        try:
+            confirmer.start()
+            for _ in range(100):
+                if confirmer._websocket is not None:
+                    break
+                await asyncio.sleep(0.01)
+            assert confirmer._websocket is not None
+
+            signature = await send_transfer(client, Keypair())
+            loop = asyncio.get_running_loop()
+            started = loop.time()
+            confirmed = await confirmer.confirm(signature, timeout=5.0)
+            return confirmed, loop.time() - started
+        finally:
+            await confirmer.close()
+            await client.close()
+            await server.stop()
+
+    return asyncio.run(run())
+
+
+def test_started_confirmer_resolves_from_signature_notifications():
+    server = MockSolanaServer(
+        port=free_port(),
+        geyser_port=0,
+        creates_per_minute=0,
+        slot_time=0.02,
+        faults=FaultInjection(confirm_latency=0.1),
+    )
+    confirmed, elapsed = confirm_on(server, safety_poll_interval=2.0)
+
+    assert confirmed
+    assert elapsed < 1.0
+    # The subscription was live from the first confirmation, so nothing was polled
+    assert server.requests["getSignatureStatuses"] == 0
+
+
+def test_safety_poll_catches_a_missed_notification():
+    server = MockSolanaServer(
+        port=free_port(),
+        geyser_port=0,
+        creates_per_minute=0,
+        slot_time=0.02,
+        faults=FaultInjection(confirm_latency=0.0),
+    )
+    # The subscription is accepted but its notification never arrives
+    server._notify_signatures = lambda: None
+    confirmed, elapsed = confirm_on(server, safety_poll_interval=0.3)
+
+    assert confirmed
+    assert elapsed >= 0.3
+    assert server.requests["getSignatureStatuses"] >= 1
+
+
+def test_landing_errors_are_reported_to_the_failure_callback():
+    failures = []
+
+    async def post_rpc(body):
+        return None
+
+    async def run():
+        confirmer = SignatureConfirmer(
+            "ws://127.0.0.1:9", post_rpc, on_failure=lambda *failure: failures.append(failure)
+        )
+        error = {"InstructionError": [2, "ComputationalBudgetExceeded"]}
+        outcomes = []
+        for signature, err in (("landed", None), ("failed", error)):
+            waiter = asyncio.create_task(confirmer.confirm(signature, timeout=1.0))
+            await asyncio.sleep(0)
+            confirmer._pending[signature].subscription_id = 7
+            confirmer._subscriptions[7] = signature
+            confirmer._handle_message(
+                {
+                    "method": "signatureNotification",
+                    "params": {"subscription": 7, "result": {"value": {"err": err}}},
+                }
+            )
+            outcomes.append(await waiter)
+        await confirmer.close()
+        return outcomes, error
+
+    outcomes, error = asyncio.run(run())
+    assert outcomes == [True, False]
+    assert failures == [("failed", error)]
+
+
+class RecordingWebsocket:
+    def __init__(self):
+        self.sent: list[dict] = []
+
+    async def send(self, message: str) -> None:
+        self.sent.append(json_codec.loads(message))
+
+
+def test_higher_commitment_resubscribes_the_signature():
+    async def post_rpc(body):
+        return None
+
+    async def run():
+        confirmer = SignatureConfirmer("ws://127.0.0.1:9", post_rpc)
+        confirmer.start = lambda: None
+        websocket = confirmer._websocket = RecordingWebsocket()
+
+        processed = asyncio.create_task(confirmer.confirm("sig", "processed", timeout=1.0))
+        await asyncio.sleep(0)
+        confirmer._handle_message({"id": websocket.sent[-1]["id"], "result": 7})
+
+        finalized = asyncio.create_task(confirmer.confirm("sig", "finalized", timeout=1.0))
+        await asyncio.sleep(0)
+        confirmer._handle_message({"id": websocket.sent[-1]["id"], "result": 8})
+
+        def notify(subscription: int) -> None:
+            confirmer._handle_message(
+                {
+                    "method": "signatureNotification",
+                    "params": {"subscription": subscription, "result": {"value": {"err": None}}},
+                }
+            )
+
+        # A late notification of the processed subscription no longer resolves
+        notify(7)
+        await asyncio.sleep(0)
+        assert not processed.done()
+        notify(8)
+        outcomes = await asyncio.gather(processed, finalized)
+        await confirmer.close()
+        return outcomes, websocket.sent
+
+    outcomes, sent = asyncio.run(run())
+    assert outcomes == [True, True]
+    assert [(message["method"], message["params"]) for message in sent] == [
+        ("signatureSubscribe", ["sig", {"commitment": "processed"}]),
+        ("signatureUnsubscribe", [7]),
+        ("signatureSubscribe", ["sig", {"commitment": "finalized"}]),
+    ]
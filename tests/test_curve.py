@@ -0,0 +1,96 @@
+"""
+Tests for BondingCurveState decoding against the construct parser it replaced
+"""
+
+import random
+import struct
+import sys
+from pathlib import Path
+
+from construct import Bytes, Flag, Int64ul, Struct
+from solders.pubkey import Pubkey
+
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+from core.curve import EXPECTED_DISCRIMINATOR, BondingCurveState
+
+RESERVE_FIELDS = (
+    "virtual_token_reserves",
+    "virtual_sol_reserves",
+    "real_token_reserves",
+    "real_sol_reserves",
+    "token_total_supply",
+)
+
+LEGACY_STRUCT = Struct(
+    "virtual_token_reserves" / Int64ul,
+    "virtual_sol_reserves" / Int64ul,
+    "real_token_reserves" / Int64ul,
+    "real_sol_reserves" / Int64ul,
+    "token_total_supply" / Int64ul,
+    "complete" / Flag,
+    "creator" / Bytes(32),
+)
+LEGACY_STRUCT_WITHOUT_CREATOR = Struct(
+    "virtual_token_reserves" / Int64ul,
+    "virtual_sol_reserves" / Int64ul,
+    "real_token_reserves" / Int64ul,
+    "real_sol_reserves" / Int64ul,
+    "token_total_supply" / Int64ul,
+    "complete" / Flag,
+)
+
+
+def random_reserves(rng: random.Random) -> list[int]:
+    return [rng.randrange(2**64) for _ in RESERVE_FIELDS]
+
+
+def test_full_layout_matches_construct_parse():
+    rng = random.Random(12)
+    for index in range(200):
+        # Accounts may be allocated larger than the layout
+        trailing = bytes(7) if index % 2 else b""
+        creator = Pubkey.new_unique()
+        complete = rng.random() < 0.5
+        data = (
+            EXPECTED_DISCRIMINATOR
+            + struct.pack("<QQQQQ?", *random_reserves(rng), complete)
+            + bytes(creator)
+            + trailing
+        )
+
+        state = BondingCurveState(data)
+        legacy = LEGACY_STRUCT.parse(data[8:])
+        for name in RESERVE_FIELDS:
+            assert getattr(state, name) == legacy[name]
+        assert state.complete == legacy.complete
+        assert state.creator == Pubkey.from_bytes(legacy.creator) == creator
+
+
+def test_short_layout_without_creator_matches_construct_parse():
+    rng = random.Random(21)
+    for _ in range(200):
+        complete = rng.random() < 0.5
+        data = EXPECTED_DISCRIMINATOR + struct.pack(
+            "<QQQQQ?", *random_reserves(rng), complete
+        )
+
+        state = BondingCurveState(data)
+        legacy = LEGACY_STRUCT_WITHOUT_CREATOR.parse(data[8:])
+        for name in RESERVE_FIELDS:
+            assert getattr(state, name) == legacy[name]
+        assert state.complete == legacy.complete
+        assert state.creator is None
+
+
+def test_invalid_data_is_rejected():
+    for data, message in (
+        (bytes(8) + bytes(41), "Invalid curve state discriminator"),
+        (EXPECTED_DISCRIMINATOR + bytes(20), "Invalid curve state data"),
+    ):
+        try:
+            BondingCurveState(data)
+        except ValueError as e:
+            assert str(e).startswith(message)
+        else:
+            raise AssertionError("invalid curve data was accepted")
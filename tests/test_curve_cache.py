@@ -0,0 +1,178 @@
+"""
+Tests for the streaming bonding curve state cache
+"""
+
+import asyncio
+import struct
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+from solders.pubkey import Pubkey
+
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+import core.curve_cache
+from core.curve import EXPECTED_DISCRIMINATOR
+from core.curve_cache import CurveStateCache
+from utils import json_codec
+
+CURVE_LAYOUT = struct.Struct("<QQQQQ?32s")
+
+
+def curve_data(virtual_sol_reserves: int) -> bytes:
+    return EXPECTED_DISCRIMINATOR + CURVE_LAYOUT.pack(
+        1_073_000_000_000_000,
+        virtual_sol_reserves,
+        793_100_000_000_000,
+        0,
+        1_000_000_000_000_000,
+        False,
+        bytes(Pubkey.new_unique()),
+    )
+
+
+class SeedClient:
+    """Answers getMultipleAccounts with the given account data per curve."""
+
+    def __init__(self, accounts: dict[Pubkey, bytes]):
+        self.accounts = accounts
+
+    async def get_multiple_accounts(self, pubkeys, priority=None):
+        return [
+            SimpleNamespace(data=self.accounts[pubkey]) if pubkey in self.accounts else None
+            for pubkey in pubkeys
+        ]
+
+
+def tracked_cache(client=None) -> tuple[CurveStateCache, Pubkey]:
+    cache = CurveStateCache(client, wss_endpoint="ws://localhost:1")
+    curve = Pubkey.new_unique()
+    cache.track(curve)
+    return cache, curve
+
+
+def test_updates_from_older_slots_are_ignored():
+    cache, curve = tracked_cache()
+
+    assert not cache.update(Pubkey.new_unique(), curve_data(1), 10)
+    assert cache.update(curve, curve_data(30_000_000_000), 100)
+    assert not cache.update(curve, curve_data(29_000_000_000), 99)
+    assert cache.get(curve).state.virtual_sol_reserves == 30_000_000_000
+
+    # Same-slot updates are later writes within the slot and replace the state
+    assert cache.update(curve, curve_data(31_000_000_000), 100)
+    assert cache.get(curve).slot == 100
+    assert cache.get(curve).state.virtual_sol_reserves == 31_000_000_000
+
+    # Undecodable data keeps the last good state
+    assert not cache.update(curve, b"garbage", 101)
+    assert cache.get(curve).state.virtual_sol_reserves == 31_000_000_000
+
+    cache.untrack(curve)
+    assert cache.get(curve) is None
+
+
+def test_seed_only_fills_curves_the_stream_has_not_updated():
+    streamed = Pubkey.new_unique()
+    seeded = Pubkey.new_unique()
+    client = SeedClient({streamed: curve_data(1_000), seeded: curve_data(2_000)})
+    cache = CurveStateCache(client, wss_endpoint="ws://localhost:1")
+    cache.track(streamed)
+    cache.track(seeded)
+
+    # Nothing is stored while the stream is down
+    asyncio.run(cache._fetch_seed([streamed, seeded]))
+    assert cache.get(seeded) is None
+
+    cache._connected = True
+    assert cache.update(streamed, curve_data(5_000), 50)
+    asyncio.run(cache._fetch_seed([streamed, seeded]))
+
+    assert cache.get(streamed).state.virtual_sol_reserves == 5_000
+    assert cache.get(streamed).slot == 50
+    assert cache.get(seeded).state.virtual_sol_reserves == 2_000
+    # Seeds carry slot 0, so the first streamed update replaces them
+    assert cache.get(seeded).slot == 0
+    assert cache.update(seeded, curve_data(3_000), 1)
+
+
+def test_states_are_cleared_when_the_stream_disconnects():
+    cache, curve = tracked_cache()
+    cache.reconnect_delay = 60.0
+    disconnected = asyncio.Event()
+
+    async def stream_then_disconnect():
+        cache._connected = True
+        cache.update(curve, curve_data(30_000_000_000), 100)
+        assert cache.get(curve) is not None
+        disconnected.set()
+        raise ConnectionError("stream closed")
+
+    cache._stream_websocket = stream_then_disconnect
+
+    async def run():
+        task = asyncio.create_task(cache.run())
+        await disconnected.wait()
+        await asyncio.sleep(0)
+        state = cache.get(curve), cache._connected
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        return state
+
+    state, connected = asyncio.run(run())
+    assert state is None
+    assert not connected
+    # The curve stays tracked and resubscribes once the stream is back
+    assert curve in cache.tracked
+
+
+class FlakyWebsocket:
+    """Rejects the first accountSubscribe and accepts the ones after it."""
+
+    def __init__(self):
+        self.subscribes = 0
+        self.replies: asyncio.Queue[str] = asyncio.Queue()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def send(self, message: str) -> None:
+        request = json_codec.loads(message)
+        if request["method"] != "accountSubscribe":
+            return
+        self.subscribes += 1
+        reply = (
+            {"error": {"code": -32603, "message": "Internal error"}}
+            if self.subscribes == 1
+            else {"result": self.subscribes}
+        )
+        await self.replies.put(json_codec.dumps({"jsonrpc": "2.0", "id": request["id"], **reply}))
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> str:
+        return await self.replies.get()
+
+
+def test_failed_subscriptions_are_retried(monkeypatch):
+    websocket = FlakyWebsocket()
+    monkeypatch.setattr(
+        core.curve_cache, "websockets", SimpleNamespace(connect=lambda endpoint: websocket)
+    )
+    cache, curve = tracked_cache(SeedClient({}))
+    cache.reconnect_delay = 0.01
+
+    async def run():
+        task = asyncio.create_task(cache._stream_websocket())
+        await asyncio.sleep(0.1)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    asyncio.run(run())
+    # Nothing else was tracked or untracked, the failure alone triggers the retry
+    assert websocket.subscribes == 2
@@ -0,0 +1,95 @@
+"""
+Tests for the vectorized bonding curve simulator
+Checks the float results against the exact integer quotes in core.quote
+"""
+
+import random
+import struct
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+from core.curve import EXPECTED_DISCRIMINATOR, BondingCurveState
+from core.curve_simulator import VIRTUAL_TOKEN_OFFSET, CurveArrays, CurveSimulator
+from core.quote import buy_sol_cost, buy_token_amount, sell_sol_output
+
+TOKENS_CSV = Path(__file__).parent.parent / "data" / "tokens" / "tokens_all.csv"
+
+
+def make_state(virtual_token_reserves: int, virtual_sol_reserves: int) -> BondingCurveState:
+    real_token_reserves = max(0, virtual_token_reserves - VIRTUAL_TOKEN_OFFSET)
+    data = EXPECTED_DISCRIMINATOR + struct.pack(
+        "<QQQQQ?32s",
+        virtual_token_reserves,
+        virtual_sol_reserves,
+        real_token_reserves,
+        0,
+        1_000_000_000_000_000,
+        False,
+        bytes(range(1, 33)),
+    )
+    return BondingCurveState(data)
+
+
+def random_states(count: int, seed: int) -> list[BondingCurveState]:
+    rng = random.Random(seed)
+    states = []
+    for _ in range(count):
+        virtual_token = rng.randint(300_000_000_000_000, 1_073_000_000_000_000)
+        virtual_sol = 30_000_000_000 * 1_073_000_000_000_000 // virtual_token
+        states.append(make_state(virtual_token, virtual_sol))
+    return states
+
+
+def test_matches_integer_quotes():
+    states = random_states(200, seed=14)
+    simulator = CurveSimulator(CurveArrays.from_states(states))
+    sol_amounts = [1_000_000, 10_000_000, 1_000_000_000, 5_000_000_000]
+    token_amounts = [10**9, 10**12, 10**14]
+
+    tokens = simulator.buy_tokens(sol_amounts)
+    proceeds = simulator.sell_proceeds(token_amounts)
+    assert tokens.shape == (200, 4)
+    assert proceeds.shape == (200, 3)
+
+    for i, state in enumerate(states):
+        for j, amount in enumerate(sol_amounts):
+            assert np.isclose(tokens[i, j], buy_token_amount(state, amount), rtol=1e-5)
+        for j, amount in enumerate(token_amounts):
+            assert np.isclose(proceeds[i, j], sell_sol_output(state, amount), rtol=1e-5, atol=3)
+
+
+def test_graduation_distance_buys_out_the_curve():
+    states = random_states(50, seed=7)
+    simulator = CurveSimulator(CurveArrays.from_states(states))
+
+    for state, distance in zip(states, simulator.graduation_distance(), strict=True):
+        exact = buy_sol_cost(state, state.real_token_reserves)
+        assert np.isclose(distance, exact, rtol=1e-5)
+
+
+def test_round_trip_without_flow_loses_fees():
+    simulator = CurveSimulator(CurveArrays.from_states(random_states(100, seed=3)))
+    sol_amounts = np.array([10_000_000, 1_000_000_000])
+
+    pnl = simulator.round_trip_pnl(sol_amounts, [-1e9, 0.0, 1e9])
+    assert pnl.shape == (100, 2, 3)
+    assert np.all(pnl[:, :, 1] < 0)
+    # Roughly two fees are paid on an unmoved curve
+    assert np.allclose(-pnl[:, :, 1] / sol_amounts, 0.02, rtol=0.05)
+    # Buying pressure from others after our buy makes the position worth more
+    assert np.all(pnl[:, :, 2] > pnl[:, :, 1])
+    assert np.all(pnl[:, :, 0] < pnl[:, :, 1])
+
+
+def test_price_impact_grows_with_size_and_loads_csv():
+    curves = CurveArrays.from_csv(TOKENS_CSV)
+    assert len(curves) > 0
+    assert np.all(curves.real_token_reserves <= curves.virtual_token_reserves)
+
+    impact = CurveSimulator(curves).price_impact([10_000_000, 100_000_000, 1_000_000_000])
+    assert impact.shape == (len(curves), 3)
+    assert np.all(np.diff(impact, axis=1) > 0)
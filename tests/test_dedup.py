@@ -0,0 +1,51 @@
+"""
+Tests for the bounded mint deduplicator
+"""
+
+import sys
+from pathlib import Path
+
+from solders.pubkey import Pubkey
+
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+from utils.dedup import MintDeduplicator
+
+
+def test_duplicates_are_rejected_until_expiry():
+    dedup = MintDeduplicator(ttl=10.0, max_entries=100)
+    mint = Pubkey.new_unique()
+
+    assert dedup.add(mint, now=0.0)
+    assert not dedup.add(mint, now=5.0)
+    assert dedup.first_seen(mint, now=5.0) == 0.0
+    assert dedup.first_seen(mint, now=10.5) is None
+
+    # Expired entries are dropped and the mint counts as new again
+    assert dedup.add(mint, now=11.0)
+    assert dedup.first_seen(mint, now=11.0) == 11.0
+    assert len(dedup) == 1
+
+
+def test_expiry_drops_only_old_entries():
+    dedup = MintDeduplicator(ttl=10.0, max_entries=100)
+    mints = [Pubkey.new_unique() for _ in range(20)]
+    for second, mint in enumerate(mints):
+        dedup.add(mint, now=float(second))
+
+    # Inserts already dropped what was older than the TTL at the time
+    assert len(dedup) == 11
+    assert dedup.expire(now=24.5) == 6
+    assert len(dedup) == 5
+    assert all(dedup.first_seen(mint, now=24.5) is not None for mint in mints[15:])
+
+
+def test_max_entries_evicts_oldest():
+    dedup = MintDeduplicator(ttl=1_000.0, max_entries=3)
+    mints = [Pubkey.new_unique() for _ in range(5)]
+    for second, mint in enumerate(mints):
+        dedup.add(mint, now=float(second))
+
+    assert len(dedup) == 3
+    assert dedup.first_seen(mints[1], now=5.0) is None
+    assert dedup.first_seen(mints[4], now=5.0) == 4.0
@@ -0,0 +1,151 @@
+"""
+Tests for hedged JSON-RPC reads
+"""
+
+import asyncio
+import gc
+import sys
+from pathlib import Path
+
+from solana.rpc.core import RPCException
+
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+from core.hedging import HedgedReader
+
+
+class FakeResponse:
+    def __init__(self, data):
+        self.data = data
+
+    def raise_for_status(self):
+        pass
+
+    async def json(self, content_type=None, loads=None):
+        return self.data
+
+
+class DelayedResponse:
+    """Async context manager answering after a delay with a result or an error."""
+
+    def __init__(self, delay: float, result):
+        self.delay = delay
+        self.result = result
+
+    async def __aenter__(self):
+        await asyncio.sleep(self.delay)
+        if isinstance(self.result, Exception):
+            raise self.result
+        if self.result is None:
+            return FakeResponse({"error": {"code": -32005, "message": "Node is behind"}})
+        return FakeResponse({"result": self.result})
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class FakeSession:
+    """Answers each endpoint after its delay; a None result is a JSON-RPC error,
+    an exception result is raised."""
+
+    def __init__(self, endpoints: dict[str, tuple[float, str | None]]):
+        self.endpoints = endpoints
+        self.posted: list[str] = []
+
+    def post(self, endpoint, json=None):
+        self.posted.append(endpoint)
+        return DelayedResponse(*self.endpoints[endpoint])
+
+
+def reader_for(endpoints: dict[str, tuple[float, str | None]]) -> tuple[HedgedReader, FakeSession]:
+    session = FakeSession(endpoints)
+
+    async def get_session():
+        return session
+
+    return HedgedReader(list(endpoints), get_session), session
+
+
+def test_hedge_delay_is_the_default_until_enough_samples_then_p90():
+    reader, _ = reader_for({"primary": (0.0, "ok"), "secondary": (0.0, "ok")})
+    primary = reader.stats["primary"]
+
+    primary.latencies.extend([0.01] * 19)
+    assert reader.hedge_delay() == 0.1
+
+    # 20 samples: 17 fast, 3 slow; the 90th percentile lands on a slow one
+    primary.latencies.clear()
+    primary.latencies.extend([0.01] * 17 + [0.05, 0.06, 0.07])
+    assert reader.hedge_delay() == 0.06
+
+
+def test_slow_primary_is_hedged_to_the_secondary():
+    reader, session = reader_for({"primary": (0.3, "primary"), "secondary": (0.0, "secondary")})
+
+    async def run():
+        response = await reader.request("getSlot")
+        await reader.close()
+        return response
+
+    assert asyncio.run(run())["result"] == "secondary"
+    assert session.posted == ["primary", "secondary"]
+    assert reader.stats["primary"].hedged == 1
+    assert reader.stats["secondary"].wins == 1
+
+
+def test_failed_primary_falls_back_without_waiting_for_the_hedge_delay():
+    reader, _ = reader_for({"primary": (0.0, None), "secondary": (0.0, "secondary")})
+    reader.default_delay = 5.0
+
+    async def run():
+        return await asyncio.wait_for(reader.request("getSlot"), 1.0)
+
+    assert asyncio.run(run())["result"] == "secondary"
+    assert reader.stats["primary"].failed == 1
+
+
+def test_hedge_losers_finish_in_the_background_without_unretrieved_errors():
+    reader, _ = reader_for({"primary": (0.05, None), "secondary": (0.0, "secondary")})
+    reader.default_delay = 0.0
+    unhandled = []
+
+    async def run():
+        asyncio.get_running_loop().set_exception_handler(
+            lambda loop, context: unhandled.append(context)
+        )
+        response = await reader.request("getSlot")
+        assert len(reader._background) == 1
+        await asyncio.sleep(0.1)
+        gc.collect()
+        return response
+
+    assert asyncio.run(run())["result"] == "secondary"
+    assert not reader._background
+    assert reader.stats["primary"].failed == 1
+    assert unhandled == []
+
+
+def test_rpc_errors_from_every_endpoint_are_raised_unchanged():
+    reader, _ = reader_for(
+        {"primary": (0.0, None), "secondary": (0.0, ConnectionError("reset"))}
+    )
+    reader.default_delay = 0.0
+
+    async def run(reader):
+        try:
+            await reader.request("getTokenAccountBalance")
+        except Exception as e:
+            return e
+        finally:
+            await reader.close()
+
+    error = asyncio.run(run(reader))
+    assert type(error) is RPCException
+    assert error.args[0]["message"] == "Node is behind"
+
+    # Without a JSON-RPC error there is no node error to pass on
+    reader, _ = reader_for(
+        {"primary": (0.0, ConnectionError("reset")), "secondary": (0.0, TimeoutError())}
+    )
+    reader.default_delay = 0.0
+    assert isinstance(asyncio.run(run(reader)), RuntimeError)
@@ -0,0 +1,101 @@
+"""
+Tests for the batched trade journal
+"""
+
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+from solders.keypair import Keypair
+from solders.pubkey import Pubkey
+
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+from trading.journal import TradeJournal, read_binary_journal
+
+
+def trade_record(action: str, index: int) -> dict:
+    signature = Keypair().sign_message(b"trade")
+    return {
+        "timestamp": 1_700_000_000.0 + index,
+        "action": action,
+        "token_address": str(Pubkey.new_unique()),
+        "symbol": f"TOK{index}",
+        "price": 2.5e-8 * (index + 1),
+        "amount": 0.01,
+        "tx_hash": str(signature) if index % 2 else None,
+    }
+
+
+def write_all(journal: TradeJournal, records: list[dict]) -> None:
+    async def run() -> None:
+        journal.start()
+        for record in records:
+            assert journal.write(record)
+        await journal.close()
+
+    asyncio.run(run())
+
+
+def test_jsonl_and_binary_sinks_round_trip(tmp_path):
+    records = [trade_record("buy" if i % 3 else "sell", i) for i in range(50)]
+    records.append({"timestamp": 1_700_000_100.0, "action": "token", "token": {"name": "x"}})
+
+    journal = TradeJournal(tmp_path, ["jsonl", "binary"], fsync="batch", flush_interval=0.01)
+    write_all(journal, [dict(record) for record in records])
+    assert journal.written == len(records)
+
+    lines = (tmp_path / "trades.log").read_text().splitlines()
+    assert len(lines) == len(records)
+    first = json.loads(lines[0])
+    assert list(first)[0] == "timestamp"
+    assert first["timestamp"] == "2023-11-14T22:13:20"
+    assert first["tx_hash"] == records[0]["tx_hash"]
+
+    assert list(read_binary_journal(tmp_path / "trades.bin")) == records
+    # Fixed-layout trades are smaller than their JSON lines
+    assert (tmp_path / "trades.bin").stat().st_size < (tmp_path / "trades.log").stat().st_size
+
+
+def test_files_rotate_and_keep_backups(tmp_path):
+    journal = TradeJournal(
+        tmp_path,
+        ["jsonl"],
+        fsync="none",
+        flush_interval=0.01,
+        max_batch_size=10,
+        max_bytes=4_000,
+        backup_count=2,
+    )
+    write_all(journal, [trade_record("buy", i) for i in range(200)])
+
+    names = sorted(path.name for path in tmp_path.iterdir())
+    assert names == ["trades.log", "trades.log.1", "trades.log.2"]
+    for path in tmp_path.iterdir():
+        assert path.stat().st_size <= 4_000
+    # The newest records are in the live file
+    last = json.loads((tmp_path / "trades.log").read_text().splitlines()[-1])
+    assert last["symbol"] == "TOK199"
+
+
+def test_full_queue_drops_instead_of_blocking(tmp_path):
+    journal = TradeJournal(tmp_path, ["jsonl"], max_queue_size=5)
+    # Writer not started: the queue fills up and further records are dropped
+    accepted = [journal.write(trade_record("buy", i)) for i in range(8)]
+    assert accepted == [True] * 5 + [False] * 3
+    assert journal.dropped == 3
+
+
+def test_named_journal_writes_its_own_files(tmp_path):
+    trades = TradeJournal(tmp_path, ["jsonl", "binary"], flush_interval=0.01)
+    traces = TradeJournal(tmp_path, ["jsonl", "binary"], name="latency", flush_interval=0.01)
+    write_all(trades, [trade_record("buy", 0)])
+    write_all(traces, [{"timestamp": 1_700_000_000.0, "action": "trace", "total_ms": 5.0}])
+
+    names = sorted(path.name for path in tmp_path.iterdir())
+    assert names == ["latency.bin", "latency.log", "trades.bin", "trades.log"]
+    assert [json.loads(line)["action"] for line in (tmp_path / "trades.log").open()] == ["buy"]
+    assert [record["action"] for record in read_binary_journal(tmp_path / "latency.bin")] == [
+        "trace"
+    ]
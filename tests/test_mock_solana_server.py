@@ -0,0 +1,104 @@
+"""
+Tests for the local mock Solana server: every listener decodes its synthetic
+creates and transactions sent through the client confirm
+"""
+
+import asyncio
+import socket
+import sys
+from pathlib import Path
+
+from solders.keypair import Keypair
+from solders.system_program import TransferParams, transfer
+
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+sys.path.append(str(Path(__file__).parent))
+
+from mock_solana_server import FaultInjection, MockSolanaServer
+from test_multi_listener import collect
+
+from core.client import SolanaClient
+from core.pubkeys import PumpAddresses
+from monitoring.block_listener import BlockListener
+from monitoring.geyser_listener import GeyserListener
+from monitoring.logs_listener import LogsListener
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def test_listeners_decode_synthetic_creates():
+    server = MockSolanaServer(
+        port=free_port(), geyser_port=free_port(), creates_per_minute=1_200, slot_time=0.05
+    )
+
+    async def run():
+        await server.start()
+        try:
+            return await asyncio.gather(
+                collect(LogsListener(server.wss_endpoint, PumpAddresses.PROGRAM), 0.6),
+                collect(BlockListener(server.wss_endpoint, PumpAddresses.PROGRAM), 0.6),
+                collect(
+                    GeyserListener(
+                        server.geyser_endpoint, "token", "x-token", PumpAddresses.PROGRAM
+                    ),
+                    0.6,
+                ),
+            )
+        finally:
+            await server.stop()
+
+    results = asyncio.run(run())
+
+    created = {create.mint.pubkey(): create for create in server.creates}
+    for tokens in results:
+        # Listeners connect at slightly different times, so compare what arrived
+        assert len(tokens) >= 5
+        for token in tokens:
+            create = created[token.mint]
+            assert token.bonding_curve == create.bonding_curve
+            assert token.user == create.user.pubkey()
+            assert token.name == create.name()
+
+
+def test_sent_transactions_confirm_unless_dropped():
+    server = MockSolanaServer(
+        port=free_port(),
+        geyser_port=0,
+        creates_per_minute=0,
+        slot_time=0.02,
+        faults=FaultInjection(latency=0.005, confirm_latency=0.05),
+    )
+    payer = Keypair()
+
+    async def send_and_confirm(client: SolanaClient, lamports: int) -> bool:
+        instruction = transfer(
+            TransferParams(from_pubkey=payer.pubkey(), to_pubkey=payer.pubkey(), lamports=lamports)
+        )
+        signature = await client.build_and_send_transaction([instruction], payer)
+        return await client.confirm_transaction(signature)
+
+    async def run() -> tuple[bool, bool]:
+        await server.start()
+        client = SolanaClient(server.rpc_endpoint, server.wss_endpoint)
+        try:
+            landed = await send_and_confirm(client, 1)
+            server.faults.land_rate = 0.0
+            server.faults.confirm_latency = 0.0
+            dropped = await asyncio.wait_for(send_and_confirm(client, 2), 0.5)
+            return landed, dropped
+        except asyncio.TimeoutError:
+            return landed, False
+        finally:
+            await client.close()
+            await server.stop()
+
+    landed, dropped = asyncio.run(run())
+
+    assert landed
+    assert not dropped
+    assert server.get_stats()["landed"] == 1
+    assert server.requests["sendTransaction"] == 2
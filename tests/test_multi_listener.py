@@ -0,0 +1,189 @@
+"""
+Tests for the racing multi-source listener and the market-data hub
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+from solders.hash import Hash
+from solders.pubkey import Pubkey
+
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+from bot_runner import get_shared_hub_socket_path
+from core.blockhash import BlockhashCache
+from core.priority_fee.hub_fee import HubPriorityFee
+from monitoring.base_listener import BaseTokenListener
+from monitoring.hub import (
+    DEFAULT_SOCKET_PATH,
+    HubListener,
+    MarketDataHub,
+    encode_message,
+)
+from monitoring.multi_listener import MultiSourceListener
+from trading.base import TokenInfo
+from utils.tracing import TokenTrace
+
+
+def make_token(mint: Pubkey, received: float, listener: str = "geyser") -> TokenInfo:
+    token_info = TokenInfo(
+        name="Token",
+        symbol="TOK",
+        uri="https://example.com/token.json",
+        mint=mint,
+        bonding_curve=Pubkey.new_unique(),
+        associated_bonding_curve=Pubkey.new_unique(),
+        user=Pubkey.new_unique(),
+        creator=Pubkey.new_unique(),
+        creator_vault=Pubkey.new_unique(),
+    )
+    token_info.trace = TokenTrace(listener, received)
+    token_info.trace.mark("decode")
+    return token_info
+
+
+class ScriptedListener(BaseTokenListener):
+    """Delivers a fixed list of tokens after a delay, then idles."""
+
+    def __init__(self, tokens: list[TokenInfo], delay: float = 0.0):
+        self.tokens = tokens
+        self.delay = delay
+
+    async def listen_for_tokens(self, token_callback, match_string=None, creator_address=None):
+        await asyncio.sleep(self.delay)
+        for token_info in self.tokens:
+            await token_callback(token_info)
+        await asyncio.Event().wait()
+
+
+class StubClient:
+    def __init__(self, cache: BlockhashCache):
+        self.blockhash_cache = cache
+
+    async def close(self) -> None:
+        pass
+
+
+async def collect(listener: BaseTokenListener, duration: float, **filters) -> list[TokenInfo]:
+    received = []
+
+    async def on_token(token_info: TokenInfo) -> None:
+        received.append(token_info)
+
+    task = asyncio.create_task(listener.listen_for_tokens(on_token, **filters))
+    await asyncio.sleep(duration)
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+    return received
+
+
+def test_first_arrival_wins_and_lag_is_recorded():
+    listener = MultiSourceListener(
+        {"geyser": ScriptedListener([]), "logs": ScriptedListener([])}, summary_every=0
+    )
+    # Geyser is 40 ms ahead on three mints, logs 10 ms ahead on the fourth
+    for index, lead in enumerate([0.040, 0.040, 0.040, -0.010]):
+        mint = Pubkey.new_unique()
+        arrivals = sorted([(100.0 + index, "geyser"), (100.0 + index + lead, "logs")])
+        assert listener.register(arrivals[0][1], make_token(mint, arrivals[0][0]))
+        assert not listener.register(arrivals[1][1], make_token(mint, arrivals[1][0]))
+
+    stats = listener.get_stats()
+    assert listener.tokens == 4
+    assert stats["geyser"]["wins"] == 3
+    assert stats["geyser"]["win_rate"] == 0.75
+    assert stats["logs"]["delivered"] == 4
+    assert round(stats["logs"]["lag_p50_ms"]) == 40
+    assert round(stats["geyser"]["lag_p50_ms"]) == 10
+
+
+def test_racing_listener_forwards_each_mint_once():
+    mints = [Pubkey.new_unique() for _ in range(3)]
+    fast = ScriptedListener([make_token(mint, 1.0) for mint in mints])
+    slow = ScriptedListener([make_token(mint, 2.0, "logs") for mint in mints], delay=0.01)
+    listener = MultiSourceListener({"fast": fast, "slow": slow}, summary_every=0)
+
+    received = asyncio.run(collect(listener, 0.05))
+
+    assert [token.mint for token in received] == mints
+    assert all(token.trace.listener == "fast" for token in received)
+    assert listener.get_stats()["slow"]["delivered"] == 3
+    assert listener.get_stats()["slow"]["wins"] == 0
+
+
+def test_hub_streams_tokens_blockhashes_and_fees_to_bots(tmp_path):
+    socket_path = str(tmp_path / "hub.sock")
+    token = make_token(Pubkey.new_unique(), 50.0)
+    hub_cache = BlockhashCache(fetch_latest=None)
+    hub_cache.update(Hash.new_unique(), slot=1_000, block_height=900)
+    bot_cache = BlockhashCache(fetch_latest=None)
+    fee_plugin = HubPriorityFee(percentile=90)
+
+    async def run() -> tuple[list[TokenInfo], list[TokenInfo]]:
+        hub = MarketDataHub(
+            MultiSourceListener({"geyser": ScriptedListener([token], delay=0.1)}, summary_every=0),
+            StubClient(hub_cache),
+            socket_path=socket_path,
+            blockhash_interval=0.01,
+        )
+        hub_task = asyncio.create_task(hub.run())
+        await asyncio.sleep(0.02)
+        # Filters run on the bot side
+        matching, other, _ = await asyncio.gather(
+            collect(HubListener(socket_path, bot_cache, fee_plugin), 0.2, match_string="tok"),
+            collect(HubListener(socket_path), 0.2, match_string="other"),
+            publish_fee(hub),
+        )
+        hub_task.cancel()
+        await asyncio.gather(hub_task, return_exceptions=True)
+        return matching, other
+
+    async def publish_fee(hub: MarketDataHub) -> None:
+        await asyncio.sleep(0.15)
+        hub._broadcast(encode_message({"type": "fee", "fees": {"70": 1_000, "90": 123_456}}))
+
+    matching, other = asyncio.run(run())
+
+    assert other == []
+    assert len(matching) == 1
+    received = matching[0]
+    assert received == token
+    # The trace continues in the bot with the hub hop as its own stage
+    assert received.trace.started == 50.0
+    assert [stage for stage, _ in received.trace.marks] == ["decode", "hub"]
+    assert bot_cache.snapshot.blockhash == hub_cache.snapshot.blockhash
+    assert bot_cache.snapshot.last_valid_block_height == 1_050
+    assert asyncio.run(fee_plugin.get_priority_fee()) == 123_456
+
+
+class StubFees:
+    async def fetch_fees(self, accounts):
+        return list(range(1, 101))
+
+
+def test_hub_estimates_every_percentile_the_bots_pay_from_one_fetch():
+    hub = MarketDataHub(
+        ScriptedListener([]),
+        StubClient(BlockhashCache(fetch_latest=None)),
+        fee_percentiles=[50, 90],
+    )
+    hub.fee_plugin = StubFees()
+
+    assert asyncio.run(hub._fetch_fee_estimates()) == {"50": 50, "90": 90}
+
+
+def test_hub_bots_must_share_one_socket():
+    configs = [
+        {"name": "a", "hub": {"enabled": True}},
+        {"name": "b", "hub": {"enabled": True, "socket_path": DEFAULT_SOCKET_PATH}},
+    ]
+    assert get_shared_hub_socket_path(configs) == DEFAULT_SOCKET_PATH
+
+    configs.append({"name": "c", "hub": {"enabled": True, "socket_path": "/tmp/other.sock"}})
+    try:
+        get_shared_hub_socket_path(configs)
+    except ValueError as e:
+        assert "c: /tmp/other.sock" in str(e)
+    else:
+        raise AssertionError("mismatched hub sockets were accepted")
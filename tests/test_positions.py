@@ -0,0 +1,193 @@
+"""
+Tests for concurrent position slots, the exposure cap and the yolo cooldown
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+from time import monotonic
+
+from solders.keypair import Keypair
+from solders.pubkey import Pubkey
+
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+from trading.base import TokenInfo, TradeResult
+from trading.trader import PumpTrader
+
+
+def token(symbol: str = "TKN") -> TokenInfo:
+    return TokenInfo(
+        name=symbol,
+        symbol=symbol,
+        uri="",
+        mint=Pubkey.new_unique(),
+        bonding_curve=Pubkey.new_unique(),
+        associated_bonding_curve=Pubkey.new_unique(),
+        user=Pubkey.new_unique(),
+        creator=Pubkey.new_unique(),
+        creator_vault=Pubkey.new_unique(),
+    )
+
+
+async def make_trader(journal_dir: Path, **kwargs) -> PumpTrader:
+    """A trader pointed at an unused port; these tests never reach the network."""
+    options = {
+        "buy_amount": 0.1,
+        "max_positions": 2,
+        "max_token_age": 60,
+        "wait_time_before_new_token": 0,
+        "yolo_mode": True,
+        **kwargs,
+    }
+    return PumpTrader(
+        rpc_endpoint="http://127.0.0.1:9",
+        wss_endpoint="ws://127.0.0.1:9",
+        private_key=str(Keypair()),
+        buy_slippage=0.3,
+        sell_slippage=0.3,
+        journal_dir=str(journal_dir),
+        **options,
+    )
+
+
+def test_slots_and_exposure_limit_new_positions(tmp_path):
+    async def run():
+        trader = await make_trader(tmp_path, max_positions=2, max_exposure=0.25)
+        try:
+            never = asyncio.Event()
+            first, second, third = token("A"), token("B"), token("C")
+
+            assert trader._reserve_position(first)
+            trader.position_tasks.add(asyncio.create_task(never.wait()))
+            assert trader._reserve_position(second)
+            # Exposure: 0.1 + 0.1 committed, another 0.1 would exceed 0.25
+            assert not trader._reserve_position(third)
+            assert third.mint not in trader.open_exposure
+
+            trader.max_exposure = 1.0
+            trader.position_tasks.add(asyncio.create_task(never.wait()))
+            # Both slots are in use
+            assert not trader._reserve_position(third)
+            assert set(trader.open_exposure) == {first.mint, second.mint}
+
+            await trader._stop_positions()
+        finally:
+            await trader.solana_client.close()
+
+    asyncio.run(run())
+
+
+def test_stop_positions_cancels_running_workers(tmp_path):
+    async def run():
+        trader = await make_trader(tmp_path)
+        cancelled = []
+
+        async def hold(token_info):
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                cancelled.append(token_info.symbol)
+                raise
+
+        trader._handle_token = hold
+        try:
+            for symbol in ("A", "B"):
+                task = asyncio.create_task(trader._run_position(token(symbol)))
+                trader.position_tasks.add(task)
+                task.add_done_callback(trader.position_tasks.discard)
+            await asyncio.sleep(0)
+            await asyncio.wait_for(trader._stop_positions(), 1.0)
+            return cancelled, len(trader.position_tasks)
+        finally:
+            await trader.solana_client.close()
+
+    cancelled, remaining = asyncio.run(run())
+    assert sorted(cancelled) == ["A", "B"]
+    assert remaining == 0
+
+
+def test_cooldown_is_applied_by_the_dispatcher_not_the_worker(tmp_path):
+    async def run():
+        trader = await make_trader(tmp_path, max_positions=1, wait_time_before_new_token=30)
+        traded = []
+
+        async def trade(token_info):
+            traded.append(token_info.symbol)
+            trader.open_exposure.pop(token_info.mint, None)
+
+        trader._handle_token = trade
+        processor = asyncio.create_task(trader._process_token_queue())
+        try:
+            first = token("A")
+            trader.seen_tokens.add(first.mint)
+            await trader.token_queue.put(first)
+            await trader.token_queue.join()
+            await asyncio.sleep(0.01)
+
+            # The finished position left its slot at once ...
+            assert traded == ["A"]
+            assert not trader.position_tasks
+            assert trader.next_position_at > monotonic() + 29
+
+            # ... and the next token waits for the cooldown, not for a slot
+            second = token("B")
+            trader.seen_tokens.add(second.mint)
+            await trader.token_queue.put(second)
+            await trader.token_queue.join()
+            assert traded == ["A"]
+
+            trader.next_position_at = 0.0
+            third = token("C")
+            trader.seen_tokens.add(third.mint)
+            await trader.token_queue.put(third)
+            await trader.token_queue.join()
+            await asyncio.sleep(0.01)
+            assert traded == ["A", "C"]
+        finally:
+            processor.cancel()
+            await asyncio.gather(processor, return_exceptions=True)
+            await trader.solana_client.close()
+
+    asyncio.run(run())
+
+
+class FixedTrade:
+    """Buyer or seller stub returning a fixed result."""
+
+    def __init__(self, success: bool):
+        self.success = success
+        self.calls = 0
+
+    async def execute(self, token_info, *args, **kwargs) -> TradeResult:
+        self.calls += 1
+        if self.success:
+            return TradeResult(success=True, tx_signature="sig", amount=1.0, price=1e-8)
+        return TradeResult(success=False, error_message="sell failed")
+
+
+def test_exposure_is_released_when_positions_are_married_or_fail_to_sell(tmp_path):
+    async def run(marry_mode: bool):
+        trader = await make_trader(
+            tmp_path,
+            max_positions=1,
+            marry_mode=marry_mode,
+            extreme_fast_mode=True,
+            wait_time_after_buy=0,
+        )
+        trader.buyer = FixedTrade(success=True)
+        trader.seller = FixedTrade(success=False)
+        try:
+            for symbol in ("A", "B", "C"):
+                bought = token(symbol)
+                assert trader._reserve_position(bought)
+                await trader._run_position(bought)
+                assert not trader.open_exposure
+            return trader.buyer.calls, trader.seller.calls
+        finally:
+            await trader.solana_client.close()
+
+    # Married positions are handed off and never sold
+    assert asyncio.run(run(marry_mode=True)) == (3, 0)
+    # A failed final sell leaves nothing more to do for the position
+    assert asyncio.run(run(marry_mode=False)) == (3, 3)
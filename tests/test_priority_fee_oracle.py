@@ -0,0 +1,87 @@
+"""
+Tests for the background priority fee oracle
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+from solders.pubkey import Pubkey
+
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+from core.priority_fee.manager import PriorityFeeManager
+from core.priority_fee.oracle import PUMP_ACCOUNTS, PriorityFeeOracle
+
+
+class FeeClient:
+    """Answers getRecentPrioritizationFees with fees per account set."""
+
+    def __init__(self, fees: dict[tuple[str, ...], list[int]]):
+        self.fees = fees
+        self.requests = 0
+
+    async def post_rpc(self, body, priority=None):
+        self.requests += 1
+        accounts = tuple(sorted(body["params"][0])) if body["params"] else ()
+        fees = self.fees.get(accounts, [])
+        return {"result": [{"slot": 1, "prioritizationFee": fee} for fee in fees]}
+
+
+def test_oracle_serves_fees_per_account_set_from_memory():
+    pump_fees = list(range(1_000, 101_000, 1_000))
+    client = FeeClient(
+        {
+            tuple(sorted(str(account) for account in PUMP_ACCOUNTS)): pump_fees,
+            (): [10, 20, 30],
+        }
+    )
+    oracle = PriorityFeeOracle(client, percentile=70)
+    asyncio.run(oracle.refresh())
+    assert client.requests == 2
+
+    # A trade's mint and curve are ignored in favour of the shared pump.fun accounts
+    trade_accounts = [Pubkey.new_unique(), Pubkey.new_unique(), *PUMP_ACCOUNTS]
+    assert asyncio.run(oracle.get_priority_fee(trade_accounts)) == 70_700
+    assert asyncio.run(oracle.get_priority_fee([Pubkey.new_unique()])) == 28
+    assert client.requests == 2
+
+    # Fees pushed from a stream replace the polled estimate
+    oracle.update([5, 6, 7], list(PUMP_ACCOUNTS))
+    assert asyncio.run(oracle.get_priority_fee(trade_accounts)) == 6
+
+
+def test_stale_or_missing_estimates_fall_back_to_the_fixed_fee():
+    oracle = PriorityFeeOracle(FeeClient({}), max_age=0.05)
+    manager = PriorityFeeManager(
+        client=None,
+        enable_dynamic_fee=True,
+        enable_fixed_fee=True,
+        fixed_fee=200_000,
+        extra_fee=0.0,
+        hard_cap=1_000_000,
+        dynamic_fee_plugin=oracle,
+    )
+    accounts = list(PUMP_ACCOUNTS)
+
+    assert asyncio.run(manager.calculate_priority_fee(accounts)) == 200_000
+    oracle.update([300_000], accounts)
+    assert asyncio.run(manager.calculate_priority_fee(accounts)) == 300_000
+
+    asyncio.run(asyncio.sleep(0.06))
+    assert asyncio.run(manager.calculate_priority_fee(accounts)) == 200_000
+
+
+def test_missing_or_stale_account_set_estimates_fall_back_to_the_network():
+    oracle = PriorityFeeOracle(FeeClient({}), max_age=0.05)
+    accounts = list(PUMP_ACCOUNTS)
+
+    oracle.update([10, 20, 30])
+    assert asyncio.run(oracle.get_priority_fee(accounts)) == 28
+
+    oracle.update([300_000], accounts)
+    assert asyncio.run(oracle.get_priority_fee(accounts)) == 300_000
+
+    asyncio.run(asyncio.sleep(0.06))
+    oracle.update([40, 50, 60])
+    assert asyncio.run(oracle.get_priority_fee(accounts)) == 58
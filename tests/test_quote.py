@@ -0,0 +1,149 @@
+"""
+Tests for the exact integer quote module
+Checks quotes against the trades recorded in learning_examples and a set of
+randomized curve properties
+"""
+
+import base64
+import json
+import random
+import struct
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+from core.curve import EXPECTED_DISCRIMINATOR, BondingCurveState
+from core.quote import (
+    FeeSchedule,
+    buy_sol_cost,
+    buy_token_amount,
+    quote_buys,
+    quote_sells,
+    sell_sol_output,
+)
+
+RECORDED_TRADES = (
+    Path(__file__).parent.parent / "learning_examples" / "raw_buy_tx_from_getTransaction.json"
+)
+
+# Virtual reserves minus real reserves of a fresh pump.fun curve
+VIRTUAL_TOKEN_OFFSET = 279_900_000_000_000
+NO_FEES = FeeSchedule(protocol_fee_basis_points=0, creator_fee_basis_points=0)
+
+
+def make_state(
+    virtual_token_reserves: int, virtual_sol_reserves: int, creator: bytes = bytes(range(1, 33))
+) -> BondingCurveState:
+    real_token_reserves = max(0, virtual_token_reserves - VIRTUAL_TOKEN_OFFSET)
+    data = EXPECTED_DISCRIMINATOR + struct.pack(
+        "<QQQQQ?",
+        virtual_token_reserves,
+        virtual_sol_reserves,
+        real_token_reserves,
+        0,
+        1_000_000_000_000_000,
+        False,
+    )
+    return BondingCurveState(data + creator)
+
+
+def load_recorded_trades() -> tuple[list[tuple[int, int, bool, int, int]], int]:
+    """Decode the TradeEvents and fee recipient balance change of the recorded tx."""
+    with open(RECORDED_TRADES) as f:
+        result = json.load(f)["result"]
+
+    events = []
+    for log in result["meta"]["logMessages"]:
+        if not log.startswith("Program data: "):
+            continue
+        data = base64.b64decode(log.removeprefix("Program data: "))
+        sol_amount, token_amount, is_buy = struct.unpack_from("<QQ?", data, 40)
+        virtual_sol, virtual_token = struct.unpack_from("<QQ", data, 40 + 17 + 32 + 8)
+        events.append((sol_amount, token_amount, is_buy, virtual_sol, virtual_token))
+
+    keys = [key["pubkey"] for key in result["transaction"]["message"]["accountKeys"]]
+    fee_index = keys.index("CebN5WGQ4jvEPvsVU4EoHEpgzq1VV7AbicfhtW4xC9iM")
+    fee_paid = result["meta"]["postBalances"][fee_index] - result["meta"]["preBalances"][fee_index]
+    return events, fee_paid
+
+
+def test_recorded_trades_match_curve_math():
+    events, _ = load_recorded_trades()
+    assert events
+
+    for sol_amount, token_amount, is_buy, virtual_sol, virtual_token in events:
+        # Events carry the reserves after the trade
+        if is_buy:
+            before = make_state(virtual_token + token_amount, virtual_sol - sol_amount)
+            assert buy_sol_cost(before, token_amount, NO_FEES) == sol_amount
+        else:
+            before = make_state(virtual_token - token_amount, virtual_sol + sol_amount)
+            assert sell_sol_output(before, token_amount, NO_FEES) == sol_amount
+
+
+def test_recorded_fees_are_bounded_by_quote():
+    events, fee_paid = load_recorded_trades()
+    # The recorded trades predate creator fees and charged a flat 1%
+    fees = FeeSchedule(protocol_fee_basis_points=100, creator_fee_basis_points=0)
+
+    quoted = sum(fees.fee(sol_amount, has_creator=False) for sol_amount, *_ in events)
+    # Rounding up never quotes less than the program charged, and at most
+    # one lamport more per fee
+    assert fee_paid <= quoted <= fee_paid + len(events)
+
+
+def test_buy_quote_never_exceeds_budget():
+    rng = random.Random(13)
+    for _ in range(2000):
+        virtual_token = rng.randint(300_000_000_000_000, 1_073_000_000_000_000)
+        virtual_sol = 30_000_000_000 * 1_073_000_000_000_000 // virtual_token
+        state = make_state(virtual_token, virtual_sol)
+        sol_amount = rng.randint(10_000, 10_000_000_000)
+
+        tokens = buy_token_amount(state, sol_amount)
+        cost = buy_sol_cost(state, tokens)
+        assert cost <= sol_amount
+        if tokens < state.real_token_reserves:
+            # The quote spends (almost) the whole budget
+            assert sol_amount - cost <= 3 + sol_amount // 100_000
+
+
+def test_round_trip_loses_fees_and_sell_is_below_spot():
+    rng = random.Random(42)
+    for _ in range(2000):
+        virtual_token = rng.randint(300_000_000_000_000, 1_073_000_000_000_000)
+        virtual_sol = 30_000_000_000 * 1_073_000_000_000_000 // virtual_token
+        state = make_state(virtual_token, virtual_sol)
+        sol_amount = rng.randint(10_000, 5_000_000_000)
+
+        tokens = buy_token_amount(state, sol_amount)
+        cost_before_fees = buy_sol_cost(state, tokens, NO_FEES)
+        after = make_state(virtual_token - tokens, virtual_sol + cost_before_fees)
+        proceeds = sell_sol_output(after, tokens)
+
+        assert proceeds < sol_amount
+        spot_value = tokens * after.virtual_sol_reserves // after.virtual_token_reserves
+        assert proceeds <= spot_value
+
+
+def test_creator_fee_only_applies_with_creator():
+    with_creator = make_state(1_000_000_000_000_000, 32_000_000_000)
+    without_creator = make_state(1_000_000_000_000_000, 32_000_000_000, creator=b"")
+
+    assert without_creator.creator is None
+    assert sell_sol_output(without_creator, 10**12) > sell_sol_output(with_creator, 10**12)
+    assert buy_sol_cost(without_creator, 10**12) < buy_sol_cost(with_creator, 10**12)
+
+
+def test_batch_quotes_match_single_quotes():
+    state = make_state(900_000_000_000_000, 35_000_000_000)
+    sol_amounts = [0, 1, 2, 1_000, 10_000_000, 1_000_000_000, 50_000_000_000]
+    token_amounts = [0, 1, 1_000_000, 10**12, 10**14]
+
+    assert quote_buys(state, sol_amounts) == [
+        buy_token_amount(state, amount) for amount in sol_amounts
+    ]
+    assert quote_sells(state, token_amounts) == [
+        sell_sol_output(state, amount) for amount in token_amounts
+    ]
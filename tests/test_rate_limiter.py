@@ -0,0 +1,89 @@
+"""
+Tests for the priority token-bucket RPC scheduler
+"""
+
+import asyncio
+import socket
+import sys
+from pathlib import Path
+
+from solders.pubkey import Pubkey
+
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+sys.path.append(str(Path(__file__).parent))
+
+from mock_solana_server import MockSolanaServer
+
+from core.client import SolanaClient
+from core.rate_limiter import RequestPriority, RpcScheduler
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def test_batched_calls_take_one_token_each():
+    server = MockSolanaServer(port=free_port(), geyser_port=0, creates_per_minute=0)
+
+    async def run():
+        await server.start()
+        client = SolanaClient(
+            server.rpc_endpoint, None, max_rps=20, stream_blockhash=False
+        )
+        try:
+            # Unknown accounts raise ValueError once their responses arrive
+            await asyncio.gather(
+                *(client.get_account_info(Pubkey.new_unique()) for _ in range(8)),
+                return_exceptions=True,
+            )
+            return client._scheduler
+        finally:
+            await client.close()
+            await server.stop()
+
+    scheduler = asyncio.run(run())
+
+    # One HTTP request carried all eight calls and paid for each of them
+    assert server.requests["getAccountInfo"] == 8
+    assert scheduler.get_metrics()["NORMAL"]["served"] == 8
+    assert scheduler._tokens < 20 - 8 + 1
+
+
+def test_batch_larger_than_the_bucket_delays_later_requests():
+    scheduler = RpcScheduler(max_rps=100, burst=10)
+
+    async def run():
+        loop = asyncio.get_running_loop()
+        await scheduler.acquire(RequestPriority.NORMAL, cost=30)
+        started = loop.time()
+        await scheduler.acquire(RequestPriority.NORMAL)
+        return loop.time() - started
+
+    # 20 tokens of debt plus one for the request itself at 100 per second
+    assert asyncio.run(run()) >= 0.2
+
+
+def test_trade_requests_go_ahead_of_queued_background_requests():
+    scheduler = RpcScheduler(max_rps=50, burst=1)
+    served: list[str] = []
+
+    async def request(name: str, priority: RequestPriority) -> None:
+        await scheduler.acquire(priority)
+        served.append(name)
+
+    async def run():
+        await scheduler.acquire(RequestPriority.NORMAL)
+        background = [
+            asyncio.create_task(request(f"background-{i}", RequestPriority.BACKGROUND))
+            for i in range(3)
+        ]
+        await asyncio.sleep(0)
+        trade = asyncio.create_task(request("trade", RequestPriority.TRADE))
+        await asyncio.gather(*background, trade)
+
+    asyncio.run(run())
+
+    assert served == ["trade", "background-0", "background-1", "background-2"]
+    assert scheduler.get_metrics()["TRADE"]["served"] == 1
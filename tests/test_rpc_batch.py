@@ -0,0 +1,78 @@
+"""
+Tests for JSON-RPC request batching
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+from core.rate_limiter import RequestPriority
+from core.rpc_batch import RpcBatcher
+
+
+class BatchEndpoint:
+    """Records every posted batch and answers each request with its method."""
+
+    def __init__(self, error: Exception | None = None):
+        self.error = error
+        self.batches: list[tuple[list[str], RequestPriority]] = []
+
+    async def send_batch(self, bodies, priority):
+        self.batches.append(([body["method"] for body in bodies], priority))
+        if self.error:
+            raise self.error
+        # Out of order, as providers may answer batches
+        return [{"jsonrpc": "2.0", "id": body["id"], "result": body["method"]} for body in reversed(bodies)]
+
+
+def test_concurrent_requests_flush_as_one_batch_on_the_next_iteration():
+    endpoint = BatchEndpoint()
+    batcher = RpcBatcher(endpoint.send_batch, window=0.0)
+
+    async def run():
+        first = await asyncio.gather(
+            batcher.request("getBalance", [], RequestPriority.BACKGROUND),
+            batcher.request("getAccountInfo", [], RequestPriority.TRADE),
+            batcher.request("getSlot", None, RequestPriority.NORMAL),
+        )
+        second = await batcher.request("getHealth", None, RequestPriority.BACKGROUND)
+        return first, second
+
+    first, second = asyncio.run(run())
+
+    assert [response["result"] for response in first] == ["getBalance", "getAccountInfo", "getSlot"]
+    assert second["result"] == "getHealth"
+    # A batch goes out with the most urgent priority in it, then the priority resets
+    assert endpoint.batches == [
+        (["getBalance", "getAccountInfo", "getSlot"], RequestPriority.TRADE),
+        (["getHealth"], RequestPriority.BACKGROUND),
+    ]
+
+
+def test_full_batches_flush_without_waiting_for_the_window():
+    endpoint = BatchEndpoint()
+    batcher = RpcBatcher(endpoint.send_batch, window=60.0, max_batch_size=2)
+
+    async def run():
+        return await asyncio.wait_for(
+            asyncio.gather(batcher.request("getSlot"), batcher.request("getHealth")), 1.0
+        )
+
+    assert len(asyncio.run(run())) == 2
+    assert endpoint.batches == [(["getSlot", "getHealth"], RequestPriority.NORMAL)]
+
+
+def test_batch_failure_reaches_every_waiter():
+    batcher = RpcBatcher(BatchEndpoint(ConnectionError("reset")).send_batch)
+
+    async def run():
+        return await asyncio.gather(
+            batcher.request("getSlot"), batcher.request("getHealth"), return_exceptions=True
+        )
+
+    results = asyncio.run(run())
+    assert len(results) == 2
+    assert all(isinstance(result, ConnectionError) for result in results)
+    assert all(str(result) == "reset" for result in results)
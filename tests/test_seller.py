@@ -0,0 +1,62 @@
+"""
+Tests for the sell path's concurrent balance and curve reads
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+from solders.keypair import Keypair
+from solders.pubkey import Pubkey
+
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+from core.wallet import Wallet
+from trading.base import TokenInfo
+from trading.seller import TokenSeller
+
+
+class BalanceClient:
+    def __init__(self, balance: int):
+        self.balance = balance
+
+    async def get_token_account_balance(self, token_account, priority=None, hedged=False):
+        return self.balance
+
+
+class FailingCurveManager:
+    async def get_curve_state(self, curve, *args, **kwargs):
+        raise ConnectionError("curve read failed")
+
+
+def token_info() -> TokenInfo:
+    return TokenInfo(
+        name="Token",
+        symbol="TKN",
+        uri="",
+        mint=Pubkey.new_unique(),
+        bonding_curve=Pubkey.new_unique(),
+        associated_bonding_curve=Pubkey.new_unique(),
+        user=Pubkey.new_unique(),
+        creator=Pubkey.new_unique(),
+        creator_vault=Pubkey.new_unique(),
+    )
+
+
+def seller(balance: int) -> TokenSeller:
+    return TokenSeller(
+        BalanceClient(balance),
+        Wallet(str(Keypair())),
+        FailingCurveManager(),
+        priority_fee_manager=None,
+    )
+
+
+def test_empty_balance_is_reported_even_if_the_curve_read_fails():
+    result = asyncio.run(seller(0).execute(token_info()))
+    assert not result.success
+    assert result.error_message == "No tokens to sell"
+
+    result = asyncio.run(seller(1_000).execute(token_info()))
+    assert not result.success
+    assert result.error_message == "curve read failed"
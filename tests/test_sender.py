@@ -0,0 +1,109 @@
+"""
+Tests for the multi-endpoint transaction fan-out
+"""
+
+import asyncio
+import gc
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+from core.sender import TransactionSender
+
+
+class FakeResponse:
+    def __init__(self, data):
+        self.data = data
+
+    def raise_for_status(self):
+        pass
+
+    async def json(self, content_type=None, loads=None):
+        return self.data
+
+
+class DelayedResponse:
+    """Async context manager answering after a delay with a signature or an error."""
+
+    def __init__(self, delay: float, signature: str | None):
+        self.delay = delay
+        self.signature = signature
+
+    async def __aenter__(self):
+        await asyncio.sleep(self.delay)
+        if self.signature is None:
+            return FakeResponse({"error": {"code": -32002, "message": "rejected"}})
+        return FakeResponse({"result": self.signature})
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class FakeSession:
+    """Answers each endpoint after its delay; a None signature means rejection."""
+
+    def __init__(self, endpoints: dict[str, tuple[float, str | None]]):
+        self.endpoints = endpoints
+
+    def post(self, endpoint, json=None):
+        return DelayedResponse(*self.endpoints[endpoint])
+
+
+def sender_for(endpoints: dict[str, tuple[float, str | None]]) -> TransactionSender:
+    session = FakeSession(endpoints)
+
+    async def get_session():
+        return session
+
+    return TransactionSender(list(endpoints), get_session)
+
+
+def test_first_acceptance_wins():
+    sender = sender_for({"slow": (0.05, "sig"), "rejecting": (0.0, None), "fast": (0.01, "sig")})
+
+    async def run():
+        signature = await sender.send(b"tx")
+        await sender.close()
+        return signature
+
+    assert asyncio.run(run()) == "sig"
+    stats = {entry["endpoint"]: entry for entry in sender.get_stats()}
+    assert stats["fast"]["wins"] == 1
+    assert stats["rejecting"]["failed"] == 1
+    assert stats["slow"]["wins"] == 0
+
+
+def test_all_rejections_raise():
+    sender = sender_for({"a": (0.0, None), "b": (0.01, None)})
+
+    async def run():
+        try:
+            await sender.send(b"tx")
+        except RuntimeError as e:
+            return str(e)
+        return None
+
+    error = asyncio.run(run())
+    assert error.startswith("All send endpoints rejected the transaction")
+    assert "a:" in error and "b:" in error
+
+
+def test_losers_finish_in_the_background_without_unretrieved_errors():
+    sender = sender_for({"fast": (0.0, "sig"), "late": (0.05, None)})
+    unhandled = []
+
+    async def run():
+        asyncio.get_running_loop().set_exception_handler(
+            lambda loop, context: unhandled.append(context)
+        )
+        signature = await sender.send(b"tx")
+        assert len(sender._background) == 1
+        await asyncio.sleep(0.1)
+        gc.collect()
+        return signature
+
+    assert asyncio.run(run()) == "sig"
+    assert not sender._background
+    assert sender.stats["late"].failed == 1
+    assert unhandled == []
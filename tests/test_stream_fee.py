@@ -0,0 +1,119 @@
+"""
+Tests for the streaming priority fee estimator fed by the Geyser listener
+"""
+
+import asyncio
+import random
+import struct
+import sys
+from pathlib import Path
+
+from solders.hash import Hash
+from solders.pubkey import Pubkey
+
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+sys.path.append(str(Path(__file__).parent))
+
+from mock_solana_server import (
+    SyntheticCreate,
+    geyser_transaction_update,
+    trade_logs,
+    trade_transaction,
+)
+
+from core.priority_fee.stream_fee import (
+    StreamingPriorityFee,
+    compute_unit_price,
+    raw_compute_unit_price,
+)
+from core.pubkeys import PumpAddresses, SystemAddresses
+from geyser.generated import geyser_pb2
+from monitoring.geyser_listener import GeyserListener, transaction_slot
+
+
+def test_percentile_covers_the_slot_window_within_bucket_resolution():
+    estimator = StreamingPriorityFee(window_slots=10, percentile=70, min_samples=5)
+    assert asyncio.run(estimator.get_priority_fee()) is None
+
+    # Slot 100 paid 1,000-100,000, slot 105 paid ten times as much
+    for price in range(1_000, 101_000, 1_000):
+        estimator.observe(100, price)
+    fee = asyncio.run(estimator.get_priority_fee())
+    assert 70_000 <= fee <= 70_000 * 1.1
+
+    for price in range(10_000, 1_010_000, 10_000):
+        estimator.observe(105, price)
+    fee = asyncio.run(estimator.get_priority_fee())
+    assert 400_000 <= fee <= 400_000 * 1.1
+
+    # Slot 100 leaves the window once slot 110 arrives; stragglers from it are ignored
+    estimator.observe(110, 0)
+    estimator.observe(100, 10**9)
+    assert estimator.samples == 101
+    fee = asyncio.run(estimator.get_priority_fee())
+    assert 700_000 <= fee <= 700_000 * 1.1
+
+    # Nothing observed for max_age means no estimate
+    estimator.max_age = 0.0
+    assert asyncio.run(estimator.get_priority_fee()) is None
+
+
+def test_geyser_listener_counts_compute_unit_prices_of_pump_transactions():
+    listener = GeyserListener("localhost:10000", "token", "x-token", PumpAddresses.PROGRAM)
+    assert "pump_fees" not in listener._create_subscription_request().transactions
+    listener.fee_estimator = StreamingPriorityFee(min_samples=1)
+    request = listener._create_subscription_request()
+    assert not request.transactions["pump_fees"].account_required
+
+    blockhash = Hash.new_unique()
+    trades = [
+        geyser_transaction_update(trade_transaction(blockhash, price), 7, trade_logs())
+        for price in (50_000, 60_000, 70_000)
+    ]
+    create = SyntheticCreate.generate(0, blockhash, 80_000)
+
+    async def run():
+        results = [
+            await listener._process_raw_update(update.SerializeToString())
+            for update in [*trades, create.geyser_update(7)]
+        ]
+        return results, await listener.fee_estimator.get_priority_fee()
+
+    results, fee = asyncio.run(run())
+    assert results[:3] == [None, None, None]
+    assert results[3].mint == create.mint.pubkey()
+    assert listener.fee_estimator.samples == 4
+    assert 70_000 <= fee <= 70_000 * 1.1
+    # Only the create is parsed; the trades are counted from their raw bytes
+    assert listener.updates_parsed == 1
+
+
+def test_raw_price_and_slot_match_the_parsed_update():
+    rng = random.Random(24)
+    for _ in range(300):
+        update = geyser_pb2.SubscribeUpdate()
+        update.filters.append("pump_fees")
+        update.transaction.slot = rng.choice([0, rng.randrange(1, 2**40)])
+        message = update.transaction.transaction.transaction.message
+        keys = [bytes(Pubkey.new_unique()) for _ in range(rng.randrange(2, 200))]
+        budget_index = rng.randrange(len(keys))
+        if rng.random() < 0.8:
+            keys[budget_index] = bytes(SystemAddresses.COMPUTE_BUDGET_PROGRAM)
+        message.account_keys.extend(keys)
+        set_price = rng.random() < 0.8
+        for position in range(rng.randrange(1, 6)):
+            ix = message.instructions.add()
+            if set_price and position == 0:
+                ix.program_id_index = budget_index
+                ix.data = bytes([3]) + struct.pack("<Q", rng.randrange(2**64))
+            else:
+                ix.program_id_index = rng.randrange(len(keys))
+                ix.accounts = bytes(rng.randrange(len(keys)) for _ in range(3))
+                ix.data = rng.randbytes(rng.randrange(1, 40))
+        update.transaction.transaction.meta.log_messages.append("Program log: Buy")
+        raw = update.SerializeToString()
+
+        assert transaction_slot(raw) == update.transaction.slot
+        assert raw_compute_unit_price(raw) == compute_unit_price(message)
+
+    assert transaction_slot(geyser_pb2.SubscribeUpdate(filters=["x"]).SerializeToString()) is None
@@ -0,0 +1,161 @@
+"""
+Tests for the pre-compiled buy transaction template
+"""
+
+import random
+import struct
+import sys
+from pathlib import Path
+
+from solders.compute_budget import set_compute_unit_limit, set_compute_unit_price
+from solders.hash import Hash
+from solders.instruction import AccountMeta, Instruction
+from solders.keypair import Keypair
+from solders.message import Message
+from solders.pubkey import Pubkey
+from solders.transaction import Transaction
+from spl.token.instructions import create_idempotent_associated_token_account
+
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+from core.pubkeys import PumpAddresses, SystemAddresses
+from core.wallet import Wallet
+from trading.base import TokenInfo
+from trading.buyer import EXPECTED_DISCRIMINATOR
+from trading.templates import BuyTransactionTemplate
+
+
+def random_token() -> TokenInfo:
+    return TokenInfo(
+        name="Token",
+        symbol="TKN",
+        uri="",
+        mint=Pubkey.new_unique(),
+        bonding_curve=Pubkey.new_unique(),
+        associated_bonding_curve=Pubkey.new_unique(),
+        user=Pubkey.new_unique(),
+        creator=Pubkey.new_unique(),
+        creator_vault=Pubkey.new_unique(),
+    )
+
+
+def reference_message(
+    wallet: Wallet,
+    token_info: TokenInfo,
+    associated_token_account: Pubkey,
+    token_amount_raw: int,
+    max_amount_lamports: int,
+    blockhash: Hash,
+    priority_fee: int | None,
+    compute_unit_limit: int,
+) -> Message:
+    """Compile the buy the way it was built before templates existed."""
+    accounts = [
+        AccountMeta(pubkey=PumpAddresses.GLOBAL, is_signer=False, is_writable=False),
+        AccountMeta(pubkey=PumpAddresses.FEE, is_signer=False, is_writable=True),
+        AccountMeta(pubkey=token_info.mint, is_signer=False, is_writable=False),
+        AccountMeta(pubkey=token_info.bonding_curve, is_signer=False, is_writable=True),
+        AccountMeta(pubkey=token_info.associated_bonding_curve, is_signer=False, is_writable=True),
+        AccountMeta(pubkey=associated_token_account, is_signer=False, is_writable=True),
+        AccountMeta(pubkey=wallet.pubkey, is_signer=True, is_writable=True),
+        AccountMeta(pubkey=SystemAddresses.PROGRAM, is_signer=False, is_writable=False),
+        AccountMeta(pubkey=SystemAddresses.TOKEN_PROGRAM, is_signer=False, is_writable=False),
+        AccountMeta(pubkey=token_info.creator_vault, is_signer=False, is_writable=True),
+        AccountMeta(pubkey=PumpAddresses.EVENT_AUTHORITY, is_signer=False, is_writable=False),
+        AccountMeta(pubkey=PumpAddresses.PROGRAM, is_signer=False, is_writable=False),
+    ]
+    data = (
+        EXPECTED_DISCRIMINATOR
+        + struct.pack("<Q", token_amount_raw)
+        + struct.pack("<Q", max_amount_lamports)
+    )
+    instructions = [
+        create_idempotent_associated_token_account(
+            wallet.pubkey, wallet.pubkey, token_info.mint, SystemAddresses.TOKEN_PROGRAM
+        ),
+        Instruction(PumpAddresses.PROGRAM, data, accounts),
+    ]
+    if priority_fee is not None:
+        instructions = [
+            set_compute_unit_limit(compute_unit_limit),
+            set_compute_unit_price(priority_fee),
+            *instructions,
+        ]
+    return Message.new_with_blockhash(instructions, wallet.pubkey, blockhash)
+
+
+def is_writable(message: Message, index: int) -> bool:
+    """Writability of an account key from the legacy message header."""
+    header = message.header
+    signers = header.num_required_signatures
+    if index < signers:
+        return index < signers - header.num_readonly_signed_accounts
+    return index < len(message.account_keys) - header.num_readonly_unsigned_accounts
+
+
+def decode(message: Message) -> list[tuple]:
+    """Resolve compiled instructions back to program, account metas and data."""
+    keys = message.account_keys
+    return [
+        (
+            keys[ix.program_id_index],
+            [
+                (keys[index], message.is_signer(index), is_writable(message, index))
+                for index in ix.accounts
+            ],
+            bytes(ix.data),
+        )
+        for ix in message.instructions
+    ]
+
+
+def check_template(with_priority_fee: bool) -> None:
+    wallet = Wallet(str(Keypair()))
+    template = BuyTransactionTemplate(wallet, EXPECTED_DISCRIMINATOR, with_priority_fee)
+    rng = random.Random(with_priority_fee)
+
+    for _ in range(100):
+        token_info = random_token()
+        associated_token_account = wallet.get_associated_token_address(token_info.mint)
+        token_amount_raw = rng.randrange(2**64)
+        max_amount_lamports = rng.randrange(2**64)
+        blockhash = Hash.new_unique()
+        priority_fee = rng.randrange(2**64) if with_priority_fee else None
+        compute_unit_limit = rng.randrange(2**32)
+
+        raw = template.build(
+            token_info,
+            associated_token_account,
+            token_amount_raw,
+            max_amount_lamports,
+            blockhash,
+            priority_fee,
+            compute_unit_limit,
+        )
+        transaction = Transaction.from_bytes(raw)
+        transaction.verify()
+
+        expected = reference_message(
+            wallet,
+            token_info,
+            associated_token_account,
+            token_amount_raw,
+            max_amount_lamports,
+            blockhash,
+            priority_fee,
+            compute_unit_limit,
+        )
+        # The compiler orders keys within a signer/writable class by value, so
+        # the placeholder keys may sit elsewhere; the instructions must not differ
+        assert transaction.message.header == expected.header
+        assert set(transaction.message.account_keys) == set(expected.account_keys)
+        assert transaction.message.recent_blockhash == blockhash
+        assert decode(transaction.message) == decode(expected)
+
+
+def test_template_with_priority_fee_matches_compiled_message():
+    check_template(with_priority_fee=True)
+
+
+def test_template_without_priority_fee_matches_compiled_message():
+    check_template(with_priority_fee=False)
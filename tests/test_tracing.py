@@ -0,0 +1,60 @@
+"""
+Tests for per-token latency tracing
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+from utils import tracing
+from utils.tracing import LatencyTracker, TokenTrace
+
+
+def make_trace(listener: str, marks: list[tuple[str, float]], started: float = 100.0):
+    trace = TokenTrace(listener, started)
+    trace.marks.extend(marks)
+    return trace
+
+
+def test_stage_durations_are_measured_from_the_previous_mark(monkeypatch):
+    # The first reading anchors the wall-clock start of the trace
+    clock = iter([100.0, 100.010, 100.015, 100.115])
+    monkeypatch.setattr(tracing, "monotonic", lambda: next(clock))
+
+    trace = TokenTrace("geyser", started=100.0)
+    trace.mark("decode")
+    trace.mark("queue")
+    trace.mark("confirm")
+    trace.finish("confirmed")
+
+    stages = dict(trace.stages())
+    assert round(stages["decode"], 6) == 0.010
+    assert round(stages["queue"], 6) == 0.005
+    assert round(stages["confirm"], 6) == 0.100
+    assert round(trace.elapsed, 6) == 0.115
+
+    record = trace.to_record()
+    assert record["action"] == "trace"
+    assert record["outcome"] == "confirmed"
+    assert record["total_ms"] == 115.0
+    assert list(record["stages_ms"]) == ["decode", "queue", "confirm"]
+
+
+def test_tracker_keeps_percentiles_per_listener_and_stage():
+    records = []
+    tracker = LatencyTracker(window=100, sink=records.append, summary_every=0)
+    for i in range(100):
+        tracker.record(make_trace("geyser", [("decode", 100.001), ("send", 100.001 + i / 1000)]))
+    tracker.record(make_trace("logs", [("decode", 100.5)]), token="mint")
+
+    stats = tracker.get_stats()
+    assert set(stats) == {"geyser", "logs"}
+    assert stats["geyser"]["send"]["samples"] == 100
+    assert round(stats["geyser"]["send"]["p50_ms"]) == 50
+    assert round(stats["geyser"]["send"]["p99_ms"]) == 99
+    assert round(stats["logs"]["total"]["p50_ms"]) == 500
+
+    assert len(records) == 101
+    assert records[-1]["token_address"] == "mint"
+    assert records[-1]["listener"] == "logs"